@@ -1,17 +1,35 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import contextlib
 import copy
 import json
 import os
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
+
+from file_lock_common import exclusive_file_lock, lock_path_for
 
 SCHEMA_VERSION = "actor_session_multibinding_v1"
 DEFAULT_BINDING_KEY_MODE = "actor_id+session_id"
 LEGACY_BINDING_KEY_MODE = "legacy_single_object"
+ACTOR_BINDING_INDEX_SCHEMA = "actor_binding_index_v2"
+ACTOR_BINDING_INDEX_FILENAME = "actor-binding-index.json"
+LOCK_TIMEOUT_SECONDS = 10.0
+LOCK_BACKOFF_SECONDS = 0.001
+LOCK_BACKOFF_MAX_SECONDS = 0.05
+
+
+class ActorBindingConflict(ValueError):
+    """Compare-and-swap rejected: the store moved past ``got`` (current token ``expected``)."""
+
+    def __init__(self, path: Path, expected: str, got: str) -> None:
+        super().__init__(f"stale_compare_token expected={expected} got={got} path={path}")
+        self.path = path
+        self.expected = expected
+        self.got = got
 
 
 def resolve_actor_id(explicit_actor_id: str = "") -> str:
@@ -255,39 +273,275 @@ def load_actor_binding(
     return _select_binding(store, identity_id=identity_id, session_id=session_id)
 
 
-def list_actor_bindings(catalog_path: Path) -> list[dict[str, Any]]:
+def _actor_store_rows(p: Path, catalog_path: Path) -> list[dict[str, Any]]:
+    data = _load_json(p)
+    actor_id = str(data.get("actor_id", "")).strip() if isinstance(data, dict) else ""
+    if not actor_id:
+        actor_id = p.stem
+    store = normalize_actor_binding_store(
+        data=data,
+        actor_id=actor_id,
+        catalog_path=catalog_path.resolve(),
+        actor_session_file=p.resolve(),
+    )
+    bindings = [x for x in (store.get("bindings") or []) if isinstance(x, dict)]
     out: list[dict[str, Any]] = []
-    root = actor_session_dir(catalog_path)
-    if not root.exists():
-        return out
-    for p in sorted(root.glob("*.json")):
-        data = _load_json(p)
-        actor_id = str(data.get("actor_id", "")).strip() if isinstance(data, dict) else ""
-        if not actor_id:
-            actor_id = p.stem
-        store = normalize_actor_binding_store(
-            data=data,
-            actor_id=actor_id,
-            catalog_path=catalog_path.resolve(),
-            actor_session_file=p.resolve(),
-        )
-        bindings = [x for x in (store.get("bindings") or []) if isinstance(x, dict)]
-        if not bindings:
+    for row in bindings:
+        entry = copy.deepcopy(row)
+        entry["actor_session_path"] = str(p.resolve())
+        entry["binding_key_mode"] = store.get("binding_key_mode", DEFAULT_BINDING_KEY_MODE)
+        entry["binding_version_store"] = store.get("binding_version", 0)
+        entry["compare_token"] = store.get("compare_token", "")
+        entry["session_entry_count"] = store.get("session_entry_count", len(bindings))
+        entry["store_stale_reasons"] = store.get("stale_reasons", [])
+        out.append(entry)
+    return out
+
+
+def actor_binding_index_path(catalog_path: Path) -> Path:
+    return (catalog_path.parent / "session" / ACTOR_BINDING_INDEX_FILENAME).resolve()
+
+
+# index path -> ((mtime_ns, size, ino), parsed index); readers share the parsed copy
+_INDEX_MEMO: dict[str, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+
+def _index_stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _load_actor_binding_index(catalog_path: Path) -> dict[str, Any] | None:
+    """The persisted index, or None when it is missing or belongs to another catalog."""
+    path = actor_binding_index_path(catalog_path)
+    key = _index_stat_key(path)
+    if key is None:
+        return None
+    cached = _INDEX_MEMO.get(str(path))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    data = _load_json(path)
+    if data.get("schema") != ACTOR_BINDING_INDEX_SCHEMA or data.get("catalog_path") != str(catalog_path.resolve()):
+        return None
+    actors = data.get("actors") if isinstance(data.get("actors"), dict) else {}
+    by_identity = data.get("by_identity") if isinstance(data.get("by_identity"), dict) else {}
+    index = {
+        "actors": {str(k): v for k, v in actors.items() if isinstance(v, dict)},
+        "by_identity": {str(k): [str(x) for x in v] for k, v in by_identity.items() if isinstance(v, list)},
+    }
+    _INDEX_MEMO[str(path)] = (key, index)
+    return index
+
+
+def _binding_identity_ids(row: dict[str, Any]) -> set[str]:
+    # bindings without an identity are indexed under "" so validators can still find them
+    return {str(b.get("identity_id", "")).strip() for b in row.get("bindings") or [] if isinstance(b, dict)}
+
+
+def _identity_reverse_index(actors: dict[str, dict[str, Any]]) -> dict[str, list[str]]:
+    by_identity: dict[str, list[str]] = {}
+    for name, row in actors.items():
+        for identity_id in _binding_identity_ids(row):
+            by_identity.setdefault(identity_id, []).append(name)
+    return {k: sorted(by_identity[k]) for k in sorted(by_identity)}
+
+
+def _write_actor_binding_index(catalog_path: Path, index: dict[str, Any]) -> None:
+    doc = {
+        "schema": ACTOR_BINDING_INDEX_SCHEMA,
+        "catalog_path": str(catalog_path.resolve()),
+        "updated_at": _utc_now(),
+        **index,
+    }
+    path = actor_binding_index_path(catalog_path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(doc, ensure_ascii=False) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def sync_actor_binding_index(catalog_path: Path) -> dict[str, Any]:
+    """
+    identity -> actors reverse index over ``session/actors/*.json``, checked against the stores.
+
+    Every store's (mtime_ns, size) is compared with the ``key`` recorded in the index; only
+    new, changed or removed stores are re-normalized, and the index is rewritten (under its
+    lock) only then. Stores written behind the API or missed by a failed index write are
+    therefore picked up. Returns ``{"actors": {store filename: {"key": [mtime_ns, size],
+    "bindings": [...]}}, "by_identity": {identity_id: [store filename, ...]}}`` with actors in
+    filename order.
+    """
+    catalog_path = catalog_path.resolve()
+    if not actor_session_dir(catalog_path).exists():
+        return {"actors": {}, "by_identity": {}}
+    with actor_binding_store_lock(actor_binding_index_path(catalog_path)):
+        loaded = _load_actor_binding_index(catalog_path)
+        index, changed = _scan_actor_stores(catalog_path, loaded)
+        if changed:
+            _persist_actor_binding_index(catalog_path, index)
+    return index
+
+
+def _scan_actor_stores(catalog_path: Path, indexed: dict[str, Any] | None) -> tuple[dict[str, Any], bool]:
+    known = (indexed or {}).get("actors") or {}
+    actors: dict[str, dict[str, Any]] = {}
+    changed = indexed is None
+    for entry in sorted(os.scandir(actor_session_dir(catalog_path)), key=lambda e: e.name):
+        if not entry.name.endswith(".json") or not entry.is_file():
+            continue
+        st = entry.stat()
+        key = [st.st_mtime_ns, st.st_size]
+        row = known.get(entry.name)
+        if row is not None and row.get("key") == key:
+            actors[entry.name] = row
             continue
-        for row in bindings:
-            entry = copy.deepcopy(row)
-            entry["actor_session_path"] = str(p.resolve())
-            entry["binding_key_mode"] = store.get("binding_key_mode", DEFAULT_BINDING_KEY_MODE)
-            entry["binding_version_store"] = store.get("binding_version", 0)
-            entry["compare_token"] = store.get("compare_token", "")
-            entry["session_entry_count"] = store.get("session_entry_count", len(bindings))
-            entry["store_stale_reasons"] = store.get("stale_reasons", [])
-            out.append(entry)
+        actors[entry.name] = {"key": key, "bindings": _actor_store_rows(Path(entry.path), catalog_path)}
+        changed = True
+    if not changed and list(actors) == list(known):
+        return indexed or {"actors": {}, "by_identity": {}}, False
+    return {"by_identity": _identity_reverse_index(actors), "actors": actors}, True
+
+
+def _persist_actor_binding_index(catalog_path: Path, index: dict[str, Any]) -> None:
+    try:
+        _write_actor_binding_index(catalog_path, index)
+    except OSError:
+        # never leave an index behind that no longer matches the stores
+        with contextlib.suppress(OSError):
+            actor_binding_index_path(catalog_path).unlink()
+
+
+def actor_binding_index(catalog_path: Path) -> dict[str, Any]:
+    """The reverse index after a stat check of every store; persisted only when it was stale."""
+    catalog_path = catalog_path.resolve()
+    if not actor_session_dir(catalog_path).exists():
+        return {"actors": {}, "by_identity": {}}
+    index, changed = _scan_actor_stores(catalog_path, _load_actor_binding_index(catalog_path))
+    return sync_actor_binding_index(catalog_path) if changed else index
+
+
+def actor_binding_identity_ids(catalog_path: Path) -> set[str]:
+    """Identity ids carrying at least one actor binding (``""`` for bindings without one)."""
+    return set(actor_binding_index(catalog_path)["by_identity"])
+
+
+def list_actor_bindings(catalog_path: Path) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for row in actor_binding_index(catalog_path)["actors"].values():
+        out.extend(copy.deepcopy(x) for x in row.get("bindings") or [] if isinstance(x, dict))
+    return out
+
+
+def list_actor_bindings_for_identities(catalog_path: Path, identity_ids: Iterable[str]) -> list[dict[str, Any]]:
+    """``list_actor_bindings`` restricted to bindings of ``identity_ids`` via the reverse index."""
+    wanted = {str(x).strip() for x in identity_ids}
+    if not wanted:
+        return []
+    index = actor_binding_index(catalog_path)
+    actors = index["actors"]
+    names = {name for identity_id in wanted for name in index["by_identity"].get(identity_id, []) if name in actors}
+    out: list[dict[str, Any]] = []
+    for name in sorted(names):
+        for binding in actors[name].get("bindings") or []:
+            if str(binding.get("identity_id", "")).strip() in wanted:
+                out.append(copy.deepcopy(binding))
     return out
 
 
+def _index_actor_store(catalog_path: Path, path: Path) -> None:
+    """Fold one rewritten store into the index (caller holds that store's lock)."""
+    with actor_binding_store_lock(actor_binding_index_path(catalog_path)):
+        index = _load_actor_binding_index(catalog_path)
+        if index is None:
+            # bootstrap: other stores may predate the index
+            _persist_actor_binding_index(catalog_path, _scan_actor_stores(catalog_path, None)[0])
+            return
+        actors = dict(index["actors"])
+        by_identity = {k: list(v) for k, v in index["by_identity"].items()}
+        old = actors.get(path.name)
+        for identity_id in _binding_identity_ids(old or {}):
+            names = [x for x in by_identity.get(identity_id, []) if x != path.name]
+            if names:
+                by_identity[identity_id] = names
+            else:
+                by_identity.pop(identity_id, None)
+        st = path.stat()
+        row = {"key": [st.st_mtime_ns, st.st_size], "bindings": _actor_store_rows(path, catalog_path)}
+        actors[path.name] = row
+        for identity_id in _binding_identity_ids(row):
+            by_identity[identity_id] = sorted({*by_identity.get(identity_id, []), path.name})
+        actors = {k: actors[k] for k in sorted(actors)}
+        by_identity = {k: by_identity[k] for k in sorted(by_identity)}
+        _persist_actor_binding_index(catalog_path, {"by_identity": by_identity, "actors": actors})
+
+
 def write_actor_binding_store(path: Path, payload: dict[str, Any]) -> None:
+    """Atomically replace one actor store and fold it into the reverse index. Hold its lock."""
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + f".tmp-{os.getpid()}")
     tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
     tmp.replace(path)
+    catalog = str(payload.get("catalog_path", "")).strip()
+    if catalog and actor_session_dir(Path(catalog)) == path.parent.resolve():
+        _index_actor_store(Path(catalog).resolve(), path)
+
+
+def actor_binding_compare_token(store: dict[str, Any]) -> str:
+    return str(store.get("compare_token", "")).strip() or str(store.get("binding_version", 0))
+
+
+@contextlib.contextmanager
+def actor_binding_store_lock(path: Path, *, timeout_seconds: float = LOCK_TIMEOUT_SECONDS) -> Iterator[None]:
+    """
+    Exclusive lock on ``<store>.lock`` (the store itself is replaced by rename, so it cannot
+    carry the lock). ``TimeoutError`` after ``timeout_seconds``. Readers stay lock-free: they
+    always see a whole file.
+    """
+    with exclusive_file_lock(
+        lock_path_for(path),
+        timeout_seconds=timeout_seconds,
+        backoff_seconds=LOCK_BACKOFF_SECONDS,
+        backoff_max_seconds=LOCK_BACKOFF_MAX_SECONDS,
+        label="actor binding store lock",
+    ):
+        yield
+
+
+def cas_update_actor_binding_store(
+    catalog_path: Path,
+    actor_id: str,
+    compare_token: str | None,
+    build_payload: Callable[[dict[str, Any]], dict[str, Any]],
+    *,
+    timeout_seconds: float = LOCK_TIMEOUT_SECONDS,
+) -> dict[str, Any]:
+    """
+    Read-modify-write of one actor binding store under its lock.
+
+    The store is re-read under the lock and ``ActorBindingConflict`` is raised when its compare
+    token no longer equals ``compare_token`` (``None`` accepts the current token); otherwise
+    ``build_payload(store)`` is written atomically and returned. ``build_payload`` owns the
+    version/token bump.
+    """
+    path = actor_session_path(catalog_path, actor_id)
+    with actor_binding_store_lock(path, timeout_seconds=timeout_seconds):
+        store = load_actor_binding_store(catalog_path, actor_id)
+        expected = actor_binding_compare_token(store)
+        if compare_token is not None and str(compare_token).strip() != expected:
+            raise ActorBindingConflict(path, expected, str(compare_token).strip())
+        payload = build_payload(store)
+        write_actor_binding_store(path, payload)
+        return payload
+
+
+def update_actor_binding_store(
+    catalog_path: Path,
+    actor_id: str,
+    build_payload: Callable[[dict[str, Any]], dict[str, Any]],
+    *,
+    timeout_seconds: float = LOCK_TIMEOUT_SECONDS,
+) -> dict[str, Any]:
+    """Unconditional locked update for callers that do not hold a compare token of their own."""
+    return cas_update_actor_binding_store(catalog_path, actor_id, None, build_payload, timeout_seconds=timeout_seconds)
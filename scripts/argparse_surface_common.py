@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import ast
+import re
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+HELP_FLAG_RE = re.compile(r"(--[a-zA-Z0-9][a-zA-Z0-9\-]*)")
+PARSER_METHODS = {"add_argument", "add_parser", "add_subparsers", "add_argument_group", "add_mutually_exclusive_group"}
+
+
+class DynamicParser(Exception):
+    """The parser surface depends on runtime values; callers fall back to running ``--help``."""
+
+
+@dataclass
+class _Parser:
+    add_help: bool = True
+    texts: list[str] = field(default_factory=list)
+    # option strings and help texts of actions (inherited by parsers listing this one in parents=)
+    action_texts: list[str] = field(default_factory=list)
+    parents: list["_Parser"] = field(default_factory=list)
+    subparsers: dict[str, "_Parser"] | None = None
+    choice_positionals: bool = False
+    used_as_parent: bool = False
+
+    def help_texts(self) -> list[str]:
+        rows = list(self.texts) + list(self.action_texts)
+        for parent in self.parents:
+            rows.extend(parent.action_texts)
+        if self.add_help:
+            rows.append("--help")
+        return rows
+
+
+@dataclass
+class _Subparsers:
+    owner: _Parser
+
+
+class _Extractor:
+    def __init__(self, tree: ast.Module) -> None:
+        self.constants: dict[str, str] = {}
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        self.constants[target.id] = node.value.value
+        self.parsers: list[_Parser] = []
+        self.tree = tree
+
+    def run(self) -> list[_Parser]:
+        self._scope(self.tree.body, {})
+        return [p for p in self.parsers if not p.used_as_parent]
+
+    # -- statements -----------------------------------------------------------------------------
+
+    def _scope(self, body: list[ast.stmt], env: dict[str, Any]) -> None:
+        # function bodies run after their enclosing scope is built, so they see its final names
+        deferred: list[ast.stmt] = []
+        self._block(body, env, deferred)
+        for fn in deferred:
+            self._scope(fn.body, dict(env))  # type: ignore[attr-defined]
+
+    def _block(self, body: list[ast.stmt], env: dict[str, Any], deferred: list[ast.stmt]) -> None:
+        for stmt in body:
+            if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                deferred.append(stmt)
+                continue
+            if isinstance(stmt, ast.Assign):
+                value = self._expr(stmt.value, env)
+                for target in stmt.targets:
+                    if isinstance(target, ast.Name):
+                        if isinstance(value, (_Parser, _Subparsers)):
+                            env[target.id] = value
+                        else:
+                            env.pop(target.id, None)
+                continue
+            if isinstance(stmt, (ast.Expr, ast.Return, ast.AnnAssign, ast.AugAssign)) and stmt.value is not None:
+                self._expr(stmt.value, env)
+                continue
+            for name in ("body", "orelse", "finalbody", "handlers"):
+                children = getattr(stmt, name, None)
+                if isinstance(children, list):
+                    for child in children:
+                        if isinstance(child, ast.ExceptHandler):
+                            self._block(child.body, env, deferred)
+                    self._block([c for c in children if isinstance(c, ast.stmt)], env, deferred)
+            for name in ("test", "iter", "items"):
+                value = getattr(stmt, name, None)
+                if isinstance(value, ast.expr):
+                    self._expr(value, env)
+
+    # -- expressions ----------------------------------------------------------------------------
+
+    def _expr(self, node: ast.expr, env: dict[str, Any]) -> Any:
+        if isinstance(node, ast.Name):
+            return env.get(node.id)
+        if not isinstance(node, ast.Call):
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, ast.expr):
+                    self._expr(child, env)
+            return None
+        func = node.func
+        if self._is_argument_parser(func):
+            return self._new_parser(node, env)
+        if isinstance(func, ast.Attribute) and func.attr in PARSER_METHODS:
+            receiver = self._expr(func.value, env)
+            if receiver is None:
+                raise DynamicParser(f"{func.attr} on unresolved receiver")
+            return self._method(receiver, func.attr, node, env)
+        for arg in [*node.args, *(kw.value for kw in node.keywords)]:
+            if isinstance(self._expr(arg, env), (_Parser, _Subparsers)):
+                raise DynamicParser("parser passed to helper call")
+        self._expr(func, env)
+        return None
+
+    @staticmethod
+    def _is_argument_parser(func: ast.expr) -> bool:
+        if isinstance(func, ast.Attribute):
+            return func.attr == "ArgumentParser"
+        return isinstance(func, ast.Name) and func.id == "ArgumentParser"
+
+    def _text(self, node: ast.expr) -> str:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        if isinstance(node, ast.Name) and node.id in self.constants:
+            return self.constants[node.id]
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            return self._text(node.left) + self._text(node.right)
+        if isinstance(node, ast.JoinedStr):
+            parts: list[str] = []
+            for value in node.values:
+                if isinstance(value, ast.FormattedValue):
+                    if value.conversion not in (-1, 115) or value.format_spec is not None:
+                        raise DynamicParser("formatted f-string field")
+                    value = value.value
+                parts.append(self._text(value))
+            return "".join(parts)
+        raise DynamicParser(f"non-literal text: {ast.dump(node)[:80]}")
+
+    def _texts(self, node: ast.Call, names: Sequence[str]) -> list[str]:
+        out: list[str] = []
+        for kw in node.keywords:
+            if kw.arg in names and not self._is_suppress(kw.value):
+                if isinstance(kw.value, (ast.Tuple, ast.List)):
+                    out.extend(self._text(x) for x in kw.value.elts)
+                elif not (isinstance(kw.value, ast.Constant) and kw.value.value is None):
+                    out.append(self._text(kw.value))
+        return out
+
+    @staticmethod
+    def _is_suppress(node: ast.expr) -> bool:
+        return (isinstance(node, ast.Attribute) and node.attr == "SUPPRESS") or (
+            isinstance(node, ast.Name) and node.id == "SUPPRESS"
+        )
+
+    @staticmethod
+    def _kw(node: ast.Call, name: str) -> ast.expr | None:
+        return next((kw.value for kw in node.keywords if kw.arg == name), None)
+
+    def _parents(self, node: ast.Call, env: dict[str, Any]) -> list[_Parser]:
+        raw = self._kw(node, "parents")
+        if raw is None:
+            return []
+        if not isinstance(raw, (ast.List, ast.Tuple)):
+            raise DynamicParser("non-literal parents")
+        out: list[_Parser] = []
+        for elt in raw.elts:
+            parent = self._expr(elt, env)
+            if not isinstance(parent, _Parser):
+                raise DynamicParser("unresolved parent parser")
+            parent.used_as_parent = True
+            out.append(parent)
+        return out
+
+    def _configure(self, parser: _Parser, node: ast.Call, env: dict[str, Any]) -> None:
+        if any(kw.arg is None for kw in node.keywords):
+            raise DynamicParser("**kwargs parser construction")
+        add_help = self._kw(node, "add_help")
+        if add_help is not None:
+            if not isinstance(add_help, ast.Constant):
+                raise DynamicParser("non-literal add_help")
+            parser.add_help = bool(add_help.value)
+        prefix = self._kw(node, "prefix_chars")
+        if prefix is not None and not (isinstance(prefix, ast.Constant) and prefix.value == "-"):
+            raise DynamicParser("custom prefix_chars")
+        parser.texts.extend(self._texts(node, ("description", "epilog", "usage")))
+        parser.parents = self._parents(node, env)
+
+    def _new_parser(self, node: ast.Call, env: dict[str, Any]) -> _Parser:
+        parser = _Parser()
+        self._configure(parser, node, env)
+        self.parsers.append(parser)
+        return parser
+
+    def _method(self, receiver: Any, method: str, node: ast.Call, env: dict[str, Any]) -> Any:
+        if isinstance(receiver, _Subparsers):
+            if method != "add_parser":
+                raise DynamicParser(f"{method} on subparsers")
+            if not node.args:
+                raise DynamicParser("add_parser without name")
+            names = [self._text(node.args[0])]
+            aliases = self._kw(node, "aliases")
+            if aliases is not None:
+                if not isinstance(aliases, (ast.List, ast.Tuple)):
+                    raise DynamicParser("non-literal aliases")
+                names.extend(self._text(x) for x in aliases.elts)
+            child = _Parser()
+            self._configure(child, node, env)
+            assert receiver.owner.subparsers is not None
+            receiver.owner.texts.extend(self._texts(node, ("help",)))
+            for name in names:
+                receiver.owner.subparsers[name] = child
+            return child
+        parser: _Parser = receiver
+        if method == "add_subparsers":
+            if parser.subparsers is not None:
+                raise DynamicParser("multiple add_subparsers")
+            parser.subparsers = {}
+            parser.texts.extend(self._texts(node, ("title", "description", "help", "metavar")))
+            return _Subparsers(owner=parser)
+        if method in {"add_argument_group", "add_mutually_exclusive_group"}:
+            parser.texts.extend(self._texts(node, ("title", "description")))
+            for arg in node.args:
+                parser.texts.append(self._text(arg))
+            return parser
+        if method != "add_argument":
+            raise DynamicParser(method)
+        if any(isinstance(a, ast.Starred) for a in node.args) or any(kw.arg is None for kw in node.keywords):
+            raise DynamicParser("starred add_argument")
+        option_strings = [self._text(a) for a in node.args]
+        help_node = self._kw(node, "help")
+        if help_node is not None and self._is_suppress(help_node):
+            return None
+        is_positional = bool(option_strings) and not option_strings[0].startswith("-")
+        if is_positional and self._kw(node, "choices") is not None:
+            parser.choice_positionals = True
+        rows = [] if is_positional else list(option_strings)
+        rows.extend(self._texts(node, ("help", "metavar")))
+        choices = self._kw(node, "choices")
+        if isinstance(choices, (ast.List, ast.Tuple, ast.Set)):
+            rows.extend(e.value for e in choices.elts if isinstance(e, ast.Constant) and isinstance(e.value, str))
+        parser.action_texts.extend(rows)
+        return None
+
+
+def static_help_flags(source: str, subcommands: Sequence[str] = ()) -> set[str] | None:
+    """
+    ``--flags`` that ``<script> [subcommands] --help`` would print, read from the script's argparse
+    calls without running it. Returns None when that cannot be decided statically (no or several
+    top-level parsers, parsers built through helpers, non-literal option/help strings, unknown
+    subcommand path, ...); callers should then run ``--help``.
+    """
+    try:
+        tree = ast.parse(source)
+        roots = _Extractor(tree).run()
+    except (SyntaxError, DynamicParser, RecursionError):
+        return None
+    if len(roots) != 1:
+        return None
+    parser = roots[0]
+    for name in subcommands:
+        if parser.subparsers is None:
+            if parser.choice_positionals:
+                return None
+            break  # bare words are positionals; argparse still prints this parser's help
+        child = parser.subparsers.get(name)
+        if child is None:
+            return None
+        parser = child
+    if not parser.add_help:
+        return None
+    out: set[str] = set()
+    for text in parser.help_texts():
+        out.update(HELP_FLAG_RE.findall(text))
+    return out
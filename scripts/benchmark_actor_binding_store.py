@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from actor_session_common import (
+    DEFAULT_BINDING_KEY_MODE,
+    SCHEMA_VERSION,
+    ActorBindingConflict,
+    actor_binding_compare_token,
+    actor_session_path,
+    cas_update_actor_binding_store,
+    load_actor_binding_store,
+    update_actor_binding_store,
+    write_actor_binding_store,
+)
+
+BENCH_ACTOR_ID = "bench:actor-binding-store"
+MODES = ("locked", "cas", "legacy")
+
+
+def _next_payload(store: dict[str, Any], catalog: Path, session_id: str) -> dict[str, Any]:
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    version = int(store.get("binding_version", 0)) + 1
+    entry = {
+        "actor_id": BENCH_ACTOR_ID,
+        "session_id": session_id,
+        "identity_id": "bench",
+        "catalog_path": str(catalog),
+        "binding_version": version,
+        "compare_token": str(version),
+        "bound_at": now,
+        "updated_at": now,
+    }
+    bindings = [*(store.get("bindings") or []), entry]
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "actor_id": BENCH_ACTOR_ID,
+        "catalog_path": str(catalog),
+        "binding_key_mode": DEFAULT_BINDING_KEY_MODE,
+        "binding_version": version,
+        "compare_token": str(version),
+        "session_entry_count": len(bindings),
+        "bindings": bindings,
+        "rebind_receipts": store.get("rebind_receipts") or [],
+        "updated_at": now,
+    }
+
+
+def _writer(catalog: str, writer: int, updates: int, mode: str, attempts: int) -> dict[str, Any]:
+    catalog_path = Path(catalog)
+    committed: list[str] = []
+    conflicts = 0
+    rejected = 0
+    for i in range(updates):
+        session_id = f"w{writer:03d}-u{i:04d}"
+
+        def build(store: dict[str, Any], sid: str = session_id) -> dict[str, Any]:
+            return _next_payload(store, catalog_path, sid)
+
+        if mode == "legacy":
+            # pre-lock behaviour: unguarded read-modify-write, last writer wins
+            store = load_actor_binding_store(catalog_path, BENCH_ACTOR_ID)
+            write_actor_binding_store(actor_session_path(catalog_path, BENCH_ACTOR_ID), build(store))
+            committed.append(session_id)
+        elif mode == "locked":
+            update_actor_binding_store(catalog_path, BENCH_ACTOR_ID, build)
+            committed.append(session_id)
+        else:
+            # sync_session_identity shape: token read lock-free, CAS under the lock, retry on conflict
+            for attempt in range(attempts):
+                token = actor_binding_compare_token(load_actor_binding_store(catalog_path, BENCH_ACTOR_ID))
+                try:
+                    cas_update_actor_binding_store(catalog_path, BENCH_ACTOR_ID, token, build)
+                    committed.append(session_id)
+                    break
+                except ActorBindingConflict:
+                    conflicts += 1
+                    time.sleep(min(0.05, 0.001 * (2**attempt)))
+            else:
+                rejected += 1
+    return {"writer": writer, "committed": committed, "conflicts": conflicts, "rejected": rejected}
+
+
+def run_benchmark(workdir: Path, writers: int, updates: int, mode: str, attempts: int) -> dict[str, Any]:
+    catalog = (workdir / "catalog" / "identities.yaml").resolve()
+    store_path = actor_session_path(catalog, BENCH_ACTOR_ID)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    if store_path.exists():
+        store_path.unlink()
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=writers) as pool:
+        futures = [pool.submit(_writer, str(catalog), w, updates, mode, attempts) for w in range(writers)]
+        results = [f.result() for f in futures]
+    elapsed = time.perf_counter() - started
+
+    committed = {sid for r in results for sid in r["committed"]}
+    conflicts = sum(int(r["conflicts"]) for r in results)
+    rejected = sum(int(r["rejected"]) for r in results)
+    store = load_actor_binding_store(catalog, BENCH_ACTOR_ID)
+    present = {str(x.get("session_id", "")) for x in store.get("bindings") or []}
+    lost = sorted(committed - present)
+    return {
+        "mode": mode,
+        "writers": writers,
+        "updates_per_writer": updates,
+        "attempts": attempts,
+        "committed": len(committed),
+        "cas_conflicts": conflicts,
+        "rejected_after_retries": rejected,
+        "lost_updates": len(lost),
+        "lost_sample": lost[:10],
+        "final_binding_version": store.get("binding_version", 0),
+        "version_matches_commits": int(store.get("binding_version", 0)) == len(committed),
+        "elapsed_seconds": round(elapsed, 3),
+        "committed_per_second": round(len(committed) / elapsed, 1) if elapsed > 0 else None,
+        "store_path": str(store_path),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description=(
+            "Stress the actor binding store with concurrent writer processes; reports throughput and "
+            "fails when a committed update is missing from the final store."
+        )
+    )
+    ap.add_argument("--writers", type=int, default=8, help="concurrent writer processes")
+    ap.add_argument("--updates", type=int, default=25, help="updates per writer")
+    ap.add_argument(
+        "--mode",
+        choices=MODES,
+        default="locked",
+        help="locked: update under the store lock; cas: lock-free token read + CAS retry; legacy: unlocked write",
+    )
+    ap.add_argument("--attempts", type=int, default=64, help="cas mode: attempts per update before it is rejected")
+    ap.add_argument("--workdir", default="", help="scratch directory (default: a fresh temp dir)")
+    args = ap.parse_args(argv)
+
+    if args.writers < 1 or args.updates < 1:
+        print("[FAIL] --writers and --updates must be >= 1")
+        return 2
+    if args.workdir.strip():
+        result = run_benchmark(Path(args.workdir).expanduser(), args.writers, args.updates, args.mode, args.attempts)
+    else:
+        with tempfile.TemporaryDirectory(prefix="actor-binding-bench-") as tmp:
+            result = run_benchmark(Path(tmp), args.writers, args.updates, args.mode, args.attempts)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    ok = result["lost_updates"] == 0 and result["version_matches_commits"]
+    if args.mode != "legacy" and not ok:
+        print("[FAIL] actor binding store lost updates under concurrent writers")
+        return 1
+    print(f"[{'OK' if ok else 'INFO'}] mode={args.mode} lost_updates={result['lost_updates']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from generate_synthetic_identity_catalog import generate_synthetic_catalog, identity_home_env
+from validator_timing_common import (
+    TIMING_ENV_DIR,
+    TIMING_ENV_ORCHESTRATOR,
+    TIMING_ENV_RUN_ID,
+    load_validator_timings,
+    measure_validator,
+    record_validator_timing,
+    run_measured,
+    summarize_validator_timings,
+    validator_timing_path,
+)
+
+BENCHMARK_SCHEMA = "identity_governance_benchmark_v1"
+SUITES = ("scan", "readiness", "e2e")
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BENCHMARK_ROOT = Path("/tmp/identity-governance-benchmark")
+DEFAULT_BASELINE = DEFAULT_BENCHMARK_ROOT / "baseline.json"
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _suite_cmd(suite: str, catalog: Path, identity_ids: list[str], out_dir: Path, repeat: int) -> tuple[list[str], dict[str, str]]:
+    env: dict[str, str] = {}
+    if suite == "scan":
+        cmd = [
+            sys.executable,
+            "scripts/full_identity_protocol_scan.py",
+            "--project-catalog",
+            str(catalog),
+            "--global-catalog",
+            str(out_dir / "no-global-catalog.yaml"),
+            "--no-cache",
+            "--out",
+            str(out_dir / f"scan-{repeat}.json"),
+        ]
+    elif suite == "readiness":
+        cmd = [
+            sys.executable,
+            "scripts/release_readiness_check.py",
+            "--identity-id",
+            identity_ids[0],
+            "--catalog",
+            str(catalog),
+            "--no-cache",
+            "--execution-report-policy",
+            "warn",
+            "--baseline-policy",
+            "warn",
+        ]
+    else:
+        cmd = ["bash", "scripts/e2e_smoke_test.sh"]
+        env = {"IDENTITY_CATALOG": str(catalog), "IDENTITY_IDS": identity_ids[0]}
+    return cmd, env
+
+
+def run_suite(
+    suite: str,
+    catalog: Path,
+    identity_ids: list[str],
+    out_dir: Path,
+    repeat: int,
+    run_id: str,
+    timing_dir: Path,
+    base_env: dict[str, str],
+) -> dict[str, Any]:
+    cmd, extra_env = _suite_cmd(suite, catalog, identity_ids, out_dir, repeat)
+    env = dict(os.environ)
+    env.update(base_env)
+    env.update(extra_env)
+    env.update(
+        {
+            TIMING_ENV_RUN_ID: run_id,
+            TIMING_ENV_DIR: str(timing_dir),
+            TIMING_ENV_ORCHESTRATOR: suite,
+            "IDENTITY_VALIDATOR_CACHE": "0",
+        }
+    )
+    log_path = out_dir / f"{suite}-{repeat}.log"
+    with log_path.open("w", encoding="utf-8") as log, measure_validator("suite") as timing:
+        p = run_measured(cmd, timing, stdout=log, stderr=subprocess.STDOUT, text=True, cwd=str(REPO_ROOT), env=env)
+        timing.rc = p.returncode
+    # the suite's own wall time is a row too, so regressions outside validators still show up
+    record_validator_timing(cmd, timing, orchestrator="benchmark_governance_suite", env=env)
+    return {"suite": suite, "repeat": repeat, "run_id": run_id, "rc": p.returncode, "wall_ms": timing.wall_ms, "log": str(log_path)}
+
+
+def compare_to_baseline(
+    current: dict[str, dict[str, dict[str, Any]]],
+    baseline: dict[str, dict[str, dict[str, Any]]],
+    *,
+    threshold: float,
+    min_delta_ms: int,
+) -> list[dict[str, Any]]:
+    """Validators whose p50 or p95 wall time grew by more than ``threshold`` x and ``min_delta_ms``."""
+    regressions: list[dict[str, Any]] = []
+    for suite, validators in current.items():
+        for name, stats in validators.items():
+            base = (baseline.get(suite) or {}).get(name)
+            if not isinstance(base, dict):
+                continue
+            for metric in ("wall_ms_p50", "wall_ms_p95"):
+                now, before = float(stats.get(metric) or 0), float(base.get(metric) or 0)
+                if before <= 0 or now - before < min_delta_ms or now < before * threshold:
+                    continue
+                regressions.append(
+                    {
+                        "suite": suite,
+                        "validator": name,
+                        "metric": metric,
+                        "baseline_ms": before,
+                        "current_ms": now,
+                        "ratio": round(now / before, 3),
+                    }
+                )
+    regressions.sort(key=lambda r: r["current_ms"] - r["baseline_ms"], reverse=True)
+    return regressions
+
+
+def _print_summary(summary: dict[str, dict[str, dict[str, Any]]]) -> None:
+    for suite, validators in summary.items():
+        print(f"[TIMING] {suite}")
+        print(f"  {'validator':<56} {'n':>4} {'p50 ms':>9} {'p95 ms':>9} {'cpu p50':>9} {'rss p95 KiB':>12}")
+        ordered = sorted(validators.items(), key=lambda kv: kv[1]["wall_ms_p95"], reverse=True)
+        for name, stats in ordered:
+            print(
+                f"  {name:<56} {stats['samples']:>4} {stats['wall_ms_p50']:>9.0f} {stats['wall_ms_p95']:>9.0f} "
+                f"{stats['cpu_ms_p50']:>9.0f} {stats['max_rss_kb_p95']:>12.0f}"
+            )
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Benchmark the governance suite (full scan, release readiness, e2e) with per-validator p50/p95 timings."
+    )
+    ap.add_argument("--identities", type=int, default=10, help="synthetic identities to register in the benchmark catalog")
+    ap.add_argument("--catalog", default="", help="benchmark an existing catalog instead of generating one")
+    ap.add_argument("--identity-ids", default="", help="targets for readiness/e2e (comma separated); default first catalog identity")
+    ap.add_argument("--suites", default=",".join(SUITES), help=f"comma separated subset of {','.join(SUITES)}")
+    ap.add_argument("--repeat", type=int, default=3, help="runs per suite")
+    ap.add_argument("--workdir", default="", help="benchmark work directory (default: fresh temp dir)")
+    ap.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="stored baseline summary to compare against")
+    ap.add_argument("--write-baseline", action="store_true", help="store this run's summary as the new baseline")
+    ap.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    ap.add_argument("--min-delta-ms", type=int, default=50, help="ignore slowdowns smaller than this (timer noise)")
+    ap.add_argument("--fail-on-regression", action="store_true", help="exit 1 when a validator regressed")
+    ap.add_argument("--out", default="", help="write the benchmark report JSON here")
+    args = ap.parse_args(argv)
+
+    suites = [s.strip() for s in args.suites.split(",") if s.strip()]
+    unknown = [s for s in suites if s not in SUITES]
+    if unknown:
+        print(f"[FAIL] unknown suites: {unknown}")
+        return 1
+    workdir = Path(args.workdir).expanduser().resolve() if args.workdir else Path(tempfile.mkdtemp(prefix="identity-governance-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    bench_id = f"bench-{int(time.time())}-{os.getpid()}"
+
+    base_env: dict[str, str] = {}
+    if args.catalog:
+        catalog = Path(args.catalog).expanduser().resolve()
+    else:
+        identity_home = workdir / "codex" / "identity"
+        print(f"[INFO] generating {args.identities} synthetic identities under {identity_home}")
+        try:
+            generated = generate_synthetic_catalog(identity_home, identities=args.identities)
+        except RuntimeError as exc:
+            print(f"[FAIL] {exc}")
+            return 1
+        catalog = Path(generated["catalog"])
+        base_env = identity_home_env(identity_home)
+    rows = (yaml.safe_load(catalog.read_text(encoding="utf-8")) or {}).get("identities") or []
+    catalog_ids = [str(r.get("id", "")) for r in rows if isinstance(r, dict) and r.get("id")]
+    identity_ids = [x.strip() for x in args.identity_ids.split(",") if x.strip()] or catalog_ids[:1]
+    if not identity_ids:
+        print(f"[FAIL] no identities in catalog: {catalog}")
+        return 1
+
+    out_dir = workdir / "runs" / bench_id
+    out_dir.mkdir(parents=True, exist_ok=True)
+    timing_dir = workdir / "timings"
+    runs: list[dict[str, Any]] = []
+    for repeat in range(max(1, args.repeat)):
+        for suite in suites:
+            run_id = f"{bench_id}-{suite}-{repeat}"
+            row = run_suite(suite, catalog, identity_ids, out_dir, repeat, run_id, timing_dir, base_env)
+            print(f"[RUN] {suite} #{repeat} rc={row['rc']} wall={row['wall_ms']}ms log={row['log']}")
+            runs.append(row)
+
+    store = validator_timing_path({TIMING_ENV_DIR: str(timing_dir)})
+    summary = {
+        suite: summarize_validator_timings(
+            load_validator_timings(store, run_ids=[r["run_id"] for r in runs if r["suite"] == suite])
+        )
+        for suite in suites
+    }
+    _print_summary(summary)
+
+    baseline_path = Path(args.baseline).expanduser()
+    baseline_doc: dict[str, Any] = {}
+    if baseline_path.exists():
+        try:
+            baseline_doc = json.loads(baseline_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            baseline_doc = {}
+    regressions = compare_to_baseline(
+        summary,
+        baseline_doc.get("suites") or {} if baseline_doc.get("schema") == BENCHMARK_SCHEMA else {},
+        threshold=args.threshold,
+        min_delta_ms=args.min_delta_ms,
+    )
+    for r in regressions:
+        print(
+            f"[WARN] regression {r['suite']}/{r['validator']} {r['metric']}: "
+            f"{r['baseline_ms']:.0f}ms -> {r['current_ms']:.0f}ms (x{r['ratio']})"
+        )
+    if baseline_doc and not regressions:
+        print(f"[OK] no validator slower than x{args.threshold} (+{args.min_delta_ms}ms) vs baseline {baseline_path}")
+
+    report = {
+        "schema": BENCHMARK_SCHEMA,
+        "benchmark_id": bench_id,
+        "generated_at": _utc_now(),
+        "catalog": str(catalog),
+        "identity_count": len(catalog_ids),
+        "identity_ids": identity_ids,
+        "repeat": max(1, args.repeat),
+        "timing_store": str(store),
+        "runs": runs,
+        "suites": summary,
+        "baseline": str(baseline_path) if baseline_doc else "",
+        "regressions": regressions,
+    }
+    if args.write_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"[OK] baseline written: {baseline_path}")
+    if args.out:
+        out = Path(args.out).expanduser()
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"[OK] report written: {out}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
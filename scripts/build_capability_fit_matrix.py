@@ -8,6 +8,7 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, resolve_pack_and_task
 
 STATUS_SKIPPED_NOT_REQUIRED = "SKIPPED_NOT_REQUIRED"
@@ -21,9 +22,9 @@ ERR_SELECTED_PLAN_INVALID = "IP-CFIT-BLD-003"
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -102,7 +103,7 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Build deterministic capability-fit matrix (inventory-first + compose-before-discover).")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -115,7 +116,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
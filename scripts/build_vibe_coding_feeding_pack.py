@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import argparse
-import glob
 import hashlib
 import json
 from pathlib import Path
 from typing import Any
 
+from feedback_batch_common import feedback_artifacts_present, feedback_batch_sha256, resolve_feedback_batches
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, resolve_pack_and_task
 
 STATUS_SKIPPED_NOT_REQUIRED = "SKIPPED_NOT_REQUIRED"
@@ -40,9 +41,9 @@ SENSITIVE_HINTS = (
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -62,34 +63,6 @@ def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
     return {}
 
 
-def _feedback_artifacts_present(pack_path: Path) -> bool:
-    root = (pack_path / "runtime" / "protocol-feedback" / "outbox-to-protocol").resolve()
-    return root.exists() and any(p.is_file() for p in root.rglob("FEEDBACK_BATCH_*"))
-
-
-def _resolve_latest_feedback_batch(pack_path: Path, pattern: str) -> Path | None:
-    raw = str(pattern or "").strip() or "runtime/protocol-feedback/outbox-to-protocol/FEEDBACK_BATCH_*.md"
-    p = Path(raw).expanduser()
-    has_magic = any(ch in raw for ch in ["*", "?", "["])
-    hits: list[Path] = []
-    if p.is_absolute():
-        if has_magic:
-            hits = [Path(x).expanduser().resolve() for x in glob.glob(str(p))]
-        elif p.exists():
-            hits = [p.resolve()]
-    else:
-        preferred = sorted(pack_path.glob(raw))
-        if preferred:
-            hits = [x.resolve() for x in preferred]
-        else:
-            hits = [x.resolve() for x in Path(".").glob(raw)]
-    hits = [x for x in hits if x.exists() and x.is_file()]
-    if not hits:
-        return None
-    hits.sort(key=lambda x: x.stat().st_mtime)
-    return hits[-1]
-
-
 def _sha256(path: Path) -> str:
     h = hashlib.sha256()
     with path.open("rb") as f:
@@ -108,7 +81,7 @@ def _contains_sensitive(content: str) -> bool:
     return any(token.lower() in low for token in SENSITIVE_HINTS)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Build deterministic vibe-coding feeding pack from protocol-feedback evidence.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -120,7 +93,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -137,7 +110,7 @@ def main() -> int:
     contract = _select_contract(task)
     required = contract_required(contract) if contract else False
     auto_required_signal = False
-    if not required and _feedback_artifacts_present(pack_path):
+    if not required and feedback_artifacts_present(pack_path):
         auto_required_signal = True
 
     payload: dict[str, Any] = {
@@ -173,7 +146,7 @@ def main() -> int:
         if p.exists() and p.is_file():
             batch_path = p
     else:
-        batch_path = _resolve_latest_feedback_batch(pack_path, pattern)
+        batch_path = next(reversed(resolve_feedback_batches(pack_path, pattern)), None)
 
     if batch_path is None:
         payload["vibe_coding_feeding_pack_status"] = STATUS_WARN_NON_BLOCKING
@@ -182,7 +155,7 @@ def main() -> int:
         _emit(payload, json_only=args.json_only)
         return 0
 
-    batch_sha = _sha256(batch_path)
+    batch_sha = feedback_batch_sha256(pack_path, batch_path)
     pack_id = hashlib.sha256(f"{args.identity_id}|{batch_path}|{batch_sha}|v1".encode("utf-8")).hexdigest()[:12]
     out_root = Path(args.out_root).expanduser().resolve()
     pack_root = (out_root / f"{args.identity_id}-{pack_id}").resolve()
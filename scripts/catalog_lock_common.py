@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator
+
+import yaml
+
+from file_lock_common import exclusive_file_lock, lock_path_for
+
+CATALOG_LOCK_TIMEOUT_SECONDS = 60.0
+CATALOG_LOCK_BACKOFF_SECONDS = 0.005
+CATALOG_LOCK_BACKOFF_MAX_SECONDS = 0.25
+
+# catalog paths whose lock this process already holds (the lock is re-entrant per process)
+_HELD: dict[str, int] = {}
+
+
+@contextlib.contextmanager
+def catalog_write_lock(path: Path, *, timeout_seconds: float = CATALOG_LOCK_TIMEOUT_SECONDS) -> Iterator[None]:
+    """
+    Exclusive lock on ``<catalog>.lock`` serializing catalog writers across processes
+    (parallel upgrade waves, installers, pack registration). Hold it around the whole
+    read-modify-write; nested use in the same process does not re-acquire. ``TimeoutError``
+    after ``timeout_seconds``. Readers stay lock-free because writes replace the file atomically.
+    """
+    key = str(Path(path).expanduser().resolve())
+    if key in _HELD:
+        _HELD[key] += 1
+        try:
+            yield
+        finally:
+            _HELD[key] -= 1
+        return
+    with exclusive_file_lock(
+        lock_path_for(Path(key)),
+        timeout_seconds=timeout_seconds,
+        backoff_seconds=CATALOG_LOCK_BACKOFF_SECONDS,
+        backoff_max_seconds=CATALOG_LOCK_BACKOFF_MAX_SECONDS,
+        label="catalog write lock",
+    ):
+        _HELD[key] = 1
+        try:
+            yield
+        finally:
+            del _HELD[key]
+
+
+def write_catalog_text(path: Path, text: str) -> None:
+    """Replace the catalog with ``text`` atomically under its write lock (also used for rollbacks)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with catalog_write_lock(path):
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.chmod(tmp, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+
+def write_catalog_yaml(path: Path, data: dict[str, Any]) -> None:
+    """Dump ``data`` to the catalog under its write lock, replacing the file atomically."""
+    write_catalog_text(path, yaml.safe_dump(data, sort_keys=False, allow_unicode=True))
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+CHECK_LOG_COMPRESSIONS = ("gzip", "none")
+DEFAULT_CHECK_LOG_COMPRESSION = "gzip"
+DEFAULT_CHECK_LOG_KEEP_RUNS = 20
+DEFAULT_CHECK_LOG_MAX_BYTES = 0  # no size cap unless configured
+CHECK_LOG_RE = re.compile(r"^(?P<run_id>.+)-check-(?P<idx>\d+)\.log(?P<gz>\.gz)?$")
+_CHUNK = 1 << 16
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(str(os.environ.get(name, "")).strip() or default)
+    except ValueError:
+        return default
+
+
+def default_check_log_compression() -> str:
+    raw = str(os.environ.get("IDENTITY_CHECK_LOG_COMPRESSION", "")).strip().lower()
+    return raw if raw in CHECK_LOG_COMPRESSIONS else DEFAULT_CHECK_LOG_COMPRESSION
+
+
+def default_check_log_keep_runs() -> int:
+    return _env_int("IDENTITY_CHECK_LOG_KEEP_RUNS", DEFAULT_CHECK_LOG_KEEP_RUNS)
+
+
+def default_check_log_max_bytes() -> int:
+    return _env_int("IDENTITY_CHECK_LOG_MAX_BYTES", DEFAULT_CHECK_LOG_MAX_BYTES)
+
+
+@dataclass(frozen=True)
+class CheckLogPolicy:
+    """How the executor stores check logs: compression plus the per-identity retention limits."""
+
+    compression: str = DEFAULT_CHECK_LOG_COMPRESSION
+    keep_runs: int = DEFAULT_CHECK_LOG_KEEP_RUNS
+    max_bytes: int = DEFAULT_CHECK_LOG_MAX_BYTES
+
+    @classmethod
+    def from_env(cls) -> "CheckLogPolicy":
+        return cls(default_check_log_compression(), default_check_log_keep_runs(), default_check_log_max_bytes())
+
+    def path(self, log_dir: Path, run_id: str, idx: int) -> Path:
+        return check_log_path(log_dir, run_id, idx, self.compression)
+
+    def retain(self, log_dir: Path, run_id: str) -> list[Path]:
+        return prune_check_logs(log_dir, keep_runs=self.keep_runs, max_bytes=self.max_bytes, protect=[run_id])
+
+
+def check_log_path(log_dir: Path, run_id: str, idx: int, compression: str = DEFAULT_CHECK_LOG_COMPRESSION) -> Path:
+    suffix = ".log.gz" if compression == "gzip" else ".log"
+    return log_dir / f"{run_id}-check-{idx:02d}{suffix}"
+
+
+def write_check_log(path: Path, parts: Iterable[str]) -> str:
+    """
+    Write the log text ``parts`` to ``path`` (gzip-compressed when it ends in ``.gz``) and return
+    the sha256 of the uncompressed text, hashed while writing instead of re-reading the file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as raw:
+        # mtime=0 keeps the compressed bytes a pure function of the log text
+        sink = gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) if path.suffix == ".gz" else raw
+        try:
+            for part in parts:
+                data = part.encode("utf-8")
+                for start in range(0, len(data), _CHUNK):
+                    chunk = data[start : start + _CHUNK]
+                    digest.update(chunk)
+                    sink.write(chunk)
+        finally:
+            if sink is not raw:
+                sink.close()
+    os.replace(tmp, path)
+    return digest.hexdigest()
+
+
+def open_check_log(path: Path) -> io.BufferedIOBase:
+    """Binary stream over the uncompressed log, whether it was stored as ``.log`` or ``.log.gz``."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    return path.open("rb")
+
+
+def read_check_log(path: Path) -> str:
+    with open_check_log(path) as f:
+        return f.read().decode("utf-8", errors="replace")
+
+
+def check_log_sha256(path: Path) -> str:
+    """sha256 of the uncompressed log content (the value recorded in ``check_results[].sha256``)."""
+    digest = hashlib.sha256()
+    with open_check_log(path) as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class CheckLogRun:
+    run_id: str
+    files: list[Path] = field(default_factory=list)
+    size: int = 0
+    mtime_ns: int = 0
+
+
+def _check_log_runs(log_dir: Path) -> list[CheckLogRun]:
+    runs: dict[str, CheckLogRun] = {}
+    try:
+        entries = list(os.scandir(log_dir))
+    except OSError:
+        return []
+    for entry in entries:
+        m = CHECK_LOG_RE.match(entry.name)
+        if not m or not entry.is_file():
+            continue
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        run = runs.setdefault(m.group("run_id"), CheckLogRun(run_id=m.group("run_id")))
+        run.files.append(Path(entry.path))
+        run.size += st.st_size
+        run.mtime_ns = max(run.mtime_ns, st.st_mtime_ns)
+    return sorted(runs.values(), key=lambda r: (r.mtime_ns, r.run_id), reverse=True)
+
+
+def prune_check_logs(log_dir: Path, *, keep_runs: int, max_bytes: int = 0, protect: Iterable[str] = ()) -> list[Path]:
+    """
+    Retention for one identity's check logs: keep the newest ``keep_runs`` runs (0 = unlimited),
+    then drop the oldest remaining runs while the directory exceeds ``max_bytes`` (0 = no cap).
+    Runs in ``protect`` (the current run) are never removed. Returns the deleted files.
+    """
+    protected = set(protect)
+    runs = _check_log_runs(log_dir)
+    doomed: list[CheckLogRun] = []
+    kept: list[CheckLogRun] = []
+    for run in runs:
+        if run.run_id not in protected and keep_runs > 0 and len(kept) >= keep_runs:
+            doomed.append(run)
+        else:
+            kept.append(run)
+    if max_bytes > 0:
+        total = sum(r.size for r in kept)
+        for run in reversed(list(kept)):
+            if total <= max_bytes:
+                break
+            if run.run_id in protected:
+                continue
+            kept.remove(run)
+            doomed.append(run)
+            total -= run.size
+    removed: list[Path] = []
+    for run in doomed:
+        for path in run.files:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            removed.append(path)
+    return sorted(removed)
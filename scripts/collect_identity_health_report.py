@@ -236,7 +236,7 @@ def _parse_json_payload(raw: str) -> dict[str, Any] | None:
     return data if isinstance(data, dict) else None
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Collect identity health report with actionable recommendations.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default="")
@@ -251,7 +251,7 @@ def main() -> int:
     ap.add_argument("--actor-id", default="")
     ap.add_argument("--out-dir", default="/tmp/identity-health-reports")
     ap.add_argument("--enforce-pass", action="store_true", help="return non-zero if any check fails")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog = args.catalog.strip() or str((Path.home() / ".codex" / "identity" / "catalog.local.yaml").resolve())
     execution_report = str(args.execution_report or "").strip()
@@ -32,13 +32,13 @@ def _format_source_entry(src: dict[str, Any]) -> str:
     return ""
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser()
     p.add_argument("--catalog", default="identity/catalog/identities.yaml")
     p.add_argument("--output", default="identity/runtime/IDENTITY_COMPILED.md")
     p.add_argument("--identity-id", default="", help="explicit identity id for identity-neutral baseline")
     p.add_argument("--actor-id", default="", help="optional actor id used for actor-scoped identity resolution")
-    args = p.parse_args()
+    args = p.parse_args(argv)
 
     catalog_path = Path(args.catalog)
     catalog = load_yaml(catalog_path)
@@ -3,13 +3,13 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from actor_session_common import load_actor_binding, resolve_actor_id
+from governed_reply_pipeline_common import run_reply_stage
 from response_stamp_common import (
     ALLOWED_SOURCE_LAYERS,
     ALLOWED_WORK_LAYERS,
@@ -18,6 +18,7 @@ from response_stamp_common import (
     resolve_layer_intent,
     resolve_stamp_context,
 )
+from result_channel_common import print_result
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent
@@ -38,27 +39,16 @@ def _load_body(args: argparse.Namespace) -> str:
     return text
 
 
-def _json_payload(raw: str) -> dict[str, Any]:
-    text = str(raw or "").strip()
-    if not text:
-        return {}
-    try:
-        doc = json.loads(text)
-    except Exception:
-        return {}
-    return doc if isinstance(doc, dict) else {}
-
-
 def _emit(payload: dict[str, Any], *, json_only: bool, composed_reply: str) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
         return
     print(composed_reply.rstrip())
     print("")
-    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    print_result(payload, ensure_ascii=False, indent=2)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description=(
             "Compose governed reply with mandatory first-line Identity-Context stamp, "
@@ -81,7 +71,7 @@ def main() -> int:
     ap.add_argument("--preflight-receipt-out", default="")
     ap.add_argument("--outlet-channel-id", default="governed_adapter_v1")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -220,8 +210,7 @@ def main() -> int:
         validate_cmd += ["--blocker-receipt-out", str(args.blocker_receipt_out).strip()]
     if str(args.layer_intent_text or "").strip():
         validate_cmd += ["--layer-intent-text", str(args.layer_intent_text).strip()]
-    proc = subprocess.run(validate_cmd, capture_output=True, text=True, cwd=str(REPO_ROOT))
-    validate_payload = _json_payload(proc.stdout)
+    send_time_rc, validate_payload = run_reply_stage(validate_cmd, REPO_ROOT)
 
     default_preflight_receipt = (Path("/tmp") / f"identity-governed-outlet-preflight-{args.identity_id}.json").resolve()
     preflight_receipt_path: Path | None = (
@@ -253,7 +242,7 @@ def main() -> int:
     except Exception:
         preflight_receipt_path = None
 
-    if proc.returncode != 0 and not out_reply:
+    if send_time_rc != 0 and not out_reply:
         # keep temporary reply evidence for strict fail-closed replay
         pass
 
@@ -272,7 +261,7 @@ def main() -> int:
         "send_time_gate_status": str(validate_payload.get("send_time_gate_status", "")),
         "send_time_error_code": str(validate_payload.get("error_code", "")),
         "error_code": str(validate_payload.get("error_code", "")),
-        "send_time_rc": proc.returncode,
+        "send_time_rc": send_time_rc,
         "reply_first_line_status": str(validate_payload.get("reply_first_line_status", "")),
         "reply_evidence_mode": str(validate_payload.get("reply_evidence_mode", "")),
         "reply_transport_ref": str(validate_payload.get("reply_transport_ref", "")),
@@ -294,7 +283,7 @@ def main() -> int:
         out_json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
     _emit(payload, json_only=args.json_only, composed_reply=composed_reply)
-    return 0 if proc.returncode == 0 else 1
+    return 0 if send_time_rc == 0 else 1
 
 
 if __name__ == "__main__":
@@ -27,12 +27,12 @@ def _default_protocol_home() -> Path:
     return Path.cwd().resolve()
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Write shared runtime path config for identity protocol tooling.")
     ap.add_argument("--identity-home", default=str(_default_identity_home()))
     ap.add_argument("--protocol-home", default=str(_default_protocol_home()))
     ap.add_argument("--config-path", default=str(_default_identity_home() / "config" / "runtime-paths.env"))
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     config_path = Path(args.config_path).expanduser().resolve()
     config_path.parent.mkdir(parents=True, exist_ok=True)
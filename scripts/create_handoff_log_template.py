@@ -44,13 +44,13 @@ def _resolve_current_task(catalog_path: Path, identity_id: str) -> Path:
     raise FileNotFoundError(f"CURRENT_TASK.json not found for identity: {identity_id}")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Create a fresh production handoff log template")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--out", default="")
     ap.add_argument("--to-agent", default="sub-agent")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     current_task_path = _resolve_current_task(Path(args.catalog), args.identity_id)
     current_task = _load_json(current_task_path)
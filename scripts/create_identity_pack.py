@@ -13,6 +13,7 @@ from pathlib import Path
 import sys
 import yaml
 
+from catalog_lock_common import catalog_write_lock, write_catalog_yaml
 from resolve_identity_context import default_identity_home, default_local_catalog_path, default_local_instances_root
 
 
@@ -95,8 +96,20 @@ def load_yaml(path: Path):
     return yaml.safe_load(path.read_text(encoding="utf-8"))
 
 
-def dump_yaml(path: Path, data) -> None:
-    path.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
+def _rollback_catalog_registration(
+    catalog_path: Path, identity_id: str, original_text: str, registered_text: str | None
+) -> None:
+    # restore the exact previous catalog unless another writer changed it since; then only drop our row
+    with catalog_write_lock(catalog_path):
+        current = catalog_path.read_text(encoding="utf-8") if catalog_path.exists() else ""
+        if current == registered_text:
+            catalog_path.write_text(original_text, encoding="utf-8")
+            return
+        catalog = yaml.safe_load(current) or {}
+        catalog["identities"] = [x for x in (catalog.get("identities") or []) if (x or {}).get("id") != identity_id]
+        if catalog.get("default_identity") == identity_id:
+            catalog["default_identity"] = (yaml.safe_load(original_text) or {}).get("default_identity", "")
+        write_catalog_yaml(catalog_path, catalog)
 
 
 def _is_within(path: Path, root: Path) -> bool:
@@ -1684,7 +1697,7 @@ def _scan_domain_residue(pack_dir: Path) -> list[str]:
     return findings
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     identity_home = default_identity_home()
     ap = argparse.ArgumentParser()
     ap.add_argument("--id", required=True)
@@ -1729,7 +1742,7 @@ def main() -> int:
         action="store_true",
         help="Skip runtime sample bootstrap copy (boundary tests / advanced workflows only).",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     identity_id = args.id.strip()
     if not identity_id:
@@ -1906,47 +1919,50 @@ def main() -> int:
     print(f"[OK] created replay sample: {replay_sample_path}")
 
     catalog_original_text: str | None = None
+    catalog_registered_text: str | None = None
     catalog_path.parent.mkdir(parents=True, exist_ok=True)
     catalog_mutated = False
     if args.register:
-        if not catalog_path.exists():
-            if args.repo_fixture:
-                print(f"[FAIL] catalog file not found: {catalog_path}")
+        with catalog_write_lock(catalog_path):
+            if not catalog_path.exists():
+                if args.repo_fixture:
+                    print(f"[FAIL] catalog file not found: {catalog_path}")
+                    return 1
+                write_catalog_yaml(
+                    catalog_path,
+                    {
+                        "version": "1.0",
+                        "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+                        "default_identity": "",
+                        "identities": [],
+                    },
+                )
+            catalog_original_text = catalog_path.read_text(encoding="utf-8")
+            catalog = load_yaml(catalog_path) or {}
+            identities = catalog.get("identities", [])
+            if any((x or {}).get("id") == identity_id for x in identities):
+                print(f"[FAIL] id already exists in catalog: {identity_id}")
                 return 1
-            dump_yaml(
-                catalog_path,
+
+            identities.append(
                 {
-                    "version": "1.0",
-                    "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-                    "default_identity": "",
-                    "identities": [],
-                },
+                    "id": identity_id,
+                    "title": args.title,
+                    "description": args.description,
+                    "status": "active" if args.activate else "inactive",
+                    "methodology_version": "v1.2.3",
+                    "profile": identity_profile,
+                    "runtime_mode": identity_runtime_mode,
+                    "pack_path": str(pack_dir),
+                    "tags": ["identity"],
+                }
             )
-        catalog_original_text = catalog_path.read_text(encoding="utf-8")
-        catalog = load_yaml(catalog_path) or {}
-        identities = catalog.get("identities", [])
-        if any((x or {}).get("id") == identity_id for x in identities):
-            print(f"[FAIL] id already exists in catalog: {identity_id}")
-            return 1
-
-        identities.append(
-            {
-                "id": identity_id,
-                "title": args.title,
-                "description": args.description,
-                "status": "active" if args.activate else "inactive",
-                "methodology_version": "v1.2.3",
-                "profile": identity_profile,
-                "runtime_mode": identity_runtime_mode,
-                "pack_path": str(pack_dir),
-                "tags": ["identity"],
-            }
-        )
-        catalog["identities"] = identities
-        if args.set_default:
-            catalog["default_identity"] = identity_id
-        dump_yaml(catalog_path, catalog)
-        catalog_mutated = True
+            catalog["identities"] = identities
+            if args.set_default:
+                catalog["default_identity"] = identity_id
+            write_catalog_yaml(catalog_path, catalog)
+            catalog_registered_text = catalog_path.read_text(encoding="utf-8")
+            catalog_mutated = True
         print(f"[OK] registered identity in catalog: {catalog_path}")
 
     if not args.skip_bootstrap_check:
@@ -1976,7 +1992,9 @@ def main() -> int:
             rc = subprocess.call(cmd)
             if rc != 0:
                 if catalog_mutated and catalog_original_text is not None:
-                    catalog_path.write_text(catalog_original_text, encoding="utf-8")
+                    _rollback_catalog_registration(
+                        catalog_path, identity_id, catalog_original_text, catalog_registered_text
+                    )
                     print("[ROLLBACK] restored catalog after bootstrap failure")
                 print("[FAIL] bootstrap validation failed")
                 return rc
@@ -6,7 +6,7 @@ import json
 from pathlib import Path
 from typing import Any
 
-import yaml
+from identity_catalog_common import catalog_row, load_json_document, load_yaml_document
 
 
 DEFAULT_TOP3_THRESHOLDS = {
@@ -36,23 +36,21 @@ FINAL_CLAIM_REQUIRED_FIELDS = ("user_turn_ref", "artifact_ref")
 
 
 def load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = load_yaml_document(path) or {}
     if not isinstance(data, dict):
         raise ValueError(f"yaml root must be object: {path}")
     return data
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_json_document(path)
     if not isinstance(data, dict):
         raise ValueError(f"json root must be object: {path}")
     return data
 
 
 def resolve_pack_and_task(catalog_path: Path, identity_id: str) -> tuple[Path, Path]:
-    catalog = load_yaml(catalog_path)
-    rows = [x for x in (catalog.get("identities") or []) if isinstance(x, dict)]
-    row = next((x for x in rows if str(x.get("id", "")).strip() == identity_id), None)
+    row = catalog_row(catalog_path, identity_id)
     if not row:
         raise FileNotFoundError(f"identity not found in catalog: {identity_id}")
     pack_raw = str((row or {}).get("pack_path", "")).strip()
@@ -5,6 +5,7 @@ Validate command snippets in governance docs against current script contracts.
 Scope:
 - ensures referenced scripts exist
 - for python script commands, verifies referenced CLI flags appear in `--help` output
+  (read statically from the script's argparse calls; `--help` is only run for dynamic parsers)
 
 This is a lightweight guardrail to prevent "doc command drift".
 
@@ -17,15 +18,20 @@ IMPORTANT:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import re
 import shlex
 import subprocess
 import sys
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, List, Set, Tuple
 
+from argparse_surface_common import static_help_flags
 
 INDEX_PATH = "docs/governance/AUDIT_SNAPSHOT_INDEX.md"
+HELP_SOURCES = ("auto", "subprocess")
+# (script sha256, subcommand path, help source) -> flags
+_HELP_FLAGS_CACHE: Dict[Tuple[str, Tuple[str, ...], str], Set[str]] = {}
 REQUIRED_CURRENT_DOC_PATTERNS = [
     r"^docs/governance/identity-token-efficiency-and-skill-parity-governance-v\d+\.\d+\.\d+\.md$",
     r"^docs/governance/identity-token-governance-audit-checklist-v\d+\.\d+\.\d+\.md$",
@@ -144,7 +150,7 @@ def parse_script_command(cmd: str) -> Tuple[str | None, List[str], bool, List[st
     return script_path, flags, is_python, subcommands
 
 
-def load_help_flags(script_path: Path, subcommands: List[str]) -> Set[str]:
+def _run_help_flags(script_path: Path, subcommands: List[str]) -> Set[str]:
     cmd = [sys.executable, str(script_path), *subcommands, "--help"]
     proc = subprocess.run(
         cmd,
@@ -156,7 +162,21 @@ def load_help_flags(script_path: Path, subcommands: List[str]) -> Set[str]:
     return set(re.findall(r"(--[a-zA-Z0-9][a-zA-Z0-9\\-]*)", output))
 
 
-def main() -> int:
+def load_help_flags(script_path: Path, subcommands: List[str], help_source: str = "auto") -> Set[str]:
+    """Flags in `<script> [subcommands] --help`, memoized per (script sha256, subcommand path)."""
+    raw = script_path.read_bytes()
+    key = (hashlib.sha256(raw).hexdigest(), tuple(subcommands), help_source)
+    flags = _HELP_FLAGS_CACHE.get(key)
+    if flags is None:
+        if help_source == "auto":
+            flags = static_help_flags(raw.decode("utf-8", errors="replace"), subcommands)
+        if flags is None:
+            flags = _run_help_flags(script_path, subcommands)
+        _HELP_FLAGS_CACHE[key] = flags
+    return set(flags)
+
+
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Validate governance-doc command snippets against script contracts."
     )
@@ -166,7 +186,13 @@ def main() -> int:
         default=None,
         help="markdown docs to scan (default: dynamic list from AUDIT_SNAPSHOT_INDEX.md + required current docs)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--help-source",
+        choices=HELP_SOURCES,
+        default="auto",
+        help="auto: static argparse extraction with --help fallback; subprocess: always run --help",
+    )
+    args = parser.parse_args(argv)
 
     repo_root = Path.cwd()
     docs = args.docs if args.docs else _docs_from_index(repo_root)
@@ -213,7 +239,7 @@ def main() -> int:
                     )
                     continue
                 if is_python:
-                    help_flags = load_help_flags(script_path, subcommands)
+                    help_flags = load_help_flags(script_path, subcommands, args.help_source)
                     for flag in flags:
                         # allow aliases in prose-style snippets using "..." or placeholders
                         if flag not in help_flags and "..." not in cmd_snippet:
@@ -21,6 +21,25 @@ fi
 echo "$HERMETIC_PAYLOAD"
 echo "[INFO] hermetic runtime import preflight PASS"
 
+# Serve validator command lines from a warm worker (started on demand, exits when idle).
+# The hermetic import preflight above must keep its fresh interpreter.
+# IDENTITY_VALIDATOR_WORKER=0 runs every validator in a new python3 process.
+if [ "${IDENTITY_VALIDATOR_WORKER:-1}" != "0" ]; then
+  python3() {
+    case "${1:-}" in
+      scripts/validate_*.py | scripts/run_cached_validator.py)
+        command python3 -S scripts/validator_worker.py run "$@"
+        ;;
+      *)
+        command python3 "$@"
+        ;;
+    esac
+  }
+fi
+
+# Rows the worker appends to the validator timing store are attributed to this runner.
+export IDENTITY_TIMING_ORCHESTRATOR="${IDENTITY_TIMING_ORCHESTRATOR:-e2e_smoke_test}"
+
 CATALOG_PATH=${IDENTITY_CATALOG:-}
 if [ -z "$CATALOG_PATH" ]; then
   echo "[FAIL] IDENTITY_CATALOG is required (implicit catalog fallback is disabled)."
@@ -69,7 +88,7 @@ BASE_SHA_GLOBAL="$(git rev-parse HEAD~1)"
 HEAD_SHA_GLOBAL="$(git rev-parse HEAD)"
 
 echo "[1/30] validate protocol"
-python3 scripts/validate_identity_protocol.py
+python3 scripts/run_cached_validator.py scripts/validate_identity_protocol.py
 
 echo "[2/30] validate local-instance persistence boundary"
 python3 scripts/validate_identity_local_persistence.py
@@ -78,7 +97,7 @@ echo "[2.2/30] validate identity creation boundary regression"
 python3 scripts/validate_identity_creation_boundary.py
 
 echo "[2.5/30] validate identity state consistency (catalog vs META)"
-python3 scripts/validate_identity_state_consistency.py --catalog "$CATALOG_PATH"
+python3 scripts/run_cached_validator.py scripts/validate_identity_state_consistency.py --catalog "$CATALOG_PATH"
 
 echo "[2.55/30] validate session pointer consistency (catalog-scoped canonical + legacy mirror)"
 python3 scripts/validate_identity_session_pointer_consistency.py --catalog "$CATALOG_PATH"
@@ -232,7 +251,7 @@ for ID in $IDS; do
 done
 
 echo "[8/30] validate manifest semantics"
-python3 scripts/validate_identity_manifest.py
+python3 scripts/run_cached_validator.py scripts/validate_identity_manifest.py
 
 echo "[9/30] test discovery contract"
 python3 scripts/test_identity_discovery_contract.py >/tmp/identity_discovery_contract.protocol_repo.json
@@ -253,7 +272,7 @@ for ID in $IDS; do
   python3 scripts/validate_identity_actor_health_profile.py --identity-id "$ID" --report-dir /tmp/identity-health-reports --operation e2e --json-only
 
   echo "[11/30][$ID] validate runtime ORRLC contract"
-  python3 scripts/validate_identity_runtime_contract.py --catalog "$CATALOG_PATH" --identity-id "$ID"
+  python3 scripts/run_cached_validator.py scripts/validate_identity_runtime_contract.py --catalog "$CATALOG_PATH" --identity-id "$ID"
 
   echo "[12/30][$ID] validate role-binding contract"
   python3 scripts/validate_identity_role_binding.py --catalog "$CATALOG_PATH" --identity-id "$ID"
@@ -358,7 +377,7 @@ for ID in $IDS; do
 
   echo "[12.5/30][$ID] validate identity prompt quality"
   # scope is resolved from bound catalog/runtime context; avoid hard-coded scope injection drift.
-  python3 scripts/validate_identity_prompt_quality.py --catalog "$CATALOG_PATH" --identity-id "$ID"
+  python3 scripts/run_cached_validator.py scripts/validate_identity_prompt_quality.py --catalog "$CATALOG_PATH" --identity-id "$ID"
 
   echo "[13/30][$ID] validate update prereq baseline gate"
   python3 scripts/validate_identity_upgrade_prereq.py --catalog "$CATALOG_PATH" --identity-id "$ID"
@@ -14,8 +14,13 @@ from typing import Any
 
 import yaml
 
+from check_log_store_common import CHECK_LOG_COMPRESSIONS, CheckLogPolicy, write_check_log
+from execution_report_index_common import record_execution_report
+from git_facts_common import rev_parse
 from response_stamp_common import DEFAULT_WORK_LAYER, resolve_layer_intent
 from resolve_identity_context import collect_protocol_evidence, default_identity_home, resolve_identity
+from result_channel_common import run_with_result_channel
+from validator_timing_common import timed_validator
 
 PROTOCOL_PUBLISH_CHECKS = {
     "scripts/validate_changelog_updated.py",
@@ -119,6 +124,11 @@ def _write_json(path: Path, data: dict[str, Any]) -> None:
     path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
+def _write_report(path: Path, data: dict[str, Any], index_roots: list[Path]) -> None:
+    _write_json(path, data)
+    record_execution_report(path, index_roots)
+
+
 def _resolve_pack(catalog_path: Path, identity_id: str) -> Path:
     catalog = _load_yaml(catalog_path)
     identities = catalog.get("identities") or []
@@ -274,26 +284,35 @@ def _sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
-def _run(cmd: list[str], log_dir: Path, run_id: str, idx: int, *, cwd: Path | None = None) -> dict[str, Any]:
+def _run(
+    cmd: list[str],
+    log_dir: Path,
+    run_id: str,
+    idx: int,
+    *,
+    cwd: Path | None = None,
+    log_policy: CheckLogPolicy | None = None,
+) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    """Check row for the report plus the validator's result-channel payload (None when it publishes none)."""
+    log_policy = log_policy or CheckLogPolicy.from_env()
     start = datetime.now(timezone.utc)
     t0 = time()
-    p = subprocess.run(cmd, capture_output=True, text=True, cwd=str(cwd) if cwd else None)
+    with timed_validator(cmd) as timing:
+        p, result = run_with_result_channel(cmd, cwd=str(cwd) if cwd else None, timing=timing)
+        timing.rc = p.returncode
     end = datetime.now(timezone.utc)
     elapsed_ms = int((time() - t0) * 1000)
-    log_path = log_dir / f"{run_id}-check-{idx:02d}.log"
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    log_content = (
+    log_path = log_policy.path(log_dir, run_id, idx)
+    header = (
         f"$ {' '.join(cmd)}\n"
         f"[cwd] {str(cwd) if cwd else str(Path.cwd())}\n"
         f"[exit_code] {p.returncode}\n"
         f"[started_at] {start.strftime('%Y-%m-%dT%H:%M:%SZ')}\n"
         f"[ended_at] {end.strftime('%Y-%m-%dT%H:%M:%SZ')}\n\n"
-        f"[stdout]\n{p.stdout}\n"
-        f"[stderr]\n{p.stderr}\n"
     )
-    log_path.write_text(log_content, encoding="utf-8")
-    log_sha256 = _sha256_file(log_path)
-    return {
+    # sha256 covers the uncompressed log text and is computed while the log is written
+    log_sha256 = write_check_log(log_path, [header, "[stdout]\n", p.stdout, "\n[stderr]\n", p.stderr, "\n"])
+    row = {
         "command": " ".join(cmd),
         "cmd": " ".join(cmd),
         "code": p.returncode,
@@ -308,10 +327,11 @@ def _run(cmd: list[str], log_dir: Path, run_id: str, idx: int, *, cwd: Path | No
         "cwd": str(cwd) if cwd else str(Path.cwd()),
         "sha256": log_sha256,
     }
+    return row, result
 
 
 def _extract_baseline_signal(
-    checks: list[dict[str, Any]],
+    checks: list[tuple[dict[str, Any], dict[str, Any] | None]],
     *,
     protocol_head_sha_at_run_start: str,
 ) -> dict[str, Any]:
@@ -323,11 +343,12 @@ def _extract_baseline_signal(
         "baseline_status": "UNKNOWN",
         "baseline_error_code": "",
     }
-    for row in checks:
+    for row, result in checks:
         cmd = str(row.get("cmd", "")).strip()
         if "validate_identity_protocol_baseline_freshness.py" not in cmd:
             continue
-        payload = _parse_json_payload(str(row.get("stdout", "")).strip()) or {}
+        # the stored stdout is truncated; the channel payload is always complete
+        payload = result if result is not None else (_parse_json_payload(str(row.get("stdout", "")).strip()) or {})
         if not isinstance(payload, dict):
             return default
         out = dict(default)
@@ -354,18 +375,19 @@ def _build_skipped_check_results(
     run_id: str,
     reason: str,
     exit_code: int = 97,
+    log_policy: CheckLogPolicy | None = None,
 ) -> list[dict[str, Any]]:
     """
     Build synthetic check/check_results rows for recoverable preflight-blocked flows.
     Keeps report contract machine-auditable while preserving fail-operational semantics.
     """
+    log_policy = log_policy or CheckLogPolicy.from_env()
     start = datetime.now(timezone.utc)
     started = start.strftime("%Y-%m-%dT%H:%M:%SZ")
     rows: list[dict[str, Any]] = []
-    log_dir.mkdir(parents=True, exist_ok=True)
     for i, cmd in enumerate(check_cmds, start=1):
         ended = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        log_path = log_dir / f"{run_id}-check-{i:02d}.log"
+        log_path = log_policy.path(log_dir, run_id, i)
         log_content = (
             f"$ {' '.join(cmd)}\n"
             f"[exit_code] {exit_code}\n"
@@ -375,8 +397,7 @@ def _build_skipped_check_results(
             f"[stderr]\n"
             f"skipped_preflight_blocked: {reason}\n"
         )
-        log_path.write_text(log_content, encoding="utf-8")
-        log_sha256 = _sha256_file(log_path)
+        log_sha256 = write_check_log(log_path, [log_content])
         rows.append(
             {
                 "command": " ".join(cmd),
@@ -393,20 +414,17 @@ def _build_skipped_check_results(
                 "sha256": log_sha256,
             }
         )
+    log_policy.retain(log_dir, run_id)
     return rows
 
 
 def _resolve_git_range() -> tuple[str, str]:
-    def _git(cmd: list[str]) -> str:
-        p = subprocess.run(["git", *cmd], capture_output=True, text=True)
-        return (p.stdout or "").strip() if p.returncode == 0 else ""
-
     base = os.environ.get("PR_BASE_SHA") or os.environ.get("GITHUB_BASE_SHA") or os.environ.get("PUSH_BEFORE_SHA") or os.environ.get("GITHUB_EVENT_BEFORE") or ""
     head = os.environ.get("PR_HEAD_SHA") or os.environ.get("GITHUB_SHA") or ""
     if not head:
-        head = _git(["rev-parse", "HEAD"])
+        head = rev_parse("HEAD")
     if not base:
-        base = _git(["rev-parse", "HEAD~1"])
+        base = rev_parse("HEAD~1")
     return base or "HEAD~1", head or "HEAD"
 
 
@@ -876,8 +894,8 @@ def _run_header_first_gate(
         cmd.extend(["--work-layer", str(expected_work_layer).strip()])
     if str(expected_source_layer or "").strip():
         cmd.extend(["--source-layer", str(expected_source_layer).strip()])
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    payload = _parse_json_payload(proc.stdout) or {}
+    proc, result = run_with_result_channel(cmd)
+    payload = result if result is not None else (_parse_json_payload(proc.stdout) or {})
     send_time_status = str(payload.get("send_time_gate_status", "")).strip().upper()
     ok = proc.returncode == 0 and send_time_status == "PASS_REQUIRED"
     return {
@@ -918,7 +936,7 @@ def _enforce_protocol_runtime_separation(
     return effective_pack
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description="Execute identity upgrade cycle using metrics + arbitration thresholds (safe-auto/review-required)."
     )
@@ -969,7 +987,31 @@ def main() -> int:
     ap.add_argument("--phase-b-strict-revalidate-status", default="NOT_APPLICABLE")
     ap.add_argument("--phase-transition-reason", default="")
     ap.add_argument("--phase-transition-error-code", default="")
-    args = ap.parse_args()
+    env_log_policy = CheckLogPolicy.from_env()
+    ap.add_argument(
+        "--check-log-compression",
+        choices=list(CHECK_LOG_COMPRESSIONS),
+        default=env_log_policy.compression,
+        help="check log storage (env IDENTITY_CHECK_LOG_COMPRESSION); sha256 always covers the uncompressed text",
+    )
+    ap.add_argument(
+        "--check-log-keep-runs",
+        type=int,
+        default=env_log_policy.keep_runs,
+        help="keep check logs of the newest N runs per identity, 0 = unlimited (env IDENTITY_CHECK_LOG_KEEP_RUNS)",
+    )
+    ap.add_argument(
+        "--check-log-max-bytes",
+        type=int,
+        default=env_log_policy.max_bytes,
+        help="drop oldest runs while an identity's check logs exceed this size, 0 = no cap (env IDENTITY_CHECK_LOG_MAX_BYTES)",
+    )
+    args = ap.parse_args(argv)
+    log_policy = CheckLogPolicy(
+        compression=args.check_log_compression,
+        keep_runs=max(0, int(args.check_log_keep_runs)),
+        max_bytes=max(0, int(args.check_log_max_bytes)),
+    )
 
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     run_id = str(args.run_id or "").strip() or f"identity-upgrade-exec-{args.identity_id}-{int(datetime.now(timezone.utc).timestamp())}"
@@ -1000,6 +1042,9 @@ def main() -> int:
     if str(out_dir).strip() in {"identity/runtime/reports", "/tmp/identity-upgrade-reports"}:
         out_dir = runtime_output_root / "reports"
     out_dir.mkdir(parents=True, exist_ok=True)
+    report_index_roots = [out_dir]
+    if _is_within(out_dir.resolve(), runtime_output_root.resolve()):
+        report_index_roots.append(runtime_output_root)
     current_task_path = pack / "CURRENT_TASK.json"
     task = _load_json(current_task_path)
     required_checks_raw = (
@@ -1112,6 +1157,7 @@ def main() -> int:
             check_cmds=check_cmds,
             log_dir=log_dir,
             run_id=run_id,
+            log_policy=log_policy,
             reason=f"pre_mutation_gate_failed:{pre_mutation_error}",
             exit_code=99,
         )
@@ -1176,7 +1222,7 @@ def main() -> int:
                 "notes": "pre-mutation gate blocked execution before any mutation",
             }
         )
-        _write_json(report_path, report)
+        _write_report(report_path, report, report_index_roots)
         print(f"report={report_path}")
         print("upgrade_required=False")
         print("all_ok=False")
@@ -1210,11 +1256,15 @@ def main() -> int:
         lane_routing_cmd.extend(["--expected-work-layer", args.expected_work_layer.strip()])
     if args.expected_source_layer.strip():
         lane_routing_cmd.extend(["--source-layer", args.expected_source_layer.strip()])
-    lane_routing_proc = subprocess.run(lane_routing_cmd, capture_output=True, text=True)
-    lane_routing_payload = _parse_json_payload(lane_routing_proc.stdout) or {}
+    lane_routing_proc, lane_routing_result = run_with_result_channel(lane_routing_cmd)
+    lane_routing_payload = (
+        lane_routing_result if lane_routing_result is not None else (_parse_json_payload(lane_routing_proc.stdout) or {})
+    )
     if lane_routing_proc.returncode != 0:
         reason = "lane_gate_set_routing_failed"
-        checks = _build_skipped_check_results(check_cmds=check_cmds, log_dir=log_dir, run_id=run_id, reason=reason, exit_code=97)
+        checks = _build_skipped_check_results(
+            check_cmds=check_cmds, log_dir=log_dir, run_id=run_id, reason=reason, exit_code=97, log_policy=log_policy
+        )
         protocol["check_results"] = checks
         now_fail = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         artifacts = {
@@ -1297,7 +1347,7 @@ def main() -> int:
             }
         )
         report_path = out_dir / f"{run_id}.json"
-        _write_json(report_path, report)
+        _write_report(report_path, report, report_index_roots)
         print(f"report={report_path}")
         print("upgrade_required=False")
         print("all_ok=False")
@@ -1360,6 +1410,7 @@ def main() -> int:
             check_cmds=check_cmds,
             log_dir=log_dir,
             run_id=run_id,
+            log_policy=log_policy,
             reason=f"capability_activation_blocked:{capability_error_code or 'IP-CAP-000'}",
         )
         report = _base_report(
@@ -1442,7 +1493,7 @@ def main() -> int:
             )
         )
         report_path = out_dir / f"{run_id}.json"
-        _write_json(report_path, report)
+        _write_report(report_path, report, report_index_roots)
         print(f"report={report_path}")
         print("upgrade_required=False")
         print("all_ok=False")
@@ -1479,6 +1530,7 @@ def main() -> int:
             check_cmds=check_cmds,
             log_dir=log_dir,
             run_id=run_id,
+            log_policy=log_policy,
             reason=f"metrics_artifact_missing:{metrics_path}",
         )
         report = _base_report(
@@ -1558,7 +1610,7 @@ def main() -> int:
             )
         )
         report_path = out_dir / f"{run_id}.json"
-        _write_json(report_path, report)
+        _write_report(report_path, report, report_index_roots)
         print(f"report={report_path}")
         print("upgrade_required=False")
         print("all_ok=False")
@@ -1705,6 +1757,7 @@ def main() -> int:
                     check_cmds=check_cmds,
                     log_dir=log_dir,
                     run_id=run_id,
+                    log_policy=log_policy,
                     reason="safe_auto_path_policy_violation",
                     exit_code=98,
                 )
@@ -1784,7 +1837,7 @@ def main() -> int:
                     )
                 )
                 report_path = out_dir / f"{run_id}.json"
-                _write_json(report_path, report)
+                _write_report(report_path, report, report_index_roots)
                 print(f"report={report_path}")
                 print("upgrade_required=True")
                 print("all_ok=False")
@@ -1875,9 +1928,14 @@ def main() -> int:
             )
 
     # Run required validators + replay-equivalent gate checks
-    checks = [_run(cmd, log_dir=log_dir, run_id=run_id, idx=i + 1, cwd=protocol_root) for i, cmd in enumerate(check_cmds)]
+    check_runs = [
+        _run(cmd, log_dir=log_dir, run_id=run_id, idx=i + 1, cwd=protocol_root, log_policy=log_policy)
+        for i, cmd in enumerate(check_cmds)
+    ]
+    log_policy.retain(log_dir, run_id)
+    checks = [row for row, _ in check_runs]
     baseline_signal = _extract_baseline_signal(
-        checks,
+        check_runs,
         protocol_head_sha_at_run_start=str(
             protocol.get("protocol_head_sha_at_run_start") or protocol.get("protocol_commit_sha") or ""
         ),
@@ -2166,7 +2224,7 @@ def main() -> int:
         }
     )
     report_path = out_dir / f"{run_id}.json"
-    _write_json(report_path, report)
+    _write_report(report_path, report, report_index_roots)
 
     print(f"report={report_path}")
     print(f"upgrade_required={upgrade_required}")
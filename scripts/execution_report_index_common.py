@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+from file_lock_common import exclusive_file_lock, lock_path_for
+
+INDEX_SCHEMA = "execution_report_index_v1"
+INDEX_FILENAME = "execution-report-index.jsonl"
+REPORT_PREFIX = "identity-upgrade-exec-"
+REPORT_SUFFIX = ".json"
+PATCH_PLAN_SUFFIX = "-patch-plan.json"
+INDEX_LOCK_TIMEOUT_SECONDS = 30.0
+INDEX_LOCK_BACKOFF_SECONDS = 0.005
+INDEX_LOCK_BACKOFF_MAX_SECONDS = 0.25
+
+# index file -> (stat key, {relative_report_path: mtime_ns}, {identity_id: [(mtime_ns, rel), ...] oldest first})
+_INDEX_ROWS: dict[str, tuple[tuple[int, int], dict[str, int], dict[str, list[tuple[int, str]]]]] = {}
+
+
+def is_execution_report_name(name: str, identity_id: str = "*") -> bool:
+    """Filename match equivalent to ``identity-upgrade-exec-<id>-*.json`` minus patch plans."""
+    normalized = str(identity_id or "").strip()
+    prefix = REPORT_PREFIX if normalized in {"", "*"} else f"{REPORT_PREFIX}{normalized}-"
+    return name.startswith(prefix) and name.endswith(REPORT_SUFFIX) and not name.endswith(PATCH_PLAN_SUFFIX)
+
+
+def index_path(root: Path) -> Path:
+    return root / INDEX_FILENAME
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _index_entry(root: Path) -> tuple[tuple[int, int], dict[str, int], dict[str, list[tuple[int, str]]]] | None:
+    path = index_path(root)
+    key = _stat_key(path)
+    if key is None:
+        return None
+    cache_key = str(path)
+    cached = _INDEX_ROWS.get(cache_key)
+    if cached is not None and cached[0] == key:
+        return cached
+    rows: dict[str, int] = {}
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    for line in lines:
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(row, dict):
+            continue
+        rel = str(row.get("path", "")).strip()
+        if rel and is_execution_report_name(Path(rel).name):
+            rows[rel] = int(row.get("mtime_ns", 0) or 0)
+    entry = (key, rows, {})
+    _INDEX_ROWS[cache_key] = entry
+    return entry
+
+
+def _load_index(root: Path) -> dict[str, int] | None:
+    """Return ``{relative_report_path: mtime_ns}`` for an index root, or None when no index exists."""
+    entry = _index_entry(root)
+    return dict(entry[1]) if entry is not None else None
+
+
+def _indexed_identity_reports(root: Path, identity_id: str) -> list[tuple[int, str]] | None:
+    """``(mtime_ns, rel)`` rows of one identity, oldest first, grouped once per index version."""
+    entry = _index_entry(root)
+    if entry is None:
+        return None
+    key = str(identity_id or "").strip() or "*"
+    group = entry[2].get(key)
+    if group is None:
+        group = sorted((mtime_ns, rel) for rel, mtime_ns in entry[1].items() if is_execution_report_name(Path(rel).name, key))
+        entry[2][key] = group
+    return group
+
+
+def _scan_tree(root: Path) -> list[Path]:
+    if not root.exists():
+        return []
+    return [p for p in root.glob(f"**/{REPORT_PREFIX}*{REPORT_SUFFIX}") if is_execution_report_name(p.name)]
+
+
+def _watched_dirs(root: Path, rels: Iterable[str]) -> set[Path]:
+    dirs = {root}
+    for rel in rels:
+        parent = Path(rel).parent
+        while parent != Path("."):
+            dirs.add(root / parent)
+            parent = parent.parent
+    return dirs
+
+
+def _refresh_from_disk(root: Path, rows: dict[str, int]) -> dict[str, int]:
+    """
+    Merge reports written after the index without re-walking the whole tree; new rows carry
+    their current mtime. Lookups use it as a staleness check (only directories on indexed
+    paths are stat'ed), recording persists what it finds.
+
+    Only directories already on an indexed path (plus the root) are watched; a directory whose
+    mtime is not older than the index is re-listed, and unseen subdirectories below it are walked.
+    Reports dropped elsewhere need ``rebuild_execution_report_index.py``.
+    """
+    index_key = _stat_key(index_path(root))
+    if index_key is None:
+        return rows
+    watched = _watched_dirs(root, rows)
+    for directory in sorted(watched):
+        dir_key = _stat_key(directory)
+        if dir_key is None or dir_key[1] < index_key[1]:
+            continue
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir() and path not in watched:
+                found = _scan_tree(path)
+            elif entry.is_file() and is_execution_report_name(entry.name):
+                found = [path]
+            else:
+                continue
+            for p in found:
+                rows.setdefault(p.relative_to(root).as_posix(), _mtime_ns(p))
+    return rows
+
+
+def _root_reports(root: Path, identity_id: str, recursive: bool) -> list[tuple[int, Path]]:
+    """``(mtime_ns, path)`` candidates under ``root``; indexed roots are not stat'ed per report."""
+    group = _indexed_identity_reports(root, identity_id)
+    if group is not None:
+        known = _load_index(root) or {}
+        fresh = _refresh_from_disk(root, dict(known))
+        if len(fresh) != len(known):
+            # reports written behind the API or lost to a concurrent rebuild: merge them in
+            extra = [(m, rel) for rel, m in fresh.items() if rel not in known and is_execution_report_name(Path(rel).name, identity_id)]
+            group = sorted([*group, *extra])
+        return [(mtime_ns, root / rel) for mtime_ns, rel in group if recursive or "/" not in rel]
+    if not root.exists():
+        return []
+    pattern = f"{REPORT_PREFIX}*{REPORT_SUFFIX}"
+    return [
+        (_mtime_ns(p), p)
+        for p in root.glob(f"**/{pattern}" if recursive else pattern)
+        if is_execution_report_name(p.name, identity_id)
+    ]
+
+
+def _mtime_ns(path: Path) -> int:
+    key = _stat_key(path)
+    return key[1] if key is not None else 0
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _candidates(identity_id: str, roots: Iterable[Path], recursive: bool) -> list[tuple[int, Path]]:
+    rows: list[tuple[int, Path]] = []
+    for root in roots:
+        rows.extend(_root_reports(Path(root), identity_id, recursive))
+    rows.sort(key=lambda row: row[0])
+    return rows
+
+
+def collect_execution_reports(
+    identity_id: str,
+    roots: Iterable[Path],
+    *,
+    recursive: bool = True,
+    newest_first: bool = False,
+) -> list[Path]:
+    """
+    Execution reports for ``identity_id`` (``*`` for all) under ``roots`` ordered by mtime.
+
+    Roots carrying an ``execution-report-index.jsonl`` are answered from the index (ordered by
+    the indexed ``mtime_ns``); other roots fall back to the legacy recursive glob. Paths are
+    returned as ``root / relative`` (unresolved); reports deleted since indexing are dropped.
+    """
+    rows = [path for _, path in _candidates(identity_id, roots, recursive) if path.is_file()]
+    if newest_first:
+        rows.reverse()
+    return rows
+
+
+def latest_execution_report(identity_id: str, roots: Iterable[Path], *, recursive: bool = True) -> Path | None:
+    """Newest report by indexed mtime; only the winner is stat'ed (older ones if it was deleted)."""
+    for _, path in reversed(_candidates(identity_id, roots, recursive)):
+        if path.is_file():
+            return path
+    return None
+
+
+def _index_row(root: Path, report: Path) -> dict[str, object] | None:
+    key = _stat_key(report)
+    if key is None:
+        return None
+    try:
+        rel = report.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        return None
+    return {
+        "schema": INDEX_SCHEMA,
+        "path": rel,
+        "mtime_ns": key[1],
+        "indexed_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+def _index_lock(root: Path):
+    return exclusive_file_lock(
+        lock_path_for(index_path(root)),
+        timeout_seconds=INDEX_LOCK_TIMEOUT_SECONDS,
+        backoff_seconds=INDEX_LOCK_BACKOFF_SECONDS,
+        backoff_max_seconds=INDEX_LOCK_BACKOFF_MAX_SECONDS,
+        label="execution report index lock",
+    )
+
+
+def rebuild_execution_report_index(root: Path) -> int:
+    """Rewrite the index for ``root`` from disk under its lock; returns the number of indexed reports."""
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    with _index_lock(root):
+        return _rebuild_locked(root)
+
+
+def _rebuild_locked(root: Path) -> int:
+    reports = sorted(_scan_tree(root), key=_mtime)
+    lines = [json.dumps(row, ensure_ascii=False) for row in (_index_row(root, p) for p in reports) if row]
+    target = index_path(root)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+    os.replace(tmp, target)
+    # the rename bumps the root's mtime; keep the index newer so lookups do not see it as stale
+    os.utime(target)
+    return len(lines)
+
+
+def record_execution_report(report: Path, index_roots: Iterable[Path] = ()) -> list[Path]:
+    """
+    Append ``report`` to the index of every ``index_roots`` entry and of every ancestor that
+    already has an index, each under the index lock. A missing index in ``index_roots`` is first
+    rebuilt from disk so previously written reports stay visible. Returns the index files touched.
+    """
+    report = Path(report).resolve()
+    targets: list[Path] = []
+    for root in index_roots:
+        resolved = Path(root).resolve()
+        if resolved not in targets:
+            targets.append(resolved)
+    for parent in report.parents:
+        if parent not in targets and index_path(parent).exists():
+            targets.append(parent)
+    touched: list[Path] = []
+    for root in targets:
+        root.mkdir(parents=True, exist_ok=True)
+        # concurrent writers (parallel upgrade waves) must not rebuild or append over each other
+        with _index_lock(root):
+            if not index_path(root).exists():
+                _rebuild_locked(root)
+                touched.append(index_path(root))
+                continue
+            # Persist reports the mtime refresh picked up, otherwise this append would hide them.
+            known = _load_index(root) or {}
+            unindexed = [root / rel for rel in _refresh_from_disk(root, dict(known)) if rel not in known]
+            rows = [_index_row(root, p) for p in sorted({*unindexed, report}, key=_mtime)]
+            lines = [json.dumps(row, ensure_ascii=False) for row in rows if row]
+            if not lines:
+                continue
+            with index_path(root).open("a", encoding="utf-8") as f:
+                f.write("".join(f"{line}\n" for line in lines))
+            touched.append(index_path(root))
+    return touched
@@ -4,26 +4,42 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import time
+from datetime import datetime, timezone
 from glob import glob
 from pathlib import Path
 from typing import Any
 
-import yaml
+from identity_catalog_common import load_current_task, load_json_document, resolve_pack_and_task
+
+ROUTE_QUALITY_STATE_SCHEMA = "route_quality_metrics_state_v1"
+COUNTER_KEYS = (
+    "route_hit_count",
+    "misroute_count",
+    "fallback_count",
+    "blocked_count",
+    "first_pass_success_count",
+    "knowledge_reuse_count",
+    "replay_success_count",
+    "policy_drift_incidents",
+)
+RATE_KEYS = {
+    "route_hit_rate": "route_hit_count",
+    "misroute_rate": "misroute_count",
+    "fallback_rate": "fallback_count",
+    "first_pass_success_rate": "first_pass_success_count",
+    "knowledge_reuse_rate": "knowledge_reuse_count",
+    "replay_success_rate": "replay_success_count",
+}
+WINDOWS = {"24h": 86400, "7d": 7 * 86400, "30d": 30 * 86400}
 
 
 def _repo_runtime_metrics_path(repo_root: Path, identity_id: str) -> Path:
     return repo_root / ".codex" / "identity" / "runtime" / identity_id / "metrics" / f"{identity_id}-route-quality.json"
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
-
-
 def _load_json(path: Path) -> dict[str, Any]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_json_document(path)
     if not isinstance(data, dict):
         raise ValueError(f"JSON root must be object: {path}")
     return data
@@ -37,27 +53,6 @@ def _is_within(path: Path, root: Path) -> bool:
         return False
 
 
-def _resolve_pack_and_task(catalog_path: Path, identity_id: str) -> tuple[Path, Path]:
-    catalog = _load_yaml(catalog_path)
-    identities = catalog.get("identities") or []
-    target = next((x for x in identities if str((x or {}).get("id", "")).strip() == identity_id), None)
-    if not target:
-        raise FileNotFoundError(f"identity id not found in catalog: {identity_id}")
-
-    pack_path = str((target or {}).get("pack_path", "")).strip()
-    if pack_path:
-        pack = Path(pack_path).expanduser().resolve()
-        p = pack / "CURRENT_TASK.json"
-        if p.exists():
-            return pack, p
-
-    legacy = Path("identity") / identity_id / "CURRENT_TASK.json"
-    if legacy.exists():
-        return legacy.parent, legacy
-
-    raise FileNotFoundError(f"CURRENT_TASK.json not found for identity: {identity_id}")
-
-
 def _pct(n: int, d: int) -> float:
     if d <= 0:
         return 0.0
@@ -71,7 +66,100 @@ def _resolve_log_files(pattern: str) -> list[Path]:
     return [p.resolve() for p in sorted(Path(".").glob(expanded))]
 
 
-def main() -> int:
+def _file_stamp(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+def _record_time(rec: dict[str, Any], stamp: list[int]) -> float:
+    # handoff logs carry generated_at (create_handoff_log_template.py); older ones fall back to mtime
+    raw = str(rec.get("generated_at") or "").strip()
+    if raw:
+        try:
+            dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return dt.timestamp()
+        except ValueError:
+            pass
+    return stamp[0] / 1e9
+
+
+def _record_counters(rec: dict[str, Any]) -> dict[str, int]:
+    rd = rec.get("route_decision") or {}
+    is_hit = bool(rd.get("route_hit", False))
+    is_misroute = bool(rd.get("misroute", False))
+    used_fallback = bool(rd.get("fallback", False))
+    result = str(rec.get("result") or "")
+    return {
+        "route_hit_count": int(is_hit),
+        "misroute_count": int(is_misroute),
+        "fallback_count": int(used_fallback),
+        "blocked_count": int(result == "BLOCKED"),
+        "first_pass_success_count": int(result == "PASS" and not used_fallback),
+        # Prefer explicit runtime fields; fallback to conservative heuristics.
+        "knowledge_reuse_count": int(
+            bool(rec.get("knowledge_reuse", False)) or bool((rec.get("rulebook_update") or {}).get("applied", False))
+        ),
+        "replay_success_count": int(str(rec.get("replay_status") or "").upper() == "PASS"),
+        "policy_drift_incidents": int(bool(rec.get("policy_drift", False)) or bool(rec.get("contract_violation", False))),
+    }
+
+
+def _rollup(entries: list[dict[str, Any]]) -> dict[str, Any]:
+    total = len(entries)
+    out: dict[str, Any] = {"total_routes": total}
+    for key in COUNTER_KEYS:
+        out[key] = sum(int((e.get("counters") or {}).get(key, 0)) for e in entries)
+    for rate, key in RATE_KEYS.items():
+        out[rate] = _pct(out[key], total)
+    return out
+
+
+def _load_state(path: Path, identity_id: str, pattern: str) -> dict[str, Any]:
+    try:
+        doc = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return {}
+    if (
+        not isinstance(doc, dict)
+        or doc.get("schema") != ROUTE_QUALITY_STATE_SCHEMA
+        or doc.get("identity_id") != identity_id
+        or doc.get("source_pattern") != pattern
+        or not isinstance(doc.get("files"), dict)
+    ):
+        return {}
+    return doc
+
+
+def _aggregate(files: list[Path], state: dict[str, Any]) -> tuple[dict[str, dict[str, Any]], int, int]:
+    """
+    Per-file contributions for ``files``: entries whose (mtime, size, inode) still match the
+    previous state are reused, new or changed logs are parsed, and logs no longer matching the
+    pattern drop out. Returns (entries, parsed, reused).
+    """
+    previous = state.get("files") or {}
+    entries: dict[str, dict[str, Any]] = {}
+    parsed = 0
+    for p in files:
+        stamp = _file_stamp(p)
+        old = previous.get(str(p))
+        if isinstance(old, dict) and old.get("stamp") == stamp:
+            entries[str(p)] = old
+            continue
+        rec = _load_json(p)
+        entries[str(p)] = {"stamp": stamp, "record_time": _record_time(rec, stamp), "counters": _record_counters(rec)}
+        parsed += 1
+    return entries, parsed, len(entries) - parsed
+
+
+def _write_state(path: Path, doc: dict[str, Any]) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(doc, ensure_ascii=False) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Export route quality metrics from handoff production logs")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-id", required=True)
@@ -81,10 +169,18 @@ def main() -> int:
         action="store_true",
         help="explicitly allow fallback output under <repo>/.codex/identity/runtime for fixture/debug only",
     )
-    args = ap.parse_args()
+    ap.add_argument(
+        "--state",
+        default="",
+        help="per-log contribution state (default: <out dir>/<identity-id>-route-quality.state.json)",
+    )
+    ap.add_argument("--full-rescan", action="store_true", help="ignore the saved state and parse every handoff log")
+    args = ap.parse_args(argv)
 
-    pack_path, task_path = _resolve_pack_and_task(Path(args.catalog).expanduser().resolve(), args.identity_id)
-    task = _load_json(task_path)
+    pack_path, task_path = resolve_pack_and_task(
+        Path(args.catalog).expanduser().resolve(), args.identity_id, legacy_fallback=True
+    )
+    task = load_current_task(task_path)
 
     contract = task.get("agent_handoff_contract") or {}
     pattern = str(contract.get("handoff_log_path_pattern") or "")
@@ -97,68 +193,6 @@ def main() -> int:
         print(f"[FAIL] no handoff logs for metrics: pattern={pattern}")
         return 1
 
-    total = 0
-    route_hit = 0
-    misroute = 0
-    fallback = 0
-    blocked = 0
-    first_pass_success = 0
-    knowledge_reuse = 0
-    replay_success = 0
-    policy_drift_incidents = 0
-
-    for p in files:
-        rec = _load_json(p)
-        total += 1
-
-        rd = rec.get("route_decision") or {}
-        is_hit = bool(rd.get("route_hit", False))
-        is_misroute = bool(rd.get("misroute", False))
-        used_fallback = bool(rd.get("fallback", False))
-
-        result = str(rec.get("result") or "")
-        if result == "BLOCKED":
-            blocked += 1
-        if result == "PASS" and not used_fallback:
-            first_pass_success += 1
-
-        if is_hit:
-            route_hit += 1
-        if is_misroute:
-            misroute += 1
-        if used_fallback:
-            fallback += 1
-
-        # Prefer explicit runtime fields; fallback to conservative heuristics.
-        if bool(rec.get("knowledge_reuse", False)) or bool((rec.get("rulebook_update") or {}).get("applied", False)):
-            knowledge_reuse += 1
-        if str(rec.get("replay_status") or "").upper() == "PASS":
-            replay_success += 1
-
-        if bool(rec.get("policy_drift", False)) or bool(rec.get("contract_violation", False)):
-            policy_drift_incidents += 1
-
-    metrics = {
-        "identity_id": args.identity_id,
-        "task_id": str(task.get("task_id") or ""),
-        "source_pattern": pattern,
-        "total_routes": total,
-        "route_hit_count": route_hit,
-        "misroute_count": misroute,
-        "fallback_count": fallback,
-        "blocked_count": blocked,
-        "first_pass_success_count": first_pass_success,
-        "knowledge_reuse_count": knowledge_reuse,
-        "replay_success_count": replay_success,
-        "policy_drift_incidents": policy_drift_incidents,
-        "route_hit_rate": _pct(route_hit, total),
-        "misroute_rate": _pct(misroute, total),
-        "fallback_rate": _pct(fallback, total),
-        "first_pass_success_rate": _pct(first_pass_success, total),
-        "knowledge_reuse_rate": _pct(knowledge_reuse, total),
-        "replay_success_rate": _pct(replay_success, total),
-    }
-
     if args.out:
         out = Path(args.out).expanduser().resolve()
     else:
@@ -189,9 +223,42 @@ def main() -> int:
         print(f"       out={out}")
         return 1
     out.parent.mkdir(parents=True, exist_ok=True)
+    state_path = (
+        Path(args.state).expanduser().resolve()
+        if args.state
+        else out.with_name(f"{args.identity_id}-route-quality.state.json")
+    )
+    state = {} if args.full_rescan else _load_state(state_path, args.identity_id, pattern)
+    entries, parsed, reused = _aggregate(files, state)
+
+    now = time.time()
+    rows = list(entries.values())
+    metrics = {
+        "identity_id": args.identity_id,
+        "task_id": str(task.get("task_id") or ""),
+        "source_pattern": pattern,
+        **_rollup(rows),
+        # rolling windows over each log's generated_at (file mtime when absent)
+        "windows": {
+            name: _rollup([e for e in rows if now - float(e.get("record_time") or 0) <= seconds])
+            for name, seconds in WINDOWS.items()
+        },
+    }
     out.write_text(json.dumps(metrics, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    _write_state(
+        state_path,
+        {
+            "schema": ROUTE_QUALITY_STATE_SCHEMA,
+            "identity_id": args.identity_id,
+            "source_pattern": pattern,
+            # newest handoff log folded in (mtime / record time)
+            "watermark_mtime_ns": max((int(e["stamp"][0]) for e in rows), default=0),
+            "watermark_record_time": max((float(e.get("record_time") or 0) for e in rows), default=0.0),
+            "files": entries,
+        },
+    )
 
-    print(f"[OK] route quality metrics exported: {out}")
+    print(f"[OK] route quality metrics exported: {out} (parsed={parsed} reused={reused})")
     print(json.dumps(metrics, ensure_ascii=False))
     return 0
 
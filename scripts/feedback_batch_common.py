@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import copy
+import glob
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from private_dir_common import private_dir, user_tmp_dir
+
+DEFAULT_FEEDBACK_BATCH_PATTERN = "runtime/protocol-feedback/outbox-to-protocol/FEEDBACK_BATCH_*.md"
+FEEDBACK_BATCH_INDEX_SCHEMA = "identity_feedback_batch_index_v2"
+DEFAULT_FEEDBACK_BATCH_INDEX_DIR = user_tmp_dir("identity-feedback-batch-index")
+FEEDBACK_BATCH_INDEX_ENV = ("IDENTITY_FEEDBACK_BATCH_INDEX", "IDENTITY_FEEDBACK_BATCH_INDEX_DIR")
+
+# (raw text, JSON root object or {}) -> JSON-serializable facts
+Extractor = Callable[[str, dict[str, Any]], dict[str, Any]]
+
+_INDEXES: dict[str, "FeedbackBatchIndex"] = {}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _stat_key(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+def feedback_batch_index_enabled() -> bool:
+    return str(os.environ.get("IDENTITY_FEEDBACK_BATCH_INDEX", "1")).strip().lower() not in {"0", "false", "off", "no"}
+
+
+def feedback_artifacts_present(pack_path: Path) -> bool:
+    root = (pack_path / "runtime" / "protocol-feedback" / "outbox-to-protocol").resolve()
+    return root.exists() and any(p.is_file() for p in root.rglob("FEEDBACK_BATCH_*"))
+
+
+def resolve_feedback_batches(pack_root: Path, pattern: str, *, fallback_root: Path = Path(".")) -> list[Path]:
+    """Batch files matching ``pattern`` (pack-relative first, then ``fallback_root``), oldest mtime first."""
+    raw = str(pattern or "").strip() or DEFAULT_FEEDBACK_BATCH_PATTERN
+    p = Path(raw).expanduser()
+    has_magic = any(ch in raw for ch in ["*", "?", "["])
+    hits: list[Path] = []
+    if p.is_absolute():
+        if has_magic:
+            hits = [Path(x).expanduser().resolve() for x in glob.glob(str(p))]
+        elif p.exists():
+            hits = [p.resolve()]
+    else:
+        preferred = sorted(pack_root.glob(raw))
+        if preferred:
+            hits = [x.resolve() for x in preferred]
+        else:
+            hits = [x.resolve() for x in fallback_root.glob(raw)]
+    hits = [x for x in hits if x.is_file()]
+    hits.sort(key=lambda x: x.stat().st_mtime)
+    return hits
+
+
+def read_feedback_batch(path: Path) -> tuple[str, dict[str, Any]]:
+    """Raw text plus the JSON root object (``{}`` for markdown batches)."""
+    raw = path.read_text(encoding="utf-8", errors="ignore")
+    try:
+        obj = json.loads(raw)
+    except Exception:
+        return raw, {}
+    return raw, obj if isinstance(obj, dict) else {}
+
+
+def _extractor_key(extractor: Extractor) -> str:
+    # Facts are invalidated when the module defining the extractor (or this module) changes.
+    module = sys.modules.get(extractor.__module__)
+    stamps = [_stat_key(Path(str(getattr(module, "__file__", "") or ""))), _stat_key(Path(__file__))]
+    digest = hashlib.sha256(json.dumps(stamps).encode("utf-8")).hexdigest()[:16]
+    name = Path(str(getattr(module, "__file__", "") or extractor.__module__)).stem
+    return f"{name}.{extractor.__qualname__}:{digest}"
+
+
+class FeedbackBatchIndex:
+    """
+    Per-pack index of parsed feedback batches keyed by (path, mtime_ns, size, inode). Each batch row
+    keeps the sha256 of the file plus the facts every extractor has derived from it, so
+    validators only read and parse batches that changed since any of them last looked.
+    """
+
+    def __init__(self, pack_root: Path, path: Path | None) -> None:
+        self.pack_root = pack_root
+        self.path = path
+        self.batches: dict[str, dict[str, Any]] = {}
+        self.dirty = False
+        self.parsed = 0
+        self.reused = 0
+        if path is not None:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            if isinstance(data, dict) and data.get("schema") == FEEDBACK_BATCH_INDEX_SCHEMA:
+                self.batches = {str(k): v for k, v in (data.get("batches") or {}).items() if isinstance(v, dict)}
+
+    def _row(self, batch: Path, verify: bool = False) -> tuple[dict[str, Any], tuple[str, dict[str, Any]] | None]:
+        resolved = str(batch.resolve())
+        key = _stat_key(batch)
+        row = self.batches.get(resolved)
+        data: bytes | None = None
+        if row is not None and key is not None and row.get("key") == key:
+            if not verify:
+                return row, None
+            # stat keys survive same-size rewrites with a preserved mtime; content hashes do not
+            data = batch.read_bytes()
+            if hashlib.sha256(data).hexdigest() == row.get("sha256"):
+                return row, None
+        if data is None:
+            data = batch.read_bytes()
+        raw = data.decode("utf-8", errors="ignore")
+        try:
+            obj = json.loads(raw)
+        except Exception:
+            obj = {}
+        row = {"key": key, "sha256": hashlib.sha256(data).hexdigest(), "facts": {}}
+        self.batches[resolved] = row
+        self.dirty = True
+        return row, (raw, obj if isinstance(obj, dict) else {})
+
+    def facts(self, batch: Path, extractor: Extractor, variant: str = "", verify: bool = False) -> dict[str, Any]:
+        # ``variant`` separates results of one extractor run with different settings (e.g. patterns)
+        name = _extractor_key(extractor) + (f"/{variant}" if variant else "")
+        row, loaded = self._row(batch, verify)
+        hit = (row.get("facts") or {}).get(name)
+        if isinstance(hit, dict):
+            self.reused += 1
+            return copy.deepcopy(hit)
+        raw, obj = loaded if loaded is not None else read_feedback_batch(batch)
+        value = extractor(raw, obj)
+        row.setdefault("facts", {})[name] = copy.deepcopy(value)
+        self.parsed += 1
+        self.dirty = True
+        return value
+
+    def sha256(self, batch: Path) -> str:
+        # published as evidence: always hashed from the bytes, never taken from a stat-keyed row
+        row, _ = self._row(batch, verify=True)
+        return str(row.get("sha256", ""))
+
+    def save(self) -> None:
+        if self.path is None or not self.dirty:
+            return
+        # drop rows for batches that were removed or rewritten since they were indexed
+        self.batches = {k: v for k, v in self.batches.items() if _stat_key(Path(k)) == v.get("key")}
+        doc = {
+            "schema": FEEDBACK_BATCH_INDEX_SCHEMA,
+            "pack_root": str(self.pack_root),
+            "updated_at": _utc_now(),
+            "batches": self.batches,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", dir=str(self.path.parent))
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(doc, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            return  # the index is an optimisation only
+        self.dirty = False
+
+
+def feedback_batch_index(pack_root: Path) -> FeedbackBatchIndex:
+    resolved = Path(pack_root).expanduser().resolve()
+    hit = _INDEXES.get(str(resolved))
+    if hit is not None:
+        return hit
+    path: Path | None = None
+    if feedback_batch_index_enabled():
+        # the indexed facts feed routing and trust-chain verdicts: only persist them where no other user can write
+        root = private_dir(Path(os.environ.get("IDENTITY_FEEDBACK_BATCH_INDEX_DIR", "") or DEFAULT_FEEDBACK_BATCH_INDEX_DIR))
+        if root is not None:
+            path = root / f"{hashlib.sha256(str(resolved).encode('utf-8')).hexdigest()[:24]}.json"
+    index = FeedbackBatchIndex(resolved, path)
+    _INDEXES[str(resolved)] = index
+    return index
+
+
+def feedback_batch_facts(
+    pack_root: Path, batches: Iterable[Path], extractor: Extractor, *, variant: str = "", verify: bool = False
+) -> list[dict[str, Any]]:
+    """
+    ``extractor`` facts for each batch, served from the pack index when the batch is unchanged.
+    ``verify`` (fail-closed checks) also re-hashes every batch and only reuses facts whose
+    recorded sha256 still matches the content.
+    """
+    index = feedback_batch_index(pack_root)
+    out = [index.facts(Path(b), extractor, variant, verify) for b in batches]
+    index.save()
+    return out
+
+
+def feedback_batch_sha256(pack_root: Path, batch: Path) -> str:
+    index = feedback_batch_index(pack_root)
+    digest = index.sha256(Path(batch))
+    index.save()
+    return digest
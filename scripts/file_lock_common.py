@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import contextlib
+import os
+import random
+import time
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts fall back to unlocked writes
+    fcntl = None  # type: ignore[assignment]
+
+
+def lock_path_for(path: Path) -> Path:
+    """Sidecar ``<file>.lock``: files replaced by rename cannot carry their own ``flock``."""
+    return path.with_name(path.name + ".lock")
+
+
+@contextlib.contextmanager
+def exclusive_file_lock(
+    lock_path: Path,
+    *,
+    timeout_seconds: float,
+    backoff_seconds: float,
+    backoff_max_seconds: float,
+    label: str = "file lock",
+) -> Iterator[None]:
+    """
+    Exclusive ``fcntl`` lock on ``lock_path``. Non-blocking attempts back off exponentially
+    (with jitter) until ``timeout_seconds``, then ``TimeoutError("<label> timeout: ...")``.
+    A no-op where ``fcntl`` is unavailable.
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout_seconds
+        attempt = 0
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"{label} timeout: {lock_path}")
+                delay = min(backoff_max_seconds, backoff_seconds * (2**attempt))
+                time.sleep(delay * (0.5 + random.random() / 2))
+                attempt += 1
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
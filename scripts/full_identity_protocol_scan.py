@@ -2,16 +2,80 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
-import subprocess
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 from actor_session_common import resolve_actor_id
+from execution_report_index_common import latest_execution_report
+from git_facts_common import publish_git_facts, release_git_facts
 from response_stamp_common import DEFAULT_WORK_LAYER, resolve_layer_intent
+from result_channel_common import Record
+from scan_manifest_common import (
+    DEFAULT_SCAN_MANIFEST,
+    DEFAULT_SCAN_MANIFEST_TTL_SECONDS,
+    ScanManifest,
+    git_head,
+    identity_input_fingerprint,
+    scan_unit_key,
+    scripts_signature,
+)
+from task_scheduler_common import TaskScheduler
+from validator_registry_common import (
+    VALIDATOR_MODE_INPROCESS,
+    VALIDATOR_MODES,
+    default_validator_mode,
+    run_validator,
+)
+from validator_result_cache_common import ValidatorResultCache, default_validator_cache
+
+
+# Artifact hand-offs between checks of one identity (stamp render -> stamp/reply gates, etc.).
+SCAN_CHECK_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "response_stamp_validation": ("response_stamp_render",),
+    "response_stamp_blocker_receipt": ("response_stamp_validation",),
+    "reply_identity_context_first_line": ("response_stamp_render",),
+    "layer_intent_resolution": ("response_stamp_render",),
+    "send_time_reply_gate_validate": ("send_time_reply_gate",),
+    "execution_reply_identity_coherence": ("response_stamp_render",),
+}
+# Checks that write pack runtime state (protocol-feedback lanes, receipts, generated packs) or
+# replay other writers. They run after every earlier check, and every later check waits for them,
+# so parallel scans observe the same pack state as the sequential order.
+SCAN_BARRIER_CHECKS = frozenset(
+    {
+        "headstamp_recurrence_closure",
+        "instance_protocol_split_receipt",
+        "discovery_requiredization",
+        "vibe_coding_feeding_pack",
+        "capability_fit_matrix_builder",
+        "work_layer_gate_set_routing",
+        "protocol_feedback_bootstrap_ready",
+        "protocol_entry_candidate_bridge",
+        "protocol_inquiry_followup_chain",
+        "protocol_feedback_ssot_archival",
+        "required_contract_coverage",
+    }
+)
+
+
+@dataclass
+class ScanOptions:
+    repo_root: Path
+    repo_catalog: Path
+    actor_id: str
+    layer_intent_text: str
+    expected_work_layer: str
+    expected_source_layer: str
+    with_docs_contract: bool
+    validator_mode: str
+    cache: ValidatorResultCache | None = None
+    progress: bool = False
 
 
 @dataclass
@@ -21,6 +85,8 @@ class CheckResult:
     tail: str = ""
     stdout: str = ""
     stderr: str = ""
+    # payload published on the validator result channel; None falls back to parsing stdout
+    result: dict[str, Any] | None = None
 
 
 def _resolve_applied_gate_set(*, layer_intent_text: str, expected_work_layer: str, expected_source_layer: str) -> str:
@@ -39,12 +105,25 @@ def _resolve_applied_gate_set(*, layer_intent_text: str, expected_work_layer: st
     return "dual_unroutable"
 
 
-def _run(cmd: list[str], cwd: Path, env: dict[str, str] | None = None) -> CheckResult:
-    p = subprocess.run(cmd, capture_output=True, text=True, cwd=str(cwd), env=env)
-    out = (p.stdout or "").strip()
-    err = (p.stderr or "").strip()
+def _run(
+    cmd: list[str],
+    cwd: Path,
+    env: dict[str, str] | None = None,
+    mode: str = VALIDATOR_MODE_INPROCESS,
+    cache: ValidatorResultCache | None = None,
+    progress_label: str = "",
+) -> CheckResult:
+    on_event = functools.partial(_print_progress, progress_label) if progress_label else None
+    p = run_validator(cmd, cwd=cwd, env=env, mode=mode, cache=cache, on_event=on_event)
+    out = p.stdout.strip()
+    err = p.stderr.strip()
     tail = out.splitlines()[-1] if out else (err.splitlines()[-1] if err else "")
-    return CheckResult(rc=p.returncode, ok=p.returncode == 0, tail=tail, stdout=out, stderr=err)
+    return CheckResult(rc=p.rc, ok=p.rc == 0, tail=tail, stdout=out, stderr=err, result=p.result)
+
+
+def _print_progress(label: str, record: Record) -> None:
+    fields = " ".join(f"{k}={v}" for k, v in record.items() if k not in {"schema", "type", "stage", "ts"})
+    print(f"[progress] {label} {record.get('stage', '')} {fields}".rstrip(), file=sys.stderr, flush=True)
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
@@ -77,15 +156,21 @@ def _parse_json_safely(raw: str) -> dict[str, Any] | None:
     return None
 
 
-def _extract_capability_signal(raw: str) -> tuple[str, str]:
+def _result_doc(r: CheckResult) -> dict[str, Any] | None:
+    return r.result if r.result is not None else _result_doc(r)
+
+
+def _extract_capability_signal(r: CheckResult) -> tuple[str, str]:
     """
-    Best-effort parser for capability preflight output.
-    Handles mixed stdout with leading [WARN]/[FAIL] lines + trailing JSON payload.
+    Capability preflight status/code from the result channel, else a best-effort parse of
+    mixed stdout with leading [WARN]/[FAIL] lines + trailing JSON payload.
     """
-    text = (raw or "").strip()
-    if not text:
+    text = (r.stdout or "").strip()
+    payload: dict[str, Any] | None = r.result
+    if payload is None and not text:
         return "", ""
-    payload: dict[str, Any] | None = _parse_json_safely(text)
+    if payload is None:
+        payload = _parse_json_safely(text)
     if payload is None:
         start = text.find("{")
         end = text.rfind("}")
@@ -113,17 +198,7 @@ def _replace_activation_policy(cmd: list[str], policy: str) -> list[str]:
 
 
 def _latest_runtime_report(identity_id: str, report_dir: Path) -> Path | None:
-    if not report_dir.exists():
-        return None
-    rows = [
-        p
-        for p in report_dir.glob(f"identity-upgrade-exec-{identity_id}-*.json")
-        if not p.name.endswith("-patch-plan.json")
-    ]
-    if not rows:
-        return None
-    rows.sort(key=lambda p: p.stat().st_mtime)
-    return rows[-1]
+    return latest_execution_report(identity_id, [report_dir], recursive=False)
 
 
 def _scope_hint_for_row(layer: str, row: dict[str, Any]) -> str:
@@ -272,7 +347,1833 @@ def _severity_for_row(row: dict[str, Any]) -> str:
     return "OK"
 
 
-def main() -> int:
+def _run_check(
+    name: str,
+    cmd: list[str],
+    cwd: Path,
+    mode: str,
+    cache: ValidatorResultCache | None = None,
+    progress_label: str = "",
+) -> tuple[CheckResult, CheckResult | None]:
+    r = _run(cmd, cwd=cwd, mode=mode, cache=cache, progress_label=progress_label)
+    fallback: CheckResult | None = None
+    if name == "capability_activation_preflight" and r.rc != 0:
+        _, cap_code = _extract_capability_signal(r)
+        if cap_code == "IP-CAP-003":
+            fallback = _run(
+                _replace_activation_policy(cmd, "route-any-ready"),
+                cwd=cwd,
+                mode=mode,
+                cache=cache,
+                progress_label=progress_label,
+            )
+    return r, fallback
+
+
+def _check_payload(name: str, r: CheckResult, fallback: CheckResult | None) -> dict[str, Any]:
+    check_payload: dict[str, Any] = {"rc": r.rc, "ok": r.ok, "tail": r.tail}
+    if name in {"capability_activation_preflight", "capability_activation_report"}:
+        cap_status, cap_code = _extract_capability_signal(r)
+        if cap_status:
+            check_payload["capability_activation_status"] = cap_status
+        if cap_code:
+            check_payload["capability_activation_error_code"] = cap_code
+        if cap_code == "IP-CAP-003":
+            check_payload["env_auth_blocked"] = True
+        if fallback is not None:
+            fb_status, fb_code = _extract_capability_signal(fallback)
+            check_payload["capability_activation_fallback_attempted"] = True
+            check_payload["capability_activation_fallback_policy"] = "route-any-ready"
+            check_payload["capability_activation_fallback_rc"] = fallback.rc
+            check_payload["capability_activation_fallback_tail"] = fallback.tail
+            if fb_status:
+                check_payload["capability_activation_fallback_status"] = fb_status
+            if fb_code:
+                check_payload["capability_activation_fallback_error_code"] = fb_code
+            if fallback.ok:
+                check_payload["rc"] = 0
+                check_payload["ok"] = True
+                check_payload["tail"] = fallback.tail
+                check_payload["capability_activation_status"] = fb_status or "ACTIVATED"
+                check_payload["capability_activation_error_code"] = fb_code
+                check_payload["capability_activation_policy_effective"] = "route-any-ready"
+    if name == "required_contract_coverage":
+        coverage_doc = _result_doc(r) or {}
+        for k in (
+            "required_contract_total",
+            "required_contract_passed",
+            "required_contract_coverage_rate",
+            "discovery_required_total",
+            "discovery_required_passed",
+            "discovery_required_coverage_rate",
+            "discovery_required_gate_failed",
+            "skipped_contract_count",
+            "failed_required_contract_count",
+            "failed_optional_contract_count",
+        ):
+            if k in coverage_doc:
+                check_payload[k] = coverage_doc.get(k)
+    if name == "semantic_routing_guard":
+        semantic_doc = _result_doc(r) or {}
+        for k in (
+            "semantic_routing_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "feedback_batch_path",
+            "intent_domain",
+            "intent_confidence",
+            "classifier_reason",
+            "legacy_namespace_refs",
+            "stale_reasons",
+        ):
+            if k in semantic_doc:
+                check_payload[k] = semantic_doc.get(k)
+    if name == "instance_protocol_split_receipt":
+        split_doc = _result_doc(r) or {}
+        for k in (
+            "instance_protocol_split_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "receipt_path",
+            "split_notice",
+            "instance_actions_ref",
+            "protocol_actions_ref",
+            "feedback_triggered",
+            "evidence_index_ref",
+            "feedback_paths",
+            "trigger_conditions",
+            "alias_fields_used",
+            "stale_reasons",
+        ):
+            if k in split_doc:
+                check_payload[k] = split_doc.get(k)
+    if name == "work_layer_gate_set_routing":
+        lane_doc = _result_doc(r) or {}
+        for k in (
+            "work_layer_gate_set_routing_status",
+            "error_code",
+            "work_layer",
+            "source_layer",
+            "applied_gate_set",
+            "protocol_context_detected",
+            "protocol_context_reasons",
+            "session_lane_lock",
+            "session_lane_lock_source",
+            "session_lane_lock_receipt",
+            "session_lane_lock_exit_receipt",
+            "lane_resolution_decision",
+            "lane_resolution_blocked",
+            "lane_resolution_error_code",
+            "lane_transition_reason",
+            "protocol_feedback_triggered",
+            "protocol_feedback_paths",
+            "pending_receipt_path",
+            "lane_lock_receipt_path",
+            "protocol_relevant_diff_detected",
+            "protocol_relevant_files",
+            "stale_reasons",
+        ):
+            if k in lane_doc:
+                check_payload[k] = lane_doc.get(k)
+    if name == "discovery_requiredization":
+        dreq_doc = _result_doc(r) or {}
+        for k in (
+            "discovery_requiredization_status",
+            "error_code",
+            "required_contract",
+            "required_contract_declared",
+            "auto_required_signal",
+            "requiredization_triggered",
+            "trigger_classes",
+            "window_rounds",
+            "feedback_batches",
+            "trigger_condition_flags",
+            "discovery_contract_required_state",
+            "requiredized_all_discovery_contracts",
+            "requiredization_receipt_path",
+            "requiredization_receipt_linked",
+            "evidence_index_path",
+            "ci_required_validators_missing",
+            "discovery_required_total",
+            "discovery_required_passed",
+            "discovery_required_coverage_rate",
+            "stale_reasons",
+        ):
+            if k in dreq_doc:
+                check_payload[k] = dreq_doc.get(k)
+    if name == "protocol_vendor_semantic_isolation":
+        semantic_iso_doc = _result_doc(r) or {}
+        for k in (
+            "protocol_vendor_semantic_isolation_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "feedback_batch_path",
+            "intent_domain",
+            "intent_confidence",
+            "intent_domain_before",
+            "intent_domain_after",
+            "switch_receipt_required",
+            "switch_receipt_present",
+            "switch_receipt_fields",
+            "protocol_vendor_refs",
+            "business_partner_refs",
+            "stale_reasons",
+        ):
+            if k in semantic_iso_doc:
+                check_payload[k] = semantic_iso_doc.get(k)
+    if name == "external_source_trust_chain":
+        src_doc = _result_doc(r) or {}
+        for k in (
+            "external_source_trust_chain_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "feedback_batch_path",
+            "allowed_trust_tiers",
+            "conclusion_required_tiers",
+            "source_row_count",
+            "conclusion_source_count",
+            "candidate_source_count",
+            "unknown_in_conclusion_refs",
+            "missing_tier_refs",
+            "missing_trace_refs",
+            "unknown_candidate_without_downgrade",
+            "stale_reasons",
+        ):
+            if k in src_doc:
+                check_payload[k] = src_doc.get(k)
+    if name == "protocol_data_sanitization_boundary":
+        dsn_doc = _result_doc(r) or {}
+        for k in (
+            "protocol_data_sanitization_boundary_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "feedback_batch_path",
+            "forbidden_key_hits",
+            "sensitive_pattern_hits",
+            "violation_count",
+            "stale_reasons",
+        ):
+            if k in dsn_doc:
+                check_payload[k] = dsn_doc.get(k)
+    if name == "platform_optimization_discovery_trigger":
+        opt_doc = _result_doc(r) or {}
+        for k in (
+            "platform_optimization_discovery_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "triggered",
+            "trigger_reason",
+            "discovery_scope",
+            "official_doc_retrieval_set",
+            "cross_validation_summary",
+            "upgrade_proposal_ref",
+            "feedback_batches",
+            "stale_reasons",
+        ):
+            if k in opt_doc:
+                check_payload[k] = opt_doc.get(k)
+    if name == "vibe_coding_feeding_pack":
+        pack_doc = _result_doc(r) or {}
+        for k in (
+            "vibe_coding_feeding_pack_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "pack_root",
+            "pack_id",
+            "pack_files",
+            "feedback_batch_path",
+            "feedback_batch_sha256",
+            "evidence_index_path",
+            "evidence_index_linked",
+            "deterministic_manifest_sha256",
+            "sanitization_check_passed",
+            "stale_reasons",
+        ):
+            if k in pack_doc:
+                check_payload[k] = pack_doc.get(k)
+    if name == "capability_fit_optimization":
+        fit_doc = _result_doc(r) or {}
+        for k in (
+            "capability_fit_optimization_status",
+            "error_code",
+            "required_contract",
+            "fit_matrix_path",
+            "matrix_candidate_count",
+            "selected_candidate_count",
+            "selected_candidate_ids",
+            "missing_required_fields",
+            "selected_missing_fields",
+            "next_review_at",
+            "review_interval_days",
+            "review_freshness_status",
+            "stale_reasons",
+        ):
+            if k in fit_doc:
+                check_payload[k] = fit_doc.get(k)
+    if name == "capability_composition_before_discovery":
+        comp_doc = _result_doc(r) or {}
+        for k in (
+            "compose_before_discovery_status",
+            "error_code",
+            "required_contract",
+            "fit_matrix_path",
+            "existing_composition_candidate_count",
+            "selected_candidate_type",
+            "decision_basis",
+            "stale_reasons",
+        ):
+            if k in comp_doc:
+                check_payload[k] = comp_doc.get(k)
+    if name == "capability_fit_review_freshness":
+        fresh_doc = _result_doc(r) or {}
+        for k in (
+            "capability_fit_review_freshness_status",
+            "error_code",
+            "required_contract",
+            "fit_matrix_path",
+            "selected_candidate_id",
+            "selected_candidate_type",
+            "next_review_at",
+            "review_interval_days",
+            "review_freshness_status",
+            "overdue_by_days",
+            "stale_reasons",
+        ):
+            if k in fresh_doc:
+                check_payload[k] = fresh_doc.get(k)
+    if name == "capability_fit_roundtable_evidence":
+        round_doc = _result_doc(r) or {}
+        for k in (
+            "capability_fit_roundtable_status",
+            "error_code",
+            "required_contract",
+            "fit_matrix_path",
+            "roundtable_evidence_path",
+            "selected_candidate_id",
+            "selected_candidate_type",
+            "roundtable_required",
+            "facts_count",
+            "inferences_count",
+            "selected_fact_refs",
+            "stale_reasons",
+        ):
+            if k in round_doc:
+                check_payload[k] = round_doc.get(k)
+    if name == "capability_fit_review_trigger":
+        trig_doc = _result_doc(r) or {}
+        for k in (
+            "capability_fit_review_trigger_status",
+            "error_code",
+            "required_contract",
+            "triggered",
+            "trigger_reason",
+            "fit_matrix_path",
+            "selected_candidate_id",
+            "selected_candidate_type",
+            "review_freshness_status",
+            "roundtable_required",
+            "roundtable_evidence_path",
+            "stale_reasons",
+        ):
+            if k in trig_doc:
+                check_payload[k] = trig_doc.get(k)
+    if name == "capability_fit_matrix_builder":
+        builder_doc = _result_doc(r) or {}
+        for k in (
+            "capability_fit_matrix_builder_status",
+            "error_code",
+            "required_contract",
+            "matrix_path",
+            "matrix_candidate_count",
+            "selected_candidate_count",
+            "selected_candidate_id",
+            "selected_candidate_type",
+            "inventory_snapshot_path",
+            "external_candidate_source_path",
+            "stale_reasons",
+        ):
+            if k in builder_doc:
+                check_payload[k] = builder_doc.get(k)
+    if name == "vendor_namespace_separation":
+        namespace_doc = _result_doc(r) or {}
+        for k in (
+            "vendor_namespace_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "feedback_root",
+            "protocol_vendor_file_count",
+            "business_partner_file_count",
+            "legacy_vendor_file_count",
+            "legacy_namespace_refs",
+            "stale_reasons",
+        ):
+            if k in namespace_doc:
+                check_payload[k] = namespace_doc.get(k)
+    if name == "protocol_feedback_sidecar":
+        sidecar_doc = _result_doc(r) or {}
+        for k in (
+            "sidecar_contract_status",
+            "sidecar_error_code",
+            "required_contract",
+            "auto_required_signal",
+            "enforce_blocking",
+            "escalation_required",
+            "escalation_decision",
+            "blocking_error_codes",
+            "p0_violations",
+            "track_a",
+            "track_b",
+            "stale_reasons",
+        ):
+            if k in sidecar_doc:
+                check_payload[k] = sidecar_doc.get(k)
+    if name == "instance_base_repo_write_boundary":
+        base_boundary_doc = _result_doc(r) or {}
+        for k in (
+            "base_repo_write_boundary_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "report_selected_path",
+            "source_mode",
+            "allowlist_prefixes",
+            "denylist_prefixes",
+            "repo_relative_candidates",
+            "allowed_paths",
+            "blocked_paths",
+            "explicit_deny_hits",
+            "override_receipt_path",
+            "override_applied",
+            "stale_reasons",
+        ):
+            if k in base_boundary_doc:
+                check_payload[k] = base_boundary_doc.get(k)
+    if name == "protocol_feedback_ssot_archival":
+        archival_doc = _result_doc(r) or {}
+        for k in (
+            "feedback_ssot_archival_status",
+            "error_code",
+            "required_contract",
+            "auto_required_signal",
+            "feedback_root",
+            "outbox_dir",
+            "evidence_index_path",
+            "batch_file_count",
+            "batch_files",
+            "index_linked_batches",
+            "index_unlinked_batches",
+            "mirror_candidate_refs",
+            "stale_reasons",
+        ):
+            if k in archival_doc:
+                check_payload[k] = archival_doc.get(k)
+    if name == "writeback_continuity":
+        writeback_doc = _result_doc(r) or {}
+        for k in (
+            "writeback_continuity_status",
+            "error_code",
+            "required_contract",
+            "report_selected_path",
+            "writeback_mode",
+            "writeback_status",
+            "upgrade_required",
+            "all_ok",
+            "degrade_reason",
+            "risk_level",
+            "next_recovery_action",
+            "stale_reasons",
+        ):
+            if k in writeback_doc:
+                check_payload[k] = writeback_doc.get(k)
+    if name == "post_execution_mandatory":
+        post_exec_doc = _result_doc(r) or {}
+        for k in (
+            "post_execution_mandatory_status",
+            "error_code",
+            "required_contract",
+            "report_selected_path",
+            "missing_fields",
+            "writeback_mode",
+            "writeback_status",
+            "next_action",
+            "next_recovery_action",
+            "stale_reasons",
+        ):
+            if k in post_exec_doc:
+                check_payload[k] = post_exec_doc.get(k)
+    if name == "execution_report_freshness":
+        freshness_doc = _result_doc(r) or {}
+        for k in (
+            "freshness_status",
+            "freshness_error_code",
+            "report_selected_path",
+            "stale_reasons",
+            "checks",
+        ):
+            if k in freshness_doc:
+                check_payload[k] = freshness_doc.get(k)
+    if name == "protocol_baseline_freshness":
+        baseline_doc = _result_doc(r) or {}
+        for k in (
+            "baseline_status",
+            "baseline_error_code",
+            "report_selected_path",
+            "report_protocol_root",
+            "report_protocol_commit_sha",
+            "protocol_head_sha_at_run_start",
+            "baseline_reference_mode",
+            "current_protocol_head_sha",
+            "head_drift_detected",
+            "lag_commits",
+            "stale_reasons",
+        ):
+            if k in baseline_doc:
+                check_payload[k] = baseline_doc.get(k)
+    if name == "protocol_version_alignment":
+        align_doc = _result_doc(r) or {}
+        for k in (
+            "protocol_version_alignment_status",
+            "error_code",
+            "required_contract",
+            "operation",
+            "alignment_policy",
+            "report_selected_path",
+            "tuple_checks",
+            "stale_reasons",
+        ):
+            if k in align_doc:
+                check_payload[k] = align_doc.get(k)
+    if name == "e2e_hermetic_runtime_import":
+        herm_doc = _result_doc(r) or {}
+        for k in (
+            "e2e_hermetic_runtime_status",
+            "pythonpath_bootstrap_mode",
+            "import_preflight_status",
+            "import_preflight_error_code",
+            "missing_modules",
+            "stale_reasons",
+        ):
+            if k in herm_doc:
+                check_payload[k] = herm_doc.get(k)
+    if name == "identity_home_catalog_alignment":
+        home_doc = _result_doc(r) or {}
+        for k in (
+            "path_governance_status",
+            "path_error_codes",
+            "identity_home",
+            "identity_home_expected",
+            "identity_home_source",
+            "stale_reasons",
+        ):
+            if k in home_doc:
+                check_payload[k] = home_doc.get(k)
+    if name == "fixture_runtime_boundary":
+        boundary_doc = _result_doc(r) or {}
+        for k in (
+            "path_governance_status",
+            "path_error_codes",
+            "operation",
+            "allow_fixture_runtime",
+            "fixture_audit_receipt",
+            "stale_reasons",
+        ):
+            if k in boundary_doc:
+                check_payload[k] = boundary_doc.get(k)
+    if name == "actor_session_binding":
+        actor_doc = _result_doc(r) or {}
+        for k in (
+            "actor_binding_status",
+            "error_code",
+            "actor_id",
+            "actor_session_path",
+            "bound_identity_id",
+            "catalog_identity_status",
+            "stale_reasons",
+        ):
+            if k in actor_doc:
+                check_payload[k] = actor_doc.get(k)
+    if name == "actor_session_multibinding_concurrency":
+        mb_doc = _result_doc(r) or {}
+        for k in (
+            "actor_session_multibinding_status",
+            "error_code",
+            "binding_key_mode",
+            "session_entry_count",
+            "cas_checked",
+            "cas_conflict_detected",
+            "non_activation_mutation_detected",
+            "rebind_receipt_status",
+            "dropped_peer_session_count",
+            "stale_reasons",
+        ):
+            if k in mb_doc:
+                check_payload[k] = mb_doc.get(k)
+    if name == "no_implicit_switch":
+        implicit_doc = _result_doc(r) or {}
+        for k in (
+            "implicit_switch_status",
+            "error_code",
+            "switch_report_path",
+            "switch_id",
+            "actor_id",
+            "run_id",
+            "cross_actor_demotion_detected",
+            "stale_reasons",
+        ):
+            if k in implicit_doc:
+                check_payload[k] = implicit_doc.get(k)
+    if name == "cross_actor_isolation":
+        isolation_doc = _result_doc(r) or {}
+        for k in (
+            "cross_actor_isolation_status",
+            "error_code",
+            "actor_binding_count",
+            "active_identities",
+            "stale_reasons",
+        ):
+            if k in isolation_doc:
+                check_payload[k] = isolation_doc.get(k)
+    if name == "session_refresh_status":
+        refresh_doc = _result_doc(r) or {}
+        for k in (
+            "session_refresh_status",
+            "error_code",
+            "actor_id",
+            "lease_status",
+            "pointer_consistency",
+            "risk_flags",
+            "next_action",
+            "baseline_status",
+            "baseline_error_code",
+            "report_protocol_commit_sha",
+            "protocol_head_sha_at_run_start",
+            "baseline_reference_mode",
+            "current_protocol_head_sha",
+            "head_drift_detected",
+            "lag_commits",
+            "report_selected_path",
+            "stale_reasons",
+        ):
+            if k in refresh_doc:
+                check_payload[k] = refresh_doc.get(k)
+    if name == "response_stamp_validation":
+        stamp_doc = _result_doc(r) or {}
+        for k in (
+            "stamp_status",
+            "error_code",
+            "stale_reasons",
+            "blocker_receipt_path",
+            "reply_sample_count",
+            "reply_stamp_missing_count",
+            "reply_stamp_missing_refs",
+        ):
+            if k in stamp_doc:
+                check_payload[k] = stamp_doc.get(k)
+    if name == "response_stamp_blocker_receipt":
+        receipt_doc = _result_doc(r) or {}
+        for k in (
+            "receipt_status",
+            "error_code",
+            "stale_reasons",
+        ):
+            if k in receipt_doc:
+                check_payload[k] = receipt_doc.get(k)
+    if name == "reply_identity_context_first_line":
+        reply_doc = _result_doc(r) or {}
+        for k in (
+            "reply_first_line_status",
+            "error_code",
+            "reply_first_line_missing_count",
+            "reply_first_line_missing_refs",
+            "reply_sample_count",
+            "reply_evidence_ref",
+            "blocker_receipt_path",
+            "stale_reasons",
+        ):
+            if k in reply_doc:
+                check_payload[k] = reply_doc.get(k)
+    if name == "send_time_reply_gate":
+        send_doc = _result_doc(r) or {}
+        for k in (
+            "send_time_gate_status",
+            "error_code",
+            "governed_outlet_enforced",
+            "outlet_channel_id",
+            "outlet_preflight_receipt",
+            "outlet_bypass_detected",
+            "reply_evidence_mode",
+            "reply_evidence_ref",
+            "reply_sample_count",
+            "reply_first_line_missing_count",
+            "reply_first_line_missing_refs",
+            "blocker_receipt_path",
+            "stale_reasons",
+        ):
+            if k in send_doc:
+                check_payload[k] = send_doc.get(k)
+    if name == "execution_reply_identity_coherence":
+        coherence_doc = _result_doc(r) or {}
+        for k in (
+            "coherence_status",
+            "coherence_decision",
+            "error_code",
+            "command_catalog_ref",
+            "resolved_catalog_ref",
+            "reply_catalog_ref",
+            "command_identity_id",
+            "resolved_identity_id",
+            "reply_identity_id",
+            "command_actor_id",
+            "resolved_actor_id",
+            "reply_actor_id",
+            "mismatch_fields",
+            "reply_evidence_ref",
+            "blocker_receipt_path",
+            "stale_reasons",
+        ):
+            if k in coherence_doc:
+                check_payload[k] = coherence_doc.get(k)
+    if name == "headstamp_recurrence_closure":
+        hs_doc = _result_doc(r) or {}
+        for k in (
+            "headstamp_recurrence_closure_status",
+            "static_wiring_status",
+            "dynamic_replay_status",
+            "error_code",
+            "missing_wiring_items",
+            "dynamic_cases",
+            "stale_reasons",
+        ):
+            if k in hs_doc:
+                check_payload[k] = hs_doc.get(k)
+    if name == "protocol_feedback_reply_channel":
+        channel_doc = _result_doc(r) or {}
+        for k in (
+            "protocol_feedback_reply_channel_status",
+            "error_code",
+            "primary_channel_root",
+            "protocol_feedback_activity_detected",
+            "protocol_feedback_activity_refs",
+            "non_standard_primary_refs",
+            "mirror_reference_refs",
+            "split_receipt_requiredized",
+            "split_receipt_status",
+            "split_receipt_error_code",
+            "stale_reasons",
+        ):
+            if k in channel_doc:
+                check_payload[k] = channel_doc.get(k)
+    if name == "protocol_feedback_bootstrap_ready":
+        boot_doc = _result_doc(r) or {}
+        for k in (
+            "protocol_feedback_bootstrap_status",
+            "protocol_feedback_bootstrap_mode",
+            "bootstrap_created_paths",
+            "bootstrap_receipt_path",
+            "resolved_work_layer",
+            "protocol_triggered",
+            "protocol_lane_selected",
+            "error_code",
+            "stale_reasons",
+        ):
+            if k in boot_doc:
+                check_payload[k] = boot_doc.get(k)
+    if name == "protocol_entry_candidate_bridge":
+        candidate_doc = _result_doc(r) or {}
+        for k in (
+            "protocol_entry_candidate_status",
+            "protocol_entry_decision",
+            "candidate_reason",
+            "candidate_confidence",
+            "clarification_required",
+            "clarification_questions",
+            "candidate_seed_outbox_ref",
+            "candidate_seed_index_ref",
+            "candidate_promotion_status",
+            "error_code",
+            "stale_reasons",
+        ):
+            if k in candidate_doc:
+                check_payload[k] = candidate_doc.get(k)
+    if name == "protocol_inquiry_followup_chain":
+        inquiry_doc = _result_doc(r) or {}
+        for k in (
+            "protocol_inquiry_followup_chain_status",
+            "inquiry_state",
+            "followup_question_set",
+            "signal_origin",
+            "sanitization_paraphrase_ref",
+            "protocol_feedback_seed_ref",
+            "protocol_feedback_index_ref",
+            "followup_round_count",
+            "max_followup_rounds",
+            "evidence_ttl_hours",
+            "inquiry_requiredization_triggered",
+            "inquiry_requiredization_receipt_path",
+            "error_code",
+            "stale_reasons",
+        ):
+            if k in inquiry_doc:
+                check_payload[k] = inquiry_doc.get(k)
+    return check_payload
+
+
+
+def _identity_checks(
+    opts: ScanOptions,
+    *,
+    item: dict[str, Any],
+    row: dict[str, Any],
+    catalog: Path,
+    iid: str,
+    scan_scope_hint: str,
+    resolved_scope: str,
+    lane_applied_gate_set: str,
+) -> dict[str, list[str]]:
+    repo_catalog = opts.repo_catalog
+    actor_id = opts.actor_id
+    layer_intent_text = opts.layer_intent_text
+    expected_work_layer = opts.expected_work_layer
+    expected_source_layer = opts.expected_source_layer
+    is_active_runtime = str(row.get("status", "")).lower() == "active" and str(row.get("profile", "")).lower() == "runtime"
+    is_fixture = str(row.get("profile", "")).lower() == "fixture" or str(row.get("runtime_mode", "")).lower() == "demo_only"
+    stamp_artifact = f"/tmp/identity-response-stamp-scan-{iid}.json"
+    stamp_blocker_receipt = f"/tmp/identity-stamp-blocker-receipt-scan-{iid}.json"
+    reply_first_line_blocker_receipt = f"/tmp/identity-reply-first-line-blocker-receipt-scan-{iid}.json"
+    send_time_reply_file = f"/tmp/identity-send-time-reply-scan-{iid}.txt"
+    send_time_reply_gate_blocker_receipt = (
+        f"/tmp/identity-send-time-reply-gate-blocker-receipt-scan-{iid}.json"
+    )
+    execution_reply_coherence_blocker_receipt = (
+        f"/tmp/identity-execution-reply-coherence-blocker-receipt-scan-{iid}.json"
+    )
+    checks = {
+        "scope_resolution": [
+            "python3",
+            "scripts/validate_identity_scope_resolution.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--scope",
+            scan_scope_hint,
+        ],
+        "scope_isolation": [
+            "python3",
+            "scripts/validate_identity_scope_isolation.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--scope",
+            scan_scope_hint,
+        ],
+        "scope_persistence": [
+            "python3",
+            "scripts/validate_identity_scope_persistence.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--scope",
+            scan_scope_hint,
+        ],
+        "runtime_contract": [
+            "python3",
+            "scripts/validate_identity_runtime_contract.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+        ],
+        "identity_home_catalog_alignment": [
+            "python3",
+            "scripts/validate_identity_home_catalog_alignment.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--identity-home",
+            str(catalog.parent.resolve()),
+            "--json-only",
+        ],
+        "fixture_runtime_boundary": [
+            "python3",
+            "scripts/validate_fixture_runtime_boundary.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "actor_session_binding": [
+            "python3",
+            "scripts/validate_actor_session_binding.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--actor-id",
+            actor_id,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "actor_session_multibinding_concurrency": [
+            "python3",
+            "scripts/validate_actor_session_multibinding_concurrency.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--actor-id",
+            actor_id,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "no_implicit_switch": [
+            "python3",
+            "scripts/validate_no_implicit_switch.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "cross_actor_isolation": [
+            "python3",
+            "scripts/validate_cross_actor_isolation.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "session_refresh_status": [
+            "python3",
+            "scripts/validate_identity_session_refresh_status.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--actor-id",
+            actor_id,
+            "--operation",
+            "scan",
+            "--baseline-policy",
+            "warn",
+            "--json-only",
+        ],
+        "response_stamp_render": [
+            "python3",
+            "scripts/render_identity_response_stamp.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--view",
+            "external",
+            "--disclosure-level",
+            "standard",
+            "--out",
+            stamp_artifact,
+            "--json-only",
+        ],
+        "response_stamp_validation": [
+            "python3",
+            "scripts/validate_identity_response_stamp.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--stamp-json",
+            stamp_artifact,
+            "--force-check",
+            "--enforce-user-visible-gate",
+            "--operation",
+            "scan",
+            "--blocker-receipt-out",
+            stamp_blocker_receipt,
+            "--json-only",
+        ],
+        "response_stamp_blocker_receipt": [
+            "python3",
+            "scripts/validate_identity_response_stamp_blocker_receipt.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--force-check",
+            "--receipt",
+            stamp_blocker_receipt,
+            "--json-only",
+        ],
+        "reply_identity_context_first_line": [
+            "python3",
+            "scripts/validate_reply_identity_context_first_line.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--stamp-json",
+            stamp_artifact,
+            "--force-check",
+            "--enforce-first-line-gate",
+            "--operation",
+            "scan",
+            "--blocker-receipt-out",
+            reply_first_line_blocker_receipt,
+            "--json-only",
+        ],
+        "layer_intent_resolution": [
+            "python3",
+            "scripts/validate_layer_intent_resolution.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--stamp-json",
+            stamp_artifact,
+            "--force-check",
+            "--enforce-layer-intent-gate",
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "send_time_reply_gate": [
+            "python3",
+            "scripts/compose_and_validate_governed_reply.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--body-text",
+            "SCAN_SEND_TIME_REPLY_BODY",
+            "--out-reply-file",
+            send_time_reply_file,
+            "--blocker-receipt-out",
+            send_time_reply_gate_blocker_receipt,
+            "--outlet-channel-id",
+            "governed_adapter_v1",
+            "--actor-id",
+            actor_id,
+            "--json-only",
+        ],
+        "send_time_reply_gate_validate": [
+            "python3",
+            "scripts/validate_send_time_reply_gate.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--reply-file",
+            send_time_reply_file,
+            "--force-check",
+            "--enforce-send-time-gate",
+            "--reply-outlet-guard-applied",
+            "--outlet-channel-id",
+            "governed_adapter_v1",
+            "--reply-transport-ref",
+            send_time_reply_file,
+            "--operation",
+            "scan",
+            "--blocker-receipt-out",
+            send_time_reply_gate_blocker_receipt,
+            "--actor-id",
+            actor_id,
+            "--json-only",
+        ],
+        "headstamp_recurrence_closure": [
+            "python3",
+            "scripts/validate_headstamp_recurrence_closure.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--actor-id",
+            actor_id,
+            "--json-only",
+        ],
+        "execution_reply_identity_coherence": [
+            "python3",
+            "scripts/validate_execution_reply_identity_coherence.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--stamp-json",
+            stamp_artifact,
+            "--force-check",
+            "--enforce-coherence-gate",
+            "--operation",
+            "scan",
+            "--blocker-receipt-out",
+            execution_reply_coherence_blocker_receipt,
+            "--json-only",
+        ],
+        "tool_installation": [
+            "python3",
+            "scripts/validate_identity_tool_installation.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+        ],
+        "install_provenance": [
+            "python3",
+            "scripts/validate_identity_install_provenance.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+        ],
+        "vendor_api_discovery": [
+            "python3",
+            "scripts/validate_identity_vendor_api_discovery.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+        ],
+        "vendor_api_solution": [
+            "python3",
+            "scripts/validate_identity_vendor_api_solution.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+        ],
+        "semantic_routing_guard": [
+            "python3",
+            "scripts/validate_semantic_routing_guard.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "instance_protocol_split_receipt": [
+            "python3",
+            "scripts/validate_instance_protocol_split_receipt.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "protocol_vendor_semantic_isolation": [
+            "python3",
+            "scripts/validate_protocol_vendor_semantic_isolation.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "external_source_trust_chain": [
+            "python3",
+            "scripts/validate_external_source_trust_chain.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "protocol_data_sanitization_boundary": [
+            "python3",
+            "scripts/validate_protocol_data_sanitization_boundary.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "platform_optimization_discovery_trigger": [
+            "python3",
+            "scripts/trigger_platform_optimization_discovery.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "discovery_requiredization": [
+            "python3",
+            "scripts/validate_discovery_requiredization.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "vibe_coding_feeding_pack": [
+            "python3",
+            "scripts/build_vibe_coding_feeding_pack.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--out-root",
+            "/tmp/vibe-coding-feeding-packs",
+            "--json-only",
+        ],
+        "capability_fit_optimization": [
+            "python3",
+            "scripts/validate_identity_capability_fit_optimization.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "capability_composition_before_discovery": [
+            "python3",
+            "scripts/validate_capability_composition_before_discovery.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "capability_fit_review_freshness": [
+            "python3",
+            "scripts/validate_capability_fit_review_freshness.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "capability_fit_roundtable_evidence": [
+            "python3",
+            "scripts/validate_capability_fit_roundtable_evidence.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "capability_fit_review_trigger": [
+            "python3",
+            "scripts/trigger_capability_fit_review.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "capability_fit_matrix_builder": [
+            "python3",
+            "scripts/build_capability_fit_matrix.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--out-root",
+            "/tmp/capability-fit-matrices",
+            "--json-only",
+        ],
+        "vendor_namespace_separation": [
+            "python3",
+            "scripts/validate_vendor_namespace_separation.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "work_layer_gate_set_routing": [
+            "python3",
+            "scripts/validate_work_layer_gate_set_routing.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--applied-gate-set",
+            lane_applied_gate_set,
+            "--force-check",
+            "--json-only",
+        ],
+        "protocol_feedback_reply_channel": [
+            "python3",
+            "scripts/validate_protocol_feedback_reply_channel.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--force-check",
+            "--json-only",
+        ],
+        "protocol_feedback_bootstrap_ready": [
+            "python3",
+            "scripts/validate_protocol_feedback_bootstrap_ready.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--force-check",
+            "--json-only",
+        ],
+        "protocol_entry_candidate_bridge": [
+            "python3",
+            "scripts/validate_protocol_entry_candidate_bridge.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--force-check",
+            "--json-only",
+        ],
+        "protocol_inquiry_followup_chain": [
+            "python3",
+            "scripts/validate_protocol_inquiry_followup_chain.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--force-check",
+            "--json-only",
+        ],
+        "protocol_feedback_sidecar": [
+            "python3",
+            "scripts/validate_protocol_feedback_sidecar_contract.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "instance_base_repo_write_boundary": [
+            "python3",
+            "scripts/validate_instance_base_repo_write_boundary.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "protocol_feedback_ssot_archival": [
+            "python3",
+            "scripts/validate_protocol_feedback_ssot_archival.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "required_contract_coverage": [
+            "python3",
+            "scripts/validate_required_contract_coverage.py",
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--identity-id",
+            iid,
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "writeback_continuity": [
+            "python3",
+            "scripts/validate_writeback_continuity.py",
+            "--identity-id",
+            iid,
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "post_execution_mandatory": [
+            "python3",
+            "scripts/validate_post_execution_mandatory.py",
+            "--identity-id",
+            iid,
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--operation",
+            "scan",
+            "--json-only",
+        ],
+        "protocol_baseline_freshness": [
+            "python3",
+            "scripts/validate_identity_protocol_baseline_freshness.py",
+            "--identity-id",
+            iid,
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--baseline-policy",
+            "warn",
+            "--json-only",
+        ],
+        "protocol_version_alignment": [
+            "python3",
+            "scripts/validate_identity_protocol_version_alignment.py",
+            "--identity-id",
+            iid,
+            "--catalog",
+            str(catalog),
+            "--repo-catalog",
+            str(repo_catalog),
+            "--operation",
+            "scan",
+            "--alignment-policy",
+            "warn",
+            "--json-only",
+        ],
+        "e2e_hermetic_runtime_import": [
+            "python3",
+            "scripts/validate_e2e_hermetic_runtime_import.py",
+            "--operation",
+            "scan",
+            "--pythonpath-bootstrap-mode",
+            "internal_bootstrap",
+            "--json-only",
+        ],
+    }
+    if layer_intent_text:
+        for key in (
+            "response_stamp_render",
+            "send_time_reply_gate",
+            "layer_intent_resolution",
+            "reply_identity_context_first_line",
+            "send_time_reply_gate_validate",
+            "execution_reply_identity_coherence",
+            "protocol_feedback_bootstrap_ready",
+            "protocol_entry_candidate_bridge",
+            "protocol_inquiry_followup_chain",
+            "work_layer_gate_set_routing",
+        ):
+            checks[key].extend(["--layer-intent-text", layer_intent_text])
+    if expected_work_layer:
+        for key in (
+            "layer_intent_resolution",
+            "reply_identity_context_first_line",
+            "send_time_reply_gate_validate",
+            "execution_reply_identity_coherence",
+            "protocol_feedback_bootstrap_ready",
+            "protocol_entry_candidate_bridge",
+            "protocol_inquiry_followup_chain",
+            "work_layer_gate_set_routing",
+        ):
+            checks[key].extend(["--expected-work-layer", expected_work_layer])
+        checks["send_time_reply_gate"].extend(["--work-layer", expected_work_layer])
+    if expected_source_layer:
+        for key in (
+            "layer_intent_resolution",
+            "reply_identity_context_first_line",
+            "send_time_reply_gate_validate",
+            "execution_reply_identity_coherence",
+        ):
+            checks[key].extend(["--expected-source-layer", expected_source_layer])
+        checks["send_time_reply_gate"].extend(["--source-layer", expected_source_layer])
+        for key in (
+            "protocol_feedback_bootstrap_ready",
+            "protocol_entry_candidate_bridge",
+            "protocol_inquiry_followup_chain",
+            "work_layer_gate_set_routing",
+        ):
+            checks[key].extend(["--source-layer", expected_source_layer])
+    if not is_fixture:
+        checks["prompt_quality"] = [
+            "python3",
+            "scripts/validate_identity_prompt_quality.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+            "--scope",
+            resolved_scope,
+        ]
+    else:
+        item["checks"]["prompt_quality"] = {
+            "rc": 0,
+            "ok": True,
+            "tail": f"[OK] prompt quality skipped for fixture/demo identity={iid}",
+            "skipped": True,
+        }
+    cap_preflight_cmd = [
+        "python3",
+        "scripts/validate_identity_capability_activation.py",
+        "--catalog",
+        str(catalog),
+        "--repo-catalog",
+        str(repo_catalog),
+        "--identity-id",
+        iid,
+    ]
+    if is_active_runtime:
+        cap_preflight_cmd.append("--require-activated")
+    checks["capability_activation_preflight"] = cap_preflight_cmd
+    checks["dialogue_content"] = [
+        "python3",
+        "scripts/validate_identity_dialogue_content.py",
+        "--catalog",
+        str(catalog),
+        "--identity-id",
+        iid,
+    ]
+    checks["dialogue_cross_validation"] = [
+        "python3",
+        "scripts/validate_identity_dialogue_cross_validation.py",
+        "--catalog",
+        str(catalog),
+        "--identity-id",
+        iid,
+    ]
+    checks["dialogue_result_support"] = [
+        "python3",
+        "scripts/validate_identity_dialogue_result_support.py",
+        "--catalog",
+        str(catalog),
+        "--identity-id",
+        iid,
+    ]
+    checks["execution_report_freshness"] = [
+        "python3",
+        "scripts/validate_execution_report_freshness.py",
+        "--identity-id",
+        iid,
+        "--catalog",
+        str(catalog),
+        "--repo-catalog",
+        str(repo_catalog),
+        "--execution-report-policy",
+        "warn",
+        "--json-only",
+    ]
+    if is_active_runtime:
+        runtime_report_dir_path = Path(str(row.get("pack_path", ""))).expanduser().resolve() / "runtime" / "reports"
+        runtime_report_dir = str(runtime_report_dir_path)
+        checks["session_pointer"] = [
+            "python3",
+            "scripts/validate_identity_session_pointer_consistency.py",
+            "--catalog",
+            str(catalog),
+            "--identity-id",
+            iid,
+        ]
+        checks["prompt_activation"] = [
+            "python3",
+            "scripts/validate_identity_prompt_activation.py",
+            "--identity-id",
+            iid,
+            "--catalog",
+            str(catalog),
+            "--report-dir",
+            runtime_report_dir,
+        ]
+        checks["prompt_lifecycle"] = [
+            "python3",
+            "scripts/validate_identity_prompt_lifecycle.py",
+            "--identity-id",
+            iid,
+            "--report-dir",
+            runtime_report_dir,
+        ]
+        latest_report = _latest_runtime_report(iid, runtime_report_dir_path)
+        if latest_report:
+            cap_report_cmd = [
+                "python3",
+                "scripts/validate_identity_capability_activation.py",
+                "--identity-id",
+                iid,
+                "--report",
+                str(latest_report),
+            ]
+            report_meta: dict[str, Any] = {}
+            try:
+                loaded = json.loads(latest_report.read_text(encoding="utf-8"))
+                if isinstance(loaded, dict):
+                    report_meta = loaded
+            except Exception:
+                report_meta = {}
+            report_all_ok = bool(report_meta.get("all_ok"))
+            report_writeback_status = str(report_meta.get("writeback_status", "")).strip().upper()
+            report_permission_state = str(report_meta.get("permission_state", "")).strip().upper()
+            if report_all_ok and report_writeback_status == "WRITTEN" and report_permission_state == "WRITEBACK_WRITTEN":
+                cap_report_cmd.append("--require-activated")
+            checks["capability_activation_report"] = cap_report_cmd
+    return checks
+
+
+
+def _scan_check_dependencies(names: list[str]) -> dict[str, tuple[str, ...]]:
+    """Derive per-check prerequisites from declared artifact edges and pack-state barriers."""
+    deps: dict[str, tuple[str, ...]] = {}
+    segment: list[str] = []
+    last_barrier = ""
+    for name in names:
+        if name in SCAN_BARRIER_CHECKS:
+            row = [last_barrier] if last_barrier else []
+            row.extend(segment)
+            last_barrier = name
+            segment = []
+        else:
+            row = [d for d in SCAN_CHECK_DEPENDENCIES.get(name, ()) if d in segment]
+            if last_barrier:
+                row.append(last_barrier)
+            segment.append(name)
+        deps[name] = tuple(row)
+    return deps
+
+
+def _schedule_identity_scan(
+    scheduler: TaskScheduler,
+    opts: ScanOptions,
+    *,
+    unit: str,
+    order: int,
+    after: str,
+    item: dict[str, Any],
+    row: dict[str, Any],
+    catalog: Path,
+    iid: str,
+    scan_scope_hint: str,
+) -> None:
+    lane_applied_gate_set = _resolve_applied_gate_set(
+        layer_intent_text=opts.layer_intent_text,
+        expected_work_layer=opts.expected_work_layer,
+        expected_source_layer=opts.expected_source_layer,
+    )
+    check_names: list[str] = []
+    results: dict[str, dict[str, Any]] = {}
+
+    def _on_check(name: str):
+        def _done(outcome: tuple[CheckResult, CheckResult | None]) -> None:
+            results[name] = _check_payload(name, *outcome)
+
+        return _done
+
+    def _on_three_plane(three_plane: CheckResult) -> None:
+        for name in check_names:
+            item["checks"][name] = results[name]
+        item["checks"]["three_plane"] = {"rc": three_plane.rc, "ok": three_plane.ok, "tail": three_plane.tail}
+        tp = _result_doc(three_plane)
+        if tp:
+            item["three_plane"] = {
+                "instance": tp.get("instance_plane_status"),
+                "repo": tp.get("repo_plane_status"),
+                "release": tp.get("release_plane_status"),
+                "overall": tp.get("overall_release_decision"),
+            }
+
+    def _on_resolve(resolve: CheckResult) -> None:
+        item["checks"]["resolve"] = {"rc": resolve.rc, "ok": resolve.ok, "tail": resolve.tail}
+        resolved_scope = scan_scope_hint
+        if resolve.ok:
+            data = _result_doc(resolve) or {}
+            item["resolved_scope"] = data.get("resolved_scope")
+            item["source_layer"] = data.get("source_layer")
+            item["conflict_detected"] = data.get("conflict_detected")
+            resolved_scope = str(data.get("resolved_scope", "")).upper() or scan_scope_hint
+        checks = _identity_checks(
+            opts,
+            item=item,
+            row=row,
+            catalog=catalog,
+            iid=iid,
+            scan_scope_hint=scan_scope_hint,
+            resolved_scope=resolved_scope,
+            lane_applied_gate_set=lane_applied_gate_set,
+        )
+        check_names.extend(checks)
+        check_deps = _scan_check_dependencies(check_names)
+        for idx, (name, cmd) in enumerate(checks.items()):
+            scheduler.add(
+                f"{unit}/{name}",
+                _run_check,
+                (name, cmd, opts.repo_root, opts.validator_mode, opts.cache, f"{unit}/{name}" if opts.progress else ""),
+                deps=[f"{unit}/{d}" for d in check_deps[name]] or [f"{unit}/resolve"],
+                priority=(order, 1 + idx),
+                on_done=_on_check(name),
+            )
+        env = os.environ.copy()
+        env["IDENTITY_CATALOG"] = str(catalog)
+        scheduler.add(
+            f"{unit}/three_plane",
+            _run,
+            (
+                [
+                    "python3",
+                    "scripts/report_three_plane_status.py",
+                    "--identity-id",
+                    iid,
+                    "--scope",
+                    scan_scope_hint,
+                    *(["--layer-intent-text", opts.layer_intent_text] if opts.layer_intent_text else []),
+                    *(["--expected-work-layer", opts.expected_work_layer] if opts.expected_work_layer else []),
+                    *(["--expected-source-layer", opts.expected_source_layer] if opts.expected_source_layer else []),
+                    *(["--with-docs-contract"] if opts.with_docs_contract else []),
+                ],
+                opts.repo_root,
+                env,
+                opts.validator_mode,
+                None,
+                f"{unit}/three_plane" if opts.progress else "",
+            ),
+            deps=[f"{unit}/resolve", *(f"{unit}/{name}" for name in checks)],
+            priority=(order, 1 + len(checks)),
+            on_done=_on_three_plane,
+        )
+
+    scheduler.add(
+        f"{unit}/resolve",
+        _run,
+        (
+            [
+                "python3",
+                "scripts/resolve_identity_context.py",
+                "resolve",
+                "--identity-id",
+                iid,
+                "--repo-catalog",
+                str(opts.repo_catalog),
+                "--local-catalog",
+                str(catalog),
+                "--scope",
+                scan_scope_hint,
+            ],
+            opts.repo_root,
+            None,
+            opts.validator_mode,
+        ),
+        deps=[after] if after else [],
+        priority=(order, 0),
+        on_done=_on_resolve,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    # validators spawned per identity share one git facts snapshot instead of re-running git
+    snapshot = publish_git_facts()
+    try:
+        return _main(argv)
+    finally:
+        release_git_facts(snapshot)
+
+
+def _main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Scan all configured identities and emit cross-catalog governance status.")
     ap.add_argument("--repo-root", default=".")
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
@@ -302,8 +2203,55 @@ def main() -> int:
             "Defaults to CODEX_ACTOR_ID; falls back to assistant:codex."
         ),
     )
+    ap.add_argument(
+        "--validator-mode",
+        choices=list(VALIDATOR_MODES),
+        default=default_validator_mode(),
+        help=(
+            "inprocess=call registry validators through their main(argv) entry point in this interpreter; "
+            "subprocess=launch one python3 process per check. Defaults to IDENTITY_VALIDATOR_MODE or inprocess."
+        ),
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "number of worker processes for identity/check execution; checks keep their declared "
+            "dependencies and the payload order is identical to --jobs 1"
+        ),
+    )
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="bypass the validator result cache (also disabled by IDENTITY_VALIDATOR_CACHE=0)",
+    )
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "reuse prior identity results from the scan manifest when the identity's inputs "
+            "(catalog rows, pack files, actor sessions, latest report, scan options, scripts, git HEAD) are unchanged"
+        ),
+    )
+    ap.add_argument(
+        "--manifest",
+        default=str(DEFAULT_SCAN_MANIFEST),
+        help="scan manifest path used by --incremental",
+    )
+    ap.add_argument(
+        "--incremental-ttl-seconds",
+        type=int,
+        default=DEFAULT_SCAN_MANIFEST_TTL_SECONDS,
+        help="re-scan cached identities older than this; time-dependent checks (review/exception expiry) go stale",
+    )
+    ap.add_argument(
+        "--progress",
+        action="store_true",
+        help="print validator progress events (result channel) to stderr while checks run",
+    )
     ap.add_argument("--out", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     repo_root = Path(args.repo_root).expanduser().resolve()
     repo_catalog = (repo_root / args.repo_catalog).resolve() if not Path(args.repo_catalog).is_absolute() else Path(args.repo_catalog)
@@ -334,13 +2282,50 @@ def main() -> int:
         "repo_root": str(repo_root),
         "repo_catalog": str(repo_catalog),
         "scan_mode": args.scan_mode,
+        "validator_mode": args.validator_mode,
         "target_identities": sorted(target_set),
         "catalogs": [],
         "summary": {"total_identities": 0, "p0": 0, "p1": 0, "ok": 0},
     }
 
+    opts = ScanOptions(
+        repo_root=repo_root,
+        repo_catalog=repo_catalog,
+        actor_id=actor_id,
+        layer_intent_text=layer_intent_text,
+        expected_work_layer=expected_work_layer,
+        expected_source_layer=expected_source_layer,
+        with_docs_contract=bool(args.with_docs_contract),
+        validator_mode=args.validator_mode,
+        cache=default_validator_cache(enabled=not args.no_cache),
+        progress=bool(args.progress),
+    )
+    scheduler = TaskScheduler(jobs=args.jobs)
+    scanned: list[dict[str, Any]] = []
+    last_unit_by_identity: dict[str, str] = {}
+    catalog_rows = {catalog: (_catalog_rows(catalog) if catalog.exists() else []) for _, catalog in catalog_list}
+    manifest = (
+        ScanManifest.load(Path(args.manifest).expanduser().resolve(), args.incremental_ttl_seconds)
+        if args.incremental
+        else None
+    )
+    scan_context: dict[str, Any] = {}
+    executed_units: list[tuple[str, dict[str, Any], dict[str, Any]]] = []
+    if manifest is not None:
+        scan_context = {
+            "scan_mode": args.scan_mode,
+            "repo_catalog": str(repo_catalog),
+            "actor_id": actor_id,
+            "layer_intent_text": layer_intent_text,
+            "expected_work_layer": expected_work_layer,
+            "expected_source_layer": expected_source_layer,
+            "with_docs_contract": bool(args.with_docs_contract),
+            "scripts": scripts_signature(),
+            "git_head": git_head(repo_root),
+        }
+        repo_rows = catalog_rows[repo_catalog] if repo_catalog in catalog_rows else _catalog_rows(repo_catalog)
     for layer, catalog in catalog_list:
-        rows = _catalog_rows(catalog) if catalog.exists() else []
+        rows = catalog_rows[catalog]
         layer_out: dict[str, Any] = {"layer": layer, "catalog": str(catalog), "exists": catalog.exists(), "identities": []}
         for row in rows:
             iid = str(row.get("id", "")).strip()
@@ -359,1704 +2344,74 @@ def main() -> int:
                 "scan_scope_hint": scan_scope_hint,
                 "checks": {},
             }
-            lane_applied_gate_set = _resolve_applied_gate_set(
-                layer_intent_text=layer_intent_text,
-                expected_work_layer=expected_work_layer,
-                expected_source_layer=expected_source_layer,
-            )
-            resolve = _run(
-                [
-                    "python3",
-                    "scripts/resolve_identity_context.py",
-                    "resolve",
-                    "--identity-id",
-                    iid,
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--local-catalog",
-                    str(catalog),
-                    "--scope",
-                    scan_scope_hint,
-                ],
-                cwd=repo_root,
-            )
-            item["checks"]["resolve"] = {"rc": resolve.rc, "ok": resolve.ok, "tail": resolve.tail}
-            resolved_scope = scan_scope_hint
-            if resolve.ok:
-                data = _parse_json_safely(resolve.stdout) or {}
-                item["resolved_scope"] = data.get("resolved_scope")
-                item["source_layer"] = data.get("source_layer")
-                item["conflict_detected"] = data.get("conflict_detected")
-                resolved_scope = str(data.get("resolved_scope", "")).upper() or scan_scope_hint
-
-            is_active_runtime = str(row.get("status", "")).lower() == "active" and str(row.get("profile", "")).lower() == "runtime"
-            is_fixture = str(row.get("profile", "")).lower() == "fixture" or str(row.get("runtime_mode", "")).lower() == "demo_only"
-            stamp_artifact = f"/tmp/identity-response-stamp-scan-{iid}.json"
-            stamp_blocker_receipt = f"/tmp/identity-stamp-blocker-receipt-scan-{iid}.json"
-            reply_first_line_blocker_receipt = f"/tmp/identity-reply-first-line-blocker-receipt-scan-{iid}.json"
-            send_time_reply_file = f"/tmp/identity-send-time-reply-scan-{iid}.txt"
-            send_time_reply_gate_blocker_receipt = (
-                f"/tmp/identity-send-time-reply-gate-blocker-receipt-scan-{iid}.json"
-            )
-            execution_reply_coherence_blocker_receipt = (
-                f"/tmp/identity-execution-reply-coherence-blocker-receipt-scan-{iid}.json"
-            )
-            checks = {
-                "scope_resolution": [
-                    "python3",
-                    "scripts/validate_identity_scope_resolution.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--scope",
-                    scan_scope_hint,
-                ],
-                "scope_isolation": [
-                    "python3",
-                    "scripts/validate_identity_scope_isolation.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--scope",
-                    scan_scope_hint,
-                ],
-                "scope_persistence": [
-                    "python3",
-                    "scripts/validate_identity_scope_persistence.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--scope",
-                    scan_scope_hint,
-                ],
-                "runtime_contract": [
-                    "python3",
-                    "scripts/validate_identity_runtime_contract.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                ],
-                "identity_home_catalog_alignment": [
-                    "python3",
-                    "scripts/validate_identity_home_catalog_alignment.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--identity-home",
-                    str(catalog.parent.resolve()),
-                    "--json-only",
-                ],
-                "fixture_runtime_boundary": [
-                    "python3",
-                    "scripts/validate_fixture_runtime_boundary.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "actor_session_binding": [
-                    "python3",
-                    "scripts/validate_actor_session_binding.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--actor-id",
-                    actor_id,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "actor_session_multibinding_concurrency": [
-                    "python3",
-                    "scripts/validate_actor_session_multibinding_concurrency.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--actor-id",
-                    actor_id,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "no_implicit_switch": [
-                    "python3",
-                    "scripts/validate_no_implicit_switch.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "cross_actor_isolation": [
-                    "python3",
-                    "scripts/validate_cross_actor_isolation.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "session_refresh_status": [
-                    "python3",
-                    "scripts/validate_identity_session_refresh_status.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--actor-id",
-                    actor_id,
-                    "--operation",
-                    "scan",
-                    "--baseline-policy",
-                    "warn",
-                    "--json-only",
-                ],
-                "response_stamp_render": [
-                    "python3",
-                    "scripts/render_identity_response_stamp.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--view",
-                    "external",
-                    "--disclosure-level",
-                    "standard",
-                    "--out",
-                    stamp_artifact,
-                    "--json-only",
-                ],
-                "response_stamp_validation": [
-                    "python3",
-                    "scripts/validate_identity_response_stamp.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--stamp-json",
-                    stamp_artifact,
-                    "--force-check",
-                    "--enforce-user-visible-gate",
-                    "--operation",
-                    "scan",
-                    "--blocker-receipt-out",
-                    stamp_blocker_receipt,
-                    "--json-only",
-                ],
-                "response_stamp_blocker_receipt": [
-                    "python3",
-                    "scripts/validate_identity_response_stamp_blocker_receipt.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--force-check",
-                    "--receipt",
-                    stamp_blocker_receipt,
-                    "--json-only",
-                ],
-                "reply_identity_context_first_line": [
-                    "python3",
-                    "scripts/validate_reply_identity_context_first_line.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--stamp-json",
-                    stamp_artifact,
-                    "--force-check",
-                    "--enforce-first-line-gate",
-                    "--operation",
-                    "scan",
-                    "--blocker-receipt-out",
-                    reply_first_line_blocker_receipt,
-                    "--json-only",
-                ],
-                "layer_intent_resolution": [
-                    "python3",
-                    "scripts/validate_layer_intent_resolution.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--stamp-json",
-                    stamp_artifact,
-                    "--force-check",
-                    "--enforce-layer-intent-gate",
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "send_time_reply_gate": [
-                    "python3",
-                    "scripts/compose_and_validate_governed_reply.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--body-text",
-                    "SCAN_SEND_TIME_REPLY_BODY",
-                    "--out-reply-file",
-                    send_time_reply_file,
-                    "--blocker-receipt-out",
-                    send_time_reply_gate_blocker_receipt,
-                    "--outlet-channel-id",
-                    "governed_adapter_v1",
-                    "--actor-id",
-                    actor_id,
-                    "--json-only",
-                ],
-                "send_time_reply_gate_validate": [
-                    "python3",
-                    "scripts/validate_send_time_reply_gate.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--reply-file",
-                    send_time_reply_file,
-                    "--force-check",
-                    "--enforce-send-time-gate",
-                    "--reply-outlet-guard-applied",
-                    "--outlet-channel-id",
-                    "governed_adapter_v1",
-                    "--reply-transport-ref",
-                    send_time_reply_file,
-                    "--operation",
-                    "scan",
-                    "--blocker-receipt-out",
-                    send_time_reply_gate_blocker_receipt,
-                    "--actor-id",
-                    actor_id,
-                    "--json-only",
-                ],
-                "headstamp_recurrence_closure": [
-                    "python3",
-                    "scripts/validate_headstamp_recurrence_closure.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--actor-id",
-                    actor_id,
-                    "--json-only",
-                ],
-                "execution_reply_identity_coherence": [
-                    "python3",
-                    "scripts/validate_execution_reply_identity_coherence.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--stamp-json",
-                    stamp_artifact,
-                    "--force-check",
-                    "--enforce-coherence-gate",
-                    "--operation",
-                    "scan",
-                    "--blocker-receipt-out",
-                    execution_reply_coherence_blocker_receipt,
-                    "--json-only",
-                ],
-                "tool_installation": [
-                    "python3",
-                    "scripts/validate_identity_tool_installation.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                ],
-                "install_provenance": [
-                    "python3",
-                    "scripts/validate_identity_install_provenance.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                ],
-                "vendor_api_discovery": [
-                    "python3",
-                    "scripts/validate_identity_vendor_api_discovery.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                ],
-                "vendor_api_solution": [
-                    "python3",
-                    "scripts/validate_identity_vendor_api_solution.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                ],
-                "semantic_routing_guard": [
-                    "python3",
-                    "scripts/validate_semantic_routing_guard.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "instance_protocol_split_receipt": [
-                    "python3",
-                    "scripts/validate_instance_protocol_split_receipt.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "protocol_vendor_semantic_isolation": [
-                    "python3",
-                    "scripts/validate_protocol_vendor_semantic_isolation.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "external_source_trust_chain": [
-                    "python3",
-                    "scripts/validate_external_source_trust_chain.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "protocol_data_sanitization_boundary": [
-                    "python3",
-                    "scripts/validate_protocol_data_sanitization_boundary.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "platform_optimization_discovery_trigger": [
-                    "python3",
-                    "scripts/trigger_platform_optimization_discovery.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "discovery_requiredization": [
-                    "python3",
-                    "scripts/validate_discovery_requiredization.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "vibe_coding_feeding_pack": [
-                    "python3",
-                    "scripts/build_vibe_coding_feeding_pack.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--out-root",
-                    "/tmp/vibe-coding-feeding-packs",
-                    "--json-only",
-                ],
-                "capability_fit_optimization": [
-                    "python3",
-                    "scripts/validate_identity_capability_fit_optimization.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "capability_composition_before_discovery": [
-                    "python3",
-                    "scripts/validate_capability_composition_before_discovery.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "capability_fit_review_freshness": [
-                    "python3",
-                    "scripts/validate_capability_fit_review_freshness.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "capability_fit_roundtable_evidence": [
-                    "python3",
-                    "scripts/validate_capability_fit_roundtable_evidence.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "capability_fit_review_trigger": [
-                    "python3",
-                    "scripts/trigger_capability_fit_review.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "capability_fit_matrix_builder": [
-                    "python3",
-                    "scripts/build_capability_fit_matrix.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--out-root",
-                    "/tmp/capability-fit-matrices",
-                    "--json-only",
-                ],
-                "vendor_namespace_separation": [
-                    "python3",
-                    "scripts/validate_vendor_namespace_separation.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "work_layer_gate_set_routing": [
-                    "python3",
-                    "scripts/validate_work_layer_gate_set_routing.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--applied-gate-set",
-                    lane_applied_gate_set,
-                    "--force-check",
-                    "--json-only",
-                ],
-                "protocol_feedback_reply_channel": [
-                    "python3",
-                    "scripts/validate_protocol_feedback_reply_channel.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--force-check",
-                    "--json-only",
-                ],
-                "protocol_feedback_bootstrap_ready": [
-                    "python3",
-                    "scripts/validate_protocol_feedback_bootstrap_ready.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--force-check",
-                    "--json-only",
-                ],
-                "protocol_entry_candidate_bridge": [
-                    "python3",
-                    "scripts/validate_protocol_entry_candidate_bridge.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--force-check",
-                    "--json-only",
-                ],
-                "protocol_inquiry_followup_chain": [
-                    "python3",
-                    "scripts/validate_protocol_inquiry_followup_chain.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--force-check",
-                    "--json-only",
-                ],
-                "protocol_feedback_sidecar": [
-                    "python3",
-                    "scripts/validate_protocol_feedback_sidecar_contract.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "instance_base_repo_write_boundary": [
-                    "python3",
-                    "scripts/validate_instance_base_repo_write_boundary.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "protocol_feedback_ssot_archival": [
-                    "python3",
-                    "scripts/validate_protocol_feedback_ssot_archival.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "required_contract_coverage": [
-                    "python3",
-                    "scripts/validate_required_contract_coverage.py",
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--identity-id",
-                    iid,
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "writeback_continuity": [
-                    "python3",
-                    "scripts/validate_writeback_continuity.py",
-                    "--identity-id",
-                    iid,
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "post_execution_mandatory": [
-                    "python3",
-                    "scripts/validate_post_execution_mandatory.py",
-                    "--identity-id",
-                    iid,
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--operation",
-                    "scan",
-                    "--json-only",
-                ],
-                "protocol_baseline_freshness": [
-                    "python3",
-                    "scripts/validate_identity_protocol_baseline_freshness.py",
-                    "--identity-id",
-                    iid,
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--baseline-policy",
-                    "warn",
-                    "--json-only",
-                ],
-                "protocol_version_alignment": [
-                    "python3",
-                    "scripts/validate_identity_protocol_version_alignment.py",
-                    "--identity-id",
-                    iid,
-                    "--catalog",
-                    str(catalog),
-                    "--repo-catalog",
-                    str(repo_catalog),
-                    "--operation",
-                    "scan",
-                    "--alignment-policy",
-                    "warn",
-                    "--json-only",
-                ],
-                "e2e_hermetic_runtime_import": [
-                    "python3",
-                    "scripts/validate_e2e_hermetic_runtime_import.py",
-                    "--operation",
-                    "scan",
-                    "--pythonpath-bootstrap-mode",
-                    "internal_bootstrap",
-                    "--json-only",
-                ],
-            }
-            if layer_intent_text:
-                for key in (
-                    "response_stamp_render",
-                    "send_time_reply_gate",
-                    "layer_intent_resolution",
-                    "reply_identity_context_first_line",
-                    "send_time_reply_gate_validate",
-                    "execution_reply_identity_coherence",
-                    "protocol_feedback_bootstrap_ready",
-                    "protocol_entry_candidate_bridge",
-                    "protocol_inquiry_followup_chain",
-                    "work_layer_gate_set_routing",
-                ):
-                    checks[key].extend(["--layer-intent-text", layer_intent_text])
-            if expected_work_layer:
-                for key in (
-                    "layer_intent_resolution",
-                    "reply_identity_context_first_line",
-                    "send_time_reply_gate_validate",
-                    "execution_reply_identity_coherence",
-                    "protocol_feedback_bootstrap_ready",
-                    "protocol_entry_candidate_bridge",
-                    "protocol_inquiry_followup_chain",
-                    "work_layer_gate_set_routing",
-                ):
-                    checks[key].extend(["--expected-work-layer", expected_work_layer])
-                checks["send_time_reply_gate"].extend(["--work-layer", expected_work_layer])
-            if expected_source_layer:
-                for key in (
-                    "layer_intent_resolution",
-                    "reply_identity_context_first_line",
-                    "send_time_reply_gate_validate",
-                    "execution_reply_identity_coherence",
-                ):
-                    checks[key].extend(["--expected-source-layer", expected_source_layer])
-                checks["send_time_reply_gate"].extend(["--source-layer", expected_source_layer])
-                for key in (
-                    "protocol_feedback_bootstrap_ready",
-                    "protocol_entry_candidate_bridge",
-                    "protocol_inquiry_followup_chain",
-                    "work_layer_gate_set_routing",
-                ):
-                    checks[key].extend(["--source-layer", expected_source_layer])
-            if not is_fixture:
-                checks["prompt_quality"] = [
-                    "python3",
-                    "scripts/validate_identity_prompt_quality.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                    "--scope",
-                    resolved_scope,
+            if manifest is not None:
+                identity_rows = [
+                    r
+                    for r in [*repo_rows, *(x for c in catalog_rows.values() for x in c)]
+                    if str(r.get("id", "")).strip() == iid
                 ]
-            else:
-                item["checks"]["prompt_quality"] = {
-                    "rc": 0,
-                    "ok": True,
-                    "tail": f"[OK] prompt quality skipped for fixture/demo identity={iid}",
-                    "skipped": True,
+
+                fingerprint_inputs: dict[str, Any] = {
+                    "identity_id": iid,
+                    "rows": identity_rows,
+                    "catalog": catalog,
+                    "pack_path": str(row.get("pack_path", "")),
+                    "scan_context": {**scan_context, "scan_scope_hint": scan_scope_hint},
                 }
-            cap_preflight_cmd = [
-                "python3",
-                "scripts/validate_identity_capability_activation.py",
-                "--catalog",
-                str(catalog),
-                "--repo-catalog",
-                str(repo_catalog),
-                "--identity-id",
-                iid,
-            ]
-            if is_active_runtime:
-                cap_preflight_cmd.append("--require-activated")
-            checks["capability_activation_preflight"] = cap_preflight_cmd
-            checks["dialogue_content"] = [
-                "python3",
-                "scripts/validate_identity_dialogue_content.py",
-                "--catalog",
-                str(catalog),
-                "--identity-id",
-                iid,
-            ]
-            checks["dialogue_cross_validation"] = [
-                "python3",
-                "scripts/validate_identity_dialogue_cross_validation.py",
-                "--catalog",
-                str(catalog),
-                "--identity-id",
-                iid,
-            ]
-            checks["dialogue_result_support"] = [
-                "python3",
-                "scripts/validate_identity_dialogue_result_support.py",
-                "--catalog",
-                str(catalog),
-                "--identity-id",
-                iid,
-            ]
-            checks["execution_report_freshness"] = [
-                "python3",
-                "scripts/validate_execution_report_freshness.py",
-                "--identity-id",
-                iid,
-                "--catalog",
-                str(catalog),
-                "--repo-catalog",
-                str(repo_catalog),
-                "--execution-report-policy",
-                "warn",
-                "--json-only",
-            ]
-            if is_active_runtime:
-                runtime_report_dir_path = Path(str(row.get("pack_path", ""))).expanduser().resolve() / "runtime" / "reports"
-                runtime_report_dir = str(runtime_report_dir_path)
-                checks["session_pointer"] = [
-                    "python3",
-                    "scripts/validate_identity_session_pointer_consistency.py",
-                    "--catalog",
-                    str(catalog),
-                    "--identity-id",
-                    iid,
-                ]
-                checks["prompt_activation"] = [
-                    "python3",
-                    "scripts/validate_identity_prompt_activation.py",
-                    "--identity-id",
-                    iid,
-                    "--catalog",
-                    str(catalog),
-                    "--report-dir",
-                    runtime_report_dir,
-                ]
-                checks["prompt_lifecycle"] = [
-                    "python3",
-                    "scripts/validate_identity_prompt_lifecycle.py",
-                    "--identity-id",
-                    iid,
-                    "--report-dir",
-                    runtime_report_dir,
-                ]
-                latest_report = _latest_runtime_report(iid, runtime_report_dir_path)
-                if latest_report:
-                    cap_report_cmd = [
-                        "python3",
-                        "scripts/validate_identity_capability_activation.py",
-                        "--identity-id",
-                        iid,
-                        "--report",
-                        str(latest_report),
-                    ]
-                    report_meta: dict[str, Any] = {}
-                    try:
-                        loaded = json.loads(latest_report.read_text(encoding="utf-8"))
-                        if isinstance(loaded, dict):
-                            report_meta = loaded
-                    except Exception:
-                        report_meta = {}
-                    report_all_ok = bool(report_meta.get("all_ok"))
-                    report_writeback_status = str(report_meta.get("writeback_status", "")).strip().upper()
-                    report_permission_state = str(report_meta.get("permission_state", "")).strip().upper()
-                    if report_all_ok and report_writeback_status == "WRITTEN" and report_permission_state == "WRITEBACK_WRITTEN":
-                        cap_report_cmd.append("--require-activated")
-                    checks["capability_activation_report"] = cap_report_cmd
-            for name, cmd in checks.items():
-                r = _run(cmd, cwd=repo_root)
-                check_payload: dict[str, Any] = {"rc": r.rc, "ok": r.ok, "tail": r.tail}
-                if name in {"capability_activation_preflight", "capability_activation_report"}:
-                    cap_status, cap_code = _extract_capability_signal(r.stdout)
-                    if cap_status:
-                        check_payload["capability_activation_status"] = cap_status
-                    if cap_code:
-                        check_payload["capability_activation_error_code"] = cap_code
-                    if cap_code == "IP-CAP-003":
-                        check_payload["env_auth_blocked"] = True
-                    if name == "capability_activation_preflight" and r.rc != 0 and cap_code == "IP-CAP-003":
-                        fallback_cmd = _replace_activation_policy(cmd, "route-any-ready")
-                        fallback = _run(fallback_cmd, cwd=repo_root)
-                        fb_status, fb_code = _extract_capability_signal(fallback.stdout)
-                        check_payload["capability_activation_fallback_attempted"] = True
-                        check_payload["capability_activation_fallback_policy"] = "route-any-ready"
-                        check_payload["capability_activation_fallback_rc"] = fallback.rc
-                        check_payload["capability_activation_fallback_tail"] = fallback.tail
-                        if fb_status:
-                            check_payload["capability_activation_fallback_status"] = fb_status
-                        if fb_code:
-                            check_payload["capability_activation_fallback_error_code"] = fb_code
-                        if fallback.ok:
-                            check_payload["rc"] = 0
-                            check_payload["ok"] = True
-                            check_payload["tail"] = fallback.tail
-                            check_payload["capability_activation_status"] = fb_status or "ACTIVATED"
-                            check_payload["capability_activation_error_code"] = fb_code
-                            check_payload["capability_activation_policy_effective"] = "route-any-ready"
-                if name == "required_contract_coverage":
-                    coverage_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "required_contract_total",
-                        "required_contract_passed",
-                        "required_contract_coverage_rate",
-                        "discovery_required_total",
-                        "discovery_required_passed",
-                        "discovery_required_coverage_rate",
-                        "discovery_required_gate_failed",
-                        "skipped_contract_count",
-                        "failed_required_contract_count",
-                        "failed_optional_contract_count",
-                    ):
-                        if k in coverage_doc:
-                            check_payload[k] = coverage_doc.get(k)
-                if name == "semantic_routing_guard":
-                    semantic_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "semantic_routing_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "feedback_batch_path",
-                        "intent_domain",
-                        "intent_confidence",
-                        "classifier_reason",
-                        "legacy_namespace_refs",
-                        "stale_reasons",
-                    ):
-                        if k in semantic_doc:
-                            check_payload[k] = semantic_doc.get(k)
-                if name == "instance_protocol_split_receipt":
-                    split_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "instance_protocol_split_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "receipt_path",
-                        "split_notice",
-                        "instance_actions_ref",
-                        "protocol_actions_ref",
-                        "feedback_triggered",
-                        "evidence_index_ref",
-                        "feedback_paths",
-                        "trigger_conditions",
-                        "alias_fields_used",
-                        "stale_reasons",
-                    ):
-                        if k in split_doc:
-                            check_payload[k] = split_doc.get(k)
-                if name == "work_layer_gate_set_routing":
-                    lane_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "work_layer_gate_set_routing_status",
-                        "error_code",
-                        "work_layer",
-                        "source_layer",
-                        "applied_gate_set",
-                        "protocol_context_detected",
-                        "protocol_context_reasons",
-                        "session_lane_lock",
-                        "session_lane_lock_source",
-                        "session_lane_lock_receipt",
-                        "session_lane_lock_exit_receipt",
-                        "lane_resolution_decision",
-                        "lane_resolution_blocked",
-                        "lane_resolution_error_code",
-                        "lane_transition_reason",
-                        "protocol_feedback_triggered",
-                        "protocol_feedback_paths",
-                        "pending_receipt_path",
-                        "lane_lock_receipt_path",
-                        "protocol_relevant_diff_detected",
-                        "protocol_relevant_files",
-                        "stale_reasons",
-                    ):
-                        if k in lane_doc:
-                            check_payload[k] = lane_doc.get(k)
-                if name == "discovery_requiredization":
-                    dreq_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "discovery_requiredization_status",
-                        "error_code",
-                        "required_contract",
-                        "required_contract_declared",
-                        "auto_required_signal",
-                        "requiredization_triggered",
-                        "trigger_classes",
-                        "window_rounds",
-                        "feedback_batches",
-                        "trigger_condition_flags",
-                        "discovery_contract_required_state",
-                        "requiredized_all_discovery_contracts",
-                        "requiredization_receipt_path",
-                        "requiredization_receipt_linked",
-                        "evidence_index_path",
-                        "ci_required_validators_missing",
-                        "discovery_required_total",
-                        "discovery_required_passed",
-                        "discovery_required_coverage_rate",
-                        "stale_reasons",
-                    ):
-                        if k in dreq_doc:
-                            check_payload[k] = dreq_doc.get(k)
-                if name == "protocol_vendor_semantic_isolation":
-                    semantic_iso_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "protocol_vendor_semantic_isolation_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "feedback_batch_path",
-                        "intent_domain",
-                        "intent_confidence",
-                        "intent_domain_before",
-                        "intent_domain_after",
-                        "switch_receipt_required",
-                        "switch_receipt_present",
-                        "switch_receipt_fields",
-                        "protocol_vendor_refs",
-                        "business_partner_refs",
-                        "stale_reasons",
-                    ):
-                        if k in semantic_iso_doc:
-                            check_payload[k] = semantic_iso_doc.get(k)
-                if name == "external_source_trust_chain":
-                    src_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "external_source_trust_chain_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "feedback_batch_path",
-                        "allowed_trust_tiers",
-                        "conclusion_required_tiers",
-                        "source_row_count",
-                        "conclusion_source_count",
-                        "candidate_source_count",
-                        "unknown_in_conclusion_refs",
-                        "missing_tier_refs",
-                        "missing_trace_refs",
-                        "unknown_candidate_without_downgrade",
-                        "stale_reasons",
-                    ):
-                        if k in src_doc:
-                            check_payload[k] = src_doc.get(k)
-                if name == "protocol_data_sanitization_boundary":
-                    dsn_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "protocol_data_sanitization_boundary_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "feedback_batch_path",
-                        "forbidden_key_hits",
-                        "sensitive_pattern_hits",
-                        "violation_count",
-                        "stale_reasons",
-                    ):
-                        if k in dsn_doc:
-                            check_payload[k] = dsn_doc.get(k)
-                if name == "platform_optimization_discovery_trigger":
-                    opt_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "platform_optimization_discovery_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "triggered",
-                        "trigger_reason",
-                        "discovery_scope",
-                        "official_doc_retrieval_set",
-                        "cross_validation_summary",
-                        "upgrade_proposal_ref",
-                        "feedback_batches",
-                        "stale_reasons",
-                    ):
-                        if k in opt_doc:
-                            check_payload[k] = opt_doc.get(k)
-                if name == "vibe_coding_feeding_pack":
-                    pack_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "vibe_coding_feeding_pack_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "pack_root",
-                        "pack_id",
-                        "pack_files",
-                        "feedback_batch_path",
-                        "feedback_batch_sha256",
-                        "evidence_index_path",
-                        "evidence_index_linked",
-                        "deterministic_manifest_sha256",
-                        "sanitization_check_passed",
-                        "stale_reasons",
-                    ):
-                        if k in pack_doc:
-                            check_payload[k] = pack_doc.get(k)
-                if name == "capability_fit_optimization":
-                    fit_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "capability_fit_optimization_status",
-                        "error_code",
-                        "required_contract",
-                        "fit_matrix_path",
-                        "matrix_candidate_count",
-                        "selected_candidate_count",
-                        "selected_candidate_ids",
-                        "missing_required_fields",
-                        "selected_missing_fields",
-                        "next_review_at",
-                        "review_interval_days",
-                        "review_freshness_status",
-                        "stale_reasons",
-                    ):
-                        if k in fit_doc:
-                            check_payload[k] = fit_doc.get(k)
-                if name == "capability_composition_before_discovery":
-                    comp_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "compose_before_discovery_status",
-                        "error_code",
-                        "required_contract",
-                        "fit_matrix_path",
-                        "existing_composition_candidate_count",
-                        "selected_candidate_type",
-                        "decision_basis",
-                        "stale_reasons",
-                    ):
-                        if k in comp_doc:
-                            check_payload[k] = comp_doc.get(k)
-                if name == "capability_fit_review_freshness":
-                    fresh_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "capability_fit_review_freshness_status",
-                        "error_code",
-                        "required_contract",
-                        "fit_matrix_path",
-                        "selected_candidate_id",
-                        "selected_candidate_type",
-                        "next_review_at",
-                        "review_interval_days",
-                        "review_freshness_status",
-                        "overdue_by_days",
-                        "stale_reasons",
-                    ):
-                        if k in fresh_doc:
-                            check_payload[k] = fresh_doc.get(k)
-                if name == "capability_fit_roundtable_evidence":
-                    round_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "capability_fit_roundtable_status",
-                        "error_code",
-                        "required_contract",
-                        "fit_matrix_path",
-                        "roundtable_evidence_path",
-                        "selected_candidate_id",
-                        "selected_candidate_type",
-                        "roundtable_required",
-                        "facts_count",
-                        "inferences_count",
-                        "selected_fact_refs",
-                        "stale_reasons",
-                    ):
-                        if k in round_doc:
-                            check_payload[k] = round_doc.get(k)
-                if name == "capability_fit_review_trigger":
-                    trig_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "capability_fit_review_trigger_status",
-                        "error_code",
-                        "required_contract",
-                        "triggered",
-                        "trigger_reason",
-                        "fit_matrix_path",
-                        "selected_candidate_id",
-                        "selected_candidate_type",
-                        "review_freshness_status",
-                        "roundtable_required",
-                        "roundtable_evidence_path",
-                        "stale_reasons",
-                    ):
-                        if k in trig_doc:
-                            check_payload[k] = trig_doc.get(k)
-                if name == "capability_fit_matrix_builder":
-                    builder_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "capability_fit_matrix_builder_status",
-                        "error_code",
-                        "required_contract",
-                        "matrix_path",
-                        "matrix_candidate_count",
-                        "selected_candidate_count",
-                        "selected_candidate_id",
-                        "selected_candidate_type",
-                        "inventory_snapshot_path",
-                        "external_candidate_source_path",
-                        "stale_reasons",
-                    ):
-                        if k in builder_doc:
-                            check_payload[k] = builder_doc.get(k)
-                if name == "vendor_namespace_separation":
-                    namespace_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "vendor_namespace_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "feedback_root",
-                        "protocol_vendor_file_count",
-                        "business_partner_file_count",
-                        "legacy_vendor_file_count",
-                        "legacy_namespace_refs",
-                        "stale_reasons",
-                    ):
-                        if k in namespace_doc:
-                            check_payload[k] = namespace_doc.get(k)
-                if name == "protocol_feedback_sidecar":
-                    sidecar_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "sidecar_contract_status",
-                        "sidecar_error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "enforce_blocking",
-                        "escalation_required",
-                        "escalation_decision",
-                        "blocking_error_codes",
-                        "p0_violations",
-                        "track_a",
-                        "track_b",
-                        "stale_reasons",
-                    ):
-                        if k in sidecar_doc:
-                            check_payload[k] = sidecar_doc.get(k)
-                if name == "instance_base_repo_write_boundary":
-                    base_boundary_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "base_repo_write_boundary_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "report_selected_path",
-                        "source_mode",
-                        "allowlist_prefixes",
-                        "denylist_prefixes",
-                        "repo_relative_candidates",
-                        "allowed_paths",
-                        "blocked_paths",
-                        "explicit_deny_hits",
-                        "override_receipt_path",
-                        "override_applied",
-                        "stale_reasons",
-                    ):
-                        if k in base_boundary_doc:
-                            check_payload[k] = base_boundary_doc.get(k)
-                if name == "protocol_feedback_ssot_archival":
-                    archival_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "feedback_ssot_archival_status",
-                        "error_code",
-                        "required_contract",
-                        "auto_required_signal",
-                        "feedback_root",
-                        "outbox_dir",
-                        "evidence_index_path",
-                        "batch_file_count",
-                        "batch_files",
-                        "index_linked_batches",
-                        "index_unlinked_batches",
-                        "mirror_candidate_refs",
-                        "stale_reasons",
-                    ):
-                        if k in archival_doc:
-                            check_payload[k] = archival_doc.get(k)
-                if name == "writeback_continuity":
-                    writeback_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "writeback_continuity_status",
-                        "error_code",
-                        "required_contract",
-                        "report_selected_path",
-                        "writeback_mode",
-                        "writeback_status",
-                        "upgrade_required",
-                        "all_ok",
-                        "degrade_reason",
-                        "risk_level",
-                        "next_recovery_action",
-                        "stale_reasons",
-                    ):
-                        if k in writeback_doc:
-                            check_payload[k] = writeback_doc.get(k)
-                if name == "post_execution_mandatory":
-                    post_exec_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "post_execution_mandatory_status",
-                        "error_code",
-                        "required_contract",
-                        "report_selected_path",
-                        "missing_fields",
-                        "writeback_mode",
-                        "writeback_status",
-                        "next_action",
-                        "next_recovery_action",
-                        "stale_reasons",
-                    ):
-                        if k in post_exec_doc:
-                            check_payload[k] = post_exec_doc.get(k)
-                if name == "execution_report_freshness":
-                    freshness_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "freshness_status",
-                        "freshness_error_code",
-                        "report_selected_path",
-                        "stale_reasons",
-                        "checks",
-                    ):
-                        if k in freshness_doc:
-                            check_payload[k] = freshness_doc.get(k)
-                if name == "protocol_baseline_freshness":
-                    baseline_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "baseline_status",
-                        "baseline_error_code",
-                        "report_selected_path",
-                        "report_protocol_root",
-                        "report_protocol_commit_sha",
-                        "protocol_head_sha_at_run_start",
-                        "baseline_reference_mode",
-                        "current_protocol_head_sha",
-                        "head_drift_detected",
-                        "lag_commits",
-                        "stale_reasons",
-                    ):
-                        if k in baseline_doc:
-                            check_payload[k] = baseline_doc.get(k)
-                if name == "protocol_version_alignment":
-                    align_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "protocol_version_alignment_status",
-                        "error_code",
-                        "required_contract",
-                        "operation",
-                        "alignment_policy",
-                        "report_selected_path",
-                        "tuple_checks",
-                        "stale_reasons",
-                    ):
-                        if k in align_doc:
-                            check_payload[k] = align_doc.get(k)
-                if name == "e2e_hermetic_runtime_import":
-                    herm_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "e2e_hermetic_runtime_status",
-                        "pythonpath_bootstrap_mode",
-                        "import_preflight_status",
-                        "import_preflight_error_code",
-                        "missing_modules",
-                        "stale_reasons",
-                    ):
-                        if k in herm_doc:
-                            check_payload[k] = herm_doc.get(k)
-                if name == "identity_home_catalog_alignment":
-                    home_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "path_governance_status",
-                        "path_error_codes",
-                        "identity_home",
-                        "identity_home_expected",
-                        "identity_home_source",
-                        "stale_reasons",
-                    ):
-                        if k in home_doc:
-                            check_payload[k] = home_doc.get(k)
-                if name == "fixture_runtime_boundary":
-                    boundary_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "path_governance_status",
-                        "path_error_codes",
-                        "operation",
-                        "allow_fixture_runtime",
-                        "fixture_audit_receipt",
-                        "stale_reasons",
-                    ):
-                        if k in boundary_doc:
-                            check_payload[k] = boundary_doc.get(k)
-                if name == "actor_session_binding":
-                    actor_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "actor_binding_status",
-                        "error_code",
-                        "actor_id",
-                        "actor_session_path",
-                        "bound_identity_id",
-                        "catalog_identity_status",
-                        "stale_reasons",
-                    ):
-                        if k in actor_doc:
-                            check_payload[k] = actor_doc.get(k)
-                if name == "actor_session_multibinding_concurrency":
-                    mb_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "actor_session_multibinding_status",
-                        "error_code",
-                        "binding_key_mode",
-                        "session_entry_count",
-                        "cas_checked",
-                        "cas_conflict_detected",
-                        "non_activation_mutation_detected",
-                        "rebind_receipt_status",
-                        "dropped_peer_session_count",
-                        "stale_reasons",
-                    ):
-                        if k in mb_doc:
-                            check_payload[k] = mb_doc.get(k)
-                if name == "no_implicit_switch":
-                    implicit_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "implicit_switch_status",
-                        "error_code",
-                        "switch_report_path",
-                        "switch_id",
-                        "actor_id",
-                        "run_id",
-                        "cross_actor_demotion_detected",
-                        "stale_reasons",
-                    ):
-                        if k in implicit_doc:
-                            check_payload[k] = implicit_doc.get(k)
-                if name == "cross_actor_isolation":
-                    isolation_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "cross_actor_isolation_status",
-                        "error_code",
-                        "actor_binding_count",
-                        "active_identities",
-                        "stale_reasons",
-                    ):
-                        if k in isolation_doc:
-                            check_payload[k] = isolation_doc.get(k)
-                if name == "session_refresh_status":
-                    refresh_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "session_refresh_status",
-                        "error_code",
-                        "actor_id",
-                        "lease_status",
-                        "pointer_consistency",
-                        "risk_flags",
-                        "next_action",
-                        "baseline_status",
-                        "baseline_error_code",
-                        "report_protocol_commit_sha",
-                        "protocol_head_sha_at_run_start",
-                        "baseline_reference_mode",
-                        "current_protocol_head_sha",
-                        "head_drift_detected",
-                        "lag_commits",
-                        "report_selected_path",
-                        "stale_reasons",
-                    ):
-                        if k in refresh_doc:
-                            check_payload[k] = refresh_doc.get(k)
-                if name == "response_stamp_validation":
-                    stamp_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "stamp_status",
-                        "error_code",
-                        "stale_reasons",
-                        "blocker_receipt_path",
-                        "reply_sample_count",
-                        "reply_stamp_missing_count",
-                        "reply_stamp_missing_refs",
-                    ):
-                        if k in stamp_doc:
-                            check_payload[k] = stamp_doc.get(k)
-                if name == "response_stamp_blocker_receipt":
-                    receipt_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "receipt_status",
-                        "error_code",
-                        "stale_reasons",
-                    ):
-                        if k in receipt_doc:
-                            check_payload[k] = receipt_doc.get(k)
-                if name == "reply_identity_context_first_line":
-                    reply_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "reply_first_line_status",
-                        "error_code",
-                        "reply_first_line_missing_count",
-                        "reply_first_line_missing_refs",
-                        "reply_sample_count",
-                        "reply_evidence_ref",
-                        "blocker_receipt_path",
-                        "stale_reasons",
-                    ):
-                        if k in reply_doc:
-                            check_payload[k] = reply_doc.get(k)
-                if name == "send_time_reply_gate":
-                    send_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "send_time_gate_status",
-                        "error_code",
-                        "governed_outlet_enforced",
-                        "outlet_channel_id",
-                        "outlet_preflight_receipt",
-                        "outlet_bypass_detected",
-                        "reply_evidence_mode",
-                        "reply_evidence_ref",
-                        "reply_sample_count",
-                        "reply_first_line_missing_count",
-                        "reply_first_line_missing_refs",
-                        "blocker_receipt_path",
-                        "stale_reasons",
-                    ):
-                        if k in send_doc:
-                            check_payload[k] = send_doc.get(k)
-                if name == "execution_reply_identity_coherence":
-                    coherence_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "coherence_status",
-                        "coherence_decision",
-                        "error_code",
-                        "command_catalog_ref",
-                        "resolved_catalog_ref",
-                        "reply_catalog_ref",
-                        "command_identity_id",
-                        "resolved_identity_id",
-                        "reply_identity_id",
-                        "command_actor_id",
-                        "resolved_actor_id",
-                        "reply_actor_id",
-                        "mismatch_fields",
-                        "reply_evidence_ref",
-                        "blocker_receipt_path",
-                        "stale_reasons",
-                    ):
-                        if k in coherence_doc:
-                            check_payload[k] = coherence_doc.get(k)
-                if name == "headstamp_recurrence_closure":
-                    hs_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "headstamp_recurrence_closure_status",
-                        "static_wiring_status",
-                        "dynamic_replay_status",
-                        "error_code",
-                        "missing_wiring_items",
-                        "dynamic_cases",
-                        "stale_reasons",
-                    ):
-                        if k in hs_doc:
-                            check_payload[k] = hs_doc.get(k)
-                if name == "protocol_feedback_reply_channel":
-                    channel_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "protocol_feedback_reply_channel_status",
-                        "error_code",
-                        "primary_channel_root",
-                        "protocol_feedback_activity_detected",
-                        "protocol_feedback_activity_refs",
-                        "non_standard_primary_refs",
-                        "mirror_reference_refs",
-                        "split_receipt_requiredized",
-                        "split_receipt_status",
-                        "split_receipt_error_code",
-                        "stale_reasons",
-                    ):
-                        if k in channel_doc:
-                            check_payload[k] = channel_doc.get(k)
-                if name == "protocol_feedback_bootstrap_ready":
-                    boot_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "protocol_feedback_bootstrap_status",
-                        "protocol_feedback_bootstrap_mode",
-                        "bootstrap_created_paths",
-                        "bootstrap_receipt_path",
-                        "resolved_work_layer",
-                        "protocol_triggered",
-                        "protocol_lane_selected",
-                        "error_code",
-                        "stale_reasons",
-                    ):
-                        if k in boot_doc:
-                            check_payload[k] = boot_doc.get(k)
-                if name == "protocol_entry_candidate_bridge":
-                    candidate_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "protocol_entry_candidate_status",
-                        "protocol_entry_decision",
-                        "candidate_reason",
-                        "candidate_confidence",
-                        "clarification_required",
-                        "clarification_questions",
-                        "candidate_seed_outbox_ref",
-                        "candidate_seed_index_ref",
-                        "candidate_promotion_status",
-                        "error_code",
-                        "stale_reasons",
-                    ):
-                        if k in candidate_doc:
-                            check_payload[k] = candidate_doc.get(k)
-                if name == "protocol_inquiry_followup_chain":
-                    inquiry_doc = _parse_json_safely(r.stdout) or {}
-                    for k in (
-                        "protocol_inquiry_followup_chain_status",
-                        "inquiry_state",
-                        "followup_question_set",
-                        "signal_origin",
-                        "sanitization_paraphrase_ref",
-                        "protocol_feedback_seed_ref",
-                        "protocol_feedback_index_ref",
-                        "followup_round_count",
-                        "max_followup_rounds",
-                        "evidence_ttl_hours",
-                        "inquiry_requiredization_triggered",
-                        "inquiry_requiredization_receipt_path",
-                        "error_code",
-                        "stale_reasons",
-                    ):
-                        if k in inquiry_doc:
-                            check_payload[k] = inquiry_doc.get(k)
-                item["checks"][name] = check_payload
-
-            env = os.environ.copy()
-            env["IDENTITY_CATALOG"] = str(catalog)
-            three_plane = _run(
-                [
-                    "python3",
-                    "scripts/report_three_plane_status.py",
-                    "--identity-id",
-                    iid,
-                    "--scope",
-                    scan_scope_hint,
-                    *(["--layer-intent-text", layer_intent_text] if layer_intent_text else []),
-                    *(["--expected-work-layer", expected_work_layer] if expected_work_layer else []),
-                    *(["--expected-source-layer", expected_source_layer] if expected_source_layer else []),
-                    *(["--with-docs-contract"] if args.with_docs_contract else []),
-                ],
-                cwd=repo_root,
-                env=env,
+                unit_key = scan_unit_key(layer, catalog, iid)
+                cached_item = manifest.lookup(unit_key, identity_input_fingerprint(**fingerprint_inputs))
+                if cached_item is not None:
+                    item.update(cached_item)
+                    scanned.append(item)
+                    layer_out["identities"].append(item)
+                    continue
+                item["incremental"] = {"result": "executed"}
+                pre_scan = identity_input_fingerprint(**fingerprint_inputs, include_runtime=False)
+                executed_units.append((unit_key, item, fingerprint_inputs, pre_scan))
+            unit = f"{len(scanned)}:{layer}:{iid}"
+            # The same identity id in several catalogs shares /tmp scan artifacts; keep those scans serial.
+            previous_unit = last_unit_by_identity.get(iid, "")
+            _schedule_identity_scan(
+                scheduler,
+                opts,
+                unit=unit,
+                order=len(scanned),
+                after=previous_unit,
+                item=item,
+                row=row,
+                catalog=catalog,
+                iid=iid,
+                scan_scope_hint=scan_scope_hint,
             )
-            item["checks"]["three_plane"] = {"rc": three_plane.rc, "ok": three_plane.ok, "tail": three_plane.tail}
-            tp = _parse_json_safely(three_plane.stdout)
-            if tp:
-                item["three_plane"] = {
-                    "instance": tp.get("instance_plane_status"),
-                    "repo": tp.get("repo_plane_status"),
-                    "release": tp.get("release_plane_status"),
-                    "overall": tp.get("overall_release_decision"),
-                }
-            item["severity"] = _severity_for_row(item)
-            payload["summary"]["total_identities"] += 1
-            if item["severity"] == "P0":
-                payload["summary"]["p0"] += 1
-            elif item["severity"] == "P1":
-                payload["summary"]["p1"] += 1
-            else:
-                payload["summary"]["ok"] += 1
+            last_unit_by_identity[iid] = f"{unit}/three_plane"
+            scanned.append(item)
             layer_out["identities"].append(item)
 
         payload["catalogs"].append(layer_out)
 
+    scheduler.run()
+    if manifest is not None:
+        # Record the post-scan fingerprint (checks write pack runtime evidence, and the next
+        # incremental scan compares against that state), but only when nothing else the scan
+        # read changed while it ran; otherwise the verdict would belong to older inputs.
+        for unit_key, item, fingerprint_inputs, pre_scan in executed_units:
+            if identity_input_fingerprint(**fingerprint_inputs, include_runtime=False) != pre_scan:
+                manifest.unstable += 1
+                continue
+            manifest.record(unit_key, identity_input_fingerprint(**fingerprint_inputs), item)
+        manifest.save()
+        payload["incremental"] = manifest.summary()
+    for item in scanned:
+        item["severity"] = _severity_for_row(item)
+        payload["summary"]["total_identities"] += 1
+        if item["severity"] == "P0":
+            payload["summary"]["p0"] += 1
+        elif item["severity"] == "P1":
+            payload["summary"]["p1"] += 1
+        else:
+            payload["summary"]["ok"] += 1
+
+
     if args.scan_mode == "target":
         missing = sorted(target_set - matched_targets)
         payload["missing_target_identities"] = missing
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from actor_session_common import (
+    DEFAULT_BINDING_KEY_MODE,
+    SCHEMA_VERSION,
+    actor_session_path,
+    write_actor_binding_store,
+)
+from catalog_lock_common import write_catalog_yaml
+from check_log_store_common import check_log_path, check_log_sha256, write_check_log
+from execution_report_index_common import record_execution_report
+from task_scheduler_common import TaskScheduler
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TEMPLATE_ID = "synthetic-template-0000"
+DEFAULT_ID_PREFIX = "synthetic"
+# scaffold checks a synthetic execution report lists (first ones pass, the rest vary per run)
+SYNTHETIC_CHECKS = [
+    "scripts/validate_identity_runtime_contract.py",
+    "scripts/validate_identity_update_lifecycle.py",
+    "scripts/validate_identity_self_upgrade_enforcement.py",
+    "scripts/validate_identity_role_binding.py",
+    "scripts/validate_identity_capability_arbitration.py",
+]
+OBJECTIVE_DOMAINS = [
+    ("catalog-operations", "Keep product listings compliant and current."),
+    ("support-triage", "Route inbound support requests to the right resolver."),
+    ("release-coordination", "Coordinate release readiness evidence across teams."),
+    ("data-quality", "Detect and repair schema drift in shared datasets."),
+    ("vendor-onboarding", "Verify vendor API contracts before integration."),
+    ("growth-analytics", "Summarize funnel metrics and flag regressions."),
+]
+PLATFORM_CLASSES = ["ecommerce-web", "saas-admin", "mobile-app", "internal-tooling"]
+INTENT_DOMAINS = ["instance", "protocol", "mixed"]
+
+
+def identity_home_env(identity_home: Path) -> dict[str, str]:
+    """Environment selecting ``identity_home`` (global runtime mode when it is ``<CODEX_HOME>/identity``)."""
+    env = {"IDENTITY_HOME": str(identity_home)}
+    if identity_home.name == "identity":
+        env["CODEX_HOME"] = str(identity_home.parent)
+    return env
+
+
+def synthetic_identity_ids(count: int, prefix: str = DEFAULT_ID_PREFIX) -> list[str]:
+    return [f"{prefix}-{i:04d}" for i in range(count)]
+
+
+def _ts(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _scaffold_template(identity_home: Path) -> tuple[Path, dict[str, Any]]:
+    """One real pack from create_identity_pack.py plus the catalog row it registered."""
+    template_root = identity_home / ".synthetic-template"
+    catalog = template_root / "catalog.yaml"
+    shutil.rmtree(template_root, ignore_errors=True)
+    cmd = [
+        sys.executable,
+        "scripts/create_identity_pack.py",
+        "--id",
+        TEMPLATE_ID,
+        "--title",
+        "Synthetic Template",
+        "--description",
+        "synthetic identity for scale testing",
+        "--pack-root",
+        str(template_root / "instances"),
+        "--catalog",
+        str(catalog),
+        "--register",
+        "--skip-bootstrap-check",
+    ]
+    env = {**os.environ, **identity_home_env(identity_home)}
+    p = subprocess.run(cmd, capture_output=True, text=True, cwd=str(REPO_ROOT), env=env)
+    if p.returncode != 0:
+        tail = (p.stdout + p.stderr).strip().splitlines()[-1:] or [""]
+        raise RuntimeError(f"create_identity_pack failed: {tail[0]}")
+    rows = (yaml.safe_load(catalog.read_text(encoding="utf-8")) or {}).get("identities") or []
+    row = next((r for r in rows if isinstance(r, dict) and r.get("id") == TEMPLATE_ID), None)
+    if row is None:
+        raise RuntimeError("create_identity_pack did not register the template identity")
+    return template_root / "instances" / TEMPLATE_ID, row
+
+
+def _rehash_check_results(doc: Any, pack: Path) -> None:
+    # cloned replay evidence embeds sha256 of logs whose text changed with the identity id
+    if isinstance(doc, dict):
+        for row in doc.get("check_results") or []:
+            if isinstance(row, dict) and row.get("log_path") and row.get("sha256"):
+                log_path = Path(str(row["log_path"])).expanduser()
+                if not log_path.is_absolute():
+                    log_path = pack / log_path
+                if log_path.exists():
+                    row["sha256"] = check_log_sha256(log_path)
+        for value in doc.values():
+            if isinstance(value, (dict, list)):
+                _rehash_check_results(value, pack)
+    elif isinstance(doc, list):
+        for value in doc:
+            _rehash_check_results(value, pack)
+
+
+def _clone_pack(template_pack: Path, pack: Path, identity_id: str) -> None:
+    replacements = [(str(template_pack), str(pack)), (TEMPLATE_ID, identity_id)]
+    json_files: list[Path] = []
+    for src in sorted(template_pack.rglob("*")):
+        rel = str(src.relative_to(template_pack)).replace(TEMPLATE_ID, identity_id)
+        dst = pack / rel
+        if src.is_dir():
+            dst.mkdir(parents=True, exist_ok=True)
+            continue
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        data = src.read_bytes()
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            dst.write_bytes(data)
+            continue
+        for old, new in replacements:
+            text = text.replace(old, new)
+        dst.write_text(text, encoding="utf-8")
+        if dst.suffix == ".json":
+            json_files.append(dst)
+    for path in json_files:
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            continue
+        before = json.dumps(doc, sort_keys=True)
+        _rehash_check_results(doc, pack)
+        if json.dumps(doc, sort_keys=True) != before:
+            path.write_text(json.dumps(doc, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def _shape_current_task(pack: Path, identity_id: str, index: int, rng: random.Random) -> str:
+    path = pack / "CURRENT_TASK.json"
+    task = json.loads(path.read_text(encoding="utf-8"))
+    domain, goal = OBJECTIVE_DOMAINS[index % len(OBJECTIVE_DOMAINS)]
+    task["objective"] = {
+        "title": f"{domain}: {goal}",
+        "priority": rng.choice(["HIGH", "MEDIUM", "LOW"]),
+        "status": rng.choice(["pending", "in_progress", "in_progress", "blocked"]),
+    }
+    task.setdefault("scaffold_metadata", {})["synthetic"] = {"index": index, "domain": domain}
+    path.write_text(json.dumps(task, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return domain
+
+
+def _write_reports(pack: Path, identity_id: str, reports: int, rng: random.Random, now: datetime) -> int:
+    runtime_root = pack / "runtime"
+    reports_dir = runtime_root / "reports"
+    log_dir = runtime_root / "logs" / "upgrade" / identity_id
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    for n in range(reports):
+        at = now - timedelta(hours=(reports - n) * rng.randint(6, 48))
+        run_id = f"identity-upgrade-exec-{identity_id}-{int(at.timestamp())}-{n:03d}"
+        checks: list[dict[str, Any]] = []
+        for idx, script in enumerate(SYNTHETIC_CHECKS, start=1):
+            cmd = f"python3 {script} --identity-id {identity_id}"
+            code = 0 if idx <= 2 or rng.random() < 0.85 else 1
+            duration_ms = rng.randint(40, 1800)
+            started = _ts(at + timedelta(seconds=idx))
+            ended = _ts(at + timedelta(seconds=idx, milliseconds=duration_ms))
+            stdout = f"[{'OK' if code == 0 else 'FAIL'}] {Path(script).stem} {identity_id}\n"
+            log_path = check_log_path(log_dir, run_id, idx)
+            sha256 = write_check_log(
+                log_path,
+                [
+                    f"$ {cmd}\n[cwd] {REPO_ROOT}\n[exit_code] {code}\n[started_at] {started}\n[ended_at] {ended}\n\n",
+                    "[stdout]\n",
+                    stdout,
+                    "\n[stderr]\n",
+                    "",
+                    "\n",
+                ],
+            )
+            checks.append(
+                {
+                    "command": cmd,
+                    "cmd": cmd,
+                    "code": code,
+                    "ok": code == 0,
+                    "stdout": stdout,
+                    "stderr": "",
+                    "started_at": started,
+                    "ended_at": ended,
+                    "duration_ms": duration_ms,
+                    "exit_code": code,
+                    "log_path": str(log_path),
+                    "cwd": str(REPO_ROOT),
+                    "sha256": sha256,
+                }
+            )
+        all_ok = all(c["ok"] for c in checks)
+        report = {
+            "run_id": run_id,
+            "identity_id": identity_id,
+            "generated_at": _ts(at),
+            "mode": "review-required",
+            "creator_invocation": {
+                "tool": "identity-creator",
+                "mode": "update",
+                "entrypoint": "scripts/execute_identity_upgrade.py",
+                "base_contract": "identity_update_lifecycle_contract",
+                "run_id": run_id,
+            },
+            "execution_context": {"generated_by": "local", "github_run_id": "", "github_sha": ""},
+            "required_checks": list(SYNTHETIC_CHECKS),
+            "work_layer": "instance",
+            "source_layer": "global",
+            "applied_gate_set": "instance_required_checks",
+            "resolved_pack_path": str(pack),
+            "runtime_output_root": str(runtime_root),
+            "checks": checks,
+            "check_results": checks,
+            "all_ok": all_ok,
+            "upgrade_required": not all_ok,
+            "synthetic": True,
+        }
+        report_path = reports_dir / f"{run_id}.json"
+        report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        stamp = at.timestamp()
+        os.utime(report_path, (stamp, stamp))
+        record_execution_report(report_path, [reports_dir, runtime_root])
+    return reports
+
+
+def _write_feedback_batches(pack: Path, identity_id: str, batches: int, rng: random.Random, now: datetime) -> int:
+    outbox = pack / "runtime" / "protocol-feedback" / "outbox-to-protocol"
+    outbox.mkdir(parents=True, exist_ok=True)
+    for n in range(1, batches + 1):
+        lines = [
+            f"# {identity_id} feedback batch {n}",
+            f"platform_class: {rng.choice(PLATFORM_CLASSES)}",
+            f"intent_domain: {rng.choice(INTENT_DOMAINS)}",
+            f"intent_confidence: {rng.randint(50, 99) / 100}",
+            "classifier_reason: synthetic batch for scale testing",
+        ]
+        for s in range(rng.randint(1, 4)):
+            tier = rng.choice(["official", "community", "unknown"])
+            lines.append(f"- source tier={tier} scope=conclusion https://example.com/{identity_id}/{n}/{s}")
+        lines.append(f"upgrade_proposal_ref: runtime/protocol-feedback/upgrade-proposals/{identity_id}-P{n}.md")
+        path = outbox / f"FEEDBACK_BATCH_{n:03d}.md"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        stamp = (now - timedelta(days=batches - n)).timestamp()
+        os.utime(path, (stamp, stamp))
+    return batches
+
+
+def materialize_identity(
+    template_pack: str, instances_root: str, identity_id: str, index: int, reports: int, batches: int, seed: int
+) -> dict[str, Any]:
+    """Clone the template pack for one identity and add its reports and feedback history (pool-safe)."""
+    rng = random.Random(f"{seed}:{identity_id}")
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    pack = Path(instances_root) / identity_id
+    shutil.rmtree(pack, ignore_errors=True)
+    _clone_pack(Path(template_pack), pack, identity_id)
+    domain = _shape_current_task(pack, identity_id, index, rng)
+    return {
+        "identity_id": identity_id,
+        "pack_path": str(pack),
+        "domain": domain,
+        "reports": _write_reports(pack, identity_id, reports, rng, now),
+        "feedback_batches": _write_feedback_batches(pack, identity_id, batches, rng, now),
+    }
+
+
+def _write_actor_stores(
+    catalog: Path, identities: list[dict[str, Any]], actors: int, sessions: int, rng: random.Random
+) -> int:
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    for a in range(actors):
+        actor_id = f"synthetic:actor-{a:04d}"
+        bindings: list[dict[str, Any]] = []
+        for s in range(sessions):
+            target = rng.choice(identities)
+            version = s + 1
+            bound_at = _ts(now - timedelta(minutes=rng.randint(1, 60 * 24 * 7)))
+            bindings.append(
+                {
+                    "actor_id": actor_id,
+                    "session_id": f"session-{a:04d}-{s:02d}",
+                    "session_id_source": "synthetic",
+                    "identity_id": target["identity_id"],
+                    "catalog_path": str(catalog),
+                    "pack_path": target["pack_path"],
+                    "status": "BOUND_ACTIVE",
+                    "bound_at": bound_at,
+                    "updated_at": bound_at,
+                    "session_pointer_type": "actor_binding",
+                    "run_id": f"synthetic-bind-{a:04d}-{s:02d}",
+                    "switch_reason": "synthetic_scale_fixture",
+                    "binding_ref": f"{actor_id}:session-{a:04d}-{s:02d}:v{version}",
+                    "binding_version": version,
+                    "compare_token": str(version),
+                }
+            )
+        latest = bindings[-1] if bindings else {}
+        payload = {
+            "schema_version": SCHEMA_VERSION,
+            "actor_id": actor_id,
+            "catalog_path": str(catalog),
+            "binding_key_mode": DEFAULT_BINDING_KEY_MODE,
+            "binding_version": len(bindings),
+            "compare_token": str(len(bindings)),
+            "session_entry_count": len(bindings),
+            "bindings": bindings,
+            "rebind_receipts": [],
+            "identity_id": latest.get("identity_id", ""),
+            "pack_path": latest.get("pack_path", ""),
+            "status": latest.get("status", ""),
+            "bound_at": latest.get("bound_at", ""),
+            "session_pointer_type": "actor_binding",
+            "updated_at": _ts(now),
+        }
+        write_actor_binding_store(actor_session_path(catalog, actor_id), payload)
+    return actors
+
+
+def generate_synthetic_catalog(
+    identity_home: Path,
+    *,
+    identities: int,
+    reports: int = 3,
+    actors: int = 4,
+    sessions_per_actor: int = 2,
+    feedback_batches: int = 3,
+    prefix: str = DEFAULT_ID_PREFIX,
+    seed: int = 0,
+    jobs: int = 1,
+) -> dict[str, Any]:
+    """
+    Fabricate ``identities`` packs under ``identity_home``: one pack scaffolded by
+    create_identity_pack.py is cloned per identity, then each clone gets its own
+    CURRENT_TASK objective, execution reports with check logs, and feedback batches; actor
+    session stores bind ``actors`` actors to random identities. Returns a summary.
+    """
+    started = time.monotonic()
+    identity_home = identity_home.expanduser().resolve()
+    identity_home.mkdir(parents=True, exist_ok=True)
+    catalog = identity_home / "catalog.local.yaml"
+    instances_root = identity_home / "instances"
+    template_pack, template_row = _scaffold_template(identity_home)
+    ids = synthetic_identity_ids(identities, prefix)
+
+    results: dict[str, dict[str, Any]] = {}
+    scheduler = TaskScheduler(jobs=jobs)
+    for index, identity_id in enumerate(ids):
+        scheduler.add(
+            identity_id,
+            materialize_identity,
+            (str(template_pack), str(instances_root), identity_id, index, reports, feedback_batches, seed),
+            on_done=lambda result: results.__setitem__(result["identity_id"], result),
+        )
+    scheduler.run()
+    materialized = [results[i] for i in ids]
+
+    row_text = json.dumps(template_row)
+    rows = []
+    for item in materialized:
+        row = json.loads(row_text.replace(str(template_pack), item["pack_path"]).replace(TEMPLATE_ID, item["identity_id"]))
+        row["title"] = f"Synthetic {item['identity_id']}"
+        row["description"] = f"synthetic {item['domain']} identity for scale testing"
+        row["status"] = "active" if item is materialized[0] else "inactive"
+        rows.append(row)
+    write_catalog_yaml(
+        catalog,
+        {
+            "version": "1.0",
+            "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+            "default_identity": ids[0] if ids else "",
+            "identities": rows,
+        },
+    )
+    shutil.rmtree(template_pack.parent.parent, ignore_errors=True)
+    _write_actor_stores(catalog, materialized, actors, sessions_per_actor, random.Random(f"{seed}:actors"))
+    return {
+        "identity_home": str(identity_home),
+        "catalog": str(catalog),
+        "env": identity_home_env(identity_home),
+        "identities": len(ids),
+        "identity_ids_sample": ids[:5],
+        "reports_per_identity": reports,
+        "feedback_batches_per_identity": feedback_batches,
+        "actors": actors,
+        "sessions_per_actor": sessions_per_actor,
+        "seed": seed,
+        "elapsed_ms": int((time.monotonic() - started) * 1000),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Generate a synthetic N-identity catalog for scale testing.")
+    ap.add_argument("--identities", type=int, default=10)
+    ap.add_argument("--reports", type=int, default=3, help="execution reports per identity")
+    ap.add_argument("--actors", type=int, default=4, help="actor session stores")
+    ap.add_argument("--sessions-per-actor", type=int, default=2)
+    ap.add_argument("--feedback-batches", type=int, default=3, help="FEEDBACK_BATCH files per identity")
+    ap.add_argument("--prefix", default=DEFAULT_ID_PREFIX, help="identity id prefix (<prefix>-NNNN)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument(
+        "--identity-home",
+        default="",
+        help="target identity home (default: fresh <tmp>/codex/identity, i.e. global runtime mode)",
+    )
+    ap.add_argument("--jobs", type=int, default=1, help="worker processes used to materialize identities")
+    args = ap.parse_args(argv)
+
+    if args.identities < 1:
+        print("[FAIL] --identities must be >= 1")
+        return 1
+    if args.identity_home:
+        identity_home = Path(args.identity_home)
+    else:
+        identity_home = Path(tempfile.mkdtemp(prefix="identity-synthetic-")) / "codex" / "identity"
+    try:
+        summary = generate_synthetic_catalog(
+            identity_home,
+            identities=args.identities,
+            reports=max(0, args.reports),
+            actors=max(0, args.actors),
+            sessions_per_actor=max(0, args.sessions_per_actor),
+            feedback_batches=max(0, args.feedback_batches),
+            prefix=args.prefix,
+            seed=args.seed,
+            jobs=args.jobs,
+        )
+    except RuntimeError as exc:
+        print(f"[FAIL] {exc}")
+        return 1
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+GIT_FACTS_SCHEMA = "identity_git_facts_v1"
+GIT_FACTS_ENV = "IDENTITY_GIT_FACTS_SNAPSHOT"
+SHA40_RE = re.compile(r"^[0-9a-f]{40}$")
+# revs whose meaning is fixed by the HEAD/index stamp; branch, tag and remote refs move on their own
+STAMPED_REV_RE = re.compile(r"^HEAD(?:[~^]\d*)*$")
+
+# In-process memo; mirrors the snapshot layout so both can be merged.
+_FACTS: dict[str, Any] = {"repos": {}, "ranges": {}, "ancestry": {}}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def git_run(args: list[str], cwd: Path | None = None) -> tuple[int, str, str]:
+    try:
+        p = subprocess.run(["git", *args], capture_output=True, text=True, cwd=str(cwd) if cwd else None)
+    except OSError as exc:  # missing cwd behaves like `git -C <missing>`
+        return 128, "", str(exc)
+    return p.returncode, p.stdout or "", p.stderr or ""
+
+
+# -- repo stamp: HEAD + index, read from .git without spawning git ------------------------------
+
+
+def _locate_git_dir(start: Path) -> tuple[Path, Path] | None:
+    if any(os.environ.get(k) for k in ("GIT_DIR", "GIT_WORK_TREE", "GIT_INDEX_FILE")):
+        return None
+    for d in [start, *start.parents]:
+        marker = d / ".git"
+        if marker.is_dir():
+            return d, marker
+        if marker.is_file():
+            text = marker.read_text(encoding="utf-8", errors="replace").strip()
+            if text.startswith("gitdir:"):
+                return d, (d / text.split(":", 1)[1].strip()).resolve()
+            return None
+    return None
+
+
+def _read_ref(git_dir: Path, ref: str) -> str:
+    common = git_dir
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        common = (git_dir / commondir.read_text(encoding="utf-8").strip()).resolve()
+    for base in (git_dir, common):
+        p = base / ref
+        if p.is_file():
+            return p.read_text(encoding="utf-8", errors="replace").strip()
+    packed = common / "packed-refs"
+    if packed.is_file():
+        for line in packed.read_text(encoding="utf-8", errors="replace").splitlines():
+            parts = line.split(" ", 1)
+            if len(parts) == 2 and parts[1].strip() == ref:
+                return parts[0].strip()
+    return ""
+
+
+def repo_stamp(cwd: Path | None = None) -> tuple[str, dict[str, Any]] | None:
+    """
+    (worktree root, stamp) where the stamp changes whenever HEAD moves or the index is rewritten.
+    None when the repo layout is not understood; callers then skip caching.
+    """
+    try:
+        start = Path(cwd or Path.cwd()).resolve()
+        if not start.is_dir():
+            return None
+        located = _locate_git_dir(start)
+        if located is None:
+            return None
+        root, git_dir = located
+        head = (git_dir / "HEAD").read_text(encoding="utf-8", errors="replace").strip()
+        ref_sha = _read_ref(git_dir, head[5:].strip()) if head.startswith("ref:") else head
+        try:
+            st = (git_dir / "index").stat()
+            index = [st.st_mtime_ns, st.st_size]
+        except FileNotFoundError:
+            index = None
+    except OSError:
+        return None
+    return str(root), {"head": head, "ref": ref_sha, "index": index}
+
+
+# -- snapshot file ---------------------------------------------------------------------------------
+
+
+def snapshot_path() -> Path | None:
+    raw = str(os.environ.get(GIT_FACTS_ENV, "")).strip()
+    return Path(raw) if raw else None
+
+
+def _load_snapshot(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) and data.get("schema") == GIT_FACTS_SCHEMA else {}
+
+
+def _merge(dst: dict[str, Any], src: dict[str, Any]) -> None:
+    for section in ("ranges", "ancestry"):
+        dst.setdefault(section, {}).update(src.get(section) or {})
+    repos = dst.setdefault("repos", {})
+    for root, row in (src.get("repos") or {}).items():
+        if not isinstance(row, dict):
+            continue
+        current = repos.get(root)
+        if isinstance(current, dict) and current.get("stamp") == row.get("stamp"):
+            for key, value in row.items():
+                if key == "revs":
+                    current.setdefault("revs", {}).update(value or {})
+                elif key == "porcelain" and "porcelain" in current and value is None:
+                    current.pop("porcelain", None)  # explicit invalidation
+                else:
+                    current[key] = value
+        else:
+            repos[root] = dict(row)
+
+
+def _sync() -> None:
+    """Pull the published snapshot into the memo (cheap; run before every lookup)."""
+    path = snapshot_path()
+    if path is not None:
+        _merge(_FACTS, _load_snapshot(path))
+
+
+def _persist(delta: dict[str, Any]) -> None:
+    """Merge freshly computed facts back into the published snapshot for sibling processes."""
+    path = snapshot_path()
+    if path is None:
+        return
+    doc = _load_snapshot(path) or {"schema": GIT_FACTS_SCHEMA, "repos": {}, "ranges": {}, "ancestry": {}}
+    _merge(doc, delta)
+    doc["schema"] = GIT_FACTS_SCHEMA
+    doc["updated_at"] = _utc_now()
+    try:
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # snapshot is an optimisation only
+
+
+def _repo_row(cwd: Path | None) -> tuple[str, dict[str, Any]] | None:
+    stamped = repo_stamp(cwd)
+    if stamped is None:
+        return None
+    root, stamp = stamped
+    _sync()
+    row = _FACTS["repos"].get(root)
+    if not isinstance(row, dict) or row.get("stamp") != stamp:
+        row = {"stamp": stamp, "revs": {}}
+        _FACTS["repos"][root] = row
+    return root, row
+
+
+def _store_repo_fact(root: str, row: dict[str, Any], key: str, value: Any) -> None:
+    if key.startswith("rev:"):
+        row.setdefault("revs", {})[key[4:]] = value
+        delta_row = {"stamp": row["stamp"], "revs": {key[4:]: value}}
+    else:
+        row[key] = value
+        delta_row = {"stamp": row["stamp"], key: value}
+    _persist({"repos": {root: delta_row}})
+
+
+# -- facts -----------------------------------------------------------------------------------------
+
+
+def rev_parse(rev: str, cwd: Path | None = None) -> str:
+    """
+    ``git rev-parse <rev>`` ("" on failure). ``HEAD``/``HEAD~n`` and full SHAs are cached per
+    HEAD/index stamp; other refs (``base``, ``origin/main``, branches) are resolved every time.
+    """
+    rev = str(rev or "").strip()
+    if not rev:
+        return ""
+    located = _repo_row(cwd) if STAMPED_REV_RE.match(rev) or SHA40_RE.match(rev) else None
+    if located is not None:
+        root, row = located
+        hit = (row.get("revs") or {}).get(rev)
+        if isinstance(hit, str):
+            return hit
+    rc, out, _ = git_run(["rev-parse", rev], cwd)
+    value = out.strip() if rc == 0 else ""
+    if located is not None and value:
+        _store_repo_fact(root, row, f"rev:{rev}", value)
+    return value
+
+
+def head_sha(cwd: Path | None = None) -> str:
+    return rev_parse("HEAD", cwd)
+
+
+def _repo_text_fact(key: str, args: list[str], cwd: Path | None) -> str:
+    located = _repo_row(cwd)
+    if located is not None:
+        root, row = located
+        if isinstance(row.get(key), str):
+            return row[key]
+    rc, out, _ = git_run(args, cwd)
+    value = out.strip() if rc == 0 else ""
+    if located is not None and value:
+        _store_repo_fact(root, row, key, value)
+    return value
+
+
+def toplevel(cwd: Path | None = None) -> str:
+    return _repo_text_fact("toplevel", ["rev-parse", "--show-toplevel"], cwd)
+
+
+def current_branch(cwd: Path | None = None) -> str:
+    return _repo_text_fact("branch", ["rev-parse", "--abbrev-ref", "HEAD"], cwd)
+
+
+def changed_files(base: str, head: str, cwd: Path | None = None) -> list[str]:
+    """
+    ``git diff --name-only base..head``; raises RuntimeError like the call sites it replaces.
+    Results are keyed by the resolved commit pair, so they never go stale.
+    """
+    if snapshot_path() is not None:
+        base, head = rev_parse(base, cwd) or base, rev_parse(head, cwd) or head
+    key = f"{base}..{head}" if SHA40_RE.match(base) and SHA40_RE.match(head) else ""
+    if key:
+        _sync()
+        hit = _FACTS["ranges"].get(key)
+        if isinstance(hit, list):
+            return list(hit)
+    rc, out, err = git_run(["diff", "--name-only", f"{base}..{head}"], cwd)
+    if rc != 0:
+        raise RuntimeError(err.strip() or f"git diff --name-only {base}..{head} failed")
+    files = [x.strip() for x in out.splitlines() if x.strip()]
+    if key:
+        _FACTS["ranges"][key] = files
+        _persist({"ranges": {key: files}})
+    return list(files)
+
+
+def ancestry(old: str, new: str, cwd: Path | None = None) -> dict[str, Any]:
+    """``{"is_ancestor": bool, "lag": int | None}`` for two commits (lag = rev-list --count old..new)."""
+    key = f"{old}..{new}" if SHA40_RE.match(old) and SHA40_RE.match(new) else ""
+    root = ""
+    if key:
+        stamped = repo_stamp(cwd)
+        root = stamped[0] if stamped else ""
+        key = f"{root}:{key}" if root else ""
+    if key:
+        _sync()
+        hit = _FACTS["ancestry"].get(key)
+        if isinstance(hit, dict):
+            return dict(hit)
+    rc_anc, _, _ = git_run(["merge-base", "--is-ancestor", old, new], cwd)
+    result: dict[str, Any] = {"is_ancestor": rc_anc == 0, "lag": None}
+    if rc_anc == 0:
+        rc_count, out, _ = git_run(["rev-list", "--count", f"{old}..{new}"], cwd)
+        if rc_count == 0 and out.strip().isdigit():
+            result["lag"] = int(out.strip())
+    elif rc_anc != 1:
+        return result  # unknown commit / not a repo: do not cache
+    if key:
+        _FACTS["ancestry"][key] = result
+        _persist({"ancestry": {key: result}})
+    return dict(result)
+
+
+def porcelain_status(cwd: Path | None = None) -> tuple[int, list[str], str]:
+    """
+    ``git status --porcelain`` rows. Served from the snapshot only when an orchestrator published
+    it with status (``publish_git_facts(include_status=True)``) and has not invalidated it since;
+    otherwise git runs every time because the worktree can change without touching HEAD or index.
+    """
+    located = _repo_row(cwd) if snapshot_path() is not None else None
+    if located is not None:
+        root, row = located
+        if isinstance(row.get("porcelain"), list):
+            return 0, list(row["porcelain"]), ""
+    rc, out, err = git_run(["status", "--porcelain"], cwd)
+    return rc, [ln.rstrip("\n") for ln in out.splitlines() if ln.strip()], err
+
+
+# -- orchestrator side -----------------------------------------------------------------------------
+
+
+def publish_git_facts(cwd: Path | None = None, *, include_status: bool = False, path: Path | None = None) -> Path | None:
+    """
+    Compute HEAD, toplevel and branch (plus porcelain status when ``include_status``) once and
+    point ``IDENTITY_GIT_FACTS_SNAPSHOT`` at the snapshot so child validators reuse them.
+    Returns the snapshot path when this call created it; None when an outer orchestrator already
+    published one (it is reused as is) or ``cwd`` is not a plain git worktree.
+    """
+    existing = snapshot_path()
+    if (existing is not None and existing.exists()) or repo_stamp(cwd) is None:
+        return None
+    row: dict[str, Any] = {"revs": {}, "published_at": _utc_now()}
+    head = git_run(["rev-parse", "HEAD"], cwd)
+    if head[0] == 0:
+        row["revs"]["HEAD"] = head[1].strip()
+    for key, args in (("toplevel", ["rev-parse", "--show-toplevel"]), ("branch", ["rev-parse", "--abbrev-ref", "HEAD"])):
+        rc, out, _ = git_run(args, cwd)
+        if rc == 0:
+            row[key] = out.strip()
+    if include_status:
+        rc, out, _ = git_run(["status", "--porcelain"], cwd)
+        if rc == 0:
+            row["porcelain"] = [ln.rstrip("\n") for ln in out.splitlines() if ln.strip()]
+    # stamp last: git status may refresh (rewrite) the index
+    stamped = repo_stamp(cwd)
+    if stamped is None:
+        return None
+    root, row["stamp"] = stamped
+    if path is None:
+        fd, raw = tempfile.mkstemp(prefix="identity-git-facts-", suffix=".json")
+        os.close(fd)
+        path = Path(raw)
+    doc = {"schema": GIT_FACTS_SCHEMA, "updated_at": _utc_now(), "repos": {root: row}, "ranges": {}, "ancestry": {}}
+    path.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+    os.environ[GIT_FACTS_ENV] = str(path)
+    return path
+
+
+def invalidate_worktree_status(cwd: Path | None = None, *, refresh: bool = True) -> None:
+    """Drop (and with ``refresh`` recompute) the published porcelain status after a step wrote files."""
+    if snapshot_path() is None:
+        return
+    porcelain: list[str] | None = None
+    if refresh:
+        rc, out, _ = git_run(["status", "--porcelain"], cwd)
+        if rc == 0:
+            porcelain = [ln.rstrip("\n") for ln in out.splitlines() if ln.strip()]
+    stamped = repo_stamp(cwd)  # after status, which may refresh the index
+    if stamped is None:
+        return
+    root, stamp = stamped
+    row = _FACTS["repos"].get(root)
+    if isinstance(row, dict):
+        row.pop("porcelain", None)
+        if porcelain is not None and row.get("stamp") == stamp:
+            row["porcelain"] = porcelain
+    _persist({"repos": {root: {"stamp": stamp, "porcelain": porcelain}}})
+
+
+def release_git_facts(path: Path | None) -> None:
+    """Remove a snapshot created by ``publish_git_facts`` in this process."""
+    if path is None or str(os.environ.get(GIT_FACTS_ENV, "")) != str(path):
+        return
+    os.environ.pop(GIT_FACTS_ENV, None)
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from validator_registry_common import default_validator_mode, run_validator
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+COMPOSE_SCRIPT = SCRIPTS_DIR / "compose_and_validate_governed_reply.py"
+
+
+def _json_payload(raw: str) -> dict[str, Any]:
+    text = str(raw or "").strip()
+    if not text:
+        return {}
+    try:
+        doc = json.loads(text)
+    except Exception:
+        return {}
+    return doc if isinstance(doc, dict) else {}
+
+
+def run_reply_stage(cmd: list[str], cwd: Path) -> tuple[int, dict[str, Any]]:
+    """
+    Run the next stage of the governed reply chain (compose -> send-time gate -> first-line
+    validator) and return ``(rc, json payload)``. Stages run in this interpreter through the
+    validator registry, so one reply costs one interpreter start; ``IDENTITY_VALIDATOR_MODE=subprocess``
+    restores the per-stage child processes. Both modes parse the stage's own stdout, so payloads
+    and receipts are the same either way.
+    """
+    inv = run_validator(cmd, cwd, mode=default_validator_mode())
+    return inv.rc, _json_payload(inv.stdout)
+
+
+@dataclass
+class GovernedReply:
+    rc: int
+    payload: dict[str, Any] = field(default_factory=dict)
+    # first-line stamp + body as written to ``out_reply_file`` ("" when nothing was composed)
+    reply_text: str = ""
+    stderr: str = ""
+    duration_ms: int = 0
+
+
+def compose_governed_reply(
+    identity_id: str,
+    catalog: str | Path,
+    body_text: str,
+    *,
+    repo_catalog: str | Path = "identity/catalog/identities.yaml",
+    actor_id: str = "",
+    work_layer: str = "",
+    source_layer: str = "",
+    layer_intent_text: str = "",
+    disclosure_level: str = "standard",
+    out_reply_file: str | Path = "",
+    out_json: str | Path = "",
+    blocker_receipt_out: str | Path = "",
+    preflight_receipt_out: str | Path = "",
+    outlet_channel_id: str = "governed_adapter_v1",
+    cwd: Path | None = None,
+) -> GovernedReply:
+    """
+    Library form of ``compose_and_validate_governed_reply.py --json-only``: compose the stamped
+    reply, run the send-time gate and first-line check, and return the same payload the script
+    prints. Relative paths resolve against ``cwd`` (default: the current directory), as on the
+    command line. Callers that keep one interpreter alive (an agent host, or
+    ``validator_worker.py run scripts/compose_and_validate_governed_reply.py ...``) also skip the
+    module imports after the first reply.
+    """
+    cmd = [
+        sys.executable,
+        str(COMPOSE_SCRIPT),
+        "--identity-id",
+        identity_id,
+        "--catalog",
+        str(catalog),
+        "--repo-catalog",
+        str(repo_catalog),
+        "--body-text",
+        body_text,
+        "--disclosure-level",
+        disclosure_level,
+        "--outlet-channel-id",
+        outlet_channel_id,
+        "--json-only",
+    ]
+    optional = {
+        "--actor-id": actor_id,
+        "--work-layer": work_layer,
+        "--source-layer": source_layer,
+        "--layer-intent-text": layer_intent_text,
+        "--out-reply-file": out_reply_file,
+        "--out-json": out_json,
+        "--blocker-receipt-out": blocker_receipt_out,
+        "--preflight-receipt-out": preflight_receipt_out,
+    }
+    for flag, value in optional.items():
+        if str(value or "").strip():
+            cmd += [flag, str(value)]
+    inv = run_validator(cmd, cwd or Path.cwd(), mode=default_validator_mode())
+    payload = inv.result if isinstance(inv.result, dict) else _json_payload(inv.stdout)
+    reply_text = ""
+    reply_path = Path(str(payload.get("out_reply_file", "") or ""))
+    # the actor-binding guard fails before composing (empty work_layer); nothing was written then
+    if payload.get("work_layer") and reply_path.is_file():
+        reply_text = reply_path.read_text(encoding="utf-8")
+    return GovernedReply(
+        rc=inv.rc,
+        payload=payload,
+        reply_text=reply_text,
+        stderr=inv.stderr,
+        duration_ms=inv.duration_ms,
+    )
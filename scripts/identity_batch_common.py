@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import traceback
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+
+from identity_catalog_common import load_yaml_document
+from result_channel_common import ResultChannel, emit_result
+
+IDENTITY_BATCH_SCHEMA = "identity_validator_batch_v1"
+
+
+def split_identity_batch_args(argv: list[str]) -> tuple[list[str] | None, list[str]]:
+    """
+    Pull ``--identity-ids a,b`` / ``--all`` out of ``argv``. Returns ``(None, argv)`` when neither
+    is present, otherwise the requested ids (``["*"]`` for ``--all``) and the remaining argv.
+    """
+    ids: list[str] | None = None
+    rest: list[str] = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--all":
+            ids = ["*"]
+        elif arg == "--identity-ids" or arg.startswith("--identity-ids="):
+            if "=" in arg:
+                raw = arg.split("=", 1)[1]
+            else:
+                raw = argv[i + 1] if i + 1 < len(argv) else ""
+                i += 1
+            if ids != ["*"]:
+                ids = [*(ids or []), *(x for x in re.split(r"[,\s]+", raw) if x)]
+        else:
+            rest.append(arg)
+        i += 1
+    return ids, rest
+
+
+def _option(argv: list[str], name: str) -> str:
+    for i, arg in enumerate(argv):
+        if arg == name and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+    return ""
+
+
+def catalog_identity_ids(argv: list[str]) -> list[str]:
+    """Ids of the catalog a validator would read (``--catalog`` or ``IDENTITY_CATALOG``), in catalog order."""
+    raw = _option(argv, "--catalog") or str(os.environ.get("IDENTITY_CATALOG", "")).strip()
+    if not raw:
+        raise ValueError("--all needs --catalog or IDENTITY_CATALOG")
+    data = load_yaml_document(Path(raw).expanduser()) or {}
+    rows = data.get("identities") if isinstance(data, dict) else None
+    ids: list[str] = []
+    for row in rows or []:
+        iid = str((row or {}).get("id", "")).strip() if isinstance(row, dict) else ""
+        if iid and iid not in ids:
+            ids.append(iid)
+    return ids
+
+
+def _exit_code(code: Any) -> int:
+    if code is None:
+        return 0
+    return code if isinstance(code, int) else 1
+
+
+def _run_one(entry: Callable[..., Any], argv: list[str]) -> dict[str, Any]:
+    out = io.StringIO()
+    err = io.StringIO()
+    channel = ResultChannel()
+    with channel.capture(), contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = _exit_code(entry(argv))
+        except SystemExit as exc:
+            if exc.code is not None and not isinstance(exc.code, int):
+                print(exc.code, file=err)
+            rc = _exit_code(exc.code)
+        except Exception:
+            traceback.print_exc(file=err)
+            rc = 1
+    return {"rc": rc, "stdout": out.getvalue(), "stderr": err.getvalue(), "result": channel.result}
+
+
+def run_identity_batch(entry: Callable[..., Any], ids: list[str], argv: list[str]) -> int:
+    """
+    Run ``entry(argv + ["--identity-id", id])`` for every id in this interpreter and print one
+    NDJSON record per identity (rc, result-channel payload, captured stdout/stderr). Catalogs and
+    pack files parsed through ``identity_catalog_common`` are shared across the batch. Returns
+    the first non-zero rc, 0 when every identity passed.
+    """
+    if ids == ["*"]:
+        try:
+            ids = catalog_identity_ids(argv)
+        except (OSError, ValueError, yaml.YAMLError) as exc:
+            print(json.dumps({"schema": IDENTITY_BATCH_SCHEMA, "identity_id": "", "rc": 2, "error": str(exc)}))
+            return 2
+    records: list[dict[str, Any]] = []
+    first_rc = 0
+    for identity_id in ids:
+        run = _run_one(entry, [*argv, "--identity-id", identity_id])
+        record = {"schema": IDENTITY_BATCH_SCHEMA, "identity_id": identity_id, **run}
+        records.append(record)
+        print(json.dumps(record, ensure_ascii=False, default=str), flush=True)
+        if run["rc"] and not first_rc:
+            first_rc = run["rc"]
+    emit_result(
+        {
+            "schema": IDENTITY_BATCH_SCHEMA,
+            "identities": len(records),
+            "failed_identity_ids": [r["identity_id"] for r in records if r["rc"]],
+            "records": [{k: r[k] for k in ("identity_id", "rc", "result")} for r in records],
+        }
+    )
+    return first_rc
+
+
+def identity_batch_main(main: Callable[..., Any], argv: list[str] | None = None) -> Any:
+    """
+    Validator entry point: ``main(argv)`` unless ``--identity-ids`` / ``--all`` is given, in which
+    case the validator runs once per identity in this process (see ``run_identity_batch``).
+    """
+    args = list(sys.argv[1:] if argv is None else argv)
+    ids, rest = split_identity_batch_args(args)
+    if ids is None:
+        return main(argv)
+    return run_identity_batch(main, ids, rest)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import copy
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+_MAX_DOCUMENTS = 512
+# parser:resolved path -> ((mtime_ns, size, ino), raw text, parsed document); most recently used last
+_DOCUMENTS: OrderedDict[str, tuple[tuple[int, int, int], str, Any]] = OrderedDict()
+_CATALOG_INDEXES: dict[str, tuple[tuple[int, int, int], "CatalogIndex"]] = {}
+
+
+def parsed_file_cache_enabled() -> bool:
+    return str(os.environ.get("IDENTITY_PARSED_FILE_CACHE", "1")).strip().lower() not in {"0", "false", "off", "no"}
+
+
+def _stat_key(path: Path) -> tuple[int, int, int]:
+    # the inode catches a same-size rewrite-by-rename within one mtime tick
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _cached_document(path: Path, parser: Any) -> tuple[str, Any]:
+    resolved = path.expanduser().resolve()
+    if not parsed_file_cache_enabled():
+        text = resolved.read_text(encoding="utf-8")
+        return text, parser(text)
+    key = _stat_key(resolved)
+    cache_key = f"{parser.__module__}.{parser.__name__}:{resolved}"
+    hit = _DOCUMENTS.get(cache_key)
+    if hit is not None and hit[0] == key:
+        _DOCUMENTS.move_to_end(cache_key)
+        return hit[1], hit[2]
+    text = resolved.read_text(encoding="utf-8")
+    parsed = parser(text)
+    _DOCUMENTS[cache_key] = (key, text, parsed)
+    _DOCUMENTS.move_to_end(cache_key)
+    while len(_DOCUMENTS) > _MAX_DOCUMENTS:
+        _DOCUMENTS.popitem(last=False)
+    return text, parsed
+
+
+def load_yaml_document(path: Path) -> Any:
+    """
+    Parsed YAML for ``path``, memoized by (path, mtime_ns, size, inode) in an LRU of
+    ``_MAX_DOCUMENTS`` for the life of the process, so validators run in one interpreter
+    (batched identities, in-process scans, the validator worker) parse each file once.
+    Callers get a private copy; ``IDENTITY_PARSED_FILE_CACHE=0`` disables the memo.
+    """
+    _, parsed = _cached_document(Path(path), yaml.safe_load)
+    return copy.deepcopy(parsed)
+
+
+def load_yaml_object(path: Path) -> dict[str, Any]:
+    """``load_yaml_document`` for files whose root must be a mapping (empty files load as ``{}``)."""
+    data = load_yaml_document(path) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"yaml root must be object: {path}")
+    return data
+
+
+def load_json_document(path: Path) -> Any:
+    """Parsed JSON for ``path``; the file read is memoized, the (cheap) parse is fresh per call."""
+    text, _ = _cached_document(Path(path), json.loads)
+    return json.loads(text)
+
+
+@dataclass
+class CatalogIndex:
+    path: Path
+    rows: list[dict[str, Any]]
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def row(self, identity_id: str) -> dict[str, Any] | None:
+        hit = self.by_id.get(str(identity_id or "").strip())
+        return copy.deepcopy(hit) if hit is not None else None
+
+    def pack_path(self, identity_id: str) -> str:
+        hit = self.by_id.get(str(identity_id or "").strip())
+        return str((hit or {}).get("pack_path", "")).strip()
+
+
+def load_catalog_index(catalog_path: Path) -> CatalogIndex:
+    """Identity catalog with an id -> row index (first row wins, like the legacy ``next(...)`` scans)."""
+    resolved = Path(catalog_path).expanduser().resolve()
+    key = _stat_key(resolved)
+    hit = _CATALOG_INDEXES.get(str(resolved))
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    _, data = _cached_document(resolved, yaml.safe_load)
+    identities = (data or {}).get("identities") if isinstance(data, dict) else None
+    rows = [x for x in (identities or []) if isinstance(x, dict)]
+    index = CatalogIndex(path=resolved, rows=rows)
+    for row in rows:
+        index.by_id.setdefault(str(row.get("id", "")).strip(), row)
+    _CATALOG_INDEXES[str(resolved)] = (key, index)
+    return index
+
+
+def catalog_row(catalog_path: Path, identity_id: str) -> dict[str, Any] | None:
+    return load_catalog_index(catalog_path).row(identity_id)
+
+
+def resolve_pack_and_task(catalog_path: Path, identity_id: str, *, legacy_fallback: bool = False) -> tuple[Path, Path]:
+    """
+    ``(pack dir, CURRENT_TASK.json)`` of a catalog identity; ``FileNotFoundError`` otherwise.
+    ``legacy_fallback`` also accepts ``identity/<id>/CURRENT_TASK.json`` (cwd-relative) when the
+    catalog row has no usable pack.
+    """
+    row = catalog_row(catalog_path, identity_id)
+    if not row:
+        raise FileNotFoundError(f"identity id not found in catalog: {identity_id}")
+    pack_raw = str(row.get("pack_path", "")).strip()
+    if legacy_fallback:
+        task = Path(pack_raw).expanduser().resolve() / "CURRENT_TASK.json" if pack_raw else None
+        if task is not None and task.exists():
+            return task.parent, task
+        legacy = Path("identity") / identity_id / "CURRENT_TASK.json"
+        if legacy.exists():
+            return legacy.parent, legacy
+        raise FileNotFoundError(f"CURRENT_TASK.json not found for identity: {identity_id}")
+    if not pack_raw:
+        raise FileNotFoundError(f"pack_path missing for identity: {identity_id}")
+    pack = Path(pack_raw).expanduser().resolve()
+    if not pack.exists():
+        raise FileNotFoundError(f"pack_path not found: {pack}")
+    task = pack / "CURRENT_TASK.json"
+    if not task.exists():
+        raise FileNotFoundError(f"CURRENT_TASK.json not found: {task}")
+    return pack, task
+
+
+def load_current_task(task_path: Path) -> dict[str, Any]:
+    data = load_json_document(task_path)
+    if not isinstance(data, dict):
+        raise ValueError(f"json root must be object: {task_path}")
+    return data
+
+
+def task_contract(task_path: Path, contract_key: str) -> dict[str, Any]:
+    """One contract block of CURRENT_TASK.json without copying the rest of the task."""
+    _, data = _cached_document(Path(task_path), json.loads)
+    raw = data.get(contract_key) if isinstance(data, dict) else None
+    return copy.deepcopy(raw) if isinstance(raw, dict) else {}
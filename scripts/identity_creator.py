@@ -11,7 +11,13 @@ from pathlib import Path
 
 import yaml
 
-from actor_session_common import list_actor_bindings, load_actor_binding, load_actor_binding_store, resolve_actor_id
+from actor_session_common import (
+    list_actor_bindings_for_identities,
+    load_actor_binding,
+    load_actor_binding_store,
+    resolve_actor_id,
+)
+from catalog_lock_common import catalog_write_lock, write_catalog_text, write_catalog_yaml
 from resolve_identity_context import (
     collect_protocol_evidence,
     default_identity_home,
@@ -341,7 +347,7 @@ def _cross_actor_conflicts(catalog_path: Path, active_identities: list[str], act
     active_set = {x for x in active_identities if x}
     if not active_set:
         return out
-    for binding in list_actor_bindings(catalog_path):
+    for binding in list_actor_bindings_for_identities(catalog_path, active_set):
         bound_identity = str(binding.get("identity_id", "")).strip()
         bound_actor = str(binding.get("actor_id", "")).strip()
         if not bound_identity or not bound_actor:
@@ -421,203 +427,206 @@ def _activate_identity(
     if not local_catalog.exists():
         print(f"[FAIL] local catalog not found: {local_catalog}")
         return 1
-    original_catalog_text = local_catalog.read_text(encoding="utf-8")
-    data = _load_yaml(local_catalog)
-    identities = data.get("identities") or []
-    target = next((x for x in identities if isinstance(x, dict) and str(x.get("id", "")).strip() == identity_id), None)
-    if not target:
-        print(f"[FAIL] identity not found in catalog: {identity_id}")
-        return 1
+    # hold the catalog lock across read, activation writes and rollback so concurrent writers
+    # neither interleave with nor get clobbered by this transaction
+    with catalog_write_lock(local_catalog):
+        original_catalog_text = local_catalog.read_text(encoding="utf-8")
+        data = _load_yaml(local_catalog)
+        identities = data.get("identities") or []
+        target = next((x for x in identities if isinstance(x, dict) and str(x.get("id", "")).strip() == identity_id), None)
+        if not target:
+            print(f"[FAIL] identity not found in catalog: {identity_id}")
+            return 1
 
-    preexisting_active = [
-        str(x.get("id", "")).strip()
-        for x in identities
-        if isinstance(x, dict)
-        and str(x.get("status", "")).strip().lower() == "active"
-        and str(x.get("id", "")).strip()
-        and str(x.get("id", "")).strip() != identity_id
-    ]
-    # Multi-active runtime model: activation should not demote other active identities.
-    # Keep cross-actor receipt fields for backward-compatible audit payload shape.
-    cross_actor_conflicts: list[dict] = []
-    cross_actor_receipt_payload: dict = {}
-    cross_actor_receipt_path = ""
-    cross_actor_receipt_errors: list[str] = []
-
-    created_evidence: list[Path] = []
-    meta_backups: dict[Path, str | None] = {}
-    switch_report: Path | None = None
-    canonical_session_pointer = (local_catalog.parent / "session" / "active_identity.json").resolve()
-    scoped_session_mirror = (local_catalog.parent / "session" / "mirror" / "current.json").resolve()
-    try:
-        # promote target to active binding first (activation validator requires this for active identities)
-        created_evidence.append(
-            _write_binding_evidence(
-                data,
-                identity_id,
-                "BOUND_ACTIVE",
-                note="activation transaction promoted identity to active",
+        preexisting_active = [
+            str(x.get("id", "")).strip()
+            for x in identities
+            if isinstance(x, dict)
+            and str(x.get("status", "")).strip().lower() == "active"
+            and str(x.get("id", "")).strip()
+            and str(x.get("id", "")).strip() != identity_id
+        ]
+        # Multi-active runtime model: activation should not demote other active identities.
+        # Keep cross-actor receipt fields for backward-compatible audit payload shape.
+        cross_actor_conflicts: list[dict] = []
+        cross_actor_receipt_payload: dict = {}
+        cross_actor_receipt_path = ""
+        cross_actor_receipt_errors: list[str] = []
+
+        created_evidence: list[Path] = []
+        meta_backups: dict[Path, str | None] = {}
+        switch_report: Path | None = None
+        canonical_session_pointer = (local_catalog.parent / "session" / "active_identity.json").resolve()
+        scoped_session_mirror = (local_catalog.parent / "session" / "mirror" / "current.json").resolve()
+        try:
+            # promote target to active binding first (activation validator requires this for active identities)
+            created_evidence.append(
+                _write_binding_evidence(
+                    data,
+                    identity_id,
+                    "BOUND_ACTIVE",
+                    note="activation transaction promoted identity to active",
+                )
             )
-        )
-        for item in identities:
-            if not isinstance(item, dict):
-                continue
-            iid = str(item.get("id", "")).strip()
-            if not iid:
-                continue
-            if iid == identity_id:
-                item["status"] = "active"
+            for item in identities:
+                if not isinstance(item, dict):
+                    continue
+                iid = str(item.get("id", "")).strip()
+                if not iid:
+                    continue
+                if iid == identity_id:
+                    item["status"] = "active"
 
-        meta_backups = _sync_meta_statuses(data)
-        _dump_yaml(local_catalog, data)
-        rc = _run(["python3", "scripts/validate_identity_role_binding.py", "--catalog", str(local_catalog), "--identity-id", identity_id])
-        if rc != 0:
-            raise RuntimeError("post-activation role-binding validation failed")
-        rc = _run(["python3", "scripts/validate_identity_state_consistency.py", "--catalog", str(local_catalog)])
-        if rc != 0:
-            raise RuntimeError("post-activation state consistency validation failed")
-
-        switch_dir = Path("/tmp/identity-activation-reports")
-        switch_dir.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now(timezone.utc)
-        switch_report = switch_dir / f"identity-activation-switch-{identity_id}-{int(ts.timestamp())}.json"
-        switch_payload = {
-            "switch_id": switch_report.stem,
-            "generated_at": ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "target_identity_id": identity_id,
-            "preexisting_active_identities": preexisting_active,
-            "demoted_identities": [],
-            "single_active_enforced": False,
-            "activation_model": "actor_scoped_catalog_with_multi_active",
-            "actor_id": actor_id_resolved,
-            "run_id": run_id_resolved,
-            "entrypoint_pid": str(os.getpid()),
-            "switch_reason": switch_reason_resolved,
-            "identity_switch_detected": identity_switch_detected,
-            "identity_switch_from": current_actor_identity,
-            "identity_switch_to": identity_id,
-            "switch_intent_override": {
-                "applied": bool(identity_switch_detected),
-                "receipt_path": switch_intent_receipt_path,
-                "receipt_fields": switch_intent_payload if switch_intent_payload else {},
-            },
-            "cross_actor_demotion_detected": bool(cross_actor_conflicts),
-            "cross_actor_conflicts": cross_actor_conflicts,
-            "cross_actor_override": {
-                "applied": bool(cross_actor_conflicts and allow_cross_actor_switch),
-                "receipt_path": cross_actor_receipt_path,
-                "receipt_fields": cross_actor_receipt_payload if cross_actor_receipt_payload else {},
-            },
-            "binding_evidence_paths": [str(p) for p in created_evidence],
-            "catalog_layer": "local",
-            "catalog_path": str(local_catalog),
-            "resolved_scope": str(resolved.get("resolved_scope", "")),
-            "resolved_pack_path": str(resolved.get("resolved_pack_path", "")),
-            "session_pointer_canonical_path": str(canonical_session_pointer),
-            "session_pointer_mirror_path": str(scoped_session_mirror),
-        }
-        protocol = collect_protocol_evidence(protocol_root, protocol_mode)
-        switch_payload.update(
-            {
-                "protocol_mode": protocol["protocol_mode"],
-                "protocol_root": protocol["protocol_root"],
-                "protocol_commit_sha": protocol["protocol_commit_sha"],
-                "protocol_ref": protocol["protocol_ref"],
-                "identity_home": str(default_identity_home()),
+            meta_backups = _sync_meta_statuses(data)
+            write_catalog_yaml(local_catalog, data)
+            rc = _run(["python3", "scripts/validate_identity_role_binding.py", "--catalog", str(local_catalog), "--identity-id", identity_id])
+            if rc != 0:
+                raise RuntimeError("post-activation role-binding validation failed")
+            rc = _run(["python3", "scripts/validate_identity_state_consistency.py", "--catalog", str(local_catalog)])
+            if rc != 0:
+                raise RuntimeError("post-activation state consistency validation failed")
+
+            switch_dir = Path("/tmp/identity-activation-reports")
+            switch_dir.mkdir(parents=True, exist_ok=True)
+            ts = datetime.now(timezone.utc)
+            switch_report = switch_dir / f"identity-activation-switch-{identity_id}-{int(ts.timestamp())}.json"
+            switch_payload = {
+                "switch_id": switch_report.stem,
+                "generated_at": ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "target_identity_id": identity_id,
+                "preexisting_active_identities": preexisting_active,
+                "demoted_identities": [],
+                "single_active_enforced": False,
+                "activation_model": "actor_scoped_catalog_with_multi_active",
+                "actor_id": actor_id_resolved,
+                "run_id": run_id_resolved,
+                "entrypoint_pid": str(os.getpid()),
+                "switch_reason": switch_reason_resolved,
+                "identity_switch_detected": identity_switch_detected,
+                "identity_switch_from": current_actor_identity,
+                "identity_switch_to": identity_id,
+                "switch_intent_override": {
+                    "applied": bool(identity_switch_detected),
+                    "receipt_path": switch_intent_receipt_path,
+                    "receipt_fields": switch_intent_payload if switch_intent_payload else {},
+                },
+                "cross_actor_demotion_detected": bool(cross_actor_conflicts),
+                "cross_actor_conflicts": cross_actor_conflicts,
+                "cross_actor_override": {
+                    "applied": bool(cross_actor_conflicts and allow_cross_actor_switch),
+                    "receipt_path": cross_actor_receipt_path,
+                    "receipt_fields": cross_actor_receipt_payload if cross_actor_receipt_payload else {},
+                },
+                "binding_evidence_paths": [str(p) for p in created_evidence],
+                "catalog_layer": "local",
+                "catalog_path": str(local_catalog),
+                "resolved_scope": str(resolved.get("resolved_scope", "")),
+                "resolved_pack_path": str(resolved.get("resolved_pack_path", "")),
+                "session_pointer_canonical_path": str(canonical_session_pointer),
+                "session_pointer_mirror_path": str(scoped_session_mirror),
             }
-        )
-        switch_report.write_text(json.dumps(switch_payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-        actor_store = load_actor_binding_store(local_catalog, actor_id_resolved)
-        compare_token = str(actor_store.get("compare_token", "")).strip() or str(actor_store.get("binding_version", 0))
-        session_id = f"run:{run_id_resolved}"
-        sync = subprocess.run(
-            [
-                "python3",
-                "scripts/sync_session_identity.py",
-                "--catalog",
-                str(local_catalog),
-                "--identity-id",
-                identity_id,
-                "--out",
-                str(canonical_session_pointer),
-                "--mirror-out",
-                str(scoped_session_mirror),
-                "--actor-id",
-                actor_id_resolved,
-                "--run-id",
-                run_id_resolved,
-                "--session-id",
-                session_id,
-                "--compare-token",
-                compare_token,
-                "--mutation-lane",
-                "activate",
-                "--switch-reason",
-                switch_reason_resolved,
-                "--entrypoint-pid",
-                str(os.getpid()),
-                "--cross-actor-override-receipt",
-                cross_actor_receipt_path,
-            ],
-            capture_output=True,
-            text=True,
-        )
-        if sync.returncode != 0:
+            protocol = collect_protocol_evidence(protocol_root, protocol_mode)
+            switch_payload.update(
+                {
+                    "protocol_mode": protocol["protocol_mode"],
+                    "protocol_root": protocol["protocol_root"],
+                    "protocol_commit_sha": protocol["protocol_commit_sha"],
+                    "protocol_ref": protocol["protocol_ref"],
+                    "identity_home": str(default_identity_home()),
+                }
+            )
+            switch_report.write_text(json.dumps(switch_payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+            actor_store = load_actor_binding_store(local_catalog, actor_id_resolved)
+            compare_token = str(actor_store.get("compare_token", "")).strip() or str(actor_store.get("binding_version", 0))
+            session_id = f"run:{run_id_resolved}"
+            sync = subprocess.run(
+                [
+                    "python3",
+                    "scripts/sync_session_identity.py",
+                    "--catalog",
+                    str(local_catalog),
+                    "--identity-id",
+                    identity_id,
+                    "--out",
+                    str(canonical_session_pointer),
+                    "--mirror-out",
+                    str(scoped_session_mirror),
+                    "--actor-id",
+                    actor_id_resolved,
+                    "--run-id",
+                    run_id_resolved,
+                    "--session-id",
+                    session_id,
+                    "--compare-token",
+                    compare_token,
+                    "--mutation-lane",
+                    "activate",
+                    "--switch-reason",
+                    switch_reason_resolved,
+                    "--entrypoint-pid",
+                    str(os.getpid()),
+                    "--cross-actor-override-receipt",
+                    cross_actor_receipt_path,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if sync.returncode != 0:
+                if sync.stdout.strip():
+                    print(sync.stdout.strip())
+                if sync.stderr.strip():
+                    print(sync.stderr.strip())
+                raise RuntimeError("session pointer canonical sync failed")
             if sync.stdout.strip():
                 print(sync.stdout.strip())
-            if sync.stderr.strip():
-                print(sync.stderr.strip())
-            raise RuntimeError("session pointer canonical sync failed")
-        if sync.stdout.strip():
-            print(sync.stdout.strip())
-        rc = _run(
-            [
-                "python3",
-                "scripts/validate_identity_session_pointer_consistency.py",
-                "--catalog",
-                str(local_catalog),
-                "--identity-id",
-                identity_id,
-                "--actor-id",
-                actor_id_resolved,
-                "--canonical-out",
-                str(canonical_session_pointer),
-                "--mirror-out",
-                str(scoped_session_mirror),
-            ]
-        )
-        if rc != 0:
-            raise RuntimeError("session pointer consistency validation failed")
-        rc = _run(
-            [
-                "python3",
-                "scripts/validate_actor_session_multibinding_concurrency.py",
-                "--catalog",
-                str(local_catalog),
-                "--identity-id",
-                identity_id,
-                "--actor-id",
-                actor_id_resolved,
-                "--operation",
-                "activate",
-                "--json-only",
-            ]
-        )
-        if rc != 0:
-            raise RuntimeError("actor session multibinding concurrency validation failed")
-        print(f"[OK] activated identity in catalog (actor-scoped multi-active): {identity_id}")
-        print(f"[OK] switch report: {switch_report}")
-        return 0
-    except Exception as e:
-        local_catalog.write_text(original_catalog_text, encoding="utf-8")
-        _restore_meta_backups(meta_backups)
-        for p in created_evidence:
-            if p.exists():
-                p.unlink()
-        if switch_report and switch_report.exists():
-            switch_report.unlink()
-        print(f"[FAIL] activation transaction rolled back: {e}")
-        return 1
+            rc = _run(
+                [
+                    "python3",
+                    "scripts/validate_identity_session_pointer_consistency.py",
+                    "--catalog",
+                    str(local_catalog),
+                    "--identity-id",
+                    identity_id,
+                    "--actor-id",
+                    actor_id_resolved,
+                    "--canonical-out",
+                    str(canonical_session_pointer),
+                    "--mirror-out",
+                    str(scoped_session_mirror),
+                ]
+            )
+            if rc != 0:
+                raise RuntimeError("session pointer consistency validation failed")
+            rc = _run(
+                [
+                    "python3",
+                    "scripts/validate_actor_session_multibinding_concurrency.py",
+                    "--catalog",
+                    str(local_catalog),
+                    "--identity-id",
+                    identity_id,
+                    "--actor-id",
+                    actor_id_resolved,
+                    "--operation",
+                    "activate",
+                    "--json-only",
+                ]
+            )
+            if rc != 0:
+                raise RuntimeError("actor session multibinding concurrency validation failed")
+            print(f"[OK] activated identity in catalog (actor-scoped multi-active): {identity_id}")
+            print(f"[OK] switch report: {switch_report}")
+            return 0
+        except Exception as e:
+            write_catalog_text(local_catalog, original_catalog_text)
+            _restore_meta_backups(meta_backups)
+            for p in created_evidence:
+                if p.exists():
+                    p.unlink()
+            if switch_report and switch_report.exists():
+                switch_report.unlink()
+            print(f"[FAIL] activation transaction rolled back: {e}")
+            return 1
 
 
 def _heal_identity(
@@ -1077,7 +1086,7 @@ def _enforce_protocol_root_separation(
         return 1
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     identity_home = default_identity_home()
     repo_catalog_default = "identity/catalog/identities.yaml"
     local_catalog_default = str(default_local_catalog_path(identity_home))
@@ -1266,7 +1275,7 @@ def main() -> int:
     p_heal.add_argument("--out-dir", default="/tmp/identity-heal-reports")
 
 
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     if args.command == "init":
         gate_ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
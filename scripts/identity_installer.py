@@ -12,6 +12,7 @@ from typing import Any
 
 import yaml
 
+from catalog_lock_common import catalog_write_lock, write_catalog_yaml
 from resolve_identity_context import (
     collect_protocol_evidence,
     default_identity_home,
@@ -36,7 +37,7 @@ def _load_yaml(path: Path) -> dict[str, Any]:
 
 
 def _dump_yaml(path: Path, data: dict[str, Any]) -> None:
-    path.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
+    write_catalog_yaml(path, data)
 
 
 def _sha256_bytes(payload: bytes) -> str:
@@ -211,43 +212,44 @@ def _register_identity(
     profile: str,
     runtime_mode: str,
 ) -> None:
-    if not catalog_path.exists():
-        _dump_yaml(
-            catalog_path,
-            {
-                "version": "1.0",
-                "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-                "default_identity": "",
-                "identities": [],
-            },
-        )
-    catalog = _load_yaml(catalog_path)
-    identities = catalog.get("identities") or []
-    existing = next((x for x in identities if isinstance(x, dict) and str(x.get("id", "")).strip() == identity_id), None)
-    if existing:
-        existing["pack_path"] = pack_path
-        existing["title"] = title or existing.get("title", identity_id)
-        existing["description"] = description or existing.get("description", "")
-        existing["profile"] = profile
-        existing["runtime_mode"] = runtime_mode
-        if activate:
-            existing["status"] = "active"
-    else:
-        identities.append(
-            {
-                "id": identity_id,
-                "title": title or identity_id,
-                "description": description or "",
-                "status": "active" if activate else "inactive",
-                "methodology_version": "v1.2.3",
-                "profile": profile,
-                "runtime_mode": runtime_mode,
-                "pack_path": pack_path,
-                "tags": ["identity"],
-            }
-        )
-    catalog["identities"] = identities
-    _dump_yaml(catalog_path, catalog)
+    with catalog_write_lock(catalog_path):
+        if not catalog_path.exists():
+            _dump_yaml(
+                catalog_path,
+                {
+                    "version": "1.0",
+                    "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+                    "default_identity": "",
+                    "identities": [],
+                },
+            )
+        catalog = _load_yaml(catalog_path)
+        identities = catalog.get("identities") or []
+        existing = next((x for x in identities if isinstance(x, dict) and str(x.get("id", "")).strip() == identity_id), None)
+        if existing:
+            existing["pack_path"] = pack_path
+            existing["title"] = title or existing.get("title", identity_id)
+            existing["description"] = description or existing.get("description", "")
+            existing["profile"] = profile
+            existing["runtime_mode"] = runtime_mode
+            if activate:
+                existing["status"] = "active"
+        else:
+            identities.append(
+                {
+                    "id": identity_id,
+                    "title": title or identity_id,
+                    "description": description or "",
+                    "status": "active" if activate else "inactive",
+                    "methodology_version": "v1.2.3",
+                    "profile": profile,
+                    "runtime_mode": runtime_mode,
+                    "pack_path": pack_path,
+                    "tags": ["identity"],
+                }
+            )
+        catalog["identities"] = identities
+        _dump_yaml(catalog_path, catalog)
 
 
 def _single_active_precheck(catalog_path: Path, target_identity_id: str, auto_converge: bool = False) -> int:
@@ -824,7 +826,7 @@ def cmd_rollback(args: argparse.Namespace) -> int:
     return 0
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     identity_home = default_identity_home()
     ap = argparse.ArgumentParser(description="Identity installer CLI (installer-plane)")
     common = argparse.ArgumentParser(add_help=False)
@@ -867,7 +869,7 @@ def main() -> int:
     p_rb = sub.add_parser("rollback", parents=[common])
     p_rb.add_argument("--rollback-ref", required=True)
 
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
     if args.command == "plan":
         return cmd_plan(args)
     if args.command == "dry-run":
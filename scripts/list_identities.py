@@ -16,11 +16,11 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     return data
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="List identities from catalog with basic health signals")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--json", action="store_true", help="output json")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog)
     if not catalog_path.exists():
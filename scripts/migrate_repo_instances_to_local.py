@@ -10,6 +10,7 @@ from typing import Any
 
 import yaml
 
+from catalog_lock_common import catalog_write_lock, write_catalog_yaml
 from resolve_identity_context import default_identity_home, default_local_catalog_path, default_local_instances_root
 
 
@@ -20,11 +21,6 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     return data
 
 
-def _dump_yaml(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
-
-
 def _write_json(path: Path, data: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
@@ -37,14 +33,23 @@ def _repo_abs(repo_root: Path, p: str) -> Path:
     return (repo_root / pp).resolve()
 
 
-def main() -> int:
+def _merge_migrated(local_catalog: dict[str, Any], migrated: list[dict[str, Any]]) -> None:
+    if not migrated:
+        return
+    existing = {str(x.get("id", "")).strip(): x for x in (local_catalog.get("identities") or []) if isinstance(x, dict)}
+    for row in migrated:
+        existing[str(row.get("id", "")).strip()] = row
+    local_catalog["identities"] = list(existing.values())
+
+
+def main(argv: list[str] | None = None) -> int:
     identity_home = default_identity_home()
     ap = argparse.ArgumentParser(description="Migrate non-fixture repo instances to local IDENTITY_HOME.")
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--local-catalog", default=str(default_local_catalog_path(identity_home)))
     ap.add_argument("--target-root", default=str(default_local_instances_root(identity_home)))
     ap.add_argument("--apply", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     repo_root = Path.cwd().resolve()
     repo_catalog = _load_yaml(Path(args.repo_catalog))
@@ -89,11 +94,7 @@ def main() -> int:
             elif pack_abs.exists() and pack_abs.is_dir():
                 shutil.copytree(pack_abs, dst, dirs_exist_ok=True)
 
-    if migrated:
-        existing = {str(x.get("id", "")).strip(): x for x in (local_catalog.get("identities") or []) if isinstance(x, dict)}
-        for row in migrated:
-            existing[str(row.get("id", "")).strip()] = row
-        local_catalog["identities"] = list(existing.values())
+    _merge_migrated(local_catalog, migrated)
 
     ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     report_dir = identity_home / "reports"
@@ -110,7 +111,14 @@ def main() -> int:
     report_path = report_dir / f"migration-report-{ts}.json"
 
     if args.apply:
-        _dump_yaml(local_catalog_path, local_catalog)
+        # re-read under the lock so rows written by concurrent writers since the first read survive
+        with catalog_write_lock(local_catalog_path):
+            if local_catalog_path.exists():
+                local_catalog = _load_yaml(local_catalog_path)
+                local_catalog.setdefault("identities", [])
+                local_catalog.setdefault("default_identity", "")
+                _merge_migrated(local_catalog, migrated)
+            write_catalog_yaml(local_catalog_path, local_catalog)
         _write_json(rollback_path, rollback_map)
         _write_json(report_path, report)
         print(f"[OK] migration applied; local catalog updated: {local_catalog_path}")
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import re
+from typing import Any, Iterator, Sequence
+
+try:  # pattern structure is read from the stdlib parser; any surprise just disables the prefilter
+    from re import _constants as _sre_c, _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - python < 3.11
+    import sre_constants as _sre_c  # type: ignore[no-redef]
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+_REPEATS = {_sre_c.MAX_REPEAT, _sre_c.MIN_REPEAT, getattr(_sre_c, "POSSESSIVE_REPEAT", _sre_c.MAX_REPEAT)}
+_BOUNDARIES = {
+    _sre_c.AT_BOUNDARY,
+    _sre_c.AT_NON_BOUNDARY,
+    _sre_c.AT_LOC_BOUNDARY,
+    _sre_c.AT_LOC_NON_BOUNDARY,
+    _sre_c.AT_UNI_BOUNDARY,
+    _sre_c.AT_UNI_NON_BOUNDARY,
+}
+
+
+def _required(seq: Any) -> list[list[str]]:
+    """
+    Literal requirements of a parsed pattern: every match contains, for each requirement, at
+    least one of its alternatives as a substring.
+    """
+    reqs: list[list[str]] = []
+    run: list[str] = []
+
+    def _flush() -> None:
+        if run:
+            reqs.append(["".join(run)])
+            run.clear()
+
+    for op, av in seq:
+        if op is _sre_c.LITERAL:
+            run.append(chr(av))
+            continue
+        _flush()
+        if op is _sre_c.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av
+            if not add_flags and not del_flags:
+                reqs.extend(_required(sub))
+        elif op is getattr(_sre_c, "ATOMIC_GROUP", None):
+            reqs.extend(_required(av))
+        elif op in _REPEATS:
+            lo, _hi, sub = av
+            if lo >= 1:
+                reqs.extend(_required(sub))
+        elif op is _sre_c.BRANCH:
+            alternatives: list[str] = []
+            for alt in av[1]:
+                options = [opts[0] for opts in _required(alt) if len(opts) == 1]
+                if not options:
+                    alternatives = []
+                    break
+                alternatives.append(max(options, key=len))
+            if alternatives:
+                reqs.append(alternatives)
+        elif op is _sre_c.IN:
+            if av and all(item_op is _sre_c.LITERAL for item_op, _ in av):
+                reqs.append([chr(x) for _, x in av])
+    _flush()
+    return reqs
+
+
+def _context_free(seq: Any) -> bool:
+    """True when a match inside a stripped line is also a match at the same offset of the whole text."""
+    for op, av in seq:
+        if op is _sre_c.AT and av not in _BOUNDARIES:
+            return False
+        if op in (_sre_c.ASSERT, _sre_c.ASSERT_NOT):
+            return False
+        if op is _sre_c.SUBPATTERN and not _context_free(av[3]):
+            return False
+        if op is getattr(_sre_c, "ATOMIC_GROUP", None) and not _context_free(av):
+            return False
+        if op in _REPEATS and not _context_free(av[2]):
+            return False
+        if op is _sre_c.BRANCH and not all(_context_free(alt) for alt in av[1]):
+            return False
+        if op is _sre_c.GROUPREF_EXISTS:
+            return False
+    return True
+
+
+def _analyse(pat: re.Pattern[str]) -> tuple[list[list[str]], bool]:
+    try:
+        parsed = _sre_parse.parse(pat.pattern, pat.flags)
+        return _required(parsed), _context_free(parsed)
+    except Exception:
+        return [], False
+
+
+class MultiPatternScanner:
+    """
+    Ordered pattern set for scanning large texts.
+
+    ``plan(text)`` drops patterns whose required literals (read from the compiled pattern) are
+    absent from ``text``; ``candidate_lines`` then runs each remaining pattern once over the whole
+    text and returns the lines its matches touch. ``matches(line)`` yields, in declared order, the
+    index of every pattern that matches - exactly like looping ``pat.search(line)`` - so callers
+    keep their per-line semantics and only pay for it on candidate lines.
+    """
+
+    def __init__(self, patterns: Sequence[re.Pattern[str]]) -> None:
+        self.patterns = list(patterns)
+        analysed = [_analyse(p) for p in self.patterns]
+        self._literals = [a[0] for a in analysed]
+        self._context_free = [a[1] for a in analysed]
+
+    @property
+    def fingerprint(self) -> str:
+        rows = [[p.pattern, int(p.flags)] for p in self.patterns]
+        return hashlib.sha256(json.dumps(rows).encode("utf-8")).hexdigest()[:16]
+
+    def plan(self, text: str, *, json_escaped: bool = False) -> list[int]:
+        """
+        Indices of patterns that can match somewhere in ``text``. With ``json_escaped`` the text is a
+        ``json.dumps`` rendering and literals containing characters JSON escapes are not trusted.
+        """
+        folded: str | None = None
+        ascii_text = text.isascii()
+        active: list[int] = []
+        for idx, pat in enumerate(self.patterns):
+            ignore_case = bool(pat.flags & re.IGNORECASE)
+            possible = True
+            for options in self._literals[idx]:
+                if not all(self._trusted(o, ignore_case, ascii_text, json_escaped) for o in options):
+                    continue  # cannot prove absence; keep the pattern
+                if ignore_case:
+                    if folded is None:
+                        folded = text.lower()
+                    found = any(o.lower() in folded for o in options)
+                else:
+                    found = any(o in text for o in options)
+                if not found:
+                    possible = False
+                    break
+            if possible:
+                active.append(idx)
+        return active
+
+    @staticmethod
+    def _trusted(literal: str, ignore_case: bool, ascii_text: bool, json_escaped: bool) -> bool:
+        if json_escaped and any(ch in '"\\' or ord(ch) < 0x20 for ch in literal):
+            return False
+        # re's case folding is wider than str.lower() outside ASCII (e.g. U+017F ~ "s", U+212A ~ "k")
+        if ignore_case and any(ch.isalpha() for ch in literal) and not (ascii_text and literal.isascii()):
+            return False
+        return True
+
+    def candidate_lines(self, text: str, active: Sequence[int]) -> set[int] | None:
+        """
+        0-based ``text.splitlines()`` indices where an active pattern may match the stripped line;
+        None when some active pattern depends on line context and every line must be checked.
+        """
+        if any(not self._context_free[idx] for idx in active):
+            return None
+        starts: list[int] = []
+        offset = 0
+        for line in text.splitlines(keepends=True):
+            starts.append(offset)
+            offset += len(line)
+        out: set[int] = set()
+        for idx in active:
+            for m in self.patterns[idx].finditer(text):
+                first = bisect.bisect_right(starts, m.start()) - 1
+                last = bisect.bisect_right(starts, max(m.end() - 1, m.start())) - 1
+                out.update(range(max(first, 0), last + 1))
+        return out
+
+    def matches(self, text: str, active: Sequence[int] | None = None) -> Iterator[int]:
+        for idx in range(len(self.patterns)) if active is None else active:
+            if self.patterns[idx].search(text):
+                yield idx
+
+    def first(self, text: str, active: Sequence[int] | None = None) -> int | None:
+        return next(self.matches(text, active), None)
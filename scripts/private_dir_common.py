@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def user_tmp_dir(name: str) -> Path:
+    """Per-user default under /tmp (``/tmp/<name>-<uid>``), so users never share cached verdicts."""
+    return Path(f"/tmp/{name}-{os.getuid()}")
+
+
+def private_dir(root: Path) -> Path | None:
+    """
+    Create ``root`` (mode 0700) if needed and return it only when this user owns it and no one
+    else can read or write it. Cached verdicts from any other directory could have been planted,
+    so callers treat None as "no cache".
+    """
+    root = Path(root).expanduser()
+    try:
+        root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = root.stat()
+    except OSError:
+        return None
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        return None
+    return root
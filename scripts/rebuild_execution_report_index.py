@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+import yaml
+
+from execution_report_index_common import rebuild_execution_report_index
+
+
+def _catalog_report_roots(catalog_path: Path) -> list[Path]:
+    if not catalog_path.exists():
+        return []
+    data = yaml.safe_load(catalog_path.read_text(encoding="utf-8")) or {}
+    roots: list[Path] = []
+    for row in data.get("identities") or []:
+        if not isinstance(row, dict):
+            continue
+        pack_raw = str(row.get("pack_path", "")).strip()
+        if not pack_raw:
+            continue
+        pack = Path(pack_raw).expanduser().resolve()
+        roots.extend([pack / "runtime" / "reports", pack / "runtime"])
+    return roots
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Rebuild execution-report-index.jsonl for identity upgrade report roots from disk."
+    )
+    ap.add_argument("--root", action="append", default=[], help="report root to (re)index (repeatable)")
+    ap.add_argument(
+        "--catalog",
+        action="append",
+        default=[],
+        help="catalog whose pack runtime/reports and runtime dirs are (re)indexed (repeatable)",
+    )
+    ap.add_argument(
+        "--include-default-roots",
+        action="store_true",
+        help="also index /tmp/identity-upgrade-reports, /tmp/identity-runtime and $IDENTITY_HOME",
+    )
+    args = ap.parse_args(argv)
+
+    roots: list[Path] = [Path(x).expanduser().resolve() for x in args.root]
+    for catalog in args.catalog:
+        roots.extend(_catalog_report_roots(Path(catalog).expanduser().resolve()))
+    if args.include_default_roots:
+        roots.extend([Path("/tmp/identity-upgrade-reports"), Path("/tmp/identity-runtime")])
+        if os.environ.get("IDENTITY_HOME", "").strip():
+            roots.append(Path(os.environ["IDENTITY_HOME"]).expanduser().resolve())
+    if not roots:
+        ap.error("nothing to index: pass --root, --catalog or --include-default-roots")
+
+    seen: set[Path] = set()
+    for root in roots:
+        if root in seen or not root.exists():
+            continue
+        seen.add(root)
+        count = rebuild_execution_report_index(root)
+        print(f"[OK] indexed {count} execution report(s): {root}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -224,7 +224,7 @@ def _next_action(pointer_consistency: str, lease_status: str, baseline_status: s
     return "none"
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Refresh identity actor/session status with baseline visibility fields.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -233,7 +233,7 @@ def main() -> int:
     ap.add_argument("--execution-report", default="")
     ap.add_argument("--baseline-policy", choices=["strict", "warn"], default="warn")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -2,19 +2,26 @@
 from __future__ import annotations
 
 import argparse
-import glob
+import contextlib
 import hashlib
+import io
 import json
 import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from actor_session_common import resolve_actor_id
+from execution_report_index_common import collect_execution_reports
+from git_facts_common import invalidate_worktree_status, publish_git_facts, release_git_facts, rev_parse
 from response_stamp_common import DEFAULT_WORK_LAYER, resolve_layer_intent
+from task_scheduler_common import TaskScheduler
+from validator_result_cache_common import ValidatorResultCache, default_validator_cache
+from validator_timing_common import run_measured, timed_validator
 
 PROTOCOL_PUBLISH_SCRIPTS = {
     "scripts/validate_changelog_updated.py",
@@ -23,28 +30,84 @@ PROTOCOL_PUBLISH_SCRIPTS = {
     "scripts/validate_release_freeze_boundary.py",
 }
 
+# Steps that write shared pack/runtime state (or, for workspace cleanliness, observe it):
+# they wait for every earlier step and every later step waits for them.
+RELEASE_BARRIER_SCRIPTS = {
+    "scripts/validate_release_workspace_cleanliness.py",
+    "scripts/validate_headstamp_recurrence_closure.py",
+    "scripts/validate_instance_protocol_split_receipt.py",
+    "scripts/validate_work_layer_gate_set_routing.py",
+    "scripts/validate_discovery_requiredization.py",
+    "scripts/build_vibe_coding_feeding_pack.py",
+    "scripts/build_capability_fit_matrix.py",
+    "scripts/validate_required_contract_coverage.py",
+    "scripts/collect_identity_health_report.py",
+    "scripts/validate_protocol_feedback_bootstrap_ready.py",
+    "scripts/validate_protocol_entry_candidate_bridge.py",
+    "scripts/validate_protocol_inquiry_followup_chain.py",
+    "scripts/validate_protocol_feedback_ssot_archival.py",
+}
+# Artifact flags used to derive read-after-write / write-after-read edges between steps.
+RELEASE_STEP_OUTPUT_FLAGS = {"--out", "--out-dir", "--out-root", "--out-reply-file", "--blocker-receipt-out"}
+RELEASE_STEP_INPUT_FLAGS = {"--stamp-json", "--receipt", "--reply-file", "--reply-transport-ref", "--report-dir"}
+
+
+def _run_timed(cmd: list[str], capture: bool = False) -> subprocess.CompletedProcess[str]:
+    with timed_validator(cmd) as timing:
+        p = run_measured(cmd, timing, capture_output=capture, text=True)
+        timing.rc = p.returncode
+    return p
+
 
-def _run(cmd: list[str]) -> int:
+def _run_cached(cmd: list[str], cache: ValidatorResultCache, key: str) -> tuple[int, str, str]:
+    hit = cache.get(key)
+    if hit is not None:
+        print(f"[CACHE] validator result hit: {cmd[1]}")
+        return int(hit.get("rc", 1)), str(hit.get("stdout", "")), str(hit.get("stderr", ""))
+    p = _run_timed(cmd, capture=True)
+    cache.put(key, cmd, p.returncode, p.stdout or "", p.stderr or "")
+    return p.returncode, p.stdout or "", p.stderr or ""
+
+
+def _run(cmd: list[str], cache: ValidatorResultCache | None = None, capture: bool = False) -> int:
     print(f"[RUN] {' '.join(cmd)}")
-    p = subprocess.run(cmd)
-    if p.returncode != 0:
-        print(f"[FAIL] command failed ({p.returncode}): {' '.join(cmd)}")
-        return p.returncode
+    key = cache.key_for(cmd, Path.cwd()) if cache is not None else None
+    if cache is not None and key:
+        rc, out, err = _run_cached(cmd, cache, key)
+        sys.stdout.write(out)
+        sys.stdout.flush()
+        sys.stderr.write(err)
+    elif capture:
+        p = _run_timed(cmd, capture=True)
+        rc = p.returncode
+        sys.stdout.write(p.stdout or "")
+        sys.stderr.write(p.stderr or "")
+    else:
+        sys.stdout.flush()
+        rc = _run_timed(cmd).returncode
+    if rc != 0:
+        print(f"[FAIL] command failed ({rc}): {' '.join(cmd)}")
+        return rc
     return 0
 
 
-def _run_capture(cmd: list[str]) -> tuple[int, str, str]:
+def _run_capture(cmd: list[str], cache: ValidatorResultCache | None = None) -> tuple[int, str, str]:
     print(f"[RUN] {' '.join(cmd)}")
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    out = (p.stdout or "").strip()
-    err = (p.stderr or "").strip()
+    key = cache.key_for(cmd, Path.cwd()) if cache is not None else None
+    if cache is not None and key:
+        rc, raw_out, raw_err = _run_cached(cmd, cache, key)
+    else:
+        p = _run_timed(cmd, capture=True)
+        rc, raw_out, raw_err = p.returncode, p.stdout or "", p.stderr or ""
+    out = raw_out.strip()
+    err = raw_err.strip()
     if out:
         print(out)
     if err:
         print(err, file=sys.stderr)
-    if p.returncode != 0:
-        print(f"[FAIL] command failed ({p.returncode}): {' '.join(cmd)}")
-    return p.returncode, out, err
+    if rc != 0:
+        print(f"[FAIL] command failed ({rc}): {' '.join(cmd)}")
+    return rc, out, err
 
 
 def _replace_activation_policy(cmd: list[str], policy: str) -> list[str]:
@@ -98,6 +161,9 @@ def _parse_json_payload(raw: str) -> dict[str, Any] | None:
 
 
 def _git_rev(expr: str) -> str:
+    resolved = rev_parse(expr)
+    if resolved:
+        return resolved
     p = subprocess.run(["git", "rev-parse", expr], check=True, capture_output=True, text=True)
     return p.stdout.strip()
 
@@ -165,7 +231,144 @@ def _route_release_seq_for_lane(seq: list[list[str]], *, work_layer: str) -> tup
     return filtered, skipped
 
 
-def main() -> int:
+def _cmd_flag_values(cmd: list[str], flags: set[str]) -> list[str]:
+    return [cmd[i + 1] for i, tok in enumerate(cmd[:-1]) if tok in flags and cmd[i + 1].strip()]
+
+
+def _release_step_dependencies(seq: list[list[str]]) -> list[list[int]]:
+    """Prerequisite step indexes: barrier ordering plus artifact producer/consumer edges."""
+    deps: list[list[int]] = []
+    last_barrier: int | None = None
+    last_writer: dict[str, int] = {}
+    readers: dict[str, list[int]] = {}
+    for idx, cmd in enumerate(seq):
+        script = cmd[1] if len(cmd) >= 2 else ""
+        if script in RELEASE_BARRIER_SCRIPTS:
+            deps.append(list(range(idx)))
+            last_barrier = idx
+            continue
+        row: set[int] = set() if last_barrier is None else {last_barrier}
+        for path in _cmd_flag_values(cmd, RELEASE_STEP_INPUT_FLAGS):
+            if path in last_writer:
+                row.add(last_writer[path])
+            readers.setdefault(path, []).append(idx)
+        for path in _cmd_flag_values(cmd, RELEASE_STEP_OUTPUT_FLAGS):
+            if path in last_writer:
+                row.add(last_writer[path])
+            row.update(r for r in readers.pop(path, []) if r != idx)
+            last_writer[path] = idx
+        deps.append(sorted(row))
+    return deps
+
+
+def _run_release_step(
+    cmd: list[str], capability_policy: str, cache: ValidatorResultCache | None, capture: bool
+) -> int:
+    is_capability_validator = len(cmd) >= 2 and cmd[1] == "scripts/validate_identity_capability_activation.py"
+    if not is_capability_validator:
+        return _run(cmd, cache=cache, capture=capture)
+
+    rc, out, _ = _run_capture(cmd)
+    if rc == 0:
+        return 0
+
+    payload = _parse_json_payload(out) or {}
+    cap_error_code = str(payload.get("capability_activation_error_code", "")).strip()
+    if str(capability_policy or "").strip().lower() == "strict-union" and cap_error_code == "IP-CAP-003":
+        print(
+            "[WARN] capability activation strict-union blocked by env/auth boundary (IP-CAP-003); "
+            "retrying route-any-ready fallback for readiness flow"
+        )
+        fallback_cmd = _replace_activation_policy(cmd, "route-any-ready")
+        return _run(fallback_cmd, capture=capture)
+    return rc
+
+
+def _release_step(cmd: list[str], capability_policy: str, cache_enabled: bool, buffered: bool) -> tuple[int, str]:
+    cache = default_validator_cache(enabled=cache_enabled)
+    if not buffered:
+        return _run_release_step(cmd, capability_policy, cache, capture=False), ""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        rc = _run_release_step(cmd, capability_policy, cache, capture=True)
+    return rc, buf.getvalue()
+
+
+def _print_release_timing_table(
+    seq: list[list[str]], scheduler: TaskScheduler, keys: list[str], rcs: dict[str, int], wall_ms: int
+) -> None:
+    print(f"[TIMING] release readiness steps (jobs={scheduler.jobs})")
+    print(f"  {'#':>3}  {'status':<9}  {'ms':>7}  script")
+    total_ms = 0
+    for idx, key in enumerate(keys):
+        if key in rcs:
+            status = "ok" if rcs[key] == 0 else f"fail({rcs[key]})"
+        else:
+            status = "cancelled"
+        duration_ms = scheduler.tasks[key].duration_ms
+        total_ms += duration_ms
+        print(f"  {idx:>3}  {status:<9}  {duration_ms:>7}  {seq[idx][1] if len(seq[idx]) >= 2 else seq[idx][0]}")
+    print(f"  step time total={total_ms}ms wall={wall_ms}ms")
+
+
+def _run_release_seq(seq: list[list[str]], *, jobs: int, capability_policy: str, cache_enabled: bool) -> int:
+    """
+    Run the release step DAG; the first failing step stops dispatch (fail-fast) and the
+    failure of the earliest declared step wins. ``jobs=1`` keeps the legacy streamed order.
+    """
+    scheduler = TaskScheduler(jobs=jobs)
+    buffered = scheduler.jobs > 1
+    keys = [f"{idx:03d}:{cmd[1] if len(cmd) >= 2 else cmd[0]}" for idx, cmd in enumerate(seq)]
+    rcs: dict[str, int] = {}
+
+    def _on_done(key: str):
+        def _record(result: tuple[int, str]) -> None:
+            rc, output = result
+            rcs[key] = rc
+            # drop only: report_three_plane_status is the sole porcelain reader and runs git itself
+            invalidate_worktree_status(refresh=False)
+            if output:
+                sys.stdout.write(output)
+                sys.stdout.flush()
+            if rc != 0:
+                scheduler.stop()
+
+        return _record
+
+    step_deps = _release_step_dependencies(seq)
+    for idx, (key, cmd) in enumerate(zip(keys, seq)):
+        scheduler.add(
+            key,
+            _release_step,
+            (cmd, capability_policy, cache_enabled, buffered),
+            deps=[keys[d] for d in step_deps[idx]],
+            on_done=_on_done(key),
+        )
+    started = time.monotonic()
+    invalidate_worktree_status(refresh=False)  # earlier gates may have written files
+    try:
+        scheduler.run()
+    finally:
+        invalidate_worktree_status(refresh=False)
+    _print_release_timing_table(seq, scheduler, keys, rcs, int((time.monotonic() - started) * 1000))
+    failed = [key for key in keys if rcs.get(key, 0) != 0]
+    if failed:
+        if scheduler.cancelled:
+            print(f"[INFO] fail-fast cancelled {len(scheduler.cancelled)} pending release step(s)")
+        return rcs[failed[0]]
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    # one git facts snapshot (HEAD, toplevel, branch, diff ranges) shared by every child validator
+    snapshot = publish_git_facts()
+    try:
+        return _main(argv)
+    finally:
+        release_git_facts(snapshot)
+
+
+def _main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Run release-readiness validators in a deterministic order.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--scope", default="", help="explicit scope arbitration (REPO/USER/ADMIN/SYSTEM)")
@@ -242,7 +445,21 @@ def main() -> int:
             "Defaults to CODEX_ACTOR_ID; falls back to assistant:codex."
         ),
     )
-    args = ap.parse_args()
+    ap.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="bypass the validator result cache (also disabled by IDENTITY_VALIDATOR_CACHE=0)",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "number of release steps run concurrently; steps keep their declared prerequisites "
+            "and the first failure cancels steps not yet started"
+        ),
+    )
+    args = ap.parse_args(argv)
 
     base = args.base.strip() or _git_rev("HEAD~1")
     head = args.head.strip() or _git_rev("HEAD")
@@ -1017,15 +1234,7 @@ def main() -> int:
         roots.append(Path("/tmp/identity-runtime"))
         if os.environ.get("IDENTITY_HOME", "").strip():
             roots.append(Path(os.environ["IDENTITY_HOME"]).expanduser().resolve())
-        candidates: list[Path] = []
-        for root in roots:
-            if not root.exists():
-                continue
-            for p in glob.glob(str(root / "**" / f"identity-upgrade-exec-{identity_id}-*.json"), recursive=True):
-                pp = Path(p)
-                if pp.name.endswith("-patch-plan.json"):
-                    continue
-                candidates.append(pp)
+        candidates = collect_execution_reports(identity_id, roots)
         prompt_sha = ""
         if pack_path is not None:
             prompt_path = pack_path / "IDENTITY_PROMPT.md"
@@ -1532,30 +1741,13 @@ def main() -> int:
             } and "--source-layer" not in cmd:
                 cmd.extend(["--source-layer", expected_source_layer])
 
-    for cmd in seq:
-        is_capability_validator = len(cmd) >= 2 and cmd[1] == "scripts/validate_identity_capability_activation.py"
-        if not is_capability_validator:
-            rc = _run(cmd)
-            if rc != 0:
-                return rc
-            continue
-
-        rc, out, _ = _run_capture(cmd)
-        if rc == 0:
-            continue
-
-        payload = _parse_json_payload(out) or {}
-        cap_error_code = str(payload.get("capability_activation_error_code", "")).strip()
-        if str(args.capability_activation_policy or "").strip().lower() == "strict-union" and cap_error_code == "IP-CAP-003":
-            print(
-                "[WARN] capability activation strict-union blocked by env/auth boundary (IP-CAP-003); "
-                "retrying route-any-ready fallback for readiness flow"
-            )
-            fallback_cmd = _replace_activation_policy(cmd, "route-any-ready")
-            rc_fb = _run(fallback_cmd)
-            if rc_fb == 0:
-                continue
-            return rc_fb
+    rc = _run_release_seq(
+        seq,
+        jobs=args.jobs,
+        capability_policy=args.capability_activation_policy,
+        cache_enabled=not args.no_cache,
+    )
+    if rc != 0:
         return rc
 
     print("[OK] release readiness checks PASSED")
@@ -15,9 +15,10 @@ from response_stamp_common import (
     resolve_disclosure_level,
     resolve_stamp_context,
 )
+from result_channel_common import print_result
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Render dynamic identity response stamp (external/internal).")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -46,7 +47,7 @@ def main() -> int:
     )
     ap.add_argument("--out", default="", help="optional path to persist rendered stamp payload JSON")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -137,14 +138,14 @@ def main() -> int:
         out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
         return 0
 
     if args.view in {"external", "dual"}:
         print(external)
     if args.view in {"internal", "dual"}:
         print(internal)
-    print(json.dumps({"identity_context": payload["identity_context"]}, ensure_ascii=False))
+    print_result({"identity_context": payload["identity_context"]}, ensure_ascii=False)
     return 0
 
 
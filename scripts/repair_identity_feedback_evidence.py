@@ -53,12 +53,12 @@ def _write(path: Path, payload: dict[str, Any], apply: bool) -> None:
         path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Repair/generate experience feedback governance evidence.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default=str((Path.home()/".codex"/"identity"/"catalog.local.yaml").resolve()))
     ap.add_argument("--apply", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog = Path(args.catalog).expanduser().resolve()
     identity = _resolve_identity(catalog, args.identity_id)
@@ -47,12 +47,12 @@ def _materialize(pattern: str, identity_id: str, ts: int) -> Path:
     return Path(p).expanduser()
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Repair/generate install safety evidence report.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default=str((Path.home()/".codex"/"identity"/"catalog.local.yaml").resolve()))
     ap.add_argument("--apply", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog = Path(args.catalog).expanduser().resolve()
     identity = _resolve_identity(catalog, args.identity_id)
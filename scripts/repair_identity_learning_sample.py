@@ -145,12 +145,12 @@ def _append_rulebook_link(
     return True, f"rulebook_link_appended:{rulebook_path}"
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Bootstrap/repair identity-scoped learning sample artifact.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--force", action="store_true", help="overwrite existing sample")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog = Path(args.catalog).expanduser().resolve()
     if not catalog.exists():
@@ -73,12 +73,12 @@ def _build_command(check: str, identity_id: str, catalog: str) -> str:
     return cmd
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Repair/generate replay evidence by synthesizing required check logs.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default=str((Path.home()/".codex"/"identity"/"catalog.local.yaml").resolve()))
     ap.add_argument("--apply", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog = Path(args.catalog).expanduser().resolve()
     identity = _resolve_identity(catalog, args.identity_id)
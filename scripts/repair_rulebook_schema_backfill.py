@@ -69,12 +69,12 @@ def _rulebook_path(pack: Path) -> Path:
     return p
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Backfill safe missing fields in RULEBOOK.jsonl historical rows.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--apply", action="store_true", help="persist changes to rulebook")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog = Path(args.catalog).expanduser().resolve()
     if not catalog.exists():
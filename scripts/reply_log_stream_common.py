@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import codecs
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+from private_dir_common import private_dir, user_tmp_dir
+
+REPLY_ROLES = {"assistant", "ai", "model"}
+IDENTITY_CONTEXT_PREFIX = "Identity-Context:"
+READ_CHUNK = 1 << 16
+REPLY_LOG_CHECKPOINT_SCHEMA = "reply_log_checkpoint_v1"
+REPLY_LOG_CHECKPOINT_DIR_ENV = "IDENTITY_REPLY_LOG_CHECKPOINT_DIR"
+# bytes before the checkpoint offset that must be unchanged for the checkpoint to apply
+CHECKPOINT_TAIL_BYTES = 4096
+
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+
+
+class ReplyLogFormatError(ValueError):
+    pass
+
+
+def message_to_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        parts: list[str] = []
+        for item in value:
+            if isinstance(item, str):
+                parts.append(item)
+            elif isinstance(item, dict):
+                text = item.get("text")
+                if isinstance(text, str):
+                    parts.append(text)
+                elif isinstance(item.get("content"), str):
+                    parts.append(str(item.get("content")))
+        return "\n".join([x for x in parts if x]).strip()
+    if isinstance(value, dict):
+        if isinstance(value.get("text"), str):
+            return str(value.get("text"))
+        if isinstance(value.get("content"), str):
+            return str(value.get("content"))
+    return ""
+
+
+def first_nonempty_line(text: str) -> str:
+    for line in str(text or "").splitlines():
+        s = line.strip()
+        if s:
+            return s
+    return ""
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="ignore")
+
+
+def _jsonl_row_text(line: str) -> str | None:
+    raw = line.strip()
+    if not raw:
+        return None
+    try:
+        row = json.loads(raw)
+    except Exception:
+        return None
+    if not isinstance(row, dict):
+        return None
+    role = str(row.get("role", "")).strip().lower()
+    if role and role not in REPLY_ROLES:
+        return None
+    msg = message_to_text(row.get("content"))
+    if not msg:
+        msg = message_to_text(row.get("message"))
+    if not msg:
+        msg = message_to_text(row.get("output"))
+    return msg or None
+
+
+class _JsonStream:
+    """Pull parser over one JSON document: top-level containers are walked element by element."""
+
+    def __init__(self, fh: IO[bytes]) -> None:
+        self._fh = fh
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, want: int = READ_CHUNK) -> bool:
+        if self.eof:
+            return False
+        data = self._fh.read(max(want, READ_CHUNK))
+        if not data:
+            self.eof = True
+        text = self._decoder.decode(data, final=not data)
+        if self.pos > READ_CHUNK:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+        self.buf += text
+        return True
+
+    def peek(self) -> str:
+        if self.pos < len(self.buf) and self.buf[self.pos] not in " \t\n\r":
+            return self.buf[self.pos]
+        while True:
+            self.pos = _JSON_WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        if self.peek() != ch:
+            raise ReplyLogFormatError(f"expected {ch!r} at char {self.pos}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                val, end = _JSON_DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as exc:
+                # only a value cut off by the buffer end is worth reading more for
+                truncated = exc.msg.startswith("Unterminated string") or exc.pos >= len(self.buf) - 6
+                if truncated and self._fill(len(self.buf) - self.pos):
+                    continue
+                raise ReplyLogFormatError(str(exc)) from exc
+            if end == len(self.buf) and not self.eof:
+                # a number at the buffer end may continue in the next chunk
+                self._fill(len(self.buf) - self.pos)
+                continue
+            self.pos = end
+            return val
+
+    def array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            ch = self.peek()
+            self.pos += 1
+            if ch == "]":
+                return
+            if ch != ",":
+                raise ReplyLogFormatError(f"expected ',' or ']' at char {self.pos - 1}")
+
+    def members(self) -> Iterator[str]:
+        """Yield each key of an object; the caller must consume (``value``/``skip``/``array``) its value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise ReplyLogFormatError(f"expected key at char {self.pos}")
+            key = self.value()
+            self.expect(":")
+            yield key
+            ch = self.peek()
+            self.pos += 1
+            if ch == "}":
+                return
+            if ch != ",":
+                raise ReplyLogFormatError(f"expected ',' or '}}' at char {self.pos - 1}")
+
+    def skip(self) -> None:
+        # one level deep: memory stays bounded by the largest member/element, not the container
+        ch = self.peek()
+        if ch == "[":
+            for _ in self.array():
+                pass
+        elif ch == "{":
+            for _ in self.members():
+                self.value()
+        else:
+            self.value()
+
+    def end(self) -> None:
+        if self.peek() != "":
+            raise ReplyLogFormatError(f"extra data at char {self.pos}")
+
+
+def _json_texts(path: Path) -> Iterator[str]:
+    # Validate the whole document first (json.loads semantics: a malformed file has no samples),
+    # noting the last occurrence of each top-level key; then stream only the values that count.
+    seen: dict[str, int] = {}
+    content: Any = None
+    with path.open("rb") as fh:
+        stream = _JsonStream(fh)
+        root = stream.peek()
+        try:
+            if root == "{":
+                for key in stream.members():
+                    seen[key] = seen.get(key, 0) + 1
+                    if key == "content":
+                        content = stream.value()
+                    else:
+                        stream.skip()
+            else:
+                stream.skip()
+            stream.end()
+        except (ReplyLogFormatError, RecursionError):
+            return
+    if root == "[":
+        with path.open("rb") as fh:
+            for item in _JsonStream(fh).array():
+                msg = message_to_text(item)
+                if msg:
+                    yield msg
+        return
+    if root != "{":
+        return
+    emitted = False
+    for wanted in ("replies", "messages"):
+        if wanted not in seen:
+            continue
+        with path.open("rb") as fh:
+            stream = _JsonStream(fh)
+            occurrence = 0
+            for key in stream.members():
+                if key != wanted:
+                    stream.skip()
+                    continue
+                occurrence += 1
+                if occurrence < seen[wanted] or stream.peek() != "[":
+                    stream.skip()
+                    continue
+                for item in stream.array():
+                    if wanted == "messages":
+                        if not isinstance(item, dict):
+                            continue
+                        role = str(item.get("role", "")).strip().lower()
+                        if role and role not in REPLY_ROLES:
+                            continue
+                        msg = message_to_text(item.get("content"))
+                    else:
+                        msg = message_to_text(item)
+                    if msg:
+                        emitted = True
+                        yield msg
+    if not emitted:
+        msg = message_to_text(content)
+        if msg:
+            yield msg
+
+
+def iter_reply_first_lines(path: Path, *, offset: int = 0) -> Iterator[tuple[str, int | None]]:
+    """
+    Stream a reply log (``.jsonl``, ``.json`` or plain text with ``\\n---\\n`` between replies)
+    and yield ``(first non-empty line, resume offset)`` per reply sample, in the order the
+    whole-file parsers used to return them. Memory is bounded by the largest single reply.
+
+    The resume offset is the byte offset just past that sample's evidence, or None when the
+    sample sits in an unterminated tail (and for ``.json`` documents, which are not append-only).
+    ``offset`` resumes a ``.jsonl``/plain scan from such an offset.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        for text in _json_texts(path):
+            yield first_nonempty_line(text), None
+        return
+    with path.open("rb") as fh:
+        fh.seek(offset)
+        pos = offset
+        if suffix == ".jsonl":
+            for raw in fh:
+                pos += len(raw)
+                resume = pos if raw.endswith(b"\n") else None
+                for line in _decode(raw).splitlines():
+                    msg = _jsonl_row_text(line)
+                    if msg is not None:
+                        yield first_nonempty_line(msg), resume
+            return
+        # plain text, read with universal newlines like read_text(): a "---" line is a separator
+        # only when the newline before it is not already part of the previous separator
+        # (str.split("\n---\n") semantics); the line at a resume offset or at the start never is
+        first = ""
+        prev_separator = True
+        emitted = False
+        separators = 0
+        for raw in fh:
+            pos += len(raw)
+            lines = _decode(raw).replace("\r\n", "\n").replace("\r", "\n").splitlines(keepends=True)
+            for i, line in enumerate(lines):
+                if line == "---\n" and not prev_separator:
+                    separators += 1
+                    if first:
+                        emitted = True
+                        # resume only at "\n"-terminated byte lines (a trailing "\r" may pair with an appended "\n")
+                        yield first, pos if i == len(lines) - 1 and raw.endswith(b"\n") else None
+                    first = ""
+                    prev_separator = True
+                    continue
+                prev_separator = False
+                if not first:
+                    first = first_nonempty_line(line)
+        if first:
+            yield first, None
+        elif not emitted and offset == 0:
+            # a log of blank replies falls back to its non-empty lines: the separators themselves
+            for _ in range(separators):
+                yield "---", None
+
+
+def first_reply_first_line(path: Path) -> str | None:
+    """First line of the first reply sample (None when the log has no samples)."""
+    for line, _ in iter_reply_first_lines(path):
+        return line
+    return None
+
+
+def reply_log_checkpoint_dir() -> Path:
+    raw = str(os.environ.get(REPLY_LOG_CHECKPOINT_DIR_ENV, "")).strip()
+    return Path(raw).expanduser() if raw else user_tmp_dir("identity-reply-log-checkpoints")
+
+
+def _tail_digest(path: Path, offset: int) -> str:
+    start = max(0, offset - CHECKPOINT_TAIL_BYTES)
+    with path.open("rb") as fh:
+        fh.seek(start)
+        return hashlib.sha256(fh.read(offset - start)).hexdigest()
+
+
+@dataclass
+class ReplyFirstLineScan:
+    """First-line facts of a reply log: sample count, first line, 1-based samples missing the stamp."""
+
+    sample_count: int = 0
+    first_line: str = ""
+    missing_refs: list[int] = field(default_factory=list)
+    # False when fail-fast stopped at the first violation
+    complete: bool = True
+    resumed_from_offset: int = 0
+    checkpoint_offset: int = 0
+    checkpoint_path: str = ""
+
+    def add(self, line: str) -> None:
+        if not line:
+            return
+        self.sample_count += 1
+        if self.sample_count == 1:
+            self.first_line = line
+        if not line.startswith(IDENTITY_CONTEXT_PREFIX):
+            self.missing_refs.append(self.sample_count)
+
+    def state(self) -> dict[str, Any]:
+        return {"sample_count": self.sample_count, "first_line": self.first_line, "missing_refs": list(self.missing_refs)}
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "complete": self.complete,
+            "resumed_from_offset": self.resumed_from_offset,
+            "checkpoint_offset": self.checkpoint_offset,
+            "checkpoint_path": self.checkpoint_path,
+        }
+
+
+def _checkpoint_file(log_path: Path) -> Path | None:
+    root = private_dir(reply_log_checkpoint_dir())
+    if root is None:
+        return None
+    key = hashlib.sha256(str(log_path).encode("utf-8")).hexdigest()
+    return root / f"{key}.json"
+
+
+def _load_checkpoint(log_path: Path, ckpt: Path) -> tuple[int, dict[str, Any]] | None:
+    try:
+        doc = json.loads(ckpt.read_text(encoding="utf-8"))
+        st = log_path.stat()
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(doc, dict) or doc.get("schema") != REPLY_LOG_CHECKPOINT_SCHEMA or doc.get("log_path") != str(log_path):
+        return None
+    offset = doc.get("offset")
+    state = doc.get("state")
+    if not isinstance(offset, int) or not isinstance(state, dict) or offset < 0:
+        return None
+    # rotated, truncated or rewritten logs start over
+    if [doc.get("dev"), doc.get("ino")] != [st.st_dev, st.st_ino] or st.st_size < offset:
+        return None
+    try:
+        if _tail_digest(log_path, offset) != doc.get("tail_sha256"):
+            return None
+    except OSError:
+        return None
+    return offset, state
+
+
+def _save_checkpoint(log_path: Path, ckpt: Path, offset: int, state: dict[str, Any]) -> None:
+    try:
+        st = log_path.stat()
+        doc = {
+            "schema": REPLY_LOG_CHECKPOINT_SCHEMA,
+            "log_path": str(log_path),
+            "dev": st.st_dev,
+            "ino": st.st_ino,
+            "offset": offset,
+            "tail_sha256": _tail_digest(log_path, offset),
+            "state": state,
+        }
+        tmp = ckpt.with_name(f".{ckpt.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(doc, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp, ckpt)
+    except OSError:
+        return
+
+
+def scan_reply_first_lines(path: Path, *, fail_fast: bool = False, checkpoint: bool = False) -> ReplyFirstLineScan:
+    """
+    Stream ``path`` into a ``ReplyFirstLineScan``. ``fail_fast`` stops at the first sample
+    without the Identity-Context stamp. ``checkpoint`` (``.jsonl`` and plain logs) resumes
+    from the offset the previous complete scan of this file validated up to, reusing its
+    facts, and records the new offset; appended replies are the only ones read again.
+    """
+    log_path = path.resolve()
+    scan = ReplyFirstLineScan()
+    ckpt = _checkpoint_file(log_path) if checkpoint and log_path.suffix.lower() != ".json" else None
+    offset = 0
+    if ckpt is not None:
+        loaded = _load_checkpoint(log_path, ckpt)
+        if loaded is not None:
+            offset, state = loaded
+            scan.sample_count = int(state.get("sample_count") or 0)
+            scan.first_line = str(state.get("first_line", ""))
+            scan.missing_refs = [int(x) for x in state.get("missing_refs") or []]
+            scan.resumed_from_offset = offset
+        scan.checkpoint_path = str(ckpt)
+    if fail_fast and scan.missing_refs:
+        scan.complete = False
+        return scan
+    committed = (offset, scan.state())
+    for line, resume in iter_reply_first_lines(log_path, offset=offset):
+        scan.add(line)
+        if resume is not None:
+            committed = (resume, scan.state())
+        if fail_fast and scan.missing_refs:
+            scan.complete = False
+            return scan
+    scan.checkpoint_offset = committed[0]
+    if ckpt is not None:
+        _save_checkpoint(log_path, ckpt, committed[0], committed[1])
+    return scan
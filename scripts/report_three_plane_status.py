@@ -4,28 +4,34 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any
 
 from actor_session_common import resolve_actor_id
+from execution_report_index_common import latest_execution_report
+from git_facts_common import current_branch, head_sha, porcelain_status
 from response_stamp_common import DEFAULT_WORK_LAYER, resolve_layer_intent
 from resolve_identity_context import resolve_identity
+from result_channel_common import print_result, run_with_result_channel
+from validator_timing_common import timed_validator
 
 PROTOCOL_ROOT = Path(__file__).resolve().parent.parent
 
-def _run(cmd: list[str], *, cwd: Path | None = None) -> tuple[int, str, str]:
+def _run(cmd: list[str], *, cwd: Path | None = None) -> tuple[int, str, str, dict[str, Any] | None]:
     run_cwd = cwd.resolve() if isinstance(cwd, Path) else PROTOCOL_ROOT
-    p = subprocess.run(cmd, capture_output=True, text=True, cwd=str(run_cwd))
-    return p.returncode, (p.stdout or "").strip(), (p.stderr or "").strip()
+    with timed_validator(cmd) as timing:
+        p, result = run_with_result_channel(cmd, cwd=str(run_cwd), timing=timing)
+        timing.rc = p.returncode
+    return p.returncode, (p.stdout or "").strip(), (p.stderr or "").strip(), result
 
 
 def _tracked_worktree_state() -> tuple[bool, list[str], str]:
-    rc, out, err = _run(["git", "status", "--porcelain"])
+    rc, lines, err = porcelain_status(PROTOCOL_ROOT)
     if rc != 0:
-        return False, [], (err or out or "git_status_failed")
-    rows = [ln for ln in out.splitlines() if ln.strip()]
+        return False, [], (err.strip() or "git_status_failed")
+    # same rows as the former stripped `git status --porcelain` stdout
+    rows = [ln for ln in "\n".join(lines).strip().splitlines() if ln.strip()]
     tracked_dirty = [ln for ln in rows if not ln.startswith("??")]
     return len(tracked_dirty) == 0, tracked_dirty[:20], ""
 
@@ -82,6 +88,11 @@ def _parse_json_payload(raw: str) -> dict[str, Any] | None:
     return data if isinstance(data, dict) else None
 
 
+def _validator_payload(result: dict[str, Any] | None, out: str) -> dict[str, Any]:
+    # result-channel payload first; stdout scraping only for validators that do not publish one
+    return result if result is not None else (_parse_json_payload(out) or {})
+
+
 def _latest_report(identity_id: str, identity_home: str = "", preferred_pack: str = "") -> Path | None:
     roots: list[Path] = []
     if preferred_pack.strip():
@@ -96,16 +107,7 @@ def _latest_report(identity_id: str, identity_home: str = "", preferred_pack: st
     )
     if identity_home.strip():
         roots.append(Path(identity_home).expanduser().resolve())
-    candidates: list[Path] = []
-    for root in roots:
-        if not root.exists():
-            continue
-        candidates.extend(root.glob(f"**/identity-upgrade-exec-{identity_id}-*.json"))
-    filtered = [p for p in candidates if not p.name.endswith("-patch-plan.json")]
-    if not filtered:
-        return None
-    filtered.sort(key=lambda p: p.stat().st_mtime)
-    return filtered[-1]
+    return latest_execution_report(identity_id, roots)
 
 
 def _release_plane_status(args: argparse.Namespace) -> tuple[str, dict[str, Any]]:
@@ -152,7 +154,7 @@ def _repo_plane_status(args: argparse.Namespace, resolved: dict[str, Any]) -> tu
         "workspace_status_error": workspace_status_error,
     }
     if args.with_docs_contract:
-        rc, out, err = _run(["python3", "scripts/docs_command_contract_check.py"])
+        rc, out, err, _ = _run(["python3", "scripts/docs_command_contract_check.py"])
         checks["docs_command_contract"] = {
             "rc": rc,
             "ok": rc == 0,
@@ -212,12 +214,12 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         expected_source_layer=expected_source_layer,
     )
     # Always validate tuple and writeback linkage to keep evidence machine-checkable.
-    rc_tuple, out_tuple, err_tuple = _run(
+    rc_tuple, out_tuple, err_tuple, result_tuple = _run(
         ["python3", "scripts/validate_identity_binding_tuple.py", "--identity-id", args.identity_id, "--report", str(report_path)]
     )
     validators["binding_tuple"] = {"rc": rc_tuple, "ok": rc_tuple == 0, "out": out_tuple, "err": err_tuple}
 
-    rc_wb, out_wb, err_wb = _run(
+    rc_wb, out_wb, err_wb, result_wb = _run(
         [
             "python3",
             "scripts/validate_identity_experience_writeback.py",
@@ -236,10 +238,10 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     perm_cmd = ["python3", "scripts/validate_identity_permission_state.py", "--identity-id", args.identity_id, "--report", str(report_path), "--ci"]
     if all_ok and wb == "WRITTEN" and ps == "WRITEBACK_WRITTEN":
         perm_cmd.append("--require-written")
-    rc_perm, out_perm, err_perm = _run(perm_cmd)
+    rc_perm, out_perm, err_perm, result_perm = _run(perm_cmd)
     validators["permission_state"] = {"rc": rc_perm, "ok": rc_perm == 0, "out": out_perm, "err": err_perm}
 
-    rc_session, out_session, err_session = _run(
+    rc_session, out_session, err_session, result_session = _run(
         [
             "python3",
             "scripts/validate_identity_session_pointer_consistency.py",
@@ -256,7 +258,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_session,
     }
 
-    rc_home_align, out_home_align, err_home_align = _run(
+    rc_home_align, out_home_align, err_home_align, result_home_align = _run(
         [
             "python3",
             "scripts/validate_identity_home_catalog_alignment.py",
@@ -271,7 +273,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    home_align_payload = _parse_json_payload(out_home_align) or {}
+    home_align_payload = _validator_payload(result_home_align, out_home_align)
     validators["identity_home_catalog_alignment"] = {
         "rc": rc_home_align,
         "ok": rc_home_align == 0,
@@ -282,7 +284,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_home_align != 0 or home_align_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_fixture_boundary, out_fixture_boundary, err_fixture_boundary = _run(
+    rc_fixture_boundary, out_fixture_boundary, err_fixture_boundary, result_fixture_boundary = _run(
         [
             "python3",
             "scripts/validate_fixture_runtime_boundary.py",
@@ -297,7 +299,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    fixture_boundary_payload = _parse_json_payload(out_fixture_boundary) or {}
+    fixture_boundary_payload = _validator_payload(result_fixture_boundary, out_fixture_boundary)
     validators["fixture_runtime_boundary"] = {
         "rc": rc_fixture_boundary,
         "ok": rc_fixture_boundary == 0,
@@ -308,7 +310,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_fixture_boundary != 0 or fixture_boundary_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_actor_binding, out_actor_binding, err_actor_binding = _run(
+    rc_actor_binding, out_actor_binding, err_actor_binding, result_actor_binding = _run(
         [
             "python3",
             "scripts/validate_actor_session_binding.py",
@@ -323,7 +325,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    actor_binding_payload = _parse_json_payload(out_actor_binding) or {}
+    actor_binding_payload = _validator_payload(result_actor_binding, out_actor_binding)
     validators["actor_session_binding"] = {
         "rc": rc_actor_binding,
         "ok": rc_actor_binding == 0,
@@ -334,7 +336,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_actor_binding != 0 or actor_binding_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_actor_mb, out_actor_mb, err_actor_mb = _run(
+    rc_actor_mb, out_actor_mb, err_actor_mb, result_actor_mb = _run(
         [
             "python3",
             "scripts/validate_actor_session_multibinding_concurrency.py",
@@ -349,7 +351,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    actor_mb_payload = _parse_json_payload(out_actor_mb) or {}
+    actor_mb_payload = _validator_payload(result_actor_mb, out_actor_mb)
     validators["actor_session_multibinding_concurrency"] = {
         "rc": rc_actor_mb,
         "ok": rc_actor_mb == 0,
@@ -360,7 +362,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_actor_mb != 0 or actor_mb_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_no_implicit, out_no_implicit, err_no_implicit = _run(
+    rc_no_implicit, out_no_implicit, err_no_implicit, result_no_implicit = _run(
         [
             "python3",
             "scripts/validate_no_implicit_switch.py",
@@ -373,7 +375,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    no_implicit_payload = _parse_json_payload(out_no_implicit) or {}
+    no_implicit_payload = _validator_payload(result_no_implicit, out_no_implicit)
     validators["no_implicit_switch"] = {
         "rc": rc_no_implicit,
         "ok": rc_no_implicit == 0,
@@ -384,7 +386,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_no_implicit != 0 or no_implicit_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_cross_actor, out_cross_actor, err_cross_actor = _run(
+    rc_cross_actor, out_cross_actor, err_cross_actor, result_cross_actor = _run(
         [
             "python3",
             "scripts/validate_cross_actor_isolation.py",
@@ -397,7 +399,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    cross_actor_payload = _parse_json_payload(out_cross_actor) or {}
+    cross_actor_payload = _validator_payload(result_cross_actor, out_cross_actor)
     validators["cross_actor_isolation"] = {
         "rc": rc_cross_actor,
         "ok": rc_cross_actor == 0,
@@ -408,7 +410,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_cross_actor != 0 or cross_actor_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_refresh, out_refresh, err_refresh = _run(
+    rc_refresh, out_refresh, err_refresh, result_refresh = _run(
         [
             "python3",
             "scripts/validate_identity_session_refresh_status.py",
@@ -427,7 +429,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    refresh_payload = _parse_json_payload(out_refresh) or {}
+    refresh_payload = _validator_payload(result_refresh, out_refresh)
     validators["session_refresh_status"] = {
         "rc": rc_refresh,
         "ok": rc_refresh == 0,
@@ -470,8 +472,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     ]
     if layer_intent_text:
         render_cmd.extend(["--layer-intent-text", layer_intent_text])
-    rc_stamp_render, out_stamp_render, err_stamp_render = _run(render_cmd)
-    stamp_render_payload = _parse_json_payload(out_stamp_render) or {}
+    rc_stamp_render, out_stamp_render, err_stamp_render, result_stamp_render = _run(render_cmd)
+    stamp_render_payload = _validator_payload(result_stamp_render, out_stamp_render)
     validators["response_stamp_render"] = {
         "rc": rc_stamp_render,
         "ok": rc_stamp_render == 0,
@@ -479,7 +481,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_stamp_render,
     }
 
-    rc_stamp, out_stamp, err_stamp = _run(
+    rc_stamp, out_stamp, err_stamp, result_stamp = _run(
         [
             "python3",
             "scripts/validate_identity_response_stamp.py",
@@ -500,7 +502,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    stamp_payload = _parse_json_payload(out_stamp) or {}
+    stamp_payload = _validator_payload(result_stamp, out_stamp)
     validators["response_stamp_validation"] = {
         "rc": rc_stamp,
         "ok": rc_stamp == 0,
@@ -508,7 +510,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_stamp,
     }
 
-    rc_receipt, out_receipt, err_receipt = _run(
+    rc_receipt, out_receipt, err_receipt, result_receipt = _run(
         [
             "python3",
             "scripts/validate_identity_response_stamp_blocker_receipt.py",
@@ -524,7 +526,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    receipt_payload = _parse_json_payload(out_receipt) or {}
+    receipt_payload = _validator_payload(result_receipt, out_receipt)
     validators["response_stamp_blocker_receipt"] = {
         "rc": rc_receipt,
         "ok": rc_receipt == 0,
@@ -559,8 +561,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         reply_first_line_cmd.extend(["--expected-work-layer", expected_work_layer])
     if expected_source_layer:
         reply_first_line_cmd.extend(["--expected-source-layer", expected_source_layer])
-    rc_reply_first_line, out_reply_first_line, err_reply_first_line = _run(reply_first_line_cmd)
-    reply_first_line_payload = _parse_json_payload(out_reply_first_line) or {}
+    rc_reply_first_line, out_reply_first_line, err_reply_first_line, result_reply_first_line = _run(reply_first_line_cmd)
+    reply_first_line_payload = _validator_payload(result_reply_first_line, out_reply_first_line)
     validators["reply_identity_context_first_line"] = {
         "rc": rc_reply_first_line,
         "ok": rc_reply_first_line == 0,
@@ -594,8 +596,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         layer_intent_cmd.extend(["--expected-work-layer", expected_work_layer])
     if expected_source_layer:
         layer_intent_cmd.extend(["--expected-source-layer", expected_source_layer])
-    rc_layer_intent, out_layer_intent, err_layer_intent = _run(layer_intent_cmd)
-    layer_intent_payload = _parse_json_payload(out_layer_intent) or {}
+    rc_layer_intent, out_layer_intent, err_layer_intent, result_layer_intent = _run(layer_intent_cmd)
+    layer_intent_payload = _validator_payload(result_layer_intent, out_layer_intent)
     validators["layer_intent_resolution"] = {
         "rc": rc_layer_intent,
         "ok": rc_layer_intent == 0,
@@ -633,8 +635,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         compose_send_time_cmd.extend(["--work-layer", expected_work_layer])
     if expected_source_layer:
         compose_send_time_cmd.extend(["--source-layer", expected_source_layer])
-    rc_compose_send_time, out_compose_send_time, err_compose_send_time = _run(compose_send_time_cmd)
-    compose_send_time_payload = _parse_json_payload(out_compose_send_time) or {}
+    rc_compose_send_time, out_compose_send_time, err_compose_send_time, result_compose_send_time = _run(compose_send_time_cmd)
+    compose_send_time_payload = _validator_payload(result_compose_send_time, out_compose_send_time)
     validators["compose_governed_reply_preflight"] = {
         "rc": rc_compose_send_time,
         "ok": rc_compose_send_time == 0,
@@ -677,8 +679,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         send_time_cmd.extend(["--expected-work-layer", expected_work_layer])
     if expected_source_layer:
         send_time_cmd.extend(["--expected-source-layer", expected_source_layer])
-    rc_send_time_gate, out_send_time_gate, err_send_time_gate = _run(send_time_cmd)
-    send_time_gate_payload = _parse_json_payload(out_send_time_gate) or {}
+    rc_send_time_gate, out_send_time_gate, err_send_time_gate, result_send_time_gate = _run(send_time_cmd)
+    send_time_gate_payload = _validator_payload(result_send_time_gate, out_send_time_gate)
     validators["send_time_reply_gate"] = {
         "rc": rc_send_time_gate,
         "ok": rc_send_time_gate == 0,
@@ -704,8 +706,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         actor_id,
         "--json-only",
     ]
-    rc_headstamp, out_headstamp, err_headstamp = _run(headstamp_recurrence_cmd)
-    headstamp_payload = _parse_json_payload(out_headstamp) or {}
+    rc_headstamp, out_headstamp, err_headstamp, result_headstamp = _run(headstamp_recurrence_cmd)
+    headstamp_payload = _validator_payload(result_headstamp, out_headstamp)
     validators["headstamp_recurrence_closure"] = {
         "rc": rc_headstamp,
         "ok": rc_headstamp == 0,
@@ -741,8 +743,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         reply_coherence_cmd.extend(["--expected-work-layer", expected_work_layer])
     if expected_source_layer:
         reply_coherence_cmd.extend(["--expected-source-layer", expected_source_layer])
-    rc_reply_coherence, out_reply_coherence, err_reply_coherence = _run(reply_coherence_cmd)
-    reply_coherence_payload = _parse_json_payload(out_reply_coherence) or {}
+    rc_reply_coherence, out_reply_coherence, err_reply_coherence, result_reply_coherence = _run(reply_coherence_cmd)
+    reply_coherence_payload = _validator_payload(result_reply_coherence, out_reply_coherence)
     validators["execution_reply_identity_coherence"] = {
         "rc": rc_reply_coherence,
         "ok": rc_reply_coherence == 0,
@@ -753,7 +755,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_reply_coherence != 0 or reply_coherence_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_prompt, out_prompt, err_prompt = _run(
+    rc_prompt, out_prompt, err_prompt, result_prompt = _run(
         [
             "python3",
             "scripts/validate_identity_prompt_activation.py",
@@ -767,7 +769,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     )
     validators["prompt_activation"] = {"rc": rc_prompt, "ok": rc_prompt == 0, "out": out_prompt, "err": err_prompt}
 
-    rc_prompt_lc, out_prompt_lc, err_prompt_lc = _run(
+    rc_prompt_lc, out_prompt_lc, err_prompt_lc, result_prompt_lc = _run(
         [
             "python3",
             "scripts/validate_identity_prompt_lifecycle.py",
@@ -794,7 +796,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     ]
     if all_ok and wb == "WRITTEN" and ps == "WRITEBACK_WRITTEN":
         cap_cmd.append("--require-activated")
-    rc_cap, out_cap, err_cap = _run(cap_cmd)
+    rc_cap, out_cap, err_cap, result_cap = _run(cap_cmd)
     validators["capability_activation"] = {
         "rc": rc_cap,
         "ok": rc_cap == 0,
@@ -802,7 +804,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_cap,
     }
 
-    rc_dc, out_dc, err_dc = _run(
+    rc_dc, out_dc, err_dc, result_dc = _run(
         [
             "python3",
             "scripts/validate_identity_dialogue_content.py",
@@ -814,7 +816,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     )
     validators["dialogue_content"] = {"rc": rc_dc, "ok": rc_dc == 0, "out": out_dc, "err": err_dc}
 
-    rc_dcv, out_dcv, err_dcv = _run(
+    rc_dcv, out_dcv, err_dcv, result_dcv = _run(
         [
             "python3",
             "scripts/validate_identity_dialogue_cross_validation.py",
@@ -831,7 +833,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_dcv,
     }
 
-    rc_drs, out_drs, err_drs = _run(
+    rc_drs, out_drs, err_drs, result_drs = _run(
         [
             "python3",
             "scripts/validate_identity_dialogue_result_support.py",
@@ -843,7 +845,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     )
     validators["dialogue_result_support"] = {"rc": rc_drs, "ok": rc_drs == 0, "out": out_drs, "err": err_drs}
 
-    rc_cov, out_cov, err_cov = _run(
+    rc_cov, out_cov, err_cov, result_cov = _run(
         [
             "python3",
             "scripts/validate_required_contract_coverage.py",
@@ -858,7 +860,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    coverage_payload = _parse_json_payload(out_cov) or {}
+    coverage_payload = _validator_payload(result_cov, out_cov)
     validators["required_contract_coverage"] = {
         "rc": rc_cov,
         "ok": rc_cov == 0,
@@ -866,7 +868,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_cov,
     }
 
-    rc_herm, out_herm, err_herm = _run(
+    rc_herm, out_herm, err_herm, result_herm = _run(
         [
             "python3",
             "scripts/validate_e2e_hermetic_runtime_import.py",
@@ -877,7 +879,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    herm_payload = _parse_json_payload(out_herm) or {}
+    herm_payload = _validator_payload(result_herm, out_herm)
     validators["e2e_hermetic_runtime_import"] = {
         "rc": rc_herm,
         "ok": rc_herm == 0,
@@ -888,7 +890,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_herm != 0 or herm_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_semantic, out_semantic, err_semantic = _run(
+    rc_semantic, out_semantic, err_semantic, result_semantic = _run(
         [
             "python3",
             "scripts/validate_semantic_routing_guard.py",
@@ -901,7 +903,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    semantic_payload = _parse_json_payload(out_semantic) or {}
+    semantic_payload = _validator_payload(result_semantic, out_semantic)
     validators["semantic_routing_guard"] = {
         "rc": rc_semantic,
         "ok": rc_semantic == 0,
@@ -912,7 +914,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_semantic != 0 or semantic_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_split, out_split, err_split = _run(
+    rc_split, out_split, err_split, result_split = _run(
         [
             "python3",
             "scripts/validate_instance_protocol_split_receipt.py",
@@ -927,7 +929,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    split_payload = _parse_json_payload(out_split) or {}
+    split_payload = _validator_payload(result_split, out_split)
     validators["instance_protocol_split_receipt"] = {
         "rc": rc_split,
         "ok": rc_split == 0,
@@ -960,8 +962,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         lane_cmd.extend(["--expected-work-layer", expected_work_layer])
     if expected_source_layer:
         lane_cmd.extend(["--source-layer", expected_source_layer])
-    rc_lane, out_lane, err_lane = _run(lane_cmd)
-    lane_payload = _parse_json_payload(out_lane) or {}
+    rc_lane, out_lane, err_lane, result_lane = _run(lane_cmd)
+    lane_payload = _validator_payload(result_lane, out_lane)
     validators["work_layer_gate_set_routing"] = {
         "rc": rc_lane,
         "ok": rc_lane == 0,
@@ -986,8 +988,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "--force-check",
         "--json-only",
     ]
-    rc_reply_channel, out_reply_channel, err_reply_channel = _run(reply_channel_cmd)
-    reply_channel_payload = _parse_json_payload(out_reply_channel) or {}
+    rc_reply_channel, out_reply_channel, err_reply_channel, result_reply_channel = _run(reply_channel_cmd)
+    reply_channel_payload = _validator_payload(result_reply_channel, out_reply_channel)
     validators["protocol_feedback_reply_channel"] = {
         "rc": rc_reply_channel,
         "ok": rc_reply_channel == 0,
@@ -1018,8 +1020,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         bootstrap_cmd.extend(["--expected-work-layer", expected_work_layer])
     if expected_source_layer:
         bootstrap_cmd.extend(["--source-layer", expected_source_layer])
-    rc_bootstrap, out_bootstrap, err_bootstrap = _run(bootstrap_cmd)
-    bootstrap_payload = _parse_json_payload(out_bootstrap) or {}
+    rc_bootstrap, out_bootstrap, err_bootstrap, result_bootstrap = _run(bootstrap_cmd)
+    bootstrap_payload = _validator_payload(result_bootstrap, out_bootstrap)
     validators["protocol_feedback_bootstrap_ready"] = {
         "rc": rc_bootstrap,
         "ok": rc_bootstrap == 0,
@@ -1050,8 +1052,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         candidate_cmd.extend(["--expected-work-layer", expected_work_layer])
     if expected_source_layer:
         candidate_cmd.extend(["--source-layer", expected_source_layer])
-    rc_candidate, out_candidate, err_candidate = _run(candidate_cmd)
-    candidate_payload = _parse_json_payload(out_candidate) or {}
+    rc_candidate, out_candidate, err_candidate, result_candidate = _run(candidate_cmd)
+    candidate_payload = _validator_payload(result_candidate, out_candidate)
     validators["protocol_entry_candidate_bridge"] = {
         "rc": rc_candidate,
         "ok": rc_candidate == 0,
@@ -1082,8 +1084,8 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         inquiry_cmd.extend(["--expected-work-layer", expected_work_layer])
     if expected_source_layer:
         inquiry_cmd.extend(["--source-layer", expected_source_layer])
-    rc_inquiry, out_inquiry, err_inquiry = _run(inquiry_cmd)
-    inquiry_payload = _parse_json_payload(out_inquiry) or {}
+    rc_inquiry, out_inquiry, err_inquiry, result_inquiry = _run(inquiry_cmd)
+    inquiry_payload = _validator_payload(result_inquiry, out_inquiry)
     validators["protocol_inquiry_followup_chain"] = {
         "rc": rc_inquiry,
         "ok": rc_inquiry == 0,
@@ -1094,7 +1096,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_inquiry != 0 or inquiry_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_semantic_iso, out_semantic_iso, err_semantic_iso = _run(
+    rc_semantic_iso, out_semantic_iso, err_semantic_iso, result_semantic_iso = _run(
         [
             "python3",
             "scripts/validate_protocol_vendor_semantic_isolation.py",
@@ -1107,7 +1109,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    semantic_iso_payload = _parse_json_payload(out_semantic_iso) or {}
+    semantic_iso_payload = _validator_payload(result_semantic_iso, out_semantic_iso)
     validators["protocol_vendor_semantic_isolation"] = {
         "rc": rc_semantic_iso,
         "ok": rc_semantic_iso == 0,
@@ -1118,7 +1120,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_semantic_iso != 0 or semantic_iso_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_source_trust, out_source_trust, err_source_trust = _run(
+    rc_source_trust, out_source_trust, err_source_trust, result_source_trust = _run(
         [
             "python3",
             "scripts/validate_external_source_trust_chain.py",
@@ -1131,7 +1133,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    source_trust_payload = _parse_json_payload(out_source_trust) or {}
+    source_trust_payload = _validator_payload(result_source_trust, out_source_trust)
     validators["external_source_trust_chain"] = {
         "rc": rc_source_trust,
         "ok": rc_source_trust == 0,
@@ -1142,7 +1144,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_source_trust != 0 or source_trust_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_sanitization, out_sanitization, err_sanitization = _run(
+    rc_sanitization, out_sanitization, err_sanitization, result_sanitization = _run(
         [
             "python3",
             "scripts/validate_protocol_data_sanitization_boundary.py",
@@ -1155,7 +1157,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    sanitization_payload = _parse_json_payload(out_sanitization) or {}
+    sanitization_payload = _validator_payload(result_sanitization, out_sanitization)
     validators["protocol_data_sanitization_boundary"] = {
         "rc": rc_sanitization,
         "ok": rc_sanitization == 0,
@@ -1168,7 +1170,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_sanitization != 0 or sanitization_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_opt_trigger, out_opt_trigger, err_opt_trigger = _run(
+    rc_opt_trigger, out_opt_trigger, err_opt_trigger, result_opt_trigger = _run(
         [
             "python3",
             "scripts/trigger_platform_optimization_discovery.py",
@@ -1181,7 +1183,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    opt_trigger_payload = _parse_json_payload(out_opt_trigger) or {}
+    opt_trigger_payload = _validator_payload(result_opt_trigger, out_opt_trigger)
     validators["platform_optimization_discovery_trigger"] = {
         "rc": rc_opt_trigger,
         "ok": rc_opt_trigger == 0,
@@ -1189,7 +1191,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_opt_trigger,
     }
 
-    rc_dreq, out_dreq, err_dreq = _run(
+    rc_dreq, out_dreq, err_dreq, result_dreq = _run(
         [
             "python3",
             "scripts/validate_discovery_requiredization.py",
@@ -1204,7 +1206,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    dreq_payload = _parse_json_payload(out_dreq) or {}
+    dreq_payload = _validator_payload(result_dreq, out_dreq)
     validators["discovery_requiredization"] = {
         "rc": rc_dreq,
         "ok": rc_dreq == 0,
@@ -1215,7 +1217,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_dreq != 0 or dreq_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_vibe_pack, out_vibe_pack, err_vibe_pack = _run(
+    rc_vibe_pack, out_vibe_pack, err_vibe_pack, result_vibe_pack = _run(
         [
             "python3",
             "scripts/build_vibe_coding_feeding_pack.py",
@@ -1230,7 +1232,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    vibe_pack_payload = _parse_json_payload(out_vibe_pack) or {}
+    vibe_pack_payload = _validator_payload(result_vibe_pack, out_vibe_pack)
     validators["vibe_coding_feeding_pack"] = {
         "rc": rc_vibe_pack,
         "ok": rc_vibe_pack == 0,
@@ -1238,7 +1240,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_vibe_pack,
     }
 
-    rc_cap_fit, out_cap_fit, err_cap_fit = _run(
+    rc_cap_fit, out_cap_fit, err_cap_fit, result_cap_fit = _run(
         [
             "python3",
             "scripts/validate_identity_capability_fit_optimization.py",
@@ -1251,7 +1253,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    cap_fit_payload = _parse_json_payload(out_cap_fit) or {}
+    cap_fit_payload = _validator_payload(result_cap_fit, out_cap_fit)
     validators["capability_fit_optimization"] = {
         "rc": rc_cap_fit,
         "ok": rc_cap_fit == 0,
@@ -1262,7 +1264,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_cap_fit != 0 or cap_fit_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_compose, out_compose, err_compose = _run(
+    rc_compose, out_compose, err_compose, result_compose = _run(
         [
             "python3",
             "scripts/validate_capability_composition_before_discovery.py",
@@ -1275,7 +1277,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    compose_payload = _parse_json_payload(out_compose) or {}
+    compose_payload = _validator_payload(result_compose, out_compose)
     validators["capability_composition_before_discovery"] = {
         "rc": rc_compose,
         "ok": rc_compose == 0,
@@ -1286,7 +1288,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_compose != 0 or compose_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_fit_fresh, out_fit_fresh, err_fit_fresh = _run(
+    rc_fit_fresh, out_fit_fresh, err_fit_fresh, result_fit_fresh = _run(
         [
             "python3",
             "scripts/validate_capability_fit_review_freshness.py",
@@ -1299,7 +1301,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    fit_fresh_payload = _parse_json_payload(out_fit_fresh) or {}
+    fit_fresh_payload = _validator_payload(result_fit_fresh, out_fit_fresh)
     validators["capability_fit_review_freshness"] = {
         "rc": rc_fit_fresh,
         "ok": rc_fit_fresh == 0,
@@ -1310,7 +1312,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_fit_fresh != 0 or fit_fresh_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_fit_roundtable, out_fit_roundtable, err_fit_roundtable = _run(
+    rc_fit_roundtable, out_fit_roundtable, err_fit_roundtable, result_fit_roundtable = _run(
         [
             "python3",
             "scripts/validate_capability_fit_roundtable_evidence.py",
@@ -1323,7 +1325,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    fit_roundtable_payload = _parse_json_payload(out_fit_roundtable) or {}
+    fit_roundtable_payload = _validator_payload(result_fit_roundtable, out_fit_roundtable)
     validators["capability_fit_roundtable_evidence"] = {
         "rc": rc_fit_roundtable,
         "ok": rc_fit_roundtable == 0,
@@ -1334,7 +1336,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_fit_roundtable != 0 or fit_roundtable_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_fit_trigger, out_fit_trigger, err_fit_trigger = _run(
+    rc_fit_trigger, out_fit_trigger, err_fit_trigger, result_fit_trigger = _run(
         [
             "python3",
             "scripts/trigger_capability_fit_review.py",
@@ -1347,7 +1349,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    fit_trigger_payload = _parse_json_payload(out_fit_trigger) or {}
+    fit_trigger_payload = _validator_payload(result_fit_trigger, out_fit_trigger)
     validators["capability_fit_review_trigger"] = {
         "rc": rc_fit_trigger,
         "ok": rc_fit_trigger == 0,
@@ -1355,7 +1357,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_fit_trigger,
     }
 
-    rc_fit_builder, out_fit_builder, err_fit_builder = _run(
+    rc_fit_builder, out_fit_builder, err_fit_builder, result_fit_builder = _run(
         [
             "python3",
             "scripts/build_capability_fit_matrix.py",
@@ -1370,7 +1372,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    fit_builder_payload = _parse_json_payload(out_fit_builder) or {}
+    fit_builder_payload = _validator_payload(result_fit_builder, out_fit_builder)
     validators["capability_fit_matrix_builder"] = {
         "rc": rc_fit_builder,
         "ok": rc_fit_builder == 0,
@@ -1378,7 +1380,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_fit_builder,
     }
 
-    rc_namespace, out_namespace, err_namespace = _run(
+    rc_namespace, out_namespace, err_namespace, result_namespace = _run(
         [
             "python3",
             "scripts/validate_vendor_namespace_separation.py",
@@ -1391,7 +1393,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    namespace_payload = _parse_json_payload(out_namespace) or {}
+    namespace_payload = _validator_payload(result_namespace, out_namespace)
     validators["vendor_namespace_separation"] = {
         "rc": rc_namespace,
         "ok": rc_namespace == 0,
@@ -1402,7 +1404,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_namespace != 0 or namespace_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_writeback, out_writeback, err_writeback = _run(
+    rc_writeback, out_writeback, err_writeback, result_writeback = _run(
         [
             "python3",
             "scripts/validate_writeback_continuity.py",
@@ -1419,7 +1421,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    writeback_payload = _parse_json_payload(out_writeback) or {}
+    writeback_payload = _validator_payload(result_writeback, out_writeback)
     validators["writeback_continuity"] = {
         "rc": rc_writeback,
         "ok": rc_writeback == 0,
@@ -1430,7 +1432,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_writeback != 0 or writeback_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_post_exec, out_post_exec, err_post_exec = _run(
+    rc_post_exec, out_post_exec, err_post_exec, result_post_exec = _run(
         [
             "python3",
             "scripts/validate_post_execution_mandatory.py",
@@ -1447,7 +1449,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    post_exec_payload = _parse_json_payload(out_post_exec) or {}
+    post_exec_payload = _validator_payload(result_post_exec, out_post_exec)
     validators["post_execution_mandatory"] = {
         "rc": rc_post_exec,
         "ok": rc_post_exec == 0,
@@ -1458,7 +1460,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_post_exec != 0 or post_exec_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_sidecar, out_sidecar, err_sidecar = _run(
+    rc_sidecar, out_sidecar, err_sidecar, result_sidecar = _run(
         [
             "python3",
             "scripts/validate_protocol_feedback_sidecar_contract.py",
@@ -1475,7 +1477,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    sidecar_payload = _parse_json_payload(out_sidecar) or {}
+    sidecar_payload = _validator_payload(result_sidecar, out_sidecar)
     validators["protocol_feedback_sidecar"] = {
         "rc": rc_sidecar,
         "ok": rc_sidecar == 0,
@@ -1486,7 +1488,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_sidecar != 0 or sidecar_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_base_boundary, out_base_boundary, err_base_boundary = _run(
+    rc_base_boundary, out_base_boundary, err_base_boundary, result_base_boundary = _run(
         [
             "python3",
             "scripts/validate_instance_base_repo_write_boundary.py",
@@ -1503,7 +1505,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    base_boundary_payload = _parse_json_payload(out_base_boundary) or {}
+    base_boundary_payload = _validator_payload(result_base_boundary, out_base_boundary)
     validators["instance_base_repo_write_boundary"] = {
         "rc": rc_base_boundary,
         "ok": rc_base_boundary == 0,
@@ -1514,7 +1516,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_base_boundary != 0 or base_boundary_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_archival, out_archival, err_archival = _run(
+    rc_archival, out_archival, err_archival, result_archival = _run(
         [
             "python3",
             "scripts/validate_protocol_feedback_ssot_archival.py",
@@ -1529,7 +1531,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    archival_payload = _parse_json_payload(out_archival) or {}
+    archival_payload = _validator_payload(result_archival, out_archival)
     validators["protocol_feedback_ssot_archival"] = {
         "rc": rc_archival,
         "ok": rc_archival == 0,
@@ -1540,7 +1542,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
     if rc_archival != 0 or archival_status == "FAIL_REQUIRED":
         hard_boundary = True
 
-    rc_fresh, out_fresh, err_fresh = _run(
+    rc_fresh, out_fresh, err_fresh, result_fresh = _run(
         [
             "python3",
             "scripts/validate_execution_report_freshness.py",
@@ -1557,7 +1559,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    freshness_payload = _parse_json_payload(out_fresh) or {}
+    freshness_payload = _validator_payload(result_fresh, out_fresh)
     validators["execution_report_freshness"] = {
         "rc": rc_fresh,
         "ok": rc_fresh == 0,
@@ -1565,7 +1567,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_fresh,
     }
 
-    rc_baseline, out_baseline, err_baseline = _run(
+    rc_baseline, out_baseline, err_baseline, result_baseline = _run(
         [
             "python3",
             "scripts/validate_identity_protocol_baseline_freshness.py",
@@ -1582,7 +1584,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    baseline_payload = _parse_json_payload(out_baseline) or {}
+    baseline_payload = _validator_payload(result_baseline, out_baseline)
     validators["protocol_baseline_freshness"] = {
         "rc": rc_baseline,
         "ok": rc_baseline == 0,
@@ -1590,7 +1592,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
         "err": err_baseline,
     }
 
-    rc_align, out_align, err_align = _run(
+    rc_align, out_align, err_align, result_align = _run(
         [
             "python3",
             "scripts/validate_identity_protocol_version_alignment.py",
@@ -1609,7 +1611,7 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
             "--json-only",
         ]
     )
-    align_payload = _parse_json_payload(out_align) or {}
+    align_payload = _validator_payload(result_align, out_align)
     validators["protocol_version_alignment"] = {
         "rc": rc_align,
         "ok": rc_align == 0,
@@ -2200,20 +2202,14 @@ def _instance_plane_status(args: argparse.Namespace, report_path: Path | None) -
 
 
 def _git_current_branch() -> str:
-    rc, out, _ = _run(["git", "rev-parse", "--abbrev-ref", "HEAD"])
-    if rc == 0:
-        return out.strip()
-    return ""
+    return current_branch(PROTOCOL_ROOT)
 
 
 def _git_head_sha() -> str:
-    rc, out, _ = _run(["git", "rev-parse", "HEAD"])
-    if rc == 0:
-        return out.strip()
-    return ""
+    return head_sha(PROTOCOL_ROOT)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Emit unified three-plane status for identity governance.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default=os.environ.get("IDENTITY_CATALOG", ""))
@@ -2241,7 +2237,7 @@ def main() -> int:
         ),
     )
     ap.add_argument("--out", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     if not args.catalog:
         print("[FAIL] --catalog is required (or export IDENTITY_CATALOG first).")
@@ -2322,7 +2318,7 @@ def main() -> int:
         out.parent.mkdir(parents=True, exist_ok=True)
         out.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
         print(f"[OK] wrote: {out}")
-    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    print_result(payload, ensure_ascii=False, indent=2)
     print(f"overall_release_decision={overall}")
     return 0
 
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import subprocess
 from pathlib import Path
@@ -10,6 +9,11 @@ from typing import Any, Literal
 
 import yaml
 
+from catalog_lock_common import catalog_write_lock, write_catalog_yaml
+from git_facts_common import head_sha, toplevel
+from identity_catalog_common import load_yaml_document
+from result_channel_common import print_result
+
 ScopeName = Literal["EXPLICIT", "REPO", "USER", "ADMIN", "SYSTEM", "FALLBACK", "UNKNOWN"]
 
 
@@ -59,7 +63,7 @@ def _git(path: Path, args: list[str]) -> str:
 
 def _detect_repo_root(start: Path | None = None) -> Path:
     base = (start or Path.cwd()).resolve()
-    out = _git(base, ["rev-parse", "--show-toplevel"])
+    out = toplevel(base)
     if out:
         return Path(out).expanduser().resolve()
     for parent in [base, *base.parents]:
@@ -180,7 +184,7 @@ def resolve_protocol_root(protocol_root: str | None = None) -> Path:
 
 def collect_protocol_evidence(protocol_root: str | None = None, protocol_mode: str = "mode_a_shared") -> dict[str, str]:
     root = resolve_protocol_root(protocol_root)
-    commit = _git(root, ["rev-parse", "HEAD"])
+    commit = head_sha(root)
     ref = _git(root, ["describe", "--tags", "--always", "--dirty"])
     return {
         "protocol_mode": str(protocol_mode or "").strip() or "mode_a_shared",
@@ -195,7 +199,7 @@ def collect_protocol_evidence(protocol_root: str | None = None, protocol_mode: s
 def load_yaml_or_empty(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {}
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = load_yaml_document(path) or {}
     if not isinstance(data, dict):
         raise ValueError(f"yaml root must be object: {path}")
     return data
@@ -245,14 +249,19 @@ def ensure_local_catalog(repo_catalog_path: Path, local_catalog_path: Path) -> d
     local = load_yaml_or_empty(local_catalog_path)
     if local.get("identities"):
         return local
-    repo = load_yaml_or_empty(repo_catalog_path)
-    seed = {
-        "version": str(repo.get("version") or "1.0"),
-        "updated_at": str(repo.get("updated_at") or ""),
-        "default_identity": "",
-        "identities": [dict(x) for x in (repo.get("identities") or []) if isinstance(x, dict)],
-    }
-    dump_yaml(local_catalog_path, seed)
+    with catalog_write_lock(local_catalog_path):
+        # another writer may have seeded the catalog while we waited for the lock
+        local = load_yaml_or_empty(local_catalog_path)
+        if local.get("identities"):
+            return local
+        repo = load_yaml_or_empty(repo_catalog_path)
+        seed = {
+            "version": str(repo.get("version") or "1.0"),
+            "updated_at": str(repo.get("updated_at") or ""),
+            "default_identity": "",
+            "identities": [dict(x) for x in (repo.get("identities") or []) if isinstance(x, dict)],
+        }
+        write_catalog_yaml(local_catalog_path, seed)
     return seed
 
 
@@ -367,7 +376,7 @@ def _cmd_resolve(args: argparse.Namespace) -> int:
         preferred_scope=args.scope,
         allow_conflict=args.allow_conflict,
     )
-    print(json.dumps(ctx, ensure_ascii=False, indent=2))
+    print_result(ctx, ensure_ascii=False, indent=2)
     return 0
 
 
@@ -377,11 +386,11 @@ def _cmd_merge(args: argparse.Namespace) -> int:
     if args.ensure_local_catalog:
         ensure_local_catalog(repo_catalog, local_catalog)
     out = merged_catalog(repo_catalog, local_catalog)
-    print(json.dumps(out, ensure_ascii=False, indent=2))
+    print_result(out, ensure_ascii=False, indent=2)
     return 0
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     identity_home = default_identity_home()
     default_local_catalog = default_local_catalog_path(identity_home)
     ap = argparse.ArgumentParser(description="Resolve identity context across repo catalog and local catalog.")
@@ -402,7 +411,7 @@ def main() -> int:
     c2.add_argument("--ensure-local-catalog", action="store_true")
     c2.set_defaults(func=_cmd_merge)
 
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
     return args.func(args)
 
 
@@ -5,13 +5,21 @@ import hashlib
 import json
 import os
 import re
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from actor_session_common import load_actor_binding, resolve_actor_id
+from actor_session_common import actor_session_path, load_actor_binding, resolve_actor_id
 from resolve_identity_context import resolve_identity
+from stamp_context_cache_common import (
+    input_fingerprint,
+    lookup_stamp_context,
+    stamp_context_cache_key,
+    store_stamp_context,
+)
 from tool_vendor_governance_common import load_json
 
 
@@ -93,19 +101,86 @@ LAYER_LITERAL_META_TOKENS = (
     "identity-context:",
     "layer-context:",
 )
+LAYER_INSTANCE_KEYWORDS = {
+    "instance",
+    "runtime",
+    "delivery",
+    "deliver",
+    "execution",
+    "execute",
+    "run",
+    "apply",
+    "operate",
+    "operation",
+    "business",
+    "实例",
+    "执行",
+    "交付",
+    "业务",
+}
+LAYER_PROTOCOL_KEYWORDS = {
+    "protocol",
+    "governance",
+    "contract",
+    "validator",
+    "gate",
+    "audit",
+    "spec",
+    "ssot",
+    "协议",
+    "治理",
+    "审计",
+    "规范",
+}
+LAYER_DUAL_KEYWORDS = {"dual", "both", "hybrid", "双层", "两层", "双轨"}
+LAYER_INTENT_MEMO_SIZE = 4096
+
+PROTOCOL_LANE_DIRECTIVE_PATTERN = re.compile(
+    r"\bprotocol\s+(?:lane|layer|track)\b"
+    r"|\bprotocol[_\-\s]?lane\b"
+    r"|协议层|协议轨|协议通道|协议lane"
+    r"|(?:按|走|切到|进入)\s*protocol"
+)
+INTERROGATIVE_PATTERN = re.compile(r"\b(why|how|what)\b|为什么|为何")
+WORK_LAYER_TUPLE_PATTERN = re.compile(r"(work[_\-\s]?layer)\s*[:=]\s*(protocol|instance|dual)\b")
+SOURCE_LAYER_TUPLE_PATTERN = re.compile(r"(source[_\-\s]?layer)\s*[:=]\s*(project|global|env|auto)\b")
+PROTOCOL_ACTIONS_COUNTER_PATTERN = re.compile(r"protocol[_\-\s]?actions?\s*[:=]\s*(-?\d+)\b")
+INSTANCE_ACTIONS_COUNTER_PATTERN = re.compile(r"instance[_\-\s]?actions?\s*[:=]\s*(-?\d+)\b")
+
+
+class KeywordMatcher:
+    """
+    Which of a fixed keyword set occur in a text, found in one regex pass instead of one
+    substring scan per keyword. The lookahead alternation (longest keyword first) reports the
+    longest keyword starting at each position; the keywords starting there are exactly that
+    match's keyword prefixes, so overlapping hits ("fail" / "failure") are all counted.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        ordered = sorted(set(keywords), key=lambda k: (-len(k), k))
+        self._pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in ordered) + "))")
+        self._prefixes = {k: frozenset(x for x in ordered if k.startswith(x)) for k in ordered}
+
+    def hits(self, text: str) -> frozenset[str]:
+        longest = set(self._pattern.findall(text))
+        return frozenset().union(*(self._prefixes[k] for k in longest)) if longest else frozenset()
+
+
+# one pass over the (lowercased) intent text serves every keyword family
+_LAYER_KEYWORD_MATCHER = KeywordMatcher(
+    PROTOCOL_TRIGGER_KEYWORDS
+    | PROTOCOL_TRIGGER_ACTIONS
+    | LAYER_INSTANCE_KEYWORDS
+    | LAYER_PROTOCOL_KEYWORDS
+    | LAYER_DUAL_KEYWORDS
+)
 
 
 def _has_protocol_lane_directive(text: str) -> bool:
     raw = str(text or "").strip().lower()
     if not raw:
         return False
-    directive_patterns = (
-        re.compile(r"\bprotocol\s+(lane|layer|track)\b"),
-        re.compile(r"\bprotocol[_\-\s]?lane\b"),
-        re.compile(r"(协议层|协议轨|协议通道|协议lane)"),
-        re.compile(r"(按|走|切到|进入)\s*protocol"),
-    )
-    return any(p.search(raw) for p in directive_patterns)
+    return PROTOCOL_LANE_DIRECTIVE_PATTERN.search(raw) is not None
 
 
 def _detect_repo_root(start: Path | None = None) -> Path:
@@ -209,7 +284,44 @@ def resolve_stamp_context(
     actor_id: str = "",
     explicit_catalog: bool = True,
 ) -> StampContext:
+    """
+    Resolve the stamp context, served from ``stamp_context_cache_common`` while the catalogs,
+    the actor session file, the session pointer and the pack directory keep their stamps.
+    """
     actor = resolve_actor_id(actor_id)
+    catalog = catalog_path.resolve()
+    repo_catalog = repo_catalog_path.resolve()
+    # relative catalog pack_path values resolve against cwd, so it is part of the key
+    key = stamp_context_cache_key(
+        [identity_id, actor, str(catalog), str(repo_catalog), str(bool(explicit_catalog)), str(Path.cwd())]
+    )
+    cached = lookup_stamp_context(key)
+    if cached is not None:
+        return StampContext(**{**cached, "catalog_path": Path(cached["catalog_path"]), "pack_path": Path(cached["pack_path"])})
+    fingerprint = input_fingerprint(
+        [catalog, repo_catalog, actor_session_path(catalog, actor), _session_pointer_path(catalog)]
+    )
+    ctx = _resolve_stamp_context(
+        identity_id=identity_id,
+        catalog_path=catalog_path,
+        repo_catalog_path=repo_catalog_path,
+        actor=actor,
+        explicit_catalog=explicit_catalog,
+    )
+    row = asdict(ctx)
+    row.update(catalog_path=str(ctx.catalog_path), pack_path=str(ctx.pack_path))
+    store_stamp_context(key, fingerprint + input_fingerprint([ctx.pack_path]), row)
+    return ctx
+
+
+def _resolve_stamp_context(
+    *,
+    identity_id: str,
+    catalog_path: Path,
+    repo_catalog_path: Path,
+    actor: str,
+    explicit_catalog: bool,
+) -> StampContext:
     resolved = resolve_identity(
         identity_id,
         repo_catalog_path.resolve(),
@@ -305,7 +417,7 @@ def _normalize_source_layer(value: str, *, fallback: str = "auto") -> str:
     return fb if fb in ALLOWED_SOURCE_LAYERS else "auto"
 
 
-def _detect_protocol_trigger(intent_text: str) -> dict[str, Any]:
+def _detect_protocol_trigger(intent_text: str, keyword_hits: frozenset[str] | None = None) -> dict[str, Any]:
     text = str(intent_text or "").strip().lower()
     if not text:
         return {
@@ -326,12 +438,13 @@ def _detect_protocol_trigger(intent_text: str) -> dict[str, Any]:
     if _has_protocol_lane_directive(text):
         reasons.append("protocol_lane_directive")
 
-    tokens = set(re.findall(r"[a-zA-Z_]+|[\u4e00-\u9fff]{1,4}", text))
-    keyword_hits = sum(1 for k in PROTOCOL_TRIGGER_KEYWORDS if k in text or k in tokens)
-    action_hits = sum(1 for k in PROTOCOL_TRIGGER_ACTIONS if k in text or k in tokens)
-    if keyword_hits > 0 and action_hits > 0:
+    # a keyword equal to a token is also a substring of the text, so substring hits are the count
+    hits = _LAYER_KEYWORD_MATCHER.hits(text) if keyword_hits is None else keyword_hits
+    trigger_keyword_hits = len(hits & PROTOCOL_TRIGGER_KEYWORDS)
+    action_hits = len(hits & PROTOCOL_TRIGGER_ACTIONS)
+    if trigger_keyword_hits > 0 and action_hits > 0:
         reasons.append("protocol_keyword_action_pair")
-    elif keyword_hits >= 2:
+    elif trigger_keyword_hits >= 2:
         reasons.append("protocol_keyword_cluster")
 
     unique_reasons = sorted(set(reasons))
@@ -367,7 +480,7 @@ def _literal_match_in_interrogative_context(text: str, start: int, end: int) ->
     window = text[s:e]
     if ("?" in window) or ("？" in window):
         return True
-    return bool(re.search(r"\b(why|how|what)\b|为什么|为何", window))
+    return bool(INTERROGATIVE_PATTERN.search(window))
 
 
 def resolve_layer_intent(
@@ -377,11 +490,40 @@ def resolve_layer_intent(
     intent_text: str = "",
     default_work_layer: str = DEFAULT_WORK_LAYER,
     default_source_layer: str = "auto",
+) -> dict[str, Any]:
+    """
+    Resolve work/source layer and protocol trigger for one reply intent. Decisions are a pure
+    function of the arguments and are memoized (LRU) on the normalized arguments; callers get
+    their own copy.
+    """
+    resolved = _resolve_layer_intent_memo(
+        str(explicit_work_layer or "").strip().lower(),
+        str(explicit_source_layer or "").strip().lower(),
+        str(intent_text or "").strip(),
+        str(default_work_layer or "").strip().lower(),
+        str(default_source_layer or "").strip().lower(),
+    )
+    return {**resolved, "protocol_trigger_reasons": list(resolved["protocol_trigger_reasons"])}
+
+
+def resolve_layer_intents(intent_texts: Iterable[str], **kwargs: str) -> list[dict[str, Any]]:
+    """Batch form of ``resolve_layer_intent``: one decision per text, same keyword arguments for all."""
+    return [resolve_layer_intent(intent_text=text, **kwargs) for text in intent_texts]
+
+
+@lru_cache(maxsize=LAYER_INTENT_MEMO_SIZE)
+def _resolve_layer_intent_memo(
+    explicit_work_layer: str,
+    explicit_source_layer: str,
+    intent_text: str,
+    default_work_layer: str,
+    default_source_layer: str,
 ) -> dict[str, Any]:
     resolved_source = _normalize_source_layer(explicit_source_layer, fallback=default_source_layer)
     fallback_work = _normalize_work_layer(default_work_layer, fallback=DEFAULT_WORK_LAYER)
     text = _sanitize_layer_intent_text(intent_text).strip().lower()
-    trigger = _detect_protocol_trigger(text)
+    keyword_hits = _LAYER_KEYWORD_MATCHER.hits(text)
+    trigger = _detect_protocol_trigger(text, keyword_hits)
     base_triggered = bool(trigger.get("protocol_triggered", False))
     base_trigger_reasons = list(trigger.get("protocol_trigger_reasons") or [])
     trigger_confidence = float(trigger.get("protocol_trigger_confidence", 0.0) or 0.0)
@@ -441,13 +583,13 @@ def resolve_layer_intent(
             protocol_trigger_reasons=[],
         )
 
-    m_work = re.search(r"(work[_\-\s]?layer)\s*[:=]\s*(protocol|instance|dual)\b", text)
-    m_source = re.search(r"(source[_\-\s]?layer)\s*[:=]\s*(project|global|env|auto)\b", text)
+    m_work = WORK_LAYER_TUPLE_PATTERN.search(text)
+    m_source = SOURCE_LAYER_TUPLE_PATTERN.search(text)
     if m_source:
         resolved_source = _normalize_source_layer(m_source.group(2), fallback=resolved_source)
     if m_work:
         candidate = _normalize_work_layer(m_work.group(2), fallback=fallback_work)
-        protocol_keyword_detected = any((k in text) for k in PROTOCOL_TRIGGER_KEYWORDS)
+        protocol_keyword_detected = bool(keyword_hits & PROTOCOL_TRIGGER_KEYWORDS)
         if (
             candidate == "instance"
             and protocol_keyword_detected
@@ -481,8 +623,8 @@ def resolve_layer_intent(
         )
 
     # Deterministic dynamic rule: protocol_actions / instance_actions counters.
-    m_protocol_actions = re.search(r"protocol[_\-\s]?actions?\s*[:=]\s*(-?\d+)\b", text)
-    m_instance_actions = re.search(r"instance[_\-\s]?actions?\s*[:=]\s*(-?\d+)\b", text)
+    m_protocol_actions = PROTOCOL_ACTIONS_COUNTER_PATTERN.search(text)
+    m_instance_actions = INSTANCE_ACTIONS_COUNTER_PATTERN.search(text)
     if m_protocol_actions or m_instance_actions:
         protocol_actions = int(m_protocol_actions.group(1)) if m_protocol_actions else 0
         instance_actions = int(m_instance_actions.group(1)) if m_instance_actions else 0
@@ -524,41 +666,7 @@ def resolve_layer_intent(
             protocol_trigger_reasons=[],
         )
 
-    instance_keywords = {
-        "instance",
-        "runtime",
-        "delivery",
-        "deliver",
-        "execution",
-        "execute",
-        "run",
-        "apply",
-        "operate",
-        "operation",
-        "business",
-        "实例",
-        "执行",
-        "交付",
-        "业务",
-    }
-    protocol_keywords = {
-        "protocol",
-        "governance",
-        "contract",
-        "validator",
-        "gate",
-        "audit",
-        "spec",
-        "ssot",
-        "协议",
-        "治理",
-        "审计",
-        "规范",
-    }
-    dual_keywords = {"dual", "both", "hybrid", "双层", "两层", "双轨"}
-    tokens = set(re.findall(r"[a-zA-Z_]+|[\u4e00-\u9fff]{1,4}", text))
-
-    if any(k in text for k in dual_keywords):
+    if keyword_hits & LAYER_DUAL_KEYWORDS:
         return _result(
             work_layer="dual",
             confidence=0.9,
@@ -568,8 +676,8 @@ def resolve_layer_intent(
             protocol_trigger_reasons=base_trigger_reasons,
         )
 
-    score_instance = sum(1 for k in instance_keywords if k in text or k in tokens)
-    score_protocol = sum(1 for k in protocol_keywords if k in text or k in tokens)
+    score_instance = len(keyword_hits & LAYER_INSTANCE_KEYWORDS)
+    score_protocol = len(keyword_hits & LAYER_PROTOCOL_KEYWORDS)
 
     if score_instance == 0 and score_protocol == 0:
         return _result(
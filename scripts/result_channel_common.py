@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+from validator_timing_common import ValidatorTiming, run_measured
+
+RESULT_CHANNEL_SCHEMA = "identity_validator_result_v1"
+RESULT_CHANNEL_ENV = "IDENTITY_RESULT_FD"
+RECORD_RESULT = "result"
+RECORD_PROGRESS = "progress"
+
+Record = dict[str, Any]
+
+# in-process captures (innermost last); they take precedence over the inherited fd
+_SINKS: list[Callable[[Record], None]] = []
+
+
+def _channel_fd() -> int | None:
+    # "<fd>:<orchestrator pid>": only the direct child owns the fd; grandchildren inherit the
+    # variable but not the descriptor, so the pid check keeps them off unrelated fds.
+    raw = str(os.environ.get(RESULT_CHANNEL_ENV, "")).strip()
+    fd_text, _, pid_text = raw.partition(":")
+    try:
+        fd, pid = int(fd_text), int(pid_text)
+    except ValueError:
+        return None
+    return fd if pid == os.getppid() else None
+
+
+def _emit(record: Record) -> None:
+    if _SINKS:
+        _SINKS[-1](record)
+        return
+    fd = _channel_fd()
+    if fd is None:
+        return
+    line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+    try:
+        while line:
+            line = line[os.write(fd, line) :]
+    except OSError:
+        os.environ.pop(RESULT_CHANNEL_ENV, None)
+
+
+def result_channel_open() -> bool:
+    return bool(_SINKS) or _channel_fd() is not None
+
+
+def emit_result(payload: dict[str, Any]) -> None:
+    """Publish the validator's result payload on the result channel (no-op when none is open)."""
+    _emit({"schema": RESULT_CHANNEL_SCHEMA, "type": RECORD_RESULT, "payload": payload})
+
+
+def emit_progress(stage: str, **fields: Any) -> None:
+    """Publish a progress event; orchestrators may surface it while the validator still runs."""
+    if not result_channel_open():
+        return
+    _emit({"schema": RESULT_CHANNEL_SCHEMA, "type": RECORD_PROGRESS, "stage": stage, "ts": time.time(), **fields})
+
+
+def print_result(payload: dict[str, Any], **dumps_kwargs: Any) -> None:
+    """``print(json.dumps(payload, **dumps_kwargs))`` plus ``emit_result(payload)``."""
+    print(json.dumps(payload, **dumps_kwargs))
+    emit_result(payload)
+
+
+class ResultChannel:
+    """
+    Orchestrator end of the validator result channel. Validators write NDJSON records (one
+    ``result``, any number of ``progress``); the last result wins and progress records are
+    passed to ``on_event`` as they arrive. Use ``capture()`` around an in-process call and
+    ``subprocess_env()`` around a child process.
+    """
+
+    def __init__(self, on_event: Callable[[Record], None] | None = None) -> None:
+        self.on_event = on_event
+        self.result: dict[str, Any] | None = None
+        self.events: list[Record] = []
+
+    def record(self, record: Record) -> None:
+        if not isinstance(record, dict) or record.get("schema") != RESULT_CHANNEL_SCHEMA:
+            return
+        kind = record.get("type")
+        if kind == RECORD_RESULT and isinstance(record.get("payload"), dict):
+            self.result = record["payload"]
+        elif kind == RECORD_PROGRESS:
+            self.events.append(record)
+            if self.on_event is not None:
+                self.on_event(record)
+
+    def replay(self, result: dict[str, Any] | None, events: list[Record] | None = None) -> None:
+        """Re-emit records received from elsewhere (cache, validator worker) on the current channel."""
+        for event in events or []:
+            _emit(event)
+        if isinstance(result, dict):
+            emit_result(result)
+
+    @contextlib.contextmanager
+    def capture(self) -> Iterator[None]:
+        _SINKS.append(self.record)
+        try:
+            yield
+        finally:
+            _SINKS.remove(self.record)
+
+    @contextlib.contextmanager
+    def subprocess_env(self, env: dict[str, str] | None) -> Iterator[tuple[dict[str, str], tuple[int, ...]]]:
+        """Yield ``(env, pass_fds)`` for one child process; records are read on a thread until it exits."""
+        read_fd, write_fd = os.pipe()
+        child_env = dict(os.environ if env is None else env)
+        child_env[RESULT_CHANNEL_ENV] = f"{write_fd}:{os.getpid()}"
+        reader = threading.Thread(target=self._read, args=(read_fd,), daemon=True)
+        reader.start()
+        try:
+            yield child_env, (write_fd,)
+        finally:
+            os.close(write_fd)
+            reader.join()
+
+    def _read(self, read_fd: int) -> None:
+        with os.fdopen(read_fd, "rb") as stream:
+            for raw in stream:
+                try:
+                    record = json.loads(raw)
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+                self.record(record)
+
+
+def run_with_result_channel(
+    cmd: list[str],
+    *,
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+    on_event: Callable[[Record], None] | None = None,
+    timing: ValidatorTiming | None = None,
+) -> tuple[subprocess.CompletedProcess[str], dict[str, Any] | None]:
+    """
+    ``subprocess.run(cmd, capture_output=True, text=True)`` plus the child's result-channel payload;
+    ``timing`` receives the child's own peak RSS.
+    """
+    channel = ResultChannel(on_event)
+    with channel.subprocess_env(env) as (child_env, pass_fds):
+        p = run_measured(cmd, timing, capture_output=True, text=True, cwd=cwd, env=child_env, pass_fds=pass_fds)
+    return p, channel.result
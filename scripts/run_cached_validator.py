@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from validator_registry_common import run_validator
+from validator_result_cache_common import default_validator_cache
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(
+        description=(
+            "Run a validator through the content-addressed result cache "
+            "(declared-pure validators only; others always execute)."
+        )
+    )
+    ap.add_argument("--no-cache", action="store_true", help="bypass the validator result cache")
+    ap.add_argument("validator", help="validator script path, e.g. scripts/validate_identity_manifest.py")
+    ap.add_argument("validator_args", nargs=argparse.REMAINDER)
+    args = ap.parse_args(argv)
+
+    result = run_validator(
+        ["python3", args.validator, *args.validator_args],
+        cwd=Path.cwd(),
+        cache=default_validator_cache(enabled=not args.no_cache),
+    )
+    sys.stdout.write(result.stdout)
+    sys.stderr.write(result.stderr)
+    return result.rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
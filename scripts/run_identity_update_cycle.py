@@ -20,12 +20,12 @@ def _run(cmd: list[str]) -> dict[str, Any]:
     }
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Run identity update cycle checks (skill-style: trigger/patch/validate/replay)")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--replay-command", default="", help="optional replay command for the original failing case")
     ap.add_argument("--out-dir", default="identity/runtime/reports")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     checks = []
     checks.append(_run(["python3", "scripts/validate_identity_upgrade_prereq.py", "--identity-id", args.identity_id]))
@@ -2,23 +2,47 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import json
 import re
-import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from git_facts_common import head_sha
+from private_dir_common import private_dir, user_tmp_dir
+from result_channel_common import run_with_result_channel
+from task_scheduler_common import TaskScheduler
+from validator_timing_common import timed_validator
+
 ERR_RE = re.compile(r"\b(IP-[A-Z0-9-]+)\b")
 REPORT_RE = re.compile(r"^report=(.+)$", re.MULTILINE)
 OUTDATED_BASELINE_CODES = {"IP-PBL-001", "IP-PBL-002", "IP-PBL-003", "IP-PBL-004"}
+DEFAULT_WAVE_LOG_ROOT = user_tmp_dir("identity-upgrade-wave-logs")
+
+
+def _run(cmd: list[str]) -> tuple[int, str, str, dict[str, Any] | None]:
+    with timed_validator(cmd) as timing:
+        p, result = run_with_result_channel(cmd, timing=timing)
+        timing.rc = p.returncode
+    return p.returncode, (p.stdout or "").strip(), (p.stderr or "").strip(), result
 
 
-def _run(cmd: list[str]) -> tuple[int, str, str]:
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    return p.returncode, (p.stdout or "").strip(), (p.stderr or "").strip()
+def _run_logged(
+    cmd: list[str], log_path: Path | None, log_errors: list[str]
+) -> tuple[int, str, str, dict[str, Any] | None]:
+    """Run ``cmd`` and log it to ``log_path``; a log failure is appended to ``log_errors``, never raised."""
+    rc, out, err, result = _run(cmd)
+    if log_path is None:
+        return rc, out, err, result
+    try:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text(f"$ {' '.join(cmd)}\nrc={rc}\n--- stdout ---\n{out}\n--- stderr ---\n{err}\n", encoding="utf-8")
+    except OSError as exc:
+        log_errors.append(f"{log_path}: {exc}")
+    return rc, out, err, result
 
 
 def _parse_json_payload(raw: str) -> dict[str, Any] | None:
@@ -49,8 +73,7 @@ def _extract_error_code(stdout: str, stderr: str) -> str:
 
 
 def _git_head(repo_root: Path) -> str:
-    rc, out, _ = _run(["git", "-C", str(repo_root), "rev-parse", "HEAD"])
-    return out.strip() if rc == 0 else ""
+    return head_sha(repo_root)
 
 
 def _load_catalog(path: Path) -> list[dict[str, Any]]:
@@ -121,7 +144,120 @@ def _is_review_required_outcome(update_rc: int, next_action: str, error_code: st
     }
 
 
-def main() -> int:
+def _run_identity(
+    iid: str,
+    catalog_path: str,
+    repo_catalog_path: str,
+    dry_run: bool,
+    mode: str,
+    capability_activation_policy: str,
+    log_dir: str,
+) -> dict[str, Any]:
+    """Baseline check (and update when applying) for one identity; runs in a worker process."""
+    log_path = Path(log_dir) if log_dir else None
+    log_errors: list[str] = []
+    base_cmd = [
+        "python3",
+        "scripts/validate_identity_protocol_baseline_freshness.py",
+        "--identity-id",
+        iid,
+        "--catalog",
+        catalog_path,
+        "--repo-catalog",
+        repo_catalog_path,
+        "--baseline-policy",
+        "warn",
+        "--json-only",
+    ]
+    rc_base, out_base, err_base, result_base = _run_logged(
+        base_cmd, log_path / "baseline.log" if log_path else None, log_errors
+    )
+    base_payload = result_base if result_base is not None else (_parse_json_payload(out_base) or {})
+    baseline_status = str(base_payload.get("baseline_status", "FAIL")).strip().upper() or "FAIL"
+    baseline_error_code = str(base_payload.get("baseline_error_code", "")).strip() or _extract_error_code(out_base, err_base)
+    stale_reasons = base_payload.get("stale_reasons", [])
+    if not isinstance(stale_reasons, list):
+        stale_reasons = [str(stale_reasons)]
+
+    outdated = _is_outdated_baseline(baseline_status, baseline_error_code, stale_reasons, rc_base)
+    next_action = _baseline_next_action(baseline_status, baseline_error_code, stale_reasons)
+    item: dict[str, Any] = {
+        "identity_id": iid,
+        "baseline_status": baseline_status,
+        "baseline_error_code": baseline_error_code,
+        "baseline_rc": rc_base,
+        "outdated": outdated,
+        "report_path": str(base_payload.get("report_selected_path", "")).strip(),
+        "update_rc": None,
+        "update_status": "",
+        "next_action": next_action,
+        "error_code": "",
+        "stale_reasons": stale_reasons,
+        "log_dir": log_dir,
+        "log_errors": log_errors,
+    }
+
+    if dry_run:
+        item["update_status"] = "SKIPPED_DRY_RUN"
+        item["error_code"] = baseline_error_code
+        return item
+
+    if not outdated:
+        item["update_status"] = "SKIPPED_NOT_OUTDATED"
+        item["next_action"] = "skip_not_outdated"
+        item["error_code"] = baseline_error_code
+        return item
+
+    update_cmd = [
+        "python3",
+        "scripts/identity_creator.py",
+        "update",
+        "--identity-id",
+        iid,
+        "--mode",
+        mode,
+        "--catalog",
+        catalog_path,
+        "--repo-catalog",
+        repo_catalog_path,
+        "--capability-activation-policy",
+        capability_activation_policy,
+        "--baseline-policy",
+        "warn",
+    ]
+    rc_upd, out_upd, err_upd, _ = _run_logged(
+        update_cmd, log_path / "update.log" if log_path else None, log_errors
+    )
+    item["update_rc"] = rc_upd
+    update_report = _extract_report_path(out_upd)
+    if update_report:
+        item["report_path"] = update_report
+    report_json: dict[str, Any] = {}
+    if item["report_path"]:
+        rp = Path(item["report_path"]).expanduser().resolve()
+        if rp.exists():
+            try:
+                report_json = _load_json(rp)
+            except Exception:
+                report_json = {}
+    item["next_action"] = str(report_json.get("next_action", "")).strip() or (
+        "review_required_create_pr_from_patch_plan" if rc_upd == 0 else "inspect_update_failure"
+    )
+    item["error_code"] = (
+        str(report_json.get("permission_error_code", "")).strip()
+        or str(report_json.get("capability_activation_error_code", "")).strip()
+        or _extract_error_code(out_upd, err_upd)
+    )
+    if rc_upd == 0:
+        item["update_status"] = "UPDATED"
+    elif _is_review_required_outcome(rc_upd, item["next_action"], item["error_code"]):
+        item["update_status"] = "REVIEW_REQUIRED"
+    else:
+        item["update_status"] = "BLOCKED"
+    return item
+
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Run protocol upgrade wave for runtime identities based on baseline freshness.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
@@ -134,8 +270,14 @@ def main() -> int:
     )
     ap.add_argument("--dry-run", action="store_true", default=True, help="preview only (default true)")
     ap.add_argument("--apply", action="store_true", help="execute updates for outdated identities")
+    ap.add_argument("--jobs", type=int, default=1, help="identities checked/updated in parallel (default 1)")
+    ap.add_argument(
+        "--log-dir",
+        default="",
+        help=f"per-identity command logs root (default {DEFAULT_WAVE_LOG_ROOT}/<wave_id>, only when private)",
+    )
     ap.add_argument("--out", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -158,120 +300,45 @@ def main() -> int:
     repo_root = Path(__file__).resolve().parent.parent
     protocol_head_sha = _git_head(repo_root)
 
-    items: list[dict[str, Any]] = []
-    outdated_ids: list[str] = []
-    updated_count = 0
-    review_required_count = 0
-    blocked_count = 0
-    skipped_count = 0
-
-    for row in runtime_rows:
-        iid = str(row.get("id", "")).strip()
-        if not iid:
+    # logs hold full identity_creator output: the shared /tmp default is used only when private
+    log_root: Path | None = None
+    log_root_error = ""
+    if args.log_dir:
+        log_root = Path(args.log_dir).expanduser().resolve()
+    elif private_dir(DEFAULT_WAVE_LOG_ROOT) is not None:
+        log_root = DEFAULT_WAVE_LOG_ROOT / wave_id
+    else:
+        log_root_error = f"log root not private to this user: {DEFAULT_WAVE_LOG_ROOT}"
+    identity_ids = [iid for iid in (str(r.get("id", "")).strip() for r in runtime_rows) if iid]
+    results: dict[str, dict[str, Any]] = {}
+    scheduler = TaskScheduler(jobs=args.jobs)
+    for iid in identity_ids:
+        if iid in scheduler.tasks:
             continue
-        base_cmd = [
-            "python3",
-            "scripts/validate_identity_protocol_baseline_freshness.py",
-            "--identity-id",
+        scheduler.add(
             iid,
-            "--catalog",
-            str(catalog_path),
-            "--repo-catalog",
-            str(repo_catalog_path),
-            "--baseline-policy",
-            "warn",
-            "--json-only",
-        ]
-        rc_base, out_base, err_base = _run(base_cmd)
-        base_payload = _parse_json_payload(out_base) or {}
-        baseline_status = str(base_payload.get("baseline_status", "FAIL")).strip().upper() or "FAIL"
-        baseline_error_code = str(base_payload.get("baseline_error_code", "")).strip() or _extract_error_code(out_base, err_base)
-        stale_reasons = base_payload.get("stale_reasons", [])
-        if not isinstance(stale_reasons, list):
-            stale_reasons = [str(stale_reasons)]
-
-        outdated = _is_outdated_baseline(baseline_status, baseline_error_code, stale_reasons, rc_base)
-        if outdated:
-            outdated_ids.append(iid)
-
-        next_action = _baseline_next_action(baseline_status, baseline_error_code, stale_reasons)
-        item: dict[str, Any] = {
-            "identity_id": iid,
-            "baseline_status": baseline_status,
-            "baseline_error_code": baseline_error_code,
-            "baseline_rc": rc_base,
-            "outdated": outdated,
-            "report_path": str(base_payload.get("report_selected_path", "")).strip(),
-            "update_rc": None,
-            "update_status": "",
-            "next_action": next_action,
-            "error_code": "",
-            "stale_reasons": stale_reasons,
-        }
-
-        if dry_run:
-            skipped_count += 1
-            item["update_status"] = "SKIPPED_DRY_RUN"
-            item["error_code"] = baseline_error_code
-            items.append(item)
-            continue
-
-        if not outdated:
-            skipped_count += 1
-            item["update_status"] = "SKIPPED_NOT_OUTDATED"
-            item["next_action"] = "skip_not_outdated"
-            item["error_code"] = baseline_error_code
-            items.append(item)
-            continue
-
-        update_cmd = [
-            "python3",
-            "scripts/identity_creator.py",
-            "update",
-            "--identity-id",
-            iid,
-            "--mode",
-            args.mode,
-            "--catalog",
-            str(catalog_path),
-            "--repo-catalog",
-            str(repo_catalog_path),
-            "--capability-activation-policy",
-            args.capability_activation_policy,
-            "--baseline-policy",
-            "warn",
-        ]
-        rc_upd, out_upd, err_upd = _run(update_cmd)
-        item["update_rc"] = rc_upd
-        update_report = _extract_report_path(out_upd)
-        if update_report:
-            item["report_path"] = update_report
-        report_json: dict[str, Any] = {}
-        if item["report_path"]:
-            rp = Path(item["report_path"]).expanduser().resolve()
-            if rp.exists():
-                try:
-                    report_json = _load_json(rp)
-                except Exception:
-                    report_json = {}
-        item["next_action"] = str(report_json.get("next_action", "")).strip() or (
-            "review_required_create_pr_from_patch_plan" if rc_upd == 0 else "inspect_update_failure"
+            _run_identity,
+            (
+                iid,
+                str(catalog_path),
+                str(repo_catalog_path),
+                dry_run,
+                args.mode,
+                args.capability_activation_policy,
+                str(log_root / iid) if log_root is not None else "",
+            ),
+            on_done=lambda item, iid=iid: results.__setitem__(iid, item),
         )
-        item["error_code"] = (
-            str(report_json.get("permission_error_code", "")).strip()
-            or str(report_json.get("capability_activation_error_code", "")).strip()
-            or _extract_error_code(out_upd, err_upd)
-        )
-        if rc_upd == 0:
-            updated_count += 1
-            item["update_status"] = "UPDATED"
-        elif _is_review_required_outcome(rc_upd, item["next_action"], item["error_code"]):
-            review_required_count += 1
-            item["update_status"] = "REVIEW_REQUIRED"
-        else:
-            blocked_count += 1
-            item["update_status"] = "BLOCKED"
-        items.append(item)
+    scheduler.run()
+
+    # aggregate in catalog order, whatever order the workers finished in
+    items = [copy.deepcopy(results[iid]) for iid in identity_ids]
+    outdated_ids = [x["identity_id"] for x in items if x["outdated"]]
+    statuses = [x["update_status"] for x in items]
+    updated_count = statuses.count("UPDATED")
+    review_required_count = statuses.count("REVIEW_REQUIRED")
+    blocked_count = statuses.count("BLOCKED")
+    skipped_count = sum(1 for x in statuses if x.startswith("SKIPPED_"))
 
     payload = {
         "wave_id": wave_id,
@@ -282,6 +349,8 @@ def main() -> int:
         "dry_run": dry_run,
         "mode": args.mode,
         "capability_activation_policy": args.capability_activation_policy,
+        "log_root": str(log_root or ""),
+        "log_root_error": log_root_error,
         "total_identities": len(items),
         "outdated_identities": sorted(outdated_ids),
         "updated_count": updated_count,
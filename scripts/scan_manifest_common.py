@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from actor_session_common import actor_session_dir
+from execution_report_index_common import latest_execution_report
+from git_facts_common import head_sha
+from private_dir_common import private_dir, user_tmp_dir
+
+SCAN_MANIFEST_SCHEMA = "identity_full_scan_manifest_v1"
+DEFAULT_SCAN_MANIFEST = user_tmp_dir("identity-full-scan") / "manifest.json"
+# Checks such as capability-fit review freshness and discovery exception expiry compare dates
+# with the clock, so unchanged inputs do not mean an unchanged verdict: cached units expire.
+DEFAULT_SCAN_MANIFEST_TTL_SECONDS = 3600
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _stat_row(path: Path, base: Path) -> list[Any]:
+    try:
+        st = path.stat()
+    except OSError:
+        return [path.relative_to(base).as_posix(), "missing"]
+    return [path.relative_to(base).as_posix(), st.st_size, st.st_mtime_ns]
+
+
+def tree_signature(root: Path, *, skip_top: tuple[str, ...] = ()) -> list[list[Any]]:
+    """(relative path, size, mtime_ns) for every file below ``root``; cheap enough to run per scan."""
+    if not root.is_dir():
+        return [[str(root), "missing"]]
+    rows: list[list[Any]] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        if Path(dirpath) == root:
+            dirnames[:] = [d for d in dirnames if d not in skip_top]
+        dirnames.sort()
+        for name in sorted(filenames):
+            rows.append(_stat_row(Path(dirpath) / name, root))
+    return rows
+
+
+def scripts_signature() -> str:
+    rows = [_stat_row(p, SCRIPTS_DIR) for p in sorted(SCRIPTS_DIR.glob("*.py"))]
+    return hashlib.sha256(json.dumps(rows).encode("utf-8")).hexdigest()
+
+
+def git_head(repo_root: Path) -> str:
+    return head_sha(repo_root)
+
+
+def scan_unit_key(layer: str, catalog: Path, identity_id: str) -> str:
+    return f"{layer}:{catalog}:{identity_id}"
+
+
+def identity_input_fingerprint(
+    *,
+    identity_id: str,
+    rows: list[dict[str, Any]],
+    catalog: Path,
+    pack_path: str,
+    scan_context: dict[str, Any],
+    include_runtime: bool = True,
+) -> str:
+    """
+    sha256 over everything an identity scan reads: its catalog rows (every scanned catalog plus
+    the repo catalog), pack files, the catalog's actor session store, the latest execution
+    report, and the scan context (options, scripts, git HEAD). ``include_runtime=False`` leaves
+    out the pack's ``runtime/`` evidence (which the scan itself writes) and the latest report.
+    """
+    pack = Path(pack_path).expanduser().resolve() if str(pack_path or "").strip() else None
+    latest = None
+    if pack is not None and include_runtime:
+        latest = latest_execution_report(identity_id, [pack / "runtime" / "reports"], recursive=False)
+    skip_top = () if include_runtime else ("runtime",)
+    doc = {
+        "schema": SCAN_MANIFEST_SCHEMA,
+        "identity_id": identity_id,
+        "rows": rows,
+        "catalog": str(catalog),
+        "pack": tree_signature(pack, skip_top=skip_top) if pack is not None else [],
+        "actor_sessions": tree_signature(actor_session_dir(catalog)),
+        "latest_report": _stat_row(latest, latest.parent) if latest is not None else None,
+        "context": scan_context,
+    }
+    return hashlib.sha256(json.dumps(doc, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _age_seconds(stamp: Any) -> float | None:
+    try:
+        then = datetime.strptime(str(stamp), "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return (datetime.now(timezone.utc) - then).total_seconds()
+
+
+@dataclass
+class ScanManifest:
+    path: Path
+    units: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # cached units older than this re-run even when their inputs are unchanged
+    ttl_seconds: int = DEFAULT_SCAN_MANIFEST_TTL_SECONDS
+    # False when the default manifest directory is not private to this user: nothing is read or saved
+    trusted: bool = True
+    cached: int = 0
+    executed: int = 0
+    expired: int = 0
+    # executed units whose inputs changed while they were scanned: not recorded
+    unstable: int = 0
+
+    @classmethod
+    def load(cls, path: Path, ttl_seconds: int = DEFAULT_SCAN_MANIFEST_TTL_SECONDS) -> "ScanManifest":
+        manifest = cls(path=path, ttl_seconds=ttl_seconds)
+        # cached verdicts replace scans: the shared /tmp default must not be writable by other users
+        if path.parent == DEFAULT_SCAN_MANIFEST.parent and private_dir(path.parent) is None:
+            manifest.trusted = False
+            return manifest
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return manifest
+        if isinstance(data, dict) and data.get("schema") == SCAN_MANIFEST_SCHEMA and isinstance(data.get("units"), dict):
+            manifest.units = {str(k): v for k, v in data["units"].items() if isinstance(v, dict)}
+        return manifest
+
+    def lookup(self, key: str, fingerprint: str) -> dict[str, Any] | None:
+        row = self.units.get(key)
+        if not row or row.get("fingerprint") != fingerprint or not isinstance(row.get("item"), dict):
+            self.executed += 1
+            return None
+        age = _age_seconds(row.get("scanned_at"))
+        if age is None or age > self.ttl_seconds:
+            self.executed += 1
+            self.expired += 1
+            return None
+        self.cached += 1
+        item = copy.deepcopy(row["item"])
+        item["incremental"] = {"result": "cached", "scanned_at": row.get("scanned_at", "")}
+        return item
+
+    def record(self, key: str, fingerprint: str, item: dict[str, Any]) -> None:
+        stored = {k: copy.deepcopy(v) for k, v in item.items() if k not in {"severity", "incremental"}}
+        self.units[key] = {"fingerprint": fingerprint, "scanned_at": _utc_now(), "item": stored}
+
+    def save(self) -> None:
+        if not self.trusted:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        doc = {"schema": SCAN_MANIFEST_SCHEMA, "updated_at": _utc_now(), "units": self.units}
+        tmp.write_text(json.dumps(doc, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "manifest": str(self.path),
+            "cached": self.cached,
+            "executed": self.executed,
+            "expired": self.expired,
+            "unstable": self.unstable,
+            "ttl_seconds": self.ttl_seconds,
+        }
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from private_dir_common import private_dir, user_tmp_dir
+
+STAMP_CONTEXT_CACHE_SCHEMA = "stamp_context_cache_v1"
+# IDENTITY_STAMP_CONTEXT_CACHE=0 disables the cache, =memory keeps it per process (no disk tier)
+STAMP_CONTEXT_CACHE_ENV = "IDENTITY_STAMP_CONTEXT_CACHE"
+STAMP_CONTEXT_CACHE_DIR_ENV = "IDENTITY_STAMP_CONTEXT_CACHE_DIR"
+# environment that changes how a context resolves (scope roots); the actor is resolved before keying
+KEY_ENV_NAMES = ("CODEX_HOME", "HOME")
+# resolution code; editing any of these invalidates the disk tier
+RESOLVER_MODULES = ("response_stamp_common.py", "resolve_identity_context.py", "actor_session_common.py")
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+Fingerprint = list[list[Any]]
+
+# key -> (input fingerprint, context dict)
+_MEMORY: dict[str, tuple[Fingerprint, dict[str, Any]]] = {}
+
+
+def stamp_context_cache_mode() -> str:
+    raw = str(os.environ.get(STAMP_CONTEXT_CACHE_ENV, "1")).strip().lower()
+    if raw in {"0", "false", "off", "no"}:
+        return "off"
+    return "memory" if raw == "memory" else "disk"
+
+
+def stamp_context_cache_dir() -> Path:
+    raw = str(os.environ.get(STAMP_CONTEXT_CACHE_DIR_ENV, "")).strip()
+    return Path(raw).expanduser() if raw else user_tmp_dir("identity-stamp-context-cache")
+
+
+def _file_stamp(path: Path) -> list[Any]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return [str(path), "missing"]
+    return [str(path), st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+def input_fingerprint(paths: list[Path]) -> Fingerprint:
+    """(path, mtime_ns, size, inode) per input; a missing file is part of the fingerprint too."""
+    return [_file_stamp(p) for p in paths]
+
+
+def _current(fingerprint: Fingerprint) -> bool:
+    return all(isinstance(row, list) and row and _file_stamp(Path(str(row[0]))) == row for row in fingerprint)
+
+
+def stamp_context_cache_key(parts: list[str]) -> str:
+    code = input_fingerprint([SCRIPTS_DIR / name for name in RESOLVER_MODULES])
+    env = [[name, str(os.environ.get(name, ""))] for name in KEY_ENV_NAMES]
+    raw = json.dumps([STAMP_CONTEXT_CACHE_SCHEMA, parts, env, code], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def lookup_stamp_context(key: str) -> dict[str, Any] | None:
+    """Cached context for ``key`` when every recorded input still has its recorded stamp."""
+    mode = stamp_context_cache_mode()
+    if mode == "off":
+        return None
+    hit = _MEMORY.get(key)
+    if hit is not None:
+        if _current(hit[0]):
+            return dict(hit[1])
+        _MEMORY.pop(key, None)
+    if mode != "disk":
+        return None
+    root = private_dir(stamp_context_cache_dir())
+    if root is None:
+        return None
+    try:
+        doc = json.loads((root / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(doc, dict) or doc.get("schema") != STAMP_CONTEXT_CACHE_SCHEMA or doc.get("key") != key:
+        return None
+    fingerprint, context = doc.get("inputs"), doc.get("context")
+    if not isinstance(fingerprint, list) or not isinstance(context, dict) or not _current(fingerprint):
+        return None
+    _MEMORY[key] = (fingerprint, context)
+    return dict(context)
+
+
+def store_stamp_context(key: str, fingerprint: Fingerprint, context: dict[str, Any]) -> None:
+    """
+    Remember ``context`` under ``key``. ``fingerprint`` must be taken before the context was
+    resolved, so a file changing mid-resolution leaves a stale stamp and the entry never hits.
+    """
+    mode = stamp_context_cache_mode()
+    if mode == "off":
+        return
+    _MEMORY[key] = (fingerprint, dict(context))
+    if mode != "disk":
+        return
+    root = private_dir(stamp_context_cache_dir())
+    if root is None:
+        return
+    path = root / f"{key}.json"
+    tmp = root / f".{key}.{os.getpid()}.tmp"
+    doc = {"schema": STAMP_CONTEXT_CACHE_SCHEMA, "key": key, "inputs": fingerprint, "context": context}
+    try:
+        tmp.write_text(json.dumps(doc, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def clear_stamp_context_cache(*, disk: bool = False) -> None:
+    _MEMORY.clear()
+    if not disk:
+        return
+    root = private_dir(stamp_context_cache_dir())
+    if root is None:
+        return
+    for p in root.glob("*.json"):
+        try:
+            p.unlink()
+        except OSError:
+            pass
@@ -19,10 +19,10 @@ def _dump_yaml(path: Path, data: dict[str, Any]) -> None:
     path.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Sync pack META.yaml status from catalog identities status.")
     ap.add_argument("--catalog", default=str(Path.home() / ".codex" / "identity" / "catalog.local.yaml"))
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -12,10 +12,10 @@ import yaml
 
 from actor_session_common import (
     DEFAULT_BINDING_KEY_MODE,
+    ActorBindingConflict,
     actor_session_path,
-    load_actor_binding_store,
+    cas_update_actor_binding_store,
     resolve_actor_id,
-    write_actor_binding_store,
 )
 
 ERR_MB_001 = "IP-ASB-MB-001"
@@ -222,7 +222,7 @@ def _build_actor_payload(
     return actor_payload, str(next_version)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Sync active identity into session evidence.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -279,7 +279,7 @@ def main() -> int:
         help="explicit governance override receipt required for non-activate canonical mutations",
     )
     ap.add_argument("--approved-by", default="", help="manual override approver for rebind receipt")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog = Path(args.catalog).expanduser().resolve()
     if not catalog.exists():
@@ -359,22 +359,18 @@ def main() -> int:
     if not session_id:
         return _fail(ERR_MB_005, "session_id_missing_and_run_id_missing")
 
-    store = load_actor_binding_store(catalog, actor_id)
-
     compare_token = str(args.compare_token or "").strip()
     if not compare_token:
         return _fail(ERR_MB_002, "compare_token_missing")
-    expected_token = str(store.get("compare_token", "")).strip() or str(store.get("binding_version", 0))
-    if compare_token != expected_token:
-        return _fail(ERR_MB_003, f"stale_compare_token expected={expected_token} got={compare_token}")
 
     run_id = str(args.run_id or "").strip()
     switch_reason = str(args.switch_reason or "").strip() or "explicit_activate"
     entrypoint_pid = str(args.entrypoint_pid or "").strip() or str(os.getpid())
     approved_by = str(args.approved_by or "").strip() or "system:auto"
     cross_actor_override_receipt = str(args.cross_actor_override_receipt or "").strip()
-    try:
-        actor_payload, compare_token_after = _build_actor_payload(
+
+    def _build(store: dict[str, Any]) -> dict[str, Any]:
+        actor_payload, _ = _build_actor_payload(
             store=store,
             actor_id=actor_id,
             session_id=session_id,
@@ -393,6 +389,13 @@ def main() -> int:
             approved_by=approved_by,
             compare_token_before=compare_token,
         )
+        return actor_payload
+
+    # compare_token check, payload build and write happen under the actor store lock
+    try:
+        actor_payload = cas_update_actor_binding_store(catalog, actor_id, compare_token, _build)
+    except ActorBindingConflict as exc:
+        return _fail(ERR_MB_003, f"stale_compare_token expected={exc.expected} got={exc.got}")
     except ValueError as exc:
         token = str(exc)
         if token.startswith(f"{ERR_MB_005}:"):
@@ -400,12 +403,10 @@ def main() -> int:
         if token.startswith(f"{ERR_MB_006}:"):
             return _fail(ERR_MB_006, token.split(":", 1)[1])
         return _fail(ERR_MB_005, token)
-
-    try:
-        write_actor_binding_store(actor_out, actor_payload)
     except Exception as exc:
         print(f"[FAIL] actor session binding sync failed: {actor_out} ({exc})")
         return 1
+    compare_token_after = str(actor_payload.get("compare_token", ""))
     print(
         "[OK] session identity actor-bound: "
         f"{actor_out} session_id={session_id} compare_token={compare_token_after} lane={mutation_lane}"
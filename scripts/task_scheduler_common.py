@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass
+class ScheduledTask:
+    key: str
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    deps: tuple[str, ...]
+    priority: tuple[Any, ...]
+    seq: int
+    on_done: Callable[[Any], None] | None = None
+    duration_ms: int = 0
+    pending_deps: set[str] = field(default_factory=set)
+
+
+class TaskScheduler:
+    """
+    Dependency-aware task runner for governance orchestrators.
+
+    Tasks run once all of their ``deps`` completed. Among ready tasks the smallest
+    ``(priority, insertion order)`` runs first, so ``jobs=1`` reproduces the legacy
+    sequential order exactly. ``jobs>1`` dispatches tasks to a process pool; ``fn``
+    and ``args`` must then be picklable. ``on_done`` callbacks always run in the
+    calling process (in completion order) and may add further tasks.
+    """
+
+    def __init__(self, jobs: int = 1) -> None:
+        self.jobs = max(1, int(jobs or 1))
+        self.tasks: dict[str, ScheduledTask] = {}
+        self.completed: list[str] = []
+        self.cancelled: list[str] = []
+        self._dependents: dict[str, list[str]] = {}
+        self._ready: list[tuple[tuple[Any, ...], int, str]] = []
+        self._seq = itertools.count()
+        self._stopped = False
+
+    def add(
+        self,
+        key: str,
+        fn: Callable[..., Any],
+        args: tuple[Any, ...] = (),
+        *,
+        deps: tuple[str, ...] | list[str] = (),
+        priority: tuple[Any, ...] = (),
+        on_done: Callable[[Any], None] | None = None,
+    ) -> None:
+        if key in self.tasks:
+            raise ValueError(f"duplicate scheduled task: {key}")
+        unknown = [d for d in deps if d not in self.tasks]
+        if unknown:
+            raise ValueError(f"task {key} depends on unscheduled tasks: {unknown}")
+        done = set(self.completed)
+        task = ScheduledTask(
+            key=key,
+            fn=fn,
+            args=tuple(args),
+            deps=tuple(deps),
+            priority=tuple(priority),
+            seq=next(self._seq),
+            on_done=on_done,
+            pending_deps={d for d in deps if d not in done},
+        )
+        self.tasks[key] = task
+        for dep in task.pending_deps:
+            self._dependents.setdefault(dep, []).append(key)
+        if not task.pending_deps:
+            heapq.heappush(self._ready, (task.priority, task.seq, key))
+
+    def stop(self) -> None:
+        """Stop dispatching; tasks not yet started are reported in ``cancelled``."""
+        self._stopped = True
+
+    def _complete(self, key: str, result: Any, duration_ms: int) -> None:
+        task = self.tasks[key]
+        task.duration_ms = duration_ms
+        self.completed.append(key)
+        for dependent in self._dependents.pop(key, []):
+            row = self.tasks[dependent]
+            row.pending_deps.discard(key)
+            if not row.pending_deps:
+                heapq.heappush(self._ready, (row.priority, row.seq, dependent))
+        if task.on_done is not None:
+            task.on_done(result)
+
+    def _run_serial(self) -> None:
+        while self._ready and not self._stopped:
+            _, _, key = heapq.heappop(self._ready)
+            task = self.tasks[key]
+            started = time.monotonic()
+            result = task.fn(*task.args)
+            self._complete(key, result, int((time.monotonic() - started) * 1000))
+
+    def _run_pool(self) -> None:
+        running: dict[Future[Any], tuple[str, float]] = {}
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            while True:
+                while self._ready and len(running) < self.jobs and not self._stopped:
+                    _, _, key = heapq.heappop(self._ready)
+                    task = self.tasks[key]
+                    running[pool.submit(task.fn, *task.args)] = (key, time.monotonic())
+                if not running:
+                    break
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for fut in sorted(finished, key=lambda f: self.tasks[running[f][0]].seq):
+                    key, started = running.pop(fut)
+                    self._complete(key, fut.result(), int((time.monotonic() - started) * 1000))
+
+    def run(self) -> None:
+        if self.jobs == 1:
+            self._run_serial()
+        else:
+            self._run_pool()
+        done = set(self.completed)
+        self.cancelled = [key for key in self.tasks if key not in done]
+        if self.cancelled and not self._stopped:
+            raise RuntimeError(f"scheduler finished with unrunnable tasks: {self.cancelled}")
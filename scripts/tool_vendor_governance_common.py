@@ -2,31 +2,29 @@
 from __future__ import annotations
 
 import glob
-import json
 from pathlib import Path
 from typing import Any
 
-import yaml
+from execution_report_index_common import latest_execution_report
+from identity_catalog_common import catalog_row, load_json_document, load_yaml_document
 
 
 def load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = load_yaml_document(path) or {}
     if not isinstance(data, dict):
         raise ValueError(f"yaml root must be object: {path}")
     return data
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_json_document(path)
     if not isinstance(data, dict):
         raise ValueError(f"json root must be object: {path}")
     return data
 
 
 def resolve_pack_and_task(catalog_path: Path, identity_id: str) -> tuple[Path, Path]:
-    catalog = load_yaml(catalog_path)
-    identities = catalog.get("identities") or []
-    row = next((x for x in identities if isinstance(x, dict) and str(x.get("id", "")).strip() == identity_id), None)
+    row = catalog_row(catalog_path, identity_id)
     if not row:
         raise FileNotFoundError(f"identity id not found in catalog: {identity_id}")
     pack_raw = str((row or {}).get("pack_path", "")).strip()
@@ -100,24 +98,7 @@ def _candidate_upgrade_report_roots(pack_root: Path) -> list[Path]:
 
 
 def latest_identity_upgrade_report(identity_id: str, pack_root: Path) -> Path | None:
-    rows: list[Path] = []
-    normalized = str(identity_id or "").strip()
-    if normalized in {"", "*"}:
-        pattern = "**/identity-upgrade-exec-*.json"
-    else:
-        pattern = f"**/identity-upgrade-exec-{normalized}-*.json"
-    for root in _candidate_upgrade_report_roots(pack_root):
-        if not root.exists():
-            continue
-        rows.extend(
-            p
-            for p in root.glob(pattern)
-            if p.is_file() and not p.name.endswith("-patch-plan.json")
-        )
-    if not rows:
-        return None
-    rows.sort(key=lambda p: p.stat().st_mtime)
-    return rows[-1]
+    return latest_execution_report(str(identity_id or "").strip() or "*", _candidate_upgrade_report_roots(pack_root))
 
 
 def boolish(value: Any) -> bool:
@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import argparse
-import glob
-import json
 import re
 from pathlib import Path
 from typing import Any
 
+from feedback_batch_common import feedback_artifacts_present, feedback_batch_facts, resolve_feedback_batches
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, resolve_pack_and_task
 
 STATUS_SKIPPED_NOT_REQUIRED = "SKIPPED_NOT_REQUIRED"
@@ -42,9 +42,9 @@ NOT_CLOSED_HINTS = (
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -64,49 +64,12 @@ def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
     return {}
 
 
-def _feedback_artifacts_present(pack_path: Path) -> bool:
-    root = (pack_path / "runtime" / "protocol-feedback" / "outbox-to-protocol").resolve()
-    if not root.exists():
-        return False
-    return any(p.is_file() for p in root.rglob("FEEDBACK_BATCH_*"))
-
-
-def _collect_batches(pack_path: Path, pattern: str, limit: int = 2) -> list[Path]:
-    raw = str(pattern).strip() if str(pattern).strip() else "runtime/protocol-feedback/outbox-to-protocol/FEEDBACK_BATCH_*.md"
-    p = Path(raw).expanduser()
-    has_magic = any(ch in raw for ch in ["*", "?", "["])
-    hits: list[Path] = []
-    if p.is_absolute():
-        if has_magic:
-            hits = [Path(x).expanduser().resolve() for x in glob.glob(str(p))]
-        elif p.exists():
-            hits = [p.resolve()]
-    else:
-        preferred = sorted(pack_path.glob(raw))
-        if preferred:
-            hits = [x.resolve() for x in preferred]
-        else:
-            hits = [x.resolve() for x in Path(".").glob(raw)]
-    hits = [x for x in hits if x.exists() and x.is_file()]
-    hits.sort(key=lambda x: x.stat().st_mtime)
-    return hits[-limit:] if limit > 0 else hits
-
-
 def _extract_first(text: str, pattern: str) -> str:
     m = re.search(pattern, text, flags=re.IGNORECASE | re.MULTILINE)
     return m.group(1).strip() if m else ""
 
 
-def _parse_batch(path: Path) -> dict[str, Any]:
-    raw = path.read_text(encoding="utf-8", errors="ignore")
-    parsed: dict[str, Any] = {}
-    try:
-        obj = json.loads(raw)
-        if isinstance(obj, dict):
-            parsed = obj
-    except Exception:
-        parsed = {}
-
+def _batch_facts(raw: str, parsed: dict[str, Any]) -> dict[str, Any]:
     platform_class = str(
         parsed.get("platform_class")
         or parsed.get("platform")
@@ -139,7 +102,6 @@ def _parse_batch(path: Path) -> dict[str, Any]:
             upgrade_ref = m.group(0).strip()
 
     return {
-        "path": str(path),
         "platform_class": platform_class,
         "optimization_intent_signal": intent_flag,
         "flow_not_closed": flow_not_closed,
@@ -147,7 +109,7 @@ def _parse_batch(path: Path) -> dict[str, Any]:
     }
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Trigger platform optimization discovery when repeated optimization signals are detected.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -158,7 +120,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -175,7 +137,7 @@ def main() -> int:
     contract = _select_contract(task)
     required = contract_required(contract) if contract else False
     auto_required_signal = False
-    if not required and _feedback_artifacts_present(pack_path):
+    if not required and feedback_artifacts_present(pack_path):
         # keep P1 non-blocking; only mark auto signal for visibility when contract absent
         auto_required_signal = True
 
@@ -212,7 +174,7 @@ def main() -> int:
         batch = Path(args.feedback_batch).expanduser().resolve()
         batches = [batch] if batch.exists() and batch.is_file() else []
     else:
-        batches = _collect_batches(pack_path, pattern=pattern, limit=window)
+        batches = resolve_feedback_batches(pack_path, pattern)[-window:]
 
     payload["feedback_batches"] = [str(x) for x in batches]
     if len(batches) < 2:
@@ -222,7 +184,7 @@ def main() -> int:
         _emit(payload, json_only=args.json_only)
         return 0
 
-    parsed = [_parse_batch(p) for p in batches[-2:]]
+    parsed = feedback_batch_facts(pack_path, batches[-2:], _batch_facts)
     latest = parsed[-1]
     prev = parsed[-2]
 
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
-import yaml
 
 from actor_session_common import actor_session_path, load_actor_binding, load_actor_binding_store, resolve_actor_id
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_yaml_document
+from result_channel_common import print_result
 
 ERR_ACTOR_BINDING = "IP-ASB-201"
 STRICT_OPS = {"activate", "update", "readiness", "e2e", "ci", "validate", "mutation"}
@@ -16,7 +17,7 @@ INSPECTION_OPS = {"scan", "three-plane", "inspection"}
 
 
 def _load_catalog(path: Path) -> dict[str, Any]:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    raw = load_yaml_document(path) or {}
     if not isinstance(raw, dict):
         raise ValueError(f"catalog root must be object: {path}")
     return raw
@@ -34,7 +35,7 @@ def _is_fixture_identity(row: dict[str, Any] | None) -> bool:
     return profile == "fixture" or runtime_mode == "demo_only"
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate actor-scoped session binding truth source.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -47,7 +48,7 @@ def main() -> int:
     )
     ap.add_argument("--session-id", default="", help="optional explicit session binding selector")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -68,10 +69,10 @@ def main() -> int:
             "stale_reasons": ["identity_not_found_in_catalog"],
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[FAIL] {ERR_ACTOR_BINDING} identity not found in catalog: {args.identity_id}")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 1
 
     actor_id = resolve_actor_id(args.actor_id)
@@ -151,7 +152,7 @@ def main() -> int:
     }
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if actor_binding_status == "PASS_REQUIRED":
             print(
@@ -168,10 +169,10 @@ def main() -> int:
                 f"[FAIL] {error_code or ERR_ACTOR_BINDING} actor session binding validation failed: "
                 f"actor={actor_id} target={args.identity_id}"
             )
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
     return 0 if actor_binding_status in {"PASS_REQUIRED", "SKIPPED_NOT_REQUIRED"} else 1
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
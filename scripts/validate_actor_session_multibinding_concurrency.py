@@ -2,11 +2,9 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
-import yaml
 
 from actor_session_common import (
     LEGACY_BINDING_KEY_MODE,
@@ -15,6 +13,9 @@ from actor_session_common import (
     normalize_actor_binding_store,
     resolve_actor_id,
 )
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_document
+from result_channel_common import print_result
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
 STATUS_WARN_NON_BLOCKING = "WARN_NON_BLOCKING"
@@ -44,7 +45,7 @@ RECEIPT_REQUIRED_FIELDS = (
 
 
 def _load_catalog(path: Path) -> dict[str, Any]:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    raw = load_yaml_document(path) or {}
     return raw if isinstance(raw, dict) else {}
 
 
@@ -63,7 +64,7 @@ def _is_fixture_identity(row: dict[str, Any] | None) -> bool:
 
 def _load_json(path: Path) -> dict[str, Any]:
     try:
-        doc = json.loads(path.read_text(encoding="utf-8"))
+        doc = load_json_document(path)
     except Exception:
         return {}
     return doc if isinstance(doc, dict) else {}
@@ -89,7 +90,7 @@ def _finalize_status(
     return status, error_code
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate same-actor multi-session binding concurrency contract.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", default="")
@@ -104,7 +105,7 @@ def main() -> int:
         help="strict operations fail-closed, inspection operations downgrade to warning",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -271,7 +272,7 @@ def main() -> int:
     }
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if status in {STATUS_PASS_REQUIRED, STATUS_SKIPPED_NOT_REQUIRED, STATUS_WARN_NON_BLOCKING}:
             print(
@@ -283,10 +284,10 @@ def main() -> int:
                 f"[FAIL] {error_code or ERR_MB_001} actor session multibinding concurrency validation failed: "
                 f"actor={actor_id} path={actor_path}"
             )
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
     return 0 if status in {STATUS_PASS_REQUIRED, STATUS_SKIPPED_NOT_REQUIRED, STATUS_WARN_NON_BLOCKING} else 1
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -7,6 +7,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, resolve_pack_and_task
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -20,9 +22,9 @@ ERR_EXTERNAL_WITHOUT_REASON = "IP-CFIT-COMP-003"
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -63,7 +65,7 @@ def _resolve_fit_matrix(pack_path: Path, report: str, pattern: str) -> Path | No
     return hits[-1]
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate compose-before-discover decision gate in capability-fit cycle.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -74,7 +76,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -178,4 +180,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
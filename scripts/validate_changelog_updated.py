@@ -5,6 +5,8 @@ import argparse
 import subprocess
 from pathlib import Path
 
+from git_facts_common import changed_files, rev_parse
+
 
 SIGNIFICANT_PREFIXES = (
     "identity/",
@@ -26,6 +28,10 @@ EXEMPT_PREFIXES = (
 
 
 def _run_git(args: list[str]) -> str:
+    if len(args) == 2 and args[0] == "rev-parse":
+        resolved = rev_parse(args[1])
+        if resolved:
+            return resolved
     cp = subprocess.run(["git", *args], capture_output=True, text=True)
     if cp.returncode != 0:
         raise RuntimeError(cp.stderr.strip() or f"git {' '.join(args)} failed")
@@ -33,8 +39,7 @@ def _run_git(args: list[str]) -> str:
 
 
 def _changed_files(base: str, head: str) -> list[str]:
-    out = _run_git(["diff", "--name-only", f"{base}..{head}"])
-    return [x.strip() for x in out.splitlines() if x.strip()]
+    return changed_files(base, head)
 
 
 def _is_significant(path: str) -> bool:
@@ -84,7 +89,7 @@ def _has_backfill_changelog_link(changelog_path: Path, head: str) -> bool:
     return any(tok in text for tok in tokens)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate changelog update across a git range")
     ap.add_argument("--base", help="base commit SHA")
     ap.add_argument("--head", help="head commit SHA")
@@ -101,7 +106,7 @@ def main() -> int:
             "modified in the exact --base..--head range"
         ),
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     base, head = _resolve_range(args.base, args.head)
     files = _changed_files(base, head)
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
-import yaml
 
-from actor_session_common import list_actor_bindings
+from actor_session_common import actor_binding_identity_ids, list_actor_bindings, list_actor_bindings_for_identities
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_yaml_document
+from result_channel_common import print_result
 
 ERR_CROSS_ACTOR_ISOLATION = "IP-ASB-203"
 STRICT_OPS = {"activate", "update", "readiness", "e2e", "ci", "validate", "mutation"}
@@ -16,13 +17,13 @@ INSPECTION_OPS = {"scan", "three-plane", "inspection"}
 
 
 def _load_catalog(path: Path) -> dict[str, Any]:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    raw = load_yaml_document(path) or {}
     if not isinstance(raw, dict):
         raise ValueError(f"catalog root must be object: {path}")
     return raw
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate cross-actor isolation for actor-scoped session bindings.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", default="")
@@ -33,7 +34,7 @@ def main() -> int:
         help="strict operations fail when actor binding set missing; inspection operations can skip",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -53,7 +54,14 @@ def main() -> int:
     operation = str(args.operation or "validate").strip().lower()
     inspection_mode = operation in INSPECTION_OPS
 
-    bindings = list_actor_bindings(catalog_path)
+    # With --identity-id only that identity's bindings and orphaned ones (unknown or missing
+    # identity) are checked; the other identities' bindings are covered by their own runs.
+    bound_ids = actor_binding_identity_ids(catalog_path)
+    scoped_identity = str(args.identity_id or "").strip()
+    if scoped_identity:
+        bindings = list_actor_bindings_for_identities(catalog_path, {scoped_identity, *(bound_ids - known_ids)})
+    else:
+        bindings = list_actor_bindings(catalog_path)
     stale_reasons: list[str] = []
     error_code = ""
     status = "PASS_REQUIRED"
@@ -61,7 +69,7 @@ def main() -> int:
     if not active_ids:
         status = "SKIPPED_NOT_REQUIRED"
         stale_reasons.append("no_active_identities_in_catalog")
-    elif not bindings:
+    elif not bound_ids:
         stale_reasons.append("actor_session_bindings_missing")
         if inspection_mode:
             status = "SKIPPED_NOT_REQUIRED"
@@ -91,6 +99,7 @@ def main() -> int:
         "identity_id": str(args.identity_id or "").strip(),
         "operation": operation,
         "active_identities": active_ids,
+        "actor_binding_scope": "identity" if scoped_identity else "catalog",
         "actor_binding_count": len(bindings),
         "cross_actor_isolation_status": status,
         "error_code": error_code,
@@ -109,7 +118,7 @@ def main() -> int:
     }
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if status in {"PASS_REQUIRED", "SKIPPED_NOT_REQUIRED"}:
             print(
@@ -118,10 +127,10 @@ def main() -> int:
             )
         else:
             print(f"[FAIL] {error_code or ERR_CROSS_ACTOR_ISOLATION} cross-actor isolation validation failed")
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
     return 0 if status in {"PASS_REQUIRED", "SKIPPED_NOT_REQUIRED"} else 1
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import glob
 import json
 import re
 import subprocess
@@ -10,6 +9,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from feedback_batch_common import feedback_batch_facts, resolve_feedback_batches
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+from result_channel_common import print_result
 from tool_vendor_governance_common import boolish, contract_required, load_json, resolve_pack_and_task, resolve_report_path
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -170,9 +173,9 @@ EXPIRY_CHECKS: tuple[tuple[str, tuple[str, ...]], ...] = (
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -188,31 +191,6 @@ def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
     return {}
 
 
-def _feedback_batches(pack_root: Path, pattern: str, window_rounds: int) -> list[Path]:
-    raw = str(pattern or "").strip() or "runtime/protocol-feedback/outbox-to-protocol/FEEDBACK_BATCH_*.md"
-    p = Path(raw).expanduser()
-    has_magic = any(ch in raw for ch in ["*", "?", "["])
-    hits: list[Path] = []
-    protocol_root = Path(__file__).resolve().parent.parent
-    if p.is_absolute():
-        if has_magic:
-            hits = [Path(x).expanduser().resolve() for x in glob.glob(str(p))]
-        elif p.exists():
-            hits = [p.resolve()]
-    else:
-        preferred = sorted((pack_root / raw).parent.glob((pack_root / raw).name)) if not has_magic else sorted(pack_root.glob(raw))
-        if preferred:
-            hits = [x.resolve() for x in preferred if x.exists()]
-        else:
-            fallback = sorted(protocol_root.glob(raw))
-            hits = [x.resolve() for x in fallback if x.exists()]
-    hits = [x for x in hits if x.is_file()]
-    hits.sort(key=lambda x: x.stat().st_mtime)
-    if window_rounds > 0:
-        return hits[-window_rounds:]
-    return hits
-
-
 def _extract_platform_class(raw: str, parsed: dict[str, Any]) -> str:
     direct = str(
         parsed.get("platform_class")
@@ -227,22 +205,13 @@ def _extract_platform_class(raw: str, parsed: dict[str, Any]) -> str:
     return m.group(2).strip() if m else ""
 
 
-def _parse_feedback_batch(path: Path) -> dict[str, Any]:
-    raw = path.read_text(encoding="utf-8", errors="ignore")
-    parsed: dict[str, Any] = {}
-    try:
-        obj = json.loads(raw)
-        if isinstance(obj, dict):
-            parsed = obj
-    except Exception:
-        parsed = {}
+def _batch_facts(raw: str, parsed: dict[str, Any]) -> dict[str, Any]:
     low = raw.lower()
     platform_class = _extract_platform_class(raw, parsed)
     optimization_signal = boolish(parsed.get("optimization_intent_signal", False)) or any(h in low for h in OPTIMIZATION_HINTS)
     quality_signal = boolish(parsed.get("quality_not_sufficient", False)) or any(h in low for h in QUALITY_NOT_SUFFICIENT_HINTS)
     capability_gap_signal = boolish(parsed.get("capability_gap", False)) or any(h in low for h in CAPABILITY_GAP_HINTS)
     return {
-        "path": str(path),
         "platform_class": platform_class,
         "optimization_signal": optimization_signal,
         "quality_not_sufficient": quality_signal,
@@ -281,7 +250,7 @@ def _required_flags(task: dict[str, Any]) -> dict[str, bool]:
 
 def _validate_receipt(receipt_path: Path) -> tuple[dict[str, Any] | None, str]:
     try:
-        obj = json.loads(receipt_path.read_text(encoding="utf-8"))
+        obj = load_json_document(receipt_path)
     except Exception as exc:
         return None, f"requiredization_receipt_invalid_json:{exc}"
     if not isinstance(obj, dict):
@@ -483,7 +452,7 @@ def _iso_now() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate discovery requiredization and CI synchronization contract.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -503,7 +472,7 @@ def main() -> int:
         ),
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -527,8 +496,9 @@ def main() -> int:
         if isinstance(contract, dict)
         else ""
     )
-    batches = _feedback_batches(pack_path, feedback_pattern, window_rounds)
-    parsed_batches = [_parse_feedback_batch(p) for p in batches]
+    protocol_root = Path(__file__).resolve().parent.parent
+    batches = resolve_feedback_batches(pack_path, feedback_pattern, fallback_root=protocol_root)[-window_rounds:]
+    parsed_batches = feedback_batch_facts(pack_path, batches, _batch_facts)
     trigger_flags, trigger_classes = _trigger_flags(parsed_batches)
     requiredization_triggered = len(trigger_classes) > 0
     non_blocking_expiry_days = int(contract.get("non_blocking_expiry_days", 7) or 7) if isinstance(contract, dict) else 7
@@ -855,4 +825,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -3,9 +3,10 @@ from __future__ import annotations
 
 import argparse
 import importlib.util
-import json
 from typing import Any
 
+from result_channel_common import print_result
+
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
 STATUS_WARN_NON_BLOCKING = "WARN_NON_BLOCKING"
 STATUS_FAIL_REQUIRED = "FAIL_REQUIRED"
@@ -16,9 +17,9 @@ STRICT_OPERATIONS = {"activate", "update", "readiness", "e2e", "ci", "validate",
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _has_module(name: str) -> bool:
@@ -28,7 +29,7 @@ def _has_module(name: str) -> bool:
         return False
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate hermetic runtime import preflight for e2e/replay operations.")
     ap.add_argument(
         "--operation",
@@ -37,7 +38,7 @@ def main() -> int:
     )
     ap.add_argument("--pythonpath-bootstrap-mode", default="")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     strict = str(args.operation or "validate").strip().lower() in STRICT_OPERATIONS
     bootstrap_mode = str(args.pythonpath_bootstrap_mode or "").strip() or "auto"
@@ -6,6 +6,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_current_task, load_json_document, resolve_pack_and_task
 from response_stamp_common import (
     ALLOWED_SOURCE_LAYERS,
     ALLOWED_WORK_LAYERS,
@@ -15,7 +17,9 @@ from response_stamp_common import (
     resolve_layer_intent,
     resolve_stamp_context,
 )
-from tool_vendor_governance_common import contract_required, load_json
+from reply_log_stream_common import first_reply_first_line
+from result_channel_common import print_result
+from tool_vendor_governance_common import contract_required
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
 STATUS_WARN_NON_BLOCKING = "WARN_NON_BLOCKING"
@@ -41,118 +45,6 @@ def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
     return {}
 
 
-def _resolve_pack_and_task(catalog_path: Path, identity_id: str) -> tuple[Path, Path]:
-    import yaml
-
-    data = yaml.safe_load(catalog_path.read_text(encoding="utf-8")) or {}
-    rows = [x for x in (data.get("identities") or []) if isinstance(x, dict)]
-    row = next((x for x in rows if str(x.get("id", "")).strip() == identity_id), None)
-    if not row:
-        raise FileNotFoundError(f"identity id not found in catalog: {identity_id}")
-    pack_raw = str((row or {}).get("pack_path", "")).strip()
-    if not pack_raw:
-        raise FileNotFoundError(f"pack_path missing for identity: {identity_id}")
-    pack = Path(pack_raw).expanduser().resolve()
-    if not pack.exists():
-        raise FileNotFoundError(f"pack_path not found: {pack}")
-    task = pack / "CURRENT_TASK.json"
-    if not task.exists():
-        raise FileNotFoundError(f"CURRENT_TASK.json not found: {task}")
-    return pack, task
-
-
-def _message_to_text(value: Any) -> str:
-    if isinstance(value, str):
-        return value
-    if isinstance(value, list):
-        parts: list[str] = []
-        for item in value:
-            if isinstance(item, str):
-                parts.append(item)
-            elif isinstance(item, dict):
-                text = item.get("text")
-                if isinstance(text, str):
-                    parts.append(text)
-                elif isinstance(item.get("content"), str):
-                    parts.append(str(item.get("content")))
-        return "\n".join([x for x in parts if x]).strip()
-    if isinstance(value, dict):
-        if isinstance(value.get("text"), str):
-            return str(value.get("text"))
-        if isinstance(value.get("content"), str):
-            return str(value.get("content"))
-    return ""
-
-
-def _extract_reply_samples(reply_log_path: Path) -> list[str]:
-    text = reply_log_path.read_text(encoding="utf-8", errors="ignore")
-    suffix = reply_log_path.suffix.lower()
-
-    if suffix == ".jsonl":
-        out: list[str] = []
-        for raw in text.splitlines():
-            raw = raw.strip()
-            if not raw:
-                continue
-            try:
-                row = json.loads(raw)
-            except Exception:
-                continue
-            if not isinstance(row, dict):
-                continue
-            role = str(row.get("role", "")).strip().lower()
-            if role and role not in {"assistant", "ai", "model"}:
-                continue
-            msg = _message_to_text(row.get("content"))
-            if not msg:
-                msg = _message_to_text(row.get("message"))
-            if not msg:
-                msg = _message_to_text(row.get("output"))
-            if msg:
-                out.append(msg)
-        return out
-
-    if suffix == ".json":
-        try:
-            doc = json.loads(text)
-        except Exception:
-            doc = None
-        out: list[str] = []
-        if isinstance(doc, dict):
-            replies = doc.get("replies")
-            if isinstance(replies, list):
-                for item in replies:
-                    msg = _message_to_text(item)
-                    if msg:
-                        out.append(msg)
-            messages = doc.get("messages")
-            if isinstance(messages, list):
-                for row in messages:
-                    if not isinstance(row, dict):
-                        continue
-                    role = str(row.get("role", "")).strip().lower()
-                    if role and role not in {"assistant", "ai", "model"}:
-                        continue
-                    msg = _message_to_text(row.get("content"))
-                    if msg:
-                        out.append(msg)
-            if not out:
-                msg = _message_to_text(doc.get("content"))
-                if msg:
-                    out.append(msg)
-        elif isinstance(doc, list):
-            for item in doc:
-                msg = _message_to_text(item)
-                if msg:
-                    out.append(msg)
-        return out
-
-    chunks = [x.strip() for x in text.split("\n---\n") if x.strip()]
-    if chunks:
-        return chunks
-    return [x.strip() for x in text.splitlines() if x.strip()]
-
-
 def _first_nonempty_line(text: str) -> str:
     for line in str(text or "").splitlines():
         s = line.strip()
@@ -163,9 +55,9 @@ def _first_nonempty_line(text: str) -> str:
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _emit_blocker(receipt_path: Path, payload: dict[str, Any]) -> None:
@@ -178,7 +70,7 @@ def _lane_ambiguity(expected_source: str, reply_source: str) -> bool:
     return expected_source in lanes and reply_source in lanes and expected_source != reply_source
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate execution command tuple vs reply identity-context tuple coherence.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -201,7 +93,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -213,8 +105,8 @@ def main() -> int:
         return 2
 
     try:
-        _, task_path = _resolve_pack_and_task(catalog_path, args.identity_id)
-        task = load_json(task_path)
+        _, task_path = resolve_pack_and_task(catalog_path, args.identity_id)
+        task = load_current_task(task_path)
     except Exception as exc:
         print(f"[FAIL] {exc}")
         return 1
@@ -258,7 +150,9 @@ def main() -> int:
         if not p.exists():
             print(f"[FAIL] reply log file not found: {p}")
             return 1
-        reply_samples = _extract_reply_samples(p)
+        # only the first reply is checked, so stop reading the log there
+        first_line = first_reply_first_line(p)
+        reply_samples = [] if first_line is None else [first_line]
         evidence_ref = str(p)
     elif args.reply_file.strip():
         p = Path(args.reply_file).expanduser().resolve()
@@ -279,7 +173,7 @@ def main() -> int:
             print(f"[FAIL] stamp json not found: {p}")
             return 1
         try:
-            doc = json.loads(p.read_text(encoding="utf-8"))
+            doc = load_json_document(p)
         except Exception as exc:
             print(f"[FAIL] invalid stamp json: {p} ({exc})")
             return 1
@@ -490,4 +384,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -3,14 +3,17 @@ from __future__ import annotations
 
 import argparse
 import hashlib
-import json
 import os
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from execution_report_index_common import collect_execution_reports
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 from resolve_identity_context import resolve_identity
+from result_channel_common import print_result
 
 
 ERROR_STALE = "IP-REL-001"
@@ -44,22 +47,15 @@ def _sha256(path: Path) -> str:
 
 def _safe_json(path: Path) -> dict[str, Any]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = load_json_document(path)
     except Exception:
         return {}
     return data if isinstance(data, dict) else {}
 
 
 def _collect_from_roots(identity_id: str, roots: list[Path]) -> list[Path]:
-    rows: list[Path] = []
-    for root in roots:
-        if not root.exists():
-            continue
-        for p in root.glob(f"**/identity-upgrade-exec-{identity_id}-*.json"):
-            if p.name.endswith("-patch-plan.json"):
-                continue
-            rows.append(p.resolve())
-    return sorted(set(rows), key=lambda p: p.stat().st_mtime, reverse=True)
+    rows = {p.resolve() for p in collect_execution_reports(identity_id, roots)}
+    return sorted(rows, key=lambda p: p.stat().st_mtime, reverse=True)
 
 
 def _collect_candidates(identity_id: str, preferred_pack: Path | None, report: str) -> list[Path]:
@@ -155,7 +151,7 @@ def _select_best(candidates: list[CandidateEval]) -> CandidateEval:
     return sorted(candidates, key=lambda c: c.score, reverse=True)[0]
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate upgrade execution report freshness and runtime binding.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -168,7 +164,7 @@ def main() -> int:
         help="strict: stale/mismatch fails with IP-REL-001; warn: emit warning payload but return 0",
     )
     ap.add_argument("--json-only", action="store_true", help="emit payload only")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -230,10 +226,10 @@ def main() -> int:
             "key_input_latest_mtime_utc": _iso_from_ts(key_input_latest_mtime),
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[FAIL] {ERROR_STALE} execution report not found for identity={args.identity_id}")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 1 if args.execution_report_policy == "strict" else 0
 
     selected = _select_best(evaluated)
@@ -264,7 +260,7 @@ def main() -> int:
         "stale_reasons": selected.stale_reasons,
     }
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if strict_ok:
             print(
@@ -276,11 +272,11 @@ def main() -> int:
                 f"[WARN] {ERROR_STALE} execution report freshness drift detected: identity={args.identity_id} "
                 f"report={selected.path}"
             )
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
     if strict_ok:
         return 0
     return 1 if args.execution_report_policy == "strict" else 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
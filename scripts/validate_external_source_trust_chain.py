@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import argparse
-import json
 import re
 from pathlib import Path
 from typing import Any
 
+from feedback_batch_common import feedback_batch_facts
+from identity_batch_common import identity_batch_main
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, load_yaml, resolve_pack_and_task, resolve_report_path
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -35,9 +37,9 @@ URL_RE = re.compile(r"https?://[^\s)\]>]+", flags=re.IGNORECASE)
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -193,7 +195,11 @@ def _dedupe_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return out
 
 
-def main() -> int:
+def _batch_facts(raw: str, parsed: dict[str, Any]) -> dict[str, Any]:
+    return {"source_rows": _dedupe_rows([*_to_rows_from_json(parsed), *_to_rows_from_text(raw)])}
+
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate external source trust-chain contract for conclusion-layer evidence.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -204,7 +210,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -320,18 +326,7 @@ def main() -> int:
         _emit(payload, json_only=args.json_only)
         return 1
 
-    raw = batch_path.read_text(encoding="utf-8", errors="ignore")
-    parsed: dict[str, Any] = {}
-    try:
-        obj = json.loads(raw)
-        if isinstance(obj, dict):
-            parsed = obj
-    except Exception:
-        parsed = {}
-
-    rows = _to_rows_from_json(parsed)
-    rows.extend(_to_rows_from_text(raw))
-    rows = _dedupe_rows(rows)
+    rows = feedback_batch_facts(pack_path, [batch_path], _batch_facts)[0]["source_rows"]
 
     payload["feedback_batch_path"] = str(batch_path)
     payload["source_row_count"] = len(rows)
@@ -425,4 +420,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
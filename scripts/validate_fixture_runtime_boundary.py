@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
-import yaml
+
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_document
+from result_channel_common import print_result
 
 ERR_FIXTURE_RUNTIME_BOUNDARY = "IP-PATH-004"
 
@@ -15,7 +17,7 @@ INSPECTION_OPS = {"scan", "three-plane", "ci", "validate", "inspection"}
 
 
 def _load_catalog(path: Path) -> dict[str, Any]:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    raw = load_yaml_document(path) or {}
     if not isinstance(raw, dict):
         raise ValueError(f"catalog root must be object: {path}")
     return raw
@@ -29,7 +31,7 @@ def _identity_row(catalog_path: Path, identity_id: str) -> dict[str, Any] | None
 
 def _load_receipt(path: Path) -> dict[str, Any]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = load_json_document(path)
     except Exception:
         return {}
     return data if isinstance(data, dict) else {}
@@ -60,7 +62,7 @@ def _valid_receipt(
     return len(reasons) == 0, reasons
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate fixture/runtime boundary for runtime mutation flows.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -78,7 +80,7 @@ def main() -> int:
         help="required JSON receipt path when --allow-fixture-runtime is set on mutation surfaces",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -110,10 +112,10 @@ def main() -> int:
             "stale_reasons": ["identity_not_found_in_catalog"],
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[FAIL] {ERR_FIXTURE_RUNTIME_BOUNDARY} identity not found in catalog: {args.identity_id}")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 1
 
     profile = str(row.get("profile", "")).strip().lower()
@@ -188,7 +190,7 @@ def main() -> int:
     }
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if path_status == "PASS_REQUIRED":
             print(
@@ -205,10 +207,10 @@ def main() -> int:
                 f"[FAIL] {ERR_FIXTURE_RUNTIME_BOUNDARY} fixture/runtime boundary gate failed: "
                 f"identity={args.identity_id} operation={operation}"
             )
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
     return 0 if path_status in {"PASS_REQUIRED", "SKIPPED_NOT_REQUIRED"} else 1
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
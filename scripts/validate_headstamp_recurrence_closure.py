@@ -9,9 +9,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
 
 from actor_session_common import load_actor_binding
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_yaml_document
+from result_channel_common import print_result
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
 STATUS_FAIL_REQUIRED = "FAIL_REQUIRED"
@@ -64,14 +66,14 @@ def _utc_now() -> str:
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
         return
-    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _is_fixture_identity(catalog_path: Path, identity_id: str) -> bool:
     try:
-        data = yaml.safe_load(catalog_path.read_text(encoding="utf-8")) or {}
+        data = load_yaml_document(catalog_path) or {}
     except Exception:
         return False
     rows = [x for x in (data.get("identities") or []) if isinstance(x, dict)]
@@ -186,7 +188,7 @@ def _send_time_cmd(
 
 def _catalog_identity_ids(catalog_path: Path) -> list[str]:
     try:
-        data = yaml.safe_load(catalog_path.read_text(encoding="utf-8")) or {}
+        data = load_yaml_document(catalog_path) or {}
     except Exception:
         return []
     rows = [x for x in (data.get("identities") or []) if isinstance(x, dict)]
@@ -281,7 +283,7 @@ def _actor_mismatch_probe(
     return ok, case, stale_reasons
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description=(
             "Hard-close headstamp recurrence for v1.5.x by combining static outlet wiring checks "
@@ -298,7 +300,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -605,4 +607,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
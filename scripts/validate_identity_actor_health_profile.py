@@ -6,6 +6,9 @@ import json
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+
 STRICT_OPS = {"update", "readiness", "e2e", "ci", "validate", "activate"}
 ERR_MISSING_FIELDS = "IP-HLT-001"
 ERR_REPORT_BINDING = "IP-HLT-002"
@@ -36,7 +39,7 @@ def _emit(payload: dict[str, Any], json_only: bool) -> int:
     return 0 if payload.get("actor_health_profile_status") == "PASS_REQUIRED" else 1
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate actor-risk health profile coverage contract.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--report", default="")
@@ -49,7 +52,7 @@ def main() -> int:
     )
     ap.add_argument("--enforce-bound-report", action="store_true")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     stale_reasons: list[str] = []
     error_code = ""
@@ -82,7 +85,7 @@ def main() -> int:
         return _emit(payload, args.json_only)
 
     try:
-        doc = json.loads(report_path.read_text(encoding="utf-8"))
+        doc = load_json_document(report_path)
     except Exception:
         payload = {
             "identity_id": args.identity_id,
@@ -175,5 +178,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
-
+    raise SystemExit(identity_batch_main(main))
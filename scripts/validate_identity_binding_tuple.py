@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 import re
 from pathlib import Path
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+
 
 SHA40_RE = re.compile(r"^[0-9a-f]{40}$")
 
 
 def _load_report(path: Path) -> dict:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_json_document(path)
     if not isinstance(data, dict):
         raise ValueError(f"report root must be object: {path}")
     return data
@@ -24,13 +26,13 @@ def _is_abs_path(value: str) -> bool:
         return False
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description="Validate identity binding tuple fields in upgrade report (machine-checkable P0 gate)."
     )
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--report", required=True, help="identity upgrade execution report JSON path")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     report_path = Path(args.report).expanduser().resolve()
     if not report_path.exists():
@@ -100,5 +102,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
-
+    raise SystemExit(identity_batch_main(main))
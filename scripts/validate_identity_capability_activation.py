@@ -10,24 +10,19 @@ import tomllib
 from pathlib import Path
 from typing import Any
 
-import yaml
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_object
 from resolve_identity_context import resolve_identity
-
-
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"yaml root must be object: {path}")
-    return data
+from result_channel_common import print_result
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_document(path)
 
 
 def _resolve_current_task(catalog_path: Path, identity_id: str) -> tuple[Path, Path]:
-    catalog = _load_yaml(catalog_path)
+    catalog = load_yaml_object(catalog_path)
     rows = [x for x in (catalog.get("identities") or []) if isinstance(x, dict)]
     row = next((x for x in rows if str(x.get("id", "")).strip() == identity_id), None)
     if not row:
@@ -385,7 +380,7 @@ def _validate_report(path: Path, require_activated: bool) -> tuple[bool, str]:
     return True, "ok"
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity capability activation (skill/mcp/tool attachment preflight).")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default="")
@@ -399,7 +394,7 @@ def main() -> int:
         help="strict-union blocks when any required capability is unavailable; route-any-ready allows activation when at least one route is ready.",
     )
     ap.add_argument("--out", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     if args.report.strip():
         report_path = Path(args.report).expanduser().resolve()
@@ -438,17 +433,17 @@ def main() -> int:
     status = str(payload.get("capability_activation_status", "BLOCKED"))
     if args.require_activated and status != "ACTIVATED":
         print(f"[FAIL] capability activation not ready: status={status} error={payload.get('capability_activation_error_code')}")
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
         return 1
     if status in {"BLOCKED", "ERROR"}:
         print(f"[WARN] capability activation not fully ready: status={status} error={payload.get('capability_activation_error_code')}")
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
         return 0
 
     print(f"[OK] capability activation validated: identity={args.identity_id} status={status}")
-    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    print_result(payload, ensure_ascii=False, indent=2)
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import argparse
 import glob
-import json
 from pathlib import Path
 from typing import Any
 
-import yaml
+
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_object
 
 REQ_KEYS = [
     "required",
@@ -40,19 +41,12 @@ REQ_DECISION_FIELDS = [
 ]
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
-
-
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_document(path)
 
 
 def _resolve_current_task(catalog_path: Path, identity_id: str) -> Path:
-    catalog = _load_yaml(catalog_path)
+    catalog = load_yaml_object(catalog_path)
     identities = catalog.get("identities") or []
     target = next((x for x in identities if str((x or {}).get("id", "")).strip() == identity_id), None)
     if not target:
@@ -113,7 +107,7 @@ def _resolve_path(path_value: str, *, pack_root: Path) -> Path:
     return (Path.cwd() / raw).resolve()
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate capability arbitration contract")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-id", required=True)
@@ -121,7 +115,7 @@ def main() -> int:
     ap.add_argument("--upgrade-report", default="", help="optional execute_identity_upgrade report path")
     ap.add_argument("--metrics-path", default="")
     ap.add_argument("--self-test", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     try:
         task_path = _resolve_current_task(Path(args.catalog), args.identity_id)
@@ -385,4 +379,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -7,7 +7,7 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-import yaml
+from identity_catalog_common import load_yaml_object
 
 REPO_FIXTURE_CONFIRM_TOKEN = "I_UNDERSTAND_REPO_FIXTURE_WRITE"
 
@@ -21,27 +21,20 @@ def _contains(text: str, pattern: str) -> bool:
     return pattern in text
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"yaml root must be object: {path}")
-    return data
-
-
 def _find_identity(catalog_path: Path, identity_id: str) -> dict[str, Any] | None:
     if not catalog_path.exists():
         return None
-    doc = _load_yaml(catalog_path)
+    doc = load_yaml_object(catalog_path)
     rows = [x for x in (doc.get("identities") or []) if isinstance(x, dict)]
     return next((x for x in rows if str(x.get("id", "")).strip() == identity_id), None)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description="Boundary regression for create_identity_pack.py (repo fixture escape-hatch hardening)."
     )
     ap.add_argument("--repo-root", default=".")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     repo_root = Path(args.repo_root).expanduser().resolve()
     create_script = repo_root / "scripts" / "create_identity_pack.py"
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +21,8 @@ from dialogue_governance_common import (
     resolve_report_path,
     top3_thresholds,
 )
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 
 REQ_SYNTHESIS_FIELDS = (
     "user_objective",
@@ -104,18 +105,18 @@ def _derive_counts(report: dict[str, Any], synthesis: dict[str, Any]) -> dict[st
     return counts
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate dialogue synthesis content governance contract.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--report", default="")
     ap.add_argument("--report-dir", default="")
     ap.add_argument("--enforce-mode", choices=["auto", "warn", "enforce"], default="auto")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     try:
         pack_path, task_path = resolve_pack_and_task(Path(args.catalog).expanduser().resolve(), args.identity_id)
-        task = json.loads(task_path.read_text(encoding="utf-8"))
+        task = load_json_document(task_path)
     except Exception as exc:
         print(f"[FAIL] {exc}")
         return 1
@@ -142,7 +143,7 @@ def main() -> int:
         return enforce_outcome(mode=mode, failures=failures, warnings=warnings, summary={"identity_id": args.identity_id})
 
     try:
-        report = json.loads(report_path.read_text(encoding="utf-8"))
+        report = load_json_document(report_path)
     except Exception as exc:
         failures.append(f"IP-DCIC-001 report json invalid: {report_path} ({exc})")
         return enforce_outcome(mode=mode, failures=failures, warnings=warnings, summary={"identity_id": args.identity_id})
@@ -218,5 +219,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
-
+    raise SystemExit(identity_batch_main(main))
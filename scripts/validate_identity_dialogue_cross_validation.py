@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +17,8 @@ from dialogue_governance_common import (
     resolve_report_path,
     top3_thresholds,
 )
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 
 
 def _trace_rows(report: dict[str, Any]) -> list[dict[str, Any]]:
@@ -42,18 +43,18 @@ def _reconciled(row: dict[str, Any]) -> bool:
     return state in {"rebuilt", "resolved", "reconciled"}
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate dialogue cross-validation trace matrix governance contract.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--report", default="")
     ap.add_argument("--report-dir", default="")
     ap.add_argument("--enforce-mode", choices=["auto", "warn", "enforce"], default="auto")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     try:
         pack_path, task_path = resolve_pack_and_task(Path(args.catalog).expanduser().resolve(), args.identity_id)
-        task = json.loads(task_path.read_text(encoding="utf-8"))
+        task = load_json_document(task_path)
     except Exception as exc:
         print(f"[FAIL] {exc}")
         return 1
@@ -80,7 +81,7 @@ def main() -> int:
         return enforce_outcome(mode=mode, failures=failures, warnings=warnings, summary={"identity_id": args.identity_id})
 
     try:
-        report = json.loads(report_path.read_text(encoding="utf-8"))
+        report = load_json_document(report_path)
     except Exception as exc:
         failures.append(f"IP-DCIC-002 report json invalid: {report_path} ({exc})")
         return enforce_outcome(mode=mode, failures=failures, warnings=warnings, summary={"identity_id": args.identity_id})
@@ -156,5 +157,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
-
+    raise SystemExit(identity_batch_main(main))
@@ -6,6 +6,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 from resolve_identity_context import resolve_identity
 
 ERR_REPORT_PATH_CONTRACT = "IP-PATH-002"
@@ -13,7 +15,7 @@ ERR_REPORT_PATH_CONTRACT = "IP-PATH-002"
 
 def _safe_json(path: Path) -> dict[str, Any]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = load_json_document(path)
     except Exception:
         return {}
     return data if isinstance(data, dict) else {}
@@ -37,14 +39,14 @@ def _canonical(path_raw: str) -> tuple[Path | None, list[str]]:
     return resolved, reasons
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate execution report resolved_pack_path contract.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--report", required=True)
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     report_path = Path(args.report).expanduser().resolve()
@@ -132,4 +134,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
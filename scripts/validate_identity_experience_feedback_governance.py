@@ -3,12 +3,13 @@ from __future__ import annotations
 
 import argparse
 import glob
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
+
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_object
 
 REQ_KEYS = [
     "required",
@@ -40,19 +41,12 @@ REQ_FEEDBACK_FIELDS = [
 ALLOWED_EXPORT_SCOPE = {"instance-only", "aggregated-only"}
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
-
-
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_document(path)
 
 
 def _resolve_current_task(catalog_path: Path, identity_id: str) -> Path:
-    catalog = _load_yaml(catalog_path)
+    catalog = load_yaml_object(catalog_path)
     identities = catalog.get("identities") or []
     target = next((x for x in identities if str((x or {}).get("id", "")).strip() == identity_id), None)
     if not target:
@@ -69,7 +63,7 @@ def _resolve_current_task(catalog_path: Path, identity_id: str) -> Path:
 
 
 def _resolve_identity_row(catalog_path: Path, identity_id: str) -> dict[str, Any] | None:
-    catalog = _load_yaml(catalog_path)
+    catalog = load_yaml_object(catalog_path)
     identities = catalog.get("identities") or []
     return next((x for x in identities if str((x or {}).get("id", "")).strip() == identity_id), None)
 
@@ -121,12 +115,12 @@ def _identity_scoped_logs(paths: list[Path], identity_id: str) -> list[Path]:
     return scoped or paths
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate experience feedback governance controls")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--report", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog)
     try:
@@ -249,4 +243,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -6,21 +6,15 @@ import json
 from pathlib import Path
 from typing import Any
 
-import yaml
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 from resolve_identity_context import default_local_catalog_path, merged_catalog
 from tool_vendor_governance_common import latest_identity_upgrade_report
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"yaml root must be object: {path}")
-    return data
+    return load_json_document(path)
 
 
 def _resolve_pack(identity_id: str, repo_catalog_path: Path, local_catalog_path: Path) -> Path:
@@ -116,7 +110,7 @@ def _load_rulebook_rows(path: Path) -> list[dict[str, Any]]:
     return rows
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate experience writeback after identity upgrade execution.")
     ap.add_argument("--catalog", default="", help="legacy alias; when set, used as repo catalog path")
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
@@ -124,7 +118,7 @@ def main() -> int:
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--execution-report", default="")
     ap.add_argument("--report", default="", help="alias of --execution-report")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     try:
         repo_catalog = Path(args.catalog).expanduser().resolve() if args.catalog else Path(args.repo_catalog).expanduser().resolve()
@@ -210,4 +204,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
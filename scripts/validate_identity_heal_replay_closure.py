@@ -6,6 +6,9 @@ import json
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+
 ERR_MISSING = "IP-HEAL-001"
 ERR_REF_MISMATCH = "IP-HEAL-002"
 ERR_POST_VALIDATE = "IP-HEAL-003"
@@ -29,16 +32,16 @@ def _emit(payload: dict[str, Any], json_only: bool) -> int:
 
 
 def _read_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_document(path)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate health->heal->post-validate replay closure refs.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--heal-report", default="")
     ap.add_argument("--report-dir", default="/tmp/identity-heal-reports")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     stale_reasons: list[str] = []
     error_code = ""
@@ -143,5 +146,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
-
+    raise SystemExit(identity_batch_main(main))
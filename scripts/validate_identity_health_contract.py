@@ -2,22 +2,24 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+
 
 def _latest_for_identity(report_dir: Path, identity_id: str) -> Path | None:
     rows = sorted(report_dir.glob(f"identity-health-{identity_id}-*.json"), key=lambda p: p.stat().st_mtime)
     return rows[-1] if rows else None
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity health report contract.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--report", default="")
     ap.add_argument("--report-dir", default="/tmp/identity-health-reports")
     ap.add_argument("--require-pass", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     if args.report:
         path = Path(args.report).expanduser().resolve()
@@ -32,7 +34,7 @@ def main() -> int:
         print(f"[FAIL] report not found: {path}")
         return 1
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_json_document(path)
     required = ["report_id", "generated_at", "identity_id", "overall_status", "warning_count", "failed_count", "checks", "recommendations"]
     miss = [k for k in required if k not in data]
     if miss:
@@ -92,4 +94,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
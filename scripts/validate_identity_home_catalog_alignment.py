@@ -2,20 +2,21 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 from pathlib import Path
 from typing import Any
 
-import yaml
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_yaml_document
 from resolve_identity_context import resolve_identity
+from result_channel_common import print_result
 
 ERR_HOME_CATALOG_ALIGNMENT = "IP-PATH-003"
 
 
 def _load_catalog(path: Path) -> dict[str, Any]:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    raw = load_yaml_document(path) or {}
     if not isinstance(raw, dict):
         raise ValueError(f"catalog root must be object: {path}")
     return raw
@@ -39,14 +40,14 @@ def _resolve_identity_home(explicit_identity_home: str) -> tuple[Path, str]:
     return (Path.home() / ".codex" / "identity").resolve(), "default:~/.codex/identity"
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity_home == dirname(identity_catalog) alignment for runtime mutation flows.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-home", default="", help="optional explicit identity_home; defaults to IDENTITY_HOME/CODEX_HOME resolution")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -74,10 +75,10 @@ def main() -> int:
             "stale_reasons": ["identity_not_found_in_catalog"],
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[FAIL] {ERR_HOME_CATALOG_ALIGNMENT} identity not found in catalog: {args.identity_id}")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 1
 
     profile = str(row.get("profile", "")).strip().lower()
@@ -116,10 +117,10 @@ def main() -> int:
             "stale_reasons": ["fixture_profile_scope"],
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[OK] identity home/catalog alignment skipped for fixture identity={args.identity_id}")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 0
 
     if identity_home != identity_home_expected:
@@ -141,7 +142,7 @@ def main() -> int:
     }
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if ok:
             print(
@@ -153,9 +154,9 @@ def main() -> int:
                 f"[FAIL] {ERR_HOME_CATALOG_ALIGNMENT} identity home/catalog alignment gate failed: "
                 f"identity={args.identity_id} identity_home={identity_home} catalog_parent={identity_home_expected}"
             )
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
     return 0 if ok else 1
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -4,6 +4,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from identity_batch_common import identity_batch_main
 from resolve_identity_context import resolve_identity, resolve_protocol_root
 
 
@@ -15,7 +16,7 @@ def _is_within(path: Path, root: Path) -> bool:
         return False
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate runtime identity instance isolation boundary.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -23,7 +24,7 @@ def main() -> int:
     ap.add_argument("--scope", default="USER")
     ap.add_argument("--protocol-root", default="")
     ap.add_argument("--allow-protocol-root-pack", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     ctx = resolve_identity(
         args.identity_id,
@@ -51,5 +52,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
-
+    raise SystemExit(identity_batch_main(main))
@@ -6,18 +6,12 @@ import json
 from pathlib import Path
 from typing import Any
 
-import yaml
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import catalog_row, load_json_document, load_yaml_object
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
+    return load_json_document(path)
 
 
 def _fail(msg: str) -> int:
@@ -32,10 +26,9 @@ def _resolve_current_task(catalog_path: Path, override: str, identity_id: str) -
             raise FileNotFoundError(f"override current task not found: {p}")
         return p, identity_id or "(override)", p.parent
 
-    catalog = _load_yaml(catalog_path)
+    catalog = load_yaml_object(catalog_path)
     target_id = identity_id or str(catalog.get("default_identity", "")).strip()
-    identities = catalog.get("identities") or []
-    active = next((x for x in identities if str(x.get("id", "")).strip() == target_id), None)
+    active = catalog_row(catalog_path, target_id)
     if not active:
         raise FileNotFoundError(f"identity not found in catalog: {target_id}")
 
@@ -77,14 +70,14 @@ def _resolve_rulebook_path(rulebook_raw: str, *, pack_dir: Path) -> Path:
     return pack_relative
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity learning loop evidence (reasoning + rulebook linkage)")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-id", default="", help="validate for explicit identity id")
     ap.add_argument("--current-task", default="")
     ap.add_argument("--run-report", default="")
     ap.add_argument("--rulebook", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog)
     if not catalog_path.exists():
@@ -182,4 +175,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
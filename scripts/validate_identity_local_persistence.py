@@ -3,20 +3,11 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-from typing import Any
-
-import yaml
 
+from identity_catalog_common import load_yaml_object
 from resolve_identity_context import default_local_catalog_path, load_yaml_or_empty
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"yaml root must be object: {path}")
-    return data
-
-
 def _is_repo_path(path: str, repo_root: Path) -> bool:
     if not path:
         return False
@@ -28,15 +19,15 @@ def _is_repo_path(path: str, repo_root: Path) -> bool:
     return str(p).startswith(str(repo_root))
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate local-instance persistence boundary (fixture/demo vs local runtime).")
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--local-catalog", default=str(default_local_catalog_path()))
     ap.add_argument("--runtime-mode", action="store_true", help="enforce local catalog existence for runtime operations")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     repo_root = Path.cwd().resolve()
-    repo_catalog = _load_yaml(Path(args.repo_catalog))
+    repo_catalog = load_yaml_object(Path(args.repo_catalog))
     local_catalog_path = Path(args.local_catalog).expanduser().resolve()
     local_catalog = load_yaml_or_empty(local_catalog_path)
 
@@ -7,7 +7,7 @@ import sys
 from pathlib import Path
 from typing import Any
 
-import yaml
+from identity_catalog_common import load_yaml_document
 
 
 def fail(msg: str) -> int:
@@ -26,7 +26,7 @@ def main() -> int:
         return fail(f"missing catalog file: {catalog_path}")
 
     # We intentionally perform semantic checks here to avoid hard dependency on jsonschema package.
-    catalog: dict[str, Any] = yaml.safe_load(catalog_path.read_text(encoding='utf-8')) or {}
+    catalog: dict[str, Any] = load_yaml_document(catalog_path) or {}
 
     for key in ('version', 'default_identity', 'identities'):
         if key not in catalog:
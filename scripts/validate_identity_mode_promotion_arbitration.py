@@ -2,24 +2,21 @@
 from __future__ import annotations
 
 import argparse
-import json
-import subprocess
 from pathlib import Path
 from typing import Any
 
-HIGH_IMPACT = {"CURRENT_TASK.json", "IDENTITY_PROMPT.md", "RULEBOOK.jsonl"}
-
+from git_facts_common import changed_files, rev_parse
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 
-def _run(cmd: list[str]) -> tuple[int, str]:
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    return p.returncode, (p.stdout or "").strip()
+HIGH_IMPACT = {"CURRENT_TASK.json", "IDENTITY_PROMPT.md", "RULEBOOK.jsonl"}
 
 
 def _changed(base: str, head: str) -> list[str]:
-    rc, out = _run(["git", "diff", "--name-only", f"{base}..{head}"])
-    if rc != 0:
+    try:
+        return changed_files(base, head)
+    except RuntimeError:
         return []
-    return [x.strip() for x in out.splitlines() if x.strip()]
 
 
 def _latest_report(identity_id: str) -> Path | None:
@@ -32,7 +29,7 @@ def _latest_report(identity_id: str) -> Path | None:
 
 
 def _load(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_document(path)
 
 
 def _is_high_impact(identity_id: str, files: list[str]) -> bool:
@@ -44,21 +41,20 @@ def _is_high_impact(identity_id: str, files: list[str]) -> bool:
     return False
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate mode-B promotion arbitration for high-impact identity changes")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--base", default="")
     ap.add_argument("--head", default="HEAD")
     ap.add_argument("--report", default="", help="optional explicit upgrade execution report")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     base = args.base.strip()
     if not base:
-        rc, out = _run(["git", "rev-parse", "HEAD~1"])
-        if rc != 0:
+        base = rev_parse("HEAD~1")
+        if not base:
             print("[WARN] cannot resolve base; skip promotion arbitration check")
             return 0
-        base = out
 
     files = _changed(base, args.head)
     if not files:
@@ -113,4 +109,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -4,24 +4,21 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import subprocess
 from pathlib import Path
 from typing import Any
 
-import yaml
-
-ERR_PATH_NON_CANONICAL = "IP-PATH-001"
 
+from git_facts_common import toplevel
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_yaml_document
 
-def _run(cmd: list[str], cwd: Path) -> tuple[int, str]:
-    p = subprocess.run(cmd, cwd=str(cwd), capture_output=True, text=True)
-    return p.returncode, (p.stdout or "").strip()
+ERR_PATH_NON_CANONICAL = "IP-PATH-001"
 
 
 def _detect_repo_root(start: Path | None = None) -> Path:
     base = (start or Path.cwd()).resolve()
-    rc, out = _run(["git", "rev-parse", "--show-toplevel"], base)
-    if rc == 0 and out:
+    out = toplevel(base)
+    if out:
         return Path(out).expanduser().resolve()
     for parent in [base, *base.parents]:
         if (parent / ".git").exists():
@@ -30,7 +27,7 @@ def _detect_repo_root(start: Path | None = None) -> Path:
 
 
 def _load_catalog(path: Path) -> dict[str, Any]:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    raw = load_yaml_document(path) or {}
     if not isinstance(raw, dict):
         raise ValueError(f"catalog root must be object: {path}")
     return raw
@@ -90,12 +87,12 @@ def _resolve_allowed_roots(catalog_path: Path, repo_root: Path, *, is_fixture: b
     return uniq
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate catalog pack_path canonical absolute contract.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -185,4 +182,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+
 ALLOWED_STATES = {
     "PRECHECK",
     "RUN_READONLY",
@@ -34,21 +36,21 @@ def _latest(identity_id: str, report_dir: Path) -> Path | None:
     return rows[-1] if rows else None
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate permission-state contract in identity upgrade report.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--report", default="")
     ap.add_argument("--report-dir", default="/tmp/identity-upgrade-reports")
     ap.add_argument("--require-written", action="store_true")
     ap.add_argument("--ci", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     report_path = Path(args.report).expanduser().resolve() if args.report else _latest(args.identity_id, Path(args.report_dir).expanduser().resolve())
     if report_path is None or not report_path.exists():
         print(f"[FAIL] execution report not found for identity={args.identity_id}")
         return 1
 
-    data = json.loads(report_path.read_text(encoding="utf-8"))
+    data = load_json_document(report_path)
     state = str(data.get("permission_state", "")).strip()
     code = str(data.get("permission_error_code", "")).strip()
     wb = str(data.get("writeback_status", "")).strip()
@@ -85,4 +87,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -3,9 +3,10 @@ from __future__ import annotations
 
 import argparse
 import hashlib
-import json
 from pathlib import Path
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 from resolve_identity_context import resolve_identity
 
 
@@ -23,7 +24,7 @@ def _latest(identity_id: str, report_dir: Path) -> Path | None:
     return rows[-1] if rows else None
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate IDENTITY_PROMPT activation contract from execution report.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -31,7 +32,7 @@ def main() -> int:
     ap.add_argument("--report", default="")
     ap.add_argument("--report-dir", default="/tmp/identity-upgrade-reports")
     ap.add_argument("--scope", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     report_path = Path(args.report).expanduser().resolve() if args.report else _latest(
         args.identity_id, Path(args.report_dir).expanduser().resolve()
@@ -39,7 +40,7 @@ def main() -> int:
     if report_path is None or not report_path.exists():
         print(f"[FAIL] execution report not found for identity={args.identity_id}")
         return 1
-    data = json.loads(report_path.read_text(encoding="utf-8"))
+    data = load_json_document(report_path)
 
     required = [
         "identity_prompt_path",
@@ -104,5 +105,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
-
+    raise SystemExit(identity_batch_main(main))
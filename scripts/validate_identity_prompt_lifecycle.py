@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import argparse
 import hashlib
-import json
 from pathlib import Path
 from typing import Iterable
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+
 
 def _latest(identity_id: str, report_dir: Path) -> Path | None:
     rows = sorted(report_dir.glob(f"identity-upgrade-exec-{identity_id}-*.json"), key=lambda p: p.stat().st_mtime)
@@ -24,7 +26,7 @@ def _sha256(path: Path) -> str:
 
 def _safe_json(path: Path) -> dict:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = load_json_document(path)
     except Exception:
         return {}
     return data if isinstance(data, dict) else {}
@@ -77,12 +79,12 @@ def _resolve_artifact_path(raw_path: str, *, report_path: Path, pack_root: Path
     return (ordered[0] if ordered else None), ordered
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate IDENTITY_PROMPT lifecycle contract in upgrade reports.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--report", default="")
     ap.add_argument("--report-dir", default="/tmp/identity-upgrade-reports")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     report_path = Path(args.report).expanduser().resolve() if args.report else _latest(
         args.identity_id, Path(args.report_dir).expanduser().resolve()
@@ -90,7 +92,7 @@ def main() -> int:
     if report_path is None or not report_path.exists():
         print(f"[FAIL] execution report not found for identity={args.identity_id}")
         return 1
-    data = json.loads(report_path.read_text(encoding="utf-8"))
+    data = load_json_document(report_path)
 
     required = [
         "upgrade_required",
@@ -238,4 +240,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
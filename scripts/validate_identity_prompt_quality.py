@@ -4,8 +4,9 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-import json
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import task_contract
 from resolve_identity_context import resolve_identity
 
 
@@ -38,13 +39,13 @@ def _score_prompt(
     return (len(fails) == 0), fails
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity prompt quality baseline for runtime governance.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True, help="local runtime catalog path")
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--scope", default="", help="optional explicit scope (USER|SYSTEM|...); use AUTO/empty to infer")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     preferred_scope = str(args.scope or "").strip()
     if preferred_scope.upper() == "AUTO":
@@ -69,9 +70,8 @@ def main() -> int:
     forbid_template_markers: list[str] = []
     if task_path.exists():
         try:
-            task = json.loads(task_path.read_text(encoding="utf-8"))
-            contract = task.get("identity_prompt_activation_contract") or {}
-            if isinstance(contract, dict):
+            contract = task_contract(task_path, "identity_prompt_activation_contract")
+            if contract:
                 min_prompt_bytes = int(contract.get("min_prompt_bytes", 200))
                 required_sections = [str(x) for x in (contract.get("required_sections") or []) if str(x).strip()]
                 forbid_template_markers = [
@@ -95,4 +95,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -7,9 +7,10 @@ import json
 from pathlib import Path
 from typing import Any
 
-import yaml
 from jsonschema import validate as jsonschema_validate
 
+from identity_catalog_common import load_current_task, load_yaml_object
+
 REQ_TASK_KEYS = {
     "objective",
     "state_machine",
@@ -49,13 +50,6 @@ def fail(msg: str) -> int:
     return 1
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
-
-
 def _resolve_pack_path(root: Path, item: dict[str, Any]) -> Path | None:
     pack_path = str(item.get("pack_path", "")).strip()
     if pack_path:
@@ -82,7 +76,7 @@ def main() -> int:
         return fail(f"missing catalog file: {catalog_path}")
 
     schema = json.loads(schema_path.read_text(encoding='utf-8'))
-    catalog: dict[str, Any] = _load_yaml(catalog_path)
+    catalog: dict[str, Any] = load_yaml_object(catalog_path)
 
     try:
         jsonschema_validate(catalog, schema)
@@ -130,7 +124,7 @@ def main() -> int:
         task_path = pack_dir / 'CURRENT_TASK.json'
         if task_path.exists():
             try:
-                task = json.loads(task_path.read_text(encoding='utf-8'))
+                task = load_current_task(task_path)
             except Exception as e:
                 print(f"[FAIL] {prefix} invalid CURRENT_TASK.json: {e}")
                 rc = 1
@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import re
-import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from execution_report_index_common import collect_execution_reports
+from git_facts_common import ancestry, head_sha
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 from resolve_identity_context import resolve_identity
+from result_channel_common import print_result
 
 ERR_BASELINE_STALE = "IP-PBL-001"
 ERR_REPORT_INVALID = "IP-PBL-002"
@@ -34,29 +37,17 @@ class BaselineResult:
     head_drift_detected: bool
 
 
-def _run(cmd: list[str]) -> tuple[int, str, str]:
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    return p.returncode, (p.stdout or "").strip(), (p.stderr or "").strip()
-
-
 def _safe_json(path: Path) -> dict[str, Any]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = load_json_document(path)
     except Exception:
         return {}
     return data if isinstance(data, dict) else {}
 
 
 def _collect_from_roots(identity_id: str, roots: list[Path]) -> list[Path]:
-    rows: list[Path] = []
-    for root in roots:
-        if not root.exists():
-            continue
-        for p in root.glob(f"**/identity-upgrade-exec-{identity_id}-*.json"):
-            if p.name.endswith("-patch-plan.json"):
-                continue
-            rows.append(p.resolve())
-    return sorted(set(rows), key=lambda p: p.stat().st_mtime, reverse=True)
+    rows = {p.resolve() for p in collect_execution_reports(identity_id, roots)}
+    return sorted(rows, key=lambda p: p.stat().st_mtime, reverse=True)
 
 
 def _collect_reports(identity_id: str, resolved_pack_path: Path, explicit_report: str) -> list[Path]:
@@ -83,22 +74,14 @@ def _collect_reports(identity_id: str, resolved_pack_path: Path, explicit_report
 
 
 def _resolve_current_head(protocol_root: Path) -> tuple[str, str]:
-    rc, out, _ = _run(["git", "-C", str(protocol_root), "rev-parse", "HEAD"])
-    if rc != 0:
-        return "", ERR_PROTOCOL_ROOT_UNAVAILABLE
-    head = out.strip().lower()
+    head = head_sha(protocol_root).lower()
     if not SHA40_RE.fullmatch(head):
         return "", ERR_PROTOCOL_ROOT_UNAVAILABLE
     return head, ""
 
 
 def _resolve_lag_commits(protocol_root: Path, old_sha: str, new_sha: str) -> int | None:
-    rc_anc, _, _ = _run(["git", "-C", str(protocol_root), "merge-base", "--is-ancestor", old_sha, new_sha])
-    if rc_anc == 0:
-        rc_count, out, _ = _run(["git", "-C", str(protocol_root), "rev-list", "--count", f"{old_sha}..{new_sha}"])
-        if rc_count == 0 and out.strip().isdigit():
-            return int(out.strip())
-    return None
+    return ancestry(old_sha, new_sha, protocol_root)["lag"]
 
 
 def _evaluate(
@@ -243,7 +226,7 @@ def _evaluate(
     )
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate protocol baseline freshness for identity execution report.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -251,7 +234,7 @@ def main() -> int:
     ap.add_argument("--execution-report", default="")
     ap.add_argument("--baseline-policy", choices=["strict", "warn"], default="warn")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -294,10 +277,10 @@ def main() -> int:
             "stale_reasons": ["execution_report_not_found"],
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[WARN] {ERR_REPORT_INVALID} execution report not found for identity={args.identity_id}")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 1 if args.baseline_policy == "strict" else 0
 
     selected = reports[0]
@@ -321,10 +304,10 @@ def main() -> int:
             "stale_reasons": ["execution_report_invalid_json"],
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[WARN] {ERR_REPORT_INVALID} invalid execution report json: {selected}")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 1 if args.baseline_policy == "strict" else 0
 
     result = _evaluate(report_data, baseline_policy=args.baseline_policy)
@@ -346,7 +329,7 @@ def main() -> int:
     }
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if result.status == "PASS":
             print(
@@ -358,7 +341,7 @@ def main() -> int:
                 f"[WARN] {result.error_code} protocol baseline stale: "
                 f"identity={args.identity_id} report={selected}"
             )
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
     if result.status == "FAIL":
         return 1
@@ -366,4 +349,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import argparse
-import json
 import re
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+
 REQ_FIELDS = [
     "protocol_mode",
     "protocol_root",
@@ -21,7 +23,7 @@ VALID_MODES = {"mode_a_shared", "mode_b_standalone"}
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_document(path)
 
 
 def _iter_reports(identity_id: str) -> list[Path]:
@@ -45,11 +47,11 @@ def _is_abs_path(v: str) -> bool:
         return False
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate protocol-root evidence fields in creator/installer/update reports")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--report", default="", help="optional explicit report path")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     reports: list[Path] = []
     if args.report:
@@ -128,4 +130,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -7,7 +7,9 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
 from resolve_identity_context import resolve_identity
+from result_channel_common import print_result
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
 STATUS_WARN_NON_BLOCKING = "WARN_NON_BLOCKING"
@@ -55,7 +57,7 @@ def _tail(out: str, err: str) -> str:
     return merged.splitlines()[-1]
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description="Validate protocol version alignment as one tuple across report/prompt/task/binding context."
     )
@@ -67,7 +69,7 @@ def main() -> int:
     ap.add_argument("--operation", choices=sorted(STRICT_OPERATIONS | INSPECTION_OPERATIONS), default="validate")
     ap.add_argument("--alignment-policy", choices=["strict", "warn"], default="strict")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -272,7 +274,7 @@ def main() -> int:
     }
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if status == STATUS_PASS_REQUIRED:
             print(
@@ -284,7 +286,7 @@ def main() -> int:
                 f"[WARN] {error_code} protocol version alignment drift: "
                 f"identity={args.identity_id} report={payload['report_selected_path']}"
             )
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
     if status == STATUS_FAIL_REQUIRED:
         return 1
@@ -292,4 +294,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
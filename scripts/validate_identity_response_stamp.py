@@ -7,6 +7,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_current_task, load_json_document, resolve_pack_and_task
 from response_stamp_common import (
     ALLOWED_SOURCE_LAYERS,
     ALLOWED_WORK_LAYERS,
@@ -17,7 +19,9 @@ from response_stamp_common import (
     render_external_stamp,
     resolve_stamp_context,
 )
-from tool_vendor_governance_common import contract_required, load_json
+from reply_log_stream_common import ReplyFirstLineScan, first_nonempty_line, scan_reply_first_lines
+from result_channel_common import print_result
+from tool_vendor_governance_common import contract_required
 
 ERR_STAMP_MISMATCH = "IP-ASB-STAMP-001"
 ERR_STAMP_SOURCE = "IP-ASB-STAMP-002"
@@ -46,26 +50,6 @@ def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
     return {}
 
 
-def _resolve_pack_and_task(catalog_path: Path, identity_id: str) -> tuple[Path, Path]:
-    import yaml
-
-    data = yaml.safe_load(catalog_path.read_text(encoding="utf-8")) or {}
-    rows = [x for x in (data.get("identities") or []) if isinstance(x, dict)]
-    row = next((x for x in rows if str(x.get("id", "")).strip() == identity_id), None)
-    if not row:
-        raise FileNotFoundError(f"identity id not found in catalog: {identity_id}")
-    pack_raw = str((row or {}).get("pack_path", "")).strip()
-    if not pack_raw:
-        raise FileNotFoundError(f"pack_path missing for identity: {identity_id}")
-    pack = Path(pack_raw).expanduser().resolve()
-    if not pack.exists():
-        raise FileNotFoundError(f"pack_path not found: {pack}")
-    task = pack / "CURRENT_TASK.json"
-    if not task.exists():
-        raise FileNotFoundError(f"CURRENT_TASK.json not found: {task}")
-    return pack, task
-
-
 def _looks_redacted(token: str) -> bool:
     t = str(token or "").strip()
     if not t:
@@ -84,107 +68,7 @@ def _emit_blocker(receipt_path: Path, payload: dict[str, Any]) -> None:
     receipt_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
-def _message_to_text(value: Any) -> str:
-    if isinstance(value, str):
-        return value
-    if isinstance(value, list):
-        parts: list[str] = []
-        for item in value:
-            if isinstance(item, str):
-                parts.append(item)
-            elif isinstance(item, dict):
-                text = item.get("text")
-                if isinstance(text, str):
-                    parts.append(text)
-                elif isinstance(item.get("content"), str):
-                    parts.append(str(item.get("content")))
-        return "\n".join([x for x in parts if x]).strip()
-    if isinstance(value, dict):
-        if isinstance(value.get("text"), str):
-            return str(value.get("text"))
-        if isinstance(value.get("content"), str):
-            return str(value.get("content"))
-    return ""
-
-
-def _extract_reply_samples(reply_log_path: Path) -> list[str]:
-    text = reply_log_path.read_text(encoding="utf-8", errors="ignore")
-    suffix = reply_log_path.suffix.lower()
-
-    if suffix == ".jsonl":
-        out: list[str] = []
-        for raw in text.splitlines():
-            raw = raw.strip()
-            if not raw:
-                continue
-            try:
-                row = json.loads(raw)
-            except Exception:
-                continue
-            if not isinstance(row, dict):
-                continue
-            role = str(row.get("role", "")).strip().lower()
-            if role and role not in {"assistant", "ai", "model"}:
-                continue
-            msg = _message_to_text(row.get("content"))
-            if not msg:
-                msg = _message_to_text(row.get("message"))
-            if not msg:
-                msg = _message_to_text(row.get("output"))
-            if msg:
-                out.append(msg)
-        return out
-
-    if suffix == ".json":
-        try:
-            doc = json.loads(text)
-        except Exception:
-            doc = None
-        out: list[str] = []
-        if isinstance(doc, dict):
-            replies = doc.get("replies")
-            if isinstance(replies, list):
-                for item in replies:
-                    msg = _message_to_text(item)
-                    if msg:
-                        out.append(msg)
-            messages = doc.get("messages")
-            if isinstance(messages, list):
-                for row in messages:
-                    if not isinstance(row, dict):
-                        continue
-                    role = str(row.get("role", "")).strip().lower()
-                    if role and role not in {"assistant", "ai", "model"}:
-                        continue
-                    msg = _message_to_text(row.get("content"))
-                    if msg:
-                        out.append(msg)
-            if not out:
-                msg = _message_to_text(doc.get("content"))
-                if msg:
-                    out.append(msg)
-        elif isinstance(doc, list):
-            for item in doc:
-                msg = _message_to_text(item)
-                if msg:
-                    out.append(msg)
-        return out
-
-    chunks = [x.strip() for x in text.split("\n---\n") if x.strip()]
-    if chunks:
-        return chunks
-    return [x.strip() for x in text.splitlines() if x.strip()]
-
-
-def _first_nonempty_line(text: str) -> str:
-    for line in str(text or "").splitlines():
-        s = line.strip()
-        if s:
-            return s
-    return ""
-
-
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate dynamic identity response stamp contract.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -201,6 +85,16 @@ def main() -> int:
             "when provided, each assistant reply is checked for first-line Identity-Context stamp."
         ),
     )
+    ap.add_argument(
+        "--reply-log-fail-fast",
+        action="store_true",
+        help="stop reading --reply-log at the first reply without the Identity-Context first line",
+    )
+    ap.add_argument(
+        "--reply-log-checkpoint",
+        action="store_true",
+        help="resume --reply-log (.jsonl/plain) from the offset of the last full scan; only appended replies are read",
+    )
     ap.add_argument("--require-dynamic", action="store_true")
     ap.add_argument("--require-redacted-external", action="store_true")
     ap.add_argument("--require-lock-match", action="store_true")
@@ -218,7 +112,7 @@ def main() -> int:
     ap.add_argument("--force-check", action="store_true", help="run checks even when contract.required is false")
     ap.add_argument("--blocker-receipt-out", default="")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -230,8 +124,8 @@ def main() -> int:
         return 2
 
     try:
-        _, task_path = _resolve_pack_and_task(catalog_path, args.identity_id)
-        task = load_json(task_path)
+        _, task_path = resolve_pack_and_task(catalog_path, args.identity_id)
+        task = load_current_task(task_path)
     except Exception as exc:
         print(f"[FAIL] {exc}")
         return 1
@@ -248,10 +142,10 @@ def main() -> int:
             "required_contract": False,
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[OK] response stamp contract not required for identity={args.identity_id}; skipped")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 0
 
     try:
@@ -267,14 +161,17 @@ def main() -> int:
         return 1
 
     reply_samples: list[str] = []
+    reply_scan: ReplyFirstLineScan | None = None
     disclosure_level = ""
     if args.reply_log.strip():
         reply_log_path = Path(args.reply_log).expanduser().resolve()
         if not reply_log_path.exists():
             print(f"[FAIL] reply log file not found: {reply_log_path}")
             return 1
-        reply_samples = _extract_reply_samples(reply_log_path)
-        stamp_line = _first_nonempty_line(reply_samples[0]) if reply_samples else ""
+        reply_scan = scan_reply_first_lines(
+            reply_log_path, fail_fast=args.reply_log_fail_fast, checkpoint=args.reply_log_checkpoint
+        )
+        stamp_line = reply_scan.first_line
     elif args.stamp_line.strip():
         stamp_line = args.stamp_line.strip()
         reply_samples = [stamp_line]
@@ -292,7 +189,7 @@ def main() -> int:
             print(f"[FAIL] stamp json file not found: {stamp_json_path}")
             return 1
         try:
-            stamp_json_payload = json.loads(stamp_json_path.read_text(encoding="utf-8"))
+            stamp_json_payload = load_json_document(stamp_json_path)
         except Exception as exc:
             print(f"[FAIL] stamp json invalid: {stamp_json_path} ({exc})")
             return 1
@@ -310,16 +207,16 @@ def main() -> int:
             stamp_line = render_external_stamp(ctx)
             reply_samples = [stamp_line]
 
-    sample_first_lines = [_first_nonempty_line(x) for x in reply_samples]
-    sample_first_lines = [x for x in sample_first_lines if x]
-    reply_stamp_missing_refs = [
-        idx for idx, line in enumerate(sample_first_lines, start=1) if not line.startswith("Identity-Context:")
-    ]
+    if reply_scan is None:
+        reply_scan = ReplyFirstLineScan()
+        for sample in reply_samples:
+            reply_scan.add(first_nonempty_line(sample))
+    reply_stamp_missing_refs = list(reply_scan.missing_refs)
     reply_stamp_missing_count = len(reply_stamp_missing_refs)
-    reply_sample_count = len(sample_first_lines)
+    reply_sample_count = reply_scan.sample_count
 
-    if not stamp_line and sample_first_lines:
-        stamp_line = sample_first_lines[0]
+    if not stamp_line and reply_scan.first_line:
+        stamp_line = reply_scan.first_line
 
     parsed = parse_identity_context_stamp(stamp_line)
     has_layer_context = bool(parsed.get("_has_layer_context", False))
@@ -464,6 +361,8 @@ def main() -> int:
         "reply_stamp_missing_refs": reply_stamp_missing_refs,
         "blocker_receipt_path": str(receipt_path) if not ok else "",
     }
+    if args.reply_log_fail_fast or args.reply_log_checkpoint:
+        payload["reply_log_scan"] = reply_scan.summary()
 
     if not ok:
         actual_identity_for_receipt = actual_identity or "MISSING_STAMP"
@@ -491,7 +390,7 @@ def main() -> int:
                 pass
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if ok:
             print(f"[OK] response stamp validated for identity={args.identity_id}")
@@ -499,10 +398,10 @@ def main() -> int:
         else:
             print(f"[FAIL] {error_code} response stamp validation failed for identity={args.identity_id}")
             print(f"blocker_receipt={receipt_path}")
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
     return 0 if ok else 1
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_current_task, load_json_document, resolve_pack_and_task
 from response_stamp_common import blocker_receipt, resolve_stamp_context
-from tool_vendor_governance_common import contract_required, load_json
+from result_channel_common import print_result
+from tool_vendor_governance_common import contract_required
 
 ERR_BLOCKER_RECEIPT = "IP-ASB-STAMP-001"
 
@@ -23,26 +25,6 @@ def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
     return {}
 
 
-def _resolve_pack_and_task(catalog_path: Path, identity_id: str) -> tuple[Path, Path]:
-    import yaml
-
-    data = yaml.safe_load(catalog_path.read_text(encoding="utf-8")) or {}
-    rows = [x for x in (data.get("identities") or []) if isinstance(x, dict)]
-    row = next((x for x in rows if str(x.get("id", "")).strip() == identity_id), None)
-    if not row:
-        raise FileNotFoundError(f"identity id not found in catalog: {identity_id}")
-    pack_raw = str((row or {}).get("pack_path", "")).strip()
-    if not pack_raw:
-        raise FileNotFoundError(f"pack_path missing for identity: {identity_id}")
-    pack = Path(pack_raw).expanduser().resolve()
-    if not pack.exists():
-        raise FileNotFoundError(f"pack_path not found: {pack}")
-    task = pack / "CURRENT_TASK.json"
-    if not task.exists():
-        raise FileNotFoundError(f"CURRENT_TASK.json not found: {task}")
-    return pack, task
-
-
 def _validate_receipt_schema(payload: dict[str, Any]) -> list[str]:
     required = (
         "error_code",
@@ -57,7 +39,7 @@ def _validate_receipt_schema(payload: dict[str, Any]) -> list[str]:
     return missing
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate blocker receipt contract for response stamp mismatch.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -65,7 +47,7 @@ def main() -> int:
     ap.add_argument("--receipt", default="")
     ap.add_argument("--force-check", action="store_true", help="run checks even when contract.required is false")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -77,8 +59,8 @@ def main() -> int:
         return 2
 
     try:
-        _, task_path = _resolve_pack_and_task(catalog_path, args.identity_id)
-        task = load_json(task_path)
+        _, task_path = resolve_pack_and_task(catalog_path, args.identity_id)
+        task = load_current_task(task_path)
     except Exception as exc:
         print(f"[FAIL] {exc}")
         return 1
@@ -95,10 +77,10 @@ def main() -> int:
             "receipt_path": "",
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[OK] response stamp blocker receipt contract not required for identity={args.identity_id}; skipped")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 0
 
     try:
@@ -115,7 +97,7 @@ def main() -> int:
     receipt_path = Path(args.receipt).expanduser().resolve() if args.receipt.strip() else None
     if receipt_path and receipt_path.exists():
         try:
-            receipt_payload = json.loads(receipt_path.read_text(encoding="utf-8"))
+            receipt_payload = load_json_document(receipt_path)
         except Exception as exc:
             print(f"[FAIL] {ERR_BLOCKER_RECEIPT} invalid receipt json: {receipt_path} ({exc})")
             return 1
@@ -146,13 +128,13 @@ def main() -> int:
         "receipt_fields": receipt_payload,
     }
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         print(f"[OK] response stamp blocker receipt validated for identity={args.identity_id}")
         print("validate_identity_response_stamp_blocker_receipt PASSED")
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
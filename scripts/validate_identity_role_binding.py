@@ -3,32 +3,26 @@ from __future__ import annotations
 
 import argparse
 import glob
-import json
 import re
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
+
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_object
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
-
-
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_document(path)
 
 
 def _resolve_identity(catalog_path: Path, identity_id: str) -> dict[str, Any]:
-    catalog = _load_yaml(catalog_path)
+    catalog = load_yaml_object(catalog_path)
     identities = catalog.get("identities") or []
     target = next((x for x in identities if str((x or {}).get("id", "")).strip() == identity_id), None)
     if not target:
@@ -37,7 +31,7 @@ def _resolve_identity(catalog_path: Path, identity_id: str) -> dict[str, Any]:
 
 
 def _all_identity_tokens(catalog_path: Path) -> list[str]:
-    catalog = _load_yaml(catalog_path)
+    catalog = load_yaml_object(catalog_path)
     rows = [x for x in (catalog.get("identities") or []) if isinstance(x, dict)]
     out: list[str] = []
     for r in rows:
@@ -126,12 +120,12 @@ def _run(cmd: list[str], *, cwd: Path | None = None) -> tuple[int, str, str]:
     return p.returncode, p.stdout.strip(), p.stderr.strip()
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity role-binding contract and activation switch guards")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--evidence", default="", help="optional explicit role-binding evidence json path")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     identity_id = args.identity_id.strip()
     catalog_path = Path(args.catalog)
@@ -300,7 +294,7 @@ def main() -> int:
 
         # promotion protection: active/default identities must be bound-ready or higher.
         identity_status = str((identity or {}).get("status", "")).strip().lower()
-        catalog = _load_yaml(catalog_path)
+        catalog = load_yaml_object(catalog_path)
         default_identity = str(catalog.get("default_identity", "")).strip()
         promotion_target = identity_status == "active" or default_identity == identity_id
         required_active_status = str(contract.get("active_binding_status_required", "")).strip() or "BOUND_ACTIVE"
@@ -317,4 +311,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -7,7 +7,9 @@ import json
 from pathlib import Path
 from typing import Any, Iterable
 
-import yaml
+
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_object
 
 REQ_TOP_LEVEL = [
     "objective",
@@ -84,14 +86,7 @@ def _fail(msg: str) -> int:
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
+    return load_json_document(path)
 
 
 def _source_signature(item: dict[str, Any]) -> str:
@@ -565,13 +560,13 @@ def _iter_target_identities(catalog: dict[str, Any], only_identity: str, all_ide
     return [x for x in identities if str(x.get("id", "")).strip() == default_id]
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity runtime ORRL contract")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--current-task", default="", help="optional explicit CURRENT_TASK path")
     ap.add_argument("--identity-id", default="", help="validate only this identity id")
     ap.add_argument("--all-identities", action="store_true", help="validate all identities from catalog")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog)
     if not catalog_path.exists():
@@ -585,7 +580,7 @@ def main() -> int:
         return rc
 
     try:
-        catalog = _load_yaml(catalog_path)
+        catalog = load_yaml_object(catalog_path)
     except Exception as e:
         return _fail(f"invalid catalog yaml: {e}")
 
@@ -610,4 +605,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -4,10 +4,11 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import subprocess
 from pathlib import Path
 from typing import Any
 
+from git_facts_common import toplevel
+from identity_batch_common import identity_batch_main
 from resolve_identity_context import resolve_identity
 
 
@@ -21,14 +22,9 @@ def _within(path: Path, root: Path) -> bool:
 
 def _detect_repo_root(start: Path | None = None) -> Path:
     base = (start or Path.cwd()).resolve()
-    p = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        cwd=str(base),
-        capture_output=True,
-        text=True,
-    )
-    if p.returncode == 0 and p.stdout.strip():
-        return Path(p.stdout.strip()).expanduser().resolve()
+    out = toplevel(base)
+    if out:
+        return Path(out).expanduser().resolve()
     for parent in [base, *base.parents]:
         if (parent / ".git").exists():
             return parent.resolve()
@@ -56,7 +52,7 @@ def _infer_runtime_mode(catalog_path: Path, project_identity_home: Path, global_
     return "custom"
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Fail-fast guard: validate runtime mode/catalog/pack binding before identity operations.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default="", help="local runtime catalog path (required unless IDENTITY_CATALOG is set)")
@@ -69,7 +65,7 @@ def main() -> int:
         help="auto requires catalog to map to project/global canonical mode",
     )
     ap.add_argument("--json", action="store_true", help="print full payload as JSON")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     explicit_catalog = args.catalog.strip()
     env_catalog = os.environ.get("IDENTITY_CATALOG", "").strip()
@@ -201,4 +197,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
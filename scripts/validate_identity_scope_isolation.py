@@ -4,25 +4,19 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-import yaml
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_yaml_object
 from resolve_identity_context import resolve_identity
 
 
-def _load_yaml(path: Path) -> dict:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"yaml root must be object: {path}")
-    return data
-
-
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate scope-isolation for an identity.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default="")
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--scope", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     local_catalog = Path(args.catalog).expanduser().resolve() if args.catalog else (Path.home() / ".codex" / "identity" / "catalog.local.yaml")
     repo_catalog = Path(args.repo_catalog).expanduser().resolve()
@@ -61,7 +55,7 @@ def main() -> int:
         return 1
 
     # no other identity may point to exact same pack path
-    catalog = _load_yaml(local_catalog if local_catalog.exists() else repo_catalog)
+    catalog = load_yaml_object(local_catalog if local_catalog.exists() else repo_catalog)
     collisions = []
     for row in catalog.get("identities", []) or []:
         if not isinstance(row, dict):
@@ -81,4 +75,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -4,19 +4,20 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from identity_batch_common import identity_batch_main
 from resolve_identity_context import resolve_identity
 
 
 RUNTIME_SCOPES = {"REPO", "USER", "ADMIN", "UNKNOWN"}
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate scope persistence policy (runtime vs fixture).")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default="")
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--scope", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     local_catalog = Path(args.catalog).expanduser().resolve() if args.catalog else (Path.home() / ".codex" / "identity" / "catalog.local.yaml")
     repo_catalog = Path(args.repo_catalog).expanduser().resolve()
@@ -65,4 +66,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
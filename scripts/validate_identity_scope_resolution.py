@@ -4,6 +4,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from identity_batch_common import identity_batch_main
 from resolve_identity_context import resolve_identity
 
 
@@ -34,13 +35,13 @@ def _probe_existing_instance_dirs(identity_id: str) -> list[Path]:
     return sorted(out)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity scope resolution is deterministic and conflict-safe.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", default="")
     ap.add_argument("--repo-catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--scope", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     local_catalog = Path(args.catalog).expanduser().resolve() if args.catalog else (Path.home() / ".codex" / "identity" / "catalog.local.yaml")
     repo_catalog = Path(args.repo_catalog).expanduser().resolve()
@@ -92,4 +93,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -2,41 +2,30 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
-import json
-import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
 
-
-def _run(cmd: list[str]) -> tuple[int, str, str]:
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    return p.returncode, p.stdout.strip(), p.stderr.strip()
+from check_log_store_common import check_log_sha256
+from git_facts_common import changed_files, rev_parse
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_object
 
 
 def _changed_files(base: str, head: str) -> list[str]:
-    rc, out, err = _run(["git", "diff", "--name-only", f"{base}..{head}"])
-    if rc != 0:
-        raise RuntimeError(f"git diff failed: {err or out}")
-    return [ln.strip() for ln in out.splitlines() if ln.strip()]
+    try:
+        return changed_files(base, head)
+    except RuntimeError as exc:
+        raise RuntimeError(f"git diff failed: {exc}") from exc
 
 
 def _load_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
-
-
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"yaml root must be object: {path}")
-    return data
+    return load_json_document(path)
 
 
 def _resolve_current_task(catalog_path: Path, identity_id: str) -> Path:
-    catalog = _load_yaml(catalog_path)
+    catalog = load_yaml_object(catalog_path)
     identities = catalog.get("identities") or []
     target = next((x for x in identities if str((x or {}).get("id", "")).strip() == identity_id), None)
     if not target:
@@ -52,14 +41,6 @@ def _resolve_current_task(catalog_path: Path, identity_id: str) -> Path:
     raise FileNotFoundError(f"CURRENT_TASK.json not found for identity: {identity_id}")
 
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def _parse_utc(ts: str) -> datetime | None:
     s = str(ts or "").strip()
     if not s:
@@ -91,7 +72,7 @@ def _parse_report_time(report: dict[str, Any]) -> datetime | None:
         return None
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description="Enforce that identity-core updates include self-upgrade execution evidence."
     )
@@ -103,14 +84,13 @@ def main() -> int:
     ap.add_argument("--require-ci-binding", action="store_true")
     ap.add_argument("--expect-github-run-id", default="")
     ap.add_argument("--expect-github-sha", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     if not args.base:
-        rc, out, _ = _run(["git", "rev-parse", "HEAD~1"])
-        if rc != 0:
+        args.base = rev_parse("HEAD~1")
+        if not args.base:
             print("[WARN] fallback base resolution failed; skip enforcement on first commit context")
             return 0
-        args.base = out.strip()
 
     try:
         changed = _changed_files(args.base, args.head)
@@ -268,7 +248,7 @@ def main() -> int:
                 invalid_check = True
                 break
             declared = str(cr.get("sha256", "")).strip()
-            actual = _sha256_file(lp)
+            actual = check_log_sha256(lp)
             if declared != actual:
                 print(
                     f"[FAIL] report.check_results[{i}] sha256 mismatch in {rel}: "
@@ -325,4 +305,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
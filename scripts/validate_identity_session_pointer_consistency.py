@@ -2,24 +2,17 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
-import yaml
 
 from actor_session_common import load_actor_binding, resolve_actor_id
-
-
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"yaml root must be object: {path}")
-    return data
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_object
 
 
 def _load_json(path: Path) -> dict[str, Any]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = load_json_document(path)
     if not isinstance(data, dict):
         raise ValueError(f"json root must be object: {path}")
     return data
@@ -81,7 +74,7 @@ def _validate_pointer(
     return True, "ok"
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description="Validate session pointer consistency under actor-scoped binding (multi-active aware)."
     )
@@ -114,14 +107,14 @@ def main() -> int:
         action="store_true",
         help="fail if mirror/legacy-mirror pointer is missing or inconsistent (default: warning-only)",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
         print(f"[FAIL] catalog not found: {catalog_path}")
         return 1
 
-    data = _load_yaml(catalog_path)
+    data = load_yaml_object(catalog_path)
     rows = [x for x in (data.get("identities") or []) if isinstance(x, dict)]
     active_rows = [x for x in rows if str(x.get("status", "")).strip().lower() == "active"]
     active_ids = [str(x.get("id", "")).strip() for x in active_rows if str(x.get("id", "")).strip()]
@@ -239,4 +232,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -7,7 +7,10 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
-import yaml
+
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_document
+from result_channel_common import print_result
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
 STATUS_WARN_NON_BLOCKING = "WARN_NON_BLOCKING"
@@ -44,7 +47,7 @@ REQUIRED_FIELDS = (
 
 
 def _load_catalog(path: Path) -> dict[str, Any]:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    raw = load_yaml_document(path) or {}
     return raw if isinstance(raw, dict) else {}
 
 
@@ -93,7 +96,7 @@ def _load_refresh_payload(args: argparse.Namespace) -> tuple[dict[str, Any], lis
             stale_reasons.append("refresh_json_not_found")
             return {}, stale_reasons, 1
         try:
-            data = json.loads(p.read_text(encoding="utf-8"))
+            data = load_json_document(p)
         except Exception:
             stale_reasons.append("refresh_json_invalid")
             return {}, stale_reasons, 1
@@ -133,12 +136,12 @@ def _load_refresh_payload(args: argparse.Namespace) -> tuple[dict[str, Any], lis
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity session refresh status contract and gate semantics.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -154,7 +157,7 @@ def main() -> int:
         help="strict operations fail on hard refresh drift; inspection operations downgrade to WARN where possible",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -333,4 +336,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -3,24 +3,16 @@ from __future__ import annotations
 
 import argparse
 from pathlib import Path
-from typing import Any
 
-import yaml
+from identity_catalog_common import load_yaml_object
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
-
-
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description="Validate identity state consistency: catalog is source-of-truth; META.status must match (if present)."
     )
     ap.add_argument("--catalog", default=str(Path.home() / ".codex" / "identity" / "catalog.local.yaml"))
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -28,7 +20,7 @@ def main() -> int:
         return 1
 
     try:
-        catalog = _load_yaml(catalog_path)
+        catalog = load_yaml_object(catalog_path)
     except Exception as e:
         print(f"[FAIL] invalid catalog yaml: {e}")
         return 1
@@ -63,7 +55,7 @@ def main() -> int:
             rc = 1
             continue
         try:
-            meta = _load_yaml(meta_path)
+            meta = load_yaml_object(meta_path)
         except Exception as e:
             print(f"[FAIL] invalid META.yaml for identity={iid}: {e}")
             rc = 1
@@ -3,11 +3,11 @@ from __future__ import annotations
 
 import argparse
 import glob
-import json
 from pathlib import Path
 from typing import Any
 
-import yaml
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import catalog_row, load_json_document
 
 REQ_RUNTIME_KEYS = [
     "required",
@@ -29,21 +29,12 @@ REQ_CASE_FIELDS = [
 ]
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
-
-
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_document(path)
 
 
 def _resolve_current_task(catalog_path: Path, identity_id: str) -> Path:
-    catalog = _load_yaml(catalog_path)
-    identities = catalog.get("identities") or []
-    target = next((x for x in identities if str((x or {}).get("id", "")).strip() == identity_id), None)
+    target = catalog_row(catalog_path, identity_id)
     if not target:
         raise FileNotFoundError(f"identity id not found in catalog: {identity_id}")
 
@@ -116,12 +107,12 @@ def _report_pattern_candidates(pattern: str, *, pack_root: Path, identity_id: st
     return candidates
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity trigger regression contract")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--report", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog)
     if not catalog_path.exists():
@@ -262,4 +253,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
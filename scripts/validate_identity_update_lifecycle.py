@@ -3,12 +3,13 @@ from __future__ import annotations
 
 import argparse
 import glob
-import hashlib
-import json
 from pathlib import Path
 from typing import Any
 
-import yaml
+
+from check_log_store_common import check_log_sha256
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document, load_yaml_object
 
 
 REQ_TOP = [
@@ -24,19 +25,12 @@ REQ_VALIDATION_KEYS = ["required_checks", "must_pass_all"]
 REQ_REPLAY_KEYS = ["replay_required", "replay_same_case_required", "replay_fail_action"]
 
 
-def _load_yaml(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be object: {path}")
-    return data
-
-
 def _load_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return load_json_document(path)
 
 
 def _resolve_current_task(catalog_path: Path, identity_id: str) -> Path:
-    catalog = _load_yaml(catalog_path)
+    catalog = load_yaml_object(catalog_path)
     identities = catalog.get("identities") or []
     target = next((x for x in identities if str((x or {}).get("id", "")).strip() == identity_id), None)
     if not target:
@@ -82,14 +76,6 @@ def _resolve_replay_evidence_path(identity_id: str, replay_contract: dict[str, A
     return Path(f"identity/runtime/examples/{identity_id}-update-replay-sample.json")
 
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def _resolve_path_with_pack(path_value: str, pack_root: Path) -> Path:
     raw = str(path_value or "").strip()
     p = Path(raw).expanduser()
@@ -101,12 +87,12 @@ def _resolve_path_with_pack(path_value: str, pack_root: Path) -> Path:
     return (Path.cwd() / raw).resolve()
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate identity update lifecycle contract")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--replay-evidence", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog)
     if not catalog_path.exists():
@@ -304,7 +290,7 @@ def main() -> int:
             print(f"[FAIL] replay evidence check_results[{i}].log_path not found: {lp}")
             return 1
         declared = str(cr.get("sha256", "")).strip()
-        actual = _sha256_file(lp)
+        actual = check_log_sha256(lp)
         if declared != actual:
             print(
                 f"[FAIL] replay evidence check_results[{i}] sha256 mismatch: "
@@ -336,4 +322,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
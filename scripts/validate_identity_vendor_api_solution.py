@@ -5,6 +5,7 @@ import argparse
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
 from tool_vendor_governance_common import contract_required, load_json, nonempty, resolve_pack_and_task, resolve_report_path
 
 
@@ -43,12 +44,12 @@ def _extract_option_matrix(report: dict[str, Any]) -> list[dict[str, Any]]:
     return []
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate vendor/API solution closure contract.")
     ap.add_argument("--catalog", default="identity/catalog/identities.yaml")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--report", default="")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     try:
         pack_path, task_path = resolve_pack_and_task(Path(args.catalog).expanduser().resolve(), args.identity_id)
@@ -141,5 +142,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
-
+    raise SystemExit(identity_batch_main(main))
@@ -3,12 +3,15 @@ from __future__ import annotations
 
 import argparse
 import fnmatch
-import json
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from git_facts_common import rev_parse
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, resolve_pack_and_task, resolve_report_path
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -36,12 +39,16 @@ REQUIRED_OVERRIDE_FIELDS = ("approved_by", "ticket_id", "purpose", "scope_paths"
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _run_git(args: list[str], *, cwd: Path) -> str:
+    if len(args) == 2 and args[0] == "rev-parse":
+        resolved = rev_parse(args[1], cwd)
+        if resolved:
+            return resolved
     p = subprocess.run(["git", *args], capture_output=True, text=True, cwd=str(cwd))
     if p.returncode != 0:
         raise RuntimeError((p.stderr or p.stdout or "git command failed").strip())
@@ -120,7 +127,7 @@ def _load_patch_surface(path: Path) -> list[str]:
     if not path.exists():
         return []
     try:
-        doc = json.loads(path.read_text(encoding="utf-8"))
+        doc = load_json_document(path)
     except Exception:
         return []
     rows = doc.get("patch_surface")
@@ -185,7 +192,7 @@ def _validate_override_receipt(path: Path, blocked_paths: list[str]) -> tuple[bo
     if not path.exists():
         return False, ["override_receipt_missing"], payload
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = load_json_document(path)
     except Exception:
         return False, ["override_receipt_invalid_json"], payload
     if not isinstance(payload, dict):
@@ -213,7 +220,7 @@ def _validate_override_receipt(path: Path, blocked_paths: list[str]) -> tuple[bo
     return not reasons, reasons, payload
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate instance-to-base-repo mutation boundary (docs allowlist / code denylist).")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -226,7 +233,7 @@ def main() -> int:
     ap.add_argument("--check-git-diff", action="store_true")
     ap.add_argument("--override-receipt", default="")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     repo_root = Path(__file__).resolve().parents[1]
     catalog_path = Path(args.catalog).expanduser().resolve()
@@ -300,7 +307,7 @@ def main() -> int:
 
     if report_path is not None:
         try:
-            report_doc = json.loads(report_path.read_text(encoding="utf-8"))
+            report_doc = load_json_document(report_path)
         except Exception:
             report_doc = {}
         artifacts = _iter_report_artifacts(report_doc)
@@ -411,4 +418,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
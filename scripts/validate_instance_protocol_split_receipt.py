@@ -7,6 +7,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 from protocol_feedback_lane_common import (
     build_correlation_keys,
     collect_protocol_feedback_activity,
@@ -14,6 +16,7 @@ from protocol_feedback_lane_common import (
     discover_default_correlation_keys,
 )
 from response_stamp_common import resolve_layer_intent, resolve_stamp_context
+from result_channel_common import print_result
 from tool_vendor_governance_common import boolish, contract_required, load_json, resolve_pack_and_task, resolve_report_path
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -65,9 +68,9 @@ STRICT_OPERATIONS = {"activate", "update", "readiness", "e2e", "ci", "validate",
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_split_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -164,7 +167,7 @@ def _protocol_actions_explicit_none(v: Any) -> bool:
     return False
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate instance/protocol split receipt contract (dual-lane machine-readable receipt).")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -182,7 +185,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -332,7 +335,7 @@ def main() -> int:
 
     payload["receipt_path"] = str(receipt_path)
     try:
-        receipt_doc = json.loads(receipt_path.read_text(encoding="utf-8"))
+        receipt_doc = load_json_document(receipt_path)
         if not isinstance(receipt_doc, dict):
             raise ValueError("receipt json root must be object")
     except Exception as exc:
@@ -470,4 +473,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -2,17 +2,20 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 from response_stamp_common import (
     ALLOWED_SOURCE_LAYERS,
     ALLOWED_WORK_LAYERS,
     parse_identity_context_stamp,
     resolve_layer_intent,
+    resolve_layer_intents,
     resolve_stamp_context,
 )
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, resolve_pack_and_task
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -26,9 +29,9 @@ STRICT_OPERATIONS = {"activate", "update", "mutation", "readiness", "e2e", "vali
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -76,12 +79,12 @@ def _run_regression_samples(default_source_layer: str) -> dict[str, Any]:
     ]
     rows: list[dict[str, Any]] = []
     failed_ids: list[str] = []
-    for sample in samples:
-        resolved = resolve_layer_intent(
-            intent_text=str(sample.get("intent_text", "")),
-            default_work_layer="instance",
-            default_source_layer=default_source_layer,
-        )
+    decisions = resolve_layer_intents(
+        [str(sample.get("intent_text", "")) for sample in samples],
+        default_work_layer="instance",
+        default_source_layer=default_source_layer,
+    )
+    for sample, resolved in zip(samples, decisions):
         actual_work = str(resolved.get("resolved_work_layer", "")).strip().lower()
         actual_trigger = bool(resolved.get("protocol_triggered", False))
         passed = (
@@ -106,7 +109,7 @@ def _run_regression_samples(default_source_layer: str) -> dict[str, Any]:
     }
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate automatic layer-intent resolution for Identity-Context reply stamp.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -127,7 +130,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -185,7 +188,7 @@ def main() -> int:
             print(f"[FAIL] stamp json not found: {p}")
             return 1
         try:
-            raw_doc = json.loads(p.read_text(encoding="utf-8"))
+            raw_doc = load_json_document(p)
         except Exception as exc:
             print(f"[FAIL] invalid stamp json: {p} ({exc})")
             return 1
@@ -350,4 +353,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
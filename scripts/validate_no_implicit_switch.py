@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
+from result_channel_common import print_result
+
 ERR_NO_IMPLICIT_SWITCH = "IP-ASB-202"
 STRICT_OPS = {"activate", "update", "readiness", "e2e", "ci", "validate", "mutation"}
 INSPECTION_OPS = {"scan", "three-plane", "inspection"}
@@ -17,7 +20,7 @@ ACTIVATION_AUDIT_SCHEMAS = {
 
 def _load_json(path: Path) -> dict[str, Any]:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = load_json_document(path)
     except Exception:
         return {}
     return raw if isinstance(raw, dict) else {}
@@ -31,7 +34,7 @@ def _latest_switch_report(identity_id: str) -> Path | None:
     return candidates[-1] if candidates else None
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate no implicit switch / no silent cross-actor demotion.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -43,7 +46,7 @@ def main() -> int:
         help="operation context for machine-readable routing semantics",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     operation = str(args.operation or "validate").strip().lower()
     report_path = Path(args.switch_report).expanduser().resolve() if args.switch_report.strip() else _latest_switch_report(args.identity_id)
@@ -58,10 +61,10 @@ def main() -> int:
             "stale_reasons": ["switch_report_not_found"],
         }
         if args.json_only:
-            print(json.dumps(payload, ensure_ascii=False))
+            print_result(payload, ensure_ascii=False)
         else:
             print(f"[OK] no switch report found for identity={args.identity_id}; skipped")
-            print(json.dumps(payload, ensure_ascii=False, indent=2))
+            print_result(payload, ensure_ascii=False, indent=2)
         return 0
 
     report = _load_json(report_path)
@@ -119,7 +122,7 @@ def main() -> int:
     }
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         if status == "PASS_REQUIRED":
             print(f"[OK] no implicit switch validated: report={report_path}")
@@ -127,10 +130,10 @@ def main() -> int:
             print(f"[OK] no implicit switch skipped: report_missing for identity={args.identity_id}")
         else:
             print(f"[FAIL] {error_code or ERR_NO_IMPLICIT_SWITCH} implicit switch validation failed: report={report_path}")
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
     return 0 if status in {"PASS_REQUIRED", "SKIPPED_NOT_REQUIRED"} else 1
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
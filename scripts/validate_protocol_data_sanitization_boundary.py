@@ -7,6 +7,10 @@ import re
 from pathlib import Path
 from typing import Any
 
+from feedback_batch_common import feedback_batch_facts
+from identity_batch_common import identity_batch_main
+from pattern_scan_common import MultiPatternScanner
+from result_channel_common import emit_progress, print_result
 from tool_vendor_governance_common import contract_required, load_json, load_yaml, resolve_pack_and_task, resolve_report_path
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -17,6 +21,9 @@ ERR_BUSINESS_LEAK = "IP-DSN-001"
 ERR_SENSITIVE_CONSTANT = "IP-DSN-002"
 
 INSPECTION_OPERATIONS = {"scan", "three-plane", "inspection"}
+SCAN_SCOPES = ("latest", "all")
+HIT_SAMPLE_LIMIT = 30
+EXEMPT_SAMPLE_LIMIT = 20
 
 REQ_CONTRACT_KEYS = (
     "required",
@@ -71,9 +78,9 @@ def _is_fixture_identity(catalog_path: Path, identity_id: str) -> bool:
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -179,7 +186,103 @@ def _should_exempt_phone_like_hit(pat: re.Pattern[str], text: str) -> bool:
     return not _has_contact_context(text)
 
 
-def main() -> int:
+
+def _feedback_artifacts(pack_path: Path) -> list[Path]:
+    root = (pack_path / "runtime" / "protocol-feedback").resolve()
+    if not root.exists():
+        return []
+    return sorted(p.resolve() for p in root.rglob("*") if p.is_file())
+
+
+def _artifact_label(path: Path, pack_path: Path) -> str:
+    try:
+        return path.relative_to(pack_path.resolve()).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def _dedupe(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    seen: set[tuple[str, str, str]] = set()
+    out: list[dict[str, Any]] = []
+    for it in items:
+        sig = (str(it.get("path", "")), str(it.get("pattern", "")), str(it.get("value_preview", "")))
+        if sig in seen:
+            continue
+        seen.add(sig)
+        out.append(it)
+    return out
+
+
+def _scan_artifact(
+    raw: str,
+    parsed: dict[str, Any],
+    key_scanner: MultiPatternScanner,
+    sensitive_scanner: MultiPatternScanner,
+) -> dict[str, Any]:
+    """Hit samples and counts for one feedback artifact (JSON leaves, then every text line)."""
+    forbidden_key_hits: list[dict[str, Any]] = []
+    sensitive_hits: list[dict[str, Any]] = []
+    phone_like_path_exemptions: list[dict[str, Any]] = []
+
+    def _sensitive(path: str, key: str, text: str, active: list[int]) -> None:
+        for idx in sensitive_scanner.matches(text, active):
+            pat = sensitive_scanner.patterns[idx]
+            row = {"path": path, "key": key, "value_preview": text[:120], "pattern": pat.pattern}
+            if _should_exempt_phone_like_hit(pat, text):
+                phone_like_path_exemptions.append({**row, "exemption_reason": "phone_like_in_path_context"})
+                continue
+            sensitive_hits.append(row)
+            break
+
+    if parsed:
+        # patterns whose required literals never occur in the document cannot match any leaf
+        rendered = json.dumps(parsed, ensure_ascii=False)
+        key_active = key_scanner.plan(rendered, json_escaped=True)
+        leaf_active = sensitive_scanner.plan(rendered, json_escaped=True)
+        for ppath, key, val in _walk_json(parsed):
+            if key.lower() in EXEMPT_DOMAIN_TERMS:
+                continue
+            sval = _stringify(val)
+            if not sval.strip():
+                continue
+            # key-level business leakage
+            idx = key_scanner.first(key, key_active)
+            if idx is not None and not _contains_exempt_term(sval):
+                forbidden_key_hits.append(
+                    {
+                        "path": f"{ppath}.{key}",
+                        "key": key,
+                        "value_preview": sval[:120],
+                        "pattern": key_scanner.patterns[idx].pattern,
+                    }
+                )
+            # sensitive constants leak
+            _sensitive(f"{ppath}.{key}", key, sval, leaf_active)
+
+    # text-level scan as fallback (for markdown/plain batches); one pass per pattern over the whole
+    # text selects the candidate lines, which then get the exact per-line check
+    line_active = sensitive_scanner.plan(raw)
+    candidates = sensitive_scanner.candidate_lines(raw, line_active) if line_active else set()
+    lines = raw.splitlines()
+    for idx in range(len(lines)) if candidates is None else sorted(candidates):
+        l = lines[idx].strip()
+        if not l or _contains_exempt_term(l):
+            continue
+        _sensitive(f"line:{idx + 1}", "", l, line_active)
+
+    forbidden_key_hits = _dedupe(forbidden_key_hits)
+    sensitive_hits = _dedupe(sensitive_hits)
+    phone_like_path_exemptions = _dedupe(phone_like_path_exemptions)
+    return {
+        "forbidden_key_hits": forbidden_key_hits[:HIT_SAMPLE_LIMIT],
+        "forbidden_key_hits_count": len(forbidden_key_hits),
+        "sensitive_pattern_hits": sensitive_hits[:HIT_SAMPLE_LIMIT],
+        "sensitive_pattern_hits_count": len(sensitive_hits),
+        "phone_like_path_exemptions": phone_like_path_exemptions[:EXEMPT_SAMPLE_LIMIT],
+        "phone_like_path_exemptions_count": len(phone_like_path_exemptions),
+    }
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate protocol data sanitization boundary for closure payloads.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -189,8 +292,15 @@ def main() -> int:
         choices=["activate", "update", "readiness", "e2e", "ci", "validate", "scan", "three-plane", "inspection"],
         default="validate",
     )
+    ap.add_argument(
+        "--scan-scope",
+        choices=SCAN_SCOPES,
+        default="",
+        help="latest: only the resolved feedback batch; all: every artifact under runtime/protocol-feedback "
+        "(default: contract scan_scope, else all)",
+    )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -286,132 +396,70 @@ def main() -> int:
         return 1
 
     payload["feedback_batch_path"] = str(batch_path)
-    raw = batch_path.read_text(encoding="utf-8", errors="ignore")
-
-    parsed: dict[str, Any] = {}
-    try:
-        obj = json.loads(raw)
-        if isinstance(obj, dict):
-            parsed = obj
-    except Exception:
-        parsed = {}
+    scan_scope = args.scan_scope or str(contract.get("scan_scope", "")).strip().lower() or "all"
+    if scan_scope not in SCAN_SCOPES:
+        scan_scope = "all"
+    artifacts = [batch_path]
+    if scan_scope == "all":
+        artifacts.extend(x for x in _feedback_artifacts(pack_path) if x != batch_path)
+
+    key_scanner = MultiPatternScanner(
+        _normalize_patterns(contract.get("forbidden_key_patterns"), DEFAULT_FORBIDDEN_KEY_PATTERNS)
+    )
+    sensitive_scanner = MultiPatternScanner(
+        _normalize_patterns(contract.get("sensitive_value_patterns"), DEFAULT_SENSITIVE_PATTERNS)
+    )
 
-    key_patterns = _normalize_patterns(contract.get("forbidden_key_patterns"), DEFAULT_FORBIDDEN_KEY_PATTERNS)
-    sensitive_patterns = _normalize_patterns(contract.get("sensitive_value_patterns"), DEFAULT_SENSITIVE_PATTERNS)
+    parsed_count = 0
+
+    def _scan(raw: str, parsed: dict[str, Any]) -> dict[str, Any]:
+        nonlocal parsed_count
+        parsed_count += 1
+        # only artifacts missing from the batch index are scanned; report them as they finish
+        emit_progress("artifact_scanned", scanned=parsed_count, artifacts=len(artifacts), bytes=len(raw))
+        return _scan_artifact(raw, parsed, key_scanner, sensitive_scanner)
+
+    # fail-closed: cached verdicts are only reused for byte-identical artifacts
+    results = feedback_batch_facts(
+        pack_path,
+        artifacts,
+        _scan,
+        variant=f"{key_scanner.fingerprint}.{sensitive_scanner.fingerprint}",
+        verify=True,
+    )
 
     forbidden_key_hits: list[dict[str, Any]] = []
     sensitive_hits: list[dict[str, Any]] = []
     phone_like_path_exemptions: list[dict[str, Any]] = []
-
-    if parsed:
-        for ppath, key, val in _walk_json(parsed):
-            k_low = key.lower()
-            if k_low in EXEMPT_DOMAIN_TERMS:
-                continue
-            # key-level business leakage
-            for pat in key_patterns:
-                if pat.search(key):
-                    sval = _stringify(val)
-                    if sval.strip() and not _contains_exempt_term(sval):
-                        forbidden_key_hits.append(
-                            {
-                                "path": f"{ppath}.{key}",
-                                "key": key,
-                                "value_preview": sval[:120],
-                                "pattern": pat.pattern,
-                            }
-                        )
-                    break
-
-            sval = _stringify(val)
-            if not sval.strip():
-                continue
-            # sensitive constants leak
-            for pat in sensitive_patterns:
-                if pat.search(sval):
-                    if _should_exempt_phone_like_hit(pat, sval):
-                        phone_like_path_exemptions.append(
-                            {
-                                "path": f"{ppath}.{key}",
-                                "key": key,
-                                "value_preview": sval[:120],
-                                "pattern": pat.pattern,
-                                "exemption_reason": "phone_like_in_path_context",
-                            }
-                        )
-                        continue
-                    sensitive_hits.append(
-                        {
-                            "path": f"{ppath}.{key}",
-                            "key": key,
-                            "value_preview": sval[:120],
-                            "pattern": pat.pattern,
-                        }
-                    )
-                    break
-
-    # text-level scan as fallback (for markdown/plain batches)
-    lines = raw.splitlines()
-    for idx, line in enumerate(lines, start=1):
-        l = line.strip()
-        if not l:
-            continue
-        if _contains_exempt_term(l):
-            continue
-        for pat in sensitive_patterns:
-            if pat.search(l):
-                if _should_exempt_phone_like_hit(pat, l):
-                    phone_like_path_exemptions.append(
-                        {
-                            "path": f"line:{idx}",
-                            "key": "",
-                            "value_preview": l[:120],
-                            "pattern": pat.pattern,
-                            "exemption_reason": "phone_like_in_path_context",
-                        }
-                    )
-                    continue
-                sensitive_hits.append(
-                    {
-                        "path": f"line:{idx}",
-                        "key": "",
-                        "value_preview": l[:120],
-                        "pattern": pat.pattern,
-                    }
-                )
-                break
-
-    # deterministic de-dup and cap output size
-    def _dedupe(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        seen: set[tuple[str, str, str]] = set()
-        out: list[dict[str, Any]] = []
-        for it in items:
-            sig = (str(it.get("path", "")), str(it.get("pattern", "")), str(it.get("value_preview", "")))
-            if sig in seen:
-                continue
-            seen.add(sig)
-            out.append(it)
-        return out
-
-    forbidden_key_hits = _dedupe(forbidden_key_hits)
-    sensitive_hits = _dedupe(sensitive_hits)
-    phone_like_path_exemptions = _dedupe(phone_like_path_exemptions)
+    counts = {"forbidden_key_hits": 0, "sensitive_pattern_hits": 0, "phone_like_path_exemptions": 0}
+    for artifact, result in zip(artifacts, results):
+        label = _artifact_label(artifact, pack_path)
+        for name, bucket in (
+            ("forbidden_key_hits", forbidden_key_hits),
+            ("sensitive_pattern_hits", sensitive_hits),
+            ("phone_like_path_exemptions", phone_like_path_exemptions),
+        ):
+            counts[name] += int(result.get(f"{name}_count", 0))
+            bucket.extend({**item, "artifact": label} for item in result.get(name) or [])
+
+    payload["scan_scope"] = scan_scope
+    payload["scanned_artifact_count"] = len(artifacts)
 
     stale_reasons: list[str] = []
     error_code = ""
-    if forbidden_key_hits:
+    if counts["forbidden_key_hits"]:
         stale_reasons.append("business_or_tenant_key_leak_detected")
         error_code = ERR_BUSINESS_LEAK
-    if sensitive_hits:
+    if counts["sensitive_pattern_hits"]:
         stale_reasons.append("sensitive_constant_detected")
         if not error_code:
             error_code = ERR_SENSITIVE_CONSTANT
 
-    payload["forbidden_key_hits"] = forbidden_key_hits[:30]
-    payload["sensitive_pattern_hits"] = sensitive_hits[:30]
-    payload["phone_like_path_exempt_count"] = len(phone_like_path_exemptions)
-    payload["phone_like_path_exempt_samples"] = phone_like_path_exemptions[:20]
-    payload["violation_count"] = len(forbidden_key_hits) + len(sensitive_hits)
+    payload["forbidden_key_hits"] = forbidden_key_hits[:HIT_SAMPLE_LIMIT]
+    payload["sensitive_pattern_hits"] = sensitive_hits[:HIT_SAMPLE_LIMIT]
+    payload["phone_like_path_exempt_count"] = counts["phone_like_path_exemptions"]
+    payload["phone_like_path_exempt_samples"] = phone_like_path_exemptions[:EXEMPT_SAMPLE_LIMIT]
+    payload["violation_count"] = counts["forbidden_key_hits"] + counts["sensitive_pattern_hits"]
 
     if stale_reasons:
         payload["protocol_data_sanitization_boundary_status"] = STATUS_FAIL_REQUIRED
@@ -428,4 +476,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -7,6 +7,7 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
 from protocol_feedback_contract_common import (
     CANONICAL_REQUIRED_DIRS,
     collect_activity_refs,
@@ -15,6 +16,7 @@ from protocol_feedback_contract_common import (
     rel_to_feedback_root,
     resolve_feedback_root,
 )
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, load_yaml, resolve_pack_and_task
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -44,9 +46,9 @@ PROTOCOL_ROOT = Path(__file__).resolve().parent.parent
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _parse_json_payload(raw: str) -> dict[str, Any] | None:
@@ -129,7 +131,7 @@ def _run_split_validator(
     return payload
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate canonical protocol-feedback reply channel contract.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -148,7 +150,7 @@ def main() -> int:
     )
     ap.add_argument("--force-check", action="store_true")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -356,4 +358,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
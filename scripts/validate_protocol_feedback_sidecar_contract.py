@@ -8,6 +8,7 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
 from protocol_feedback_lane_common import (
     build_correlation_keys,
     collect_protocol_feedback_activity,
@@ -15,6 +16,7 @@ from protocol_feedback_lane_common import (
     discover_default_correlation_keys,
 )
 from response_stamp_common import resolve_layer_intent
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, resolve_pack_and_task
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -48,9 +50,9 @@ REPO_ROOT = SCRIPT_DIR.parent
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _parse_json_payload(raw: str) -> dict[str, Any] | None:
@@ -135,7 +137,7 @@ def _validator_payload(
     return result, payload
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate protocol-feedback sidecar escalation contract.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -154,7 +156,7 @@ def main() -> int:
     )
     ap.add_argument("--enforce-blocking", action="store_true")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -485,4 +487,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -6,7 +6,8 @@ import re
 import subprocess
 from pathlib import Path
 
-import yaml
+from git_facts_common import changed_files, rev_parse
+from identity_catalog_common import load_yaml_document
 
 DEFAULT_MAP_PATH = Path("docs/governance/templates/protocol-core-change-map.yaml")
 DEFAULT_INDEX_PATH = Path("docs/governance/AUDIT_SNAPSHOT_INDEX.md")
@@ -31,6 +32,13 @@ CORE_PREFIXES = (
 
 
 def _run_git(args: list[str]) -> str:
+    if len(args) == 2 and args[0] == "rev-parse":
+        resolved = rev_parse(args[1])
+        if resolved:
+            return resolved
+    if len(args) == 3 and args[:2] == ["diff", "--name-only"] and ".." in args[2]:
+        base, head = args[2].split("..", 1)
+        return "\n".join(changed_files(base, head))
     cp = subprocess.run(["git", *args], capture_output=True, text=True)
     if cp.returncode != 0:
         raise RuntimeError(cp.stderr.strip() or f"git {' '.join(args)} failed")
@@ -51,7 +59,7 @@ def _changed_files(base: str, head: str) -> list[str]:
 def _load_map(path: Path) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"mapping file not found: {path}")
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = load_yaml_document(path) or {}
     if not isinstance(data, dict):
         raise ValueError("mapping root must be object")
     return data
@@ -107,12 +115,12 @@ def _is_core_file(path: str, core_files: list[str], core_prefixes: list[str]) ->
     return any(path.startswith(p) for p in core_prefixes)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Enforce protocol core-change -> canonical handoff doc coupling.")
     ap.add_argument("--base", default="")
     ap.add_argument("--head", default="")
     ap.add_argument("--mapping", default=str(DEFAULT_MAP_PATH), help="path to protocol core-change mapping yaml")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     try:
         mapping = _resolve_map(Path(args.mapping).expanduser().resolve())
@@ -5,7 +5,7 @@ import argparse
 import re
 from pathlib import Path
 
-import yaml
+from identity_catalog_common import load_yaml_document
 
 
 INDEX_PATH = Path("docs/governance/AUDIT_SNAPSHOT_INDEX.md")
@@ -53,7 +53,7 @@ def _contains_absolute_user_path(text: str) -> bool:
 def _load_core_change_map(path: Path) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"core-change map missing: {path}")
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = load_yaml_document(path) or {}
     if not isinstance(data, dict):
         raise ValueError("core-change map root must be object")
     handoff = data.get("handoff")
@@ -71,14 +71,14 @@ def _load_core_change_map(path: Path) -> dict:
     return data
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate protocol SSOT source boundary: handoff is canonical, artifacts are evidence-only.")
     ap.add_argument(
         "--require-canonical-changed",
         action="store_true",
         help="reserved for future wiring; no-op in this validator (use validate_protocol_handoff_coupling.py for diff-range checks)",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     if not INDEX_PATH.exists():
         print(f"[FAIL] IP-SSOT-001 missing index file: {INDEX_PATH}")
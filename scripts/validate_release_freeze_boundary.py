@@ -6,10 +6,15 @@ import subprocess
 import sys
 from pathlib import Path
 
-import yaml
+from git_facts_common import rev_parse
+from identity_catalog_common import load_yaml_document
 
 
 def _run_git(args: list[str]) -> str:
+    if len(args) == 2 and args[0] == "rev-parse":
+        resolved = rev_parse(args[1])
+        if resolved:
+            return resolved
     p = subprocess.run(["git", *args], check=True, capture_output=True, text=True)
     return p.stdout.strip()
 
@@ -30,7 +35,7 @@ def _changed_files(base: str, head: str) -> list[tuple[str, str]]:
 
 
 def _load_catalog(path: Path) -> dict:
-    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    raw = load_yaml_document(path) or {}
     if not isinstance(raw, dict):
         raise ValueError(f"catalog root must be object: {path}")
     return raw
@@ -42,7 +47,7 @@ def _is_fixture_demo_row(row: dict) -> bool:
     return profile == "fixture" and runtime_mode == "demo_only"
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description=(
             "Validate release freeze boundary: base repo must not absorb local identity "
@@ -62,7 +67,7 @@ def main() -> int:
         default="identity/catalog/identities.yaml",
         help="identity catalog path",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     base = args.base.strip() or _run_git(["rev-parse", "HEAD~1"])
     head = args.head.strip() or _run_git(["rev-parse", "HEAD"])
@@ -27,7 +27,7 @@ def _all_success(checks: List[Dict[str, Any]]) -> bool:
     return all(str(c.get("status", "")).lower() == "success" for c in checks)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description="Validate Release-plane cloud closure contract (6 conditions)."
     )
@@ -46,7 +46,7 @@ def main() -> int:
         "--evidence-json",
         help="optional json that can provide any of the fields above; CLI args remain authoritative",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         evidence = _load_json(args.evidence_json)
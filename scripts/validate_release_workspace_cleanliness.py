@@ -26,10 +26,10 @@ def _extract_path(status_line: str) -> str:
     return status_line[3:].strip()
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Fail release checks when runtime artifacts pollute worktree.")
     ap.add_argument("--strict", action="store_true", help="strict mode: disallow any identity/runtime changes")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     lines = _git_status_lines()
     offenders: list[str] = []
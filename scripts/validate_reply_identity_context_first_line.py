@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Any
 
 from actor_session_common import load_actor_binding
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_current_task, load_json_document, resolve_pack_and_task
 from response_stamp_common import (
     ALLOWED_SOURCE_LAYERS,
     ALLOWED_WORK_LAYERS,
@@ -15,7 +17,9 @@ from response_stamp_common import (
     resolve_layer_intent,
     resolve_stamp_context,
 )
-from tool_vendor_governance_common import contract_required, load_json
+from reply_log_stream_common import ReplyFirstLineScan, first_nonempty_line, scan_reply_first_lines
+from result_channel_common import print_result
+from tool_vendor_governance_common import contract_required
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
 STATUS_SKIPPED_NOT_REQUIRED = "SKIPPED_NOT_REQUIRED"
@@ -40,131 +44,11 @@ def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
     return {}
 
 
-def _resolve_pack_and_task(catalog_path: Path, identity_id: str) -> tuple[Path, Path]:
-    import yaml
-
-    data = yaml.safe_load(catalog_path.read_text(encoding="utf-8")) or {}
-    rows = [x for x in (data.get("identities") or []) if isinstance(x, dict)]
-    row = next((x for x in rows if str(x.get("id", "")).strip() == identity_id), None)
-    if not row:
-        raise FileNotFoundError(f"identity id not found in catalog: {identity_id}")
-    pack_raw = str((row or {}).get("pack_path", "")).strip()
-    if not pack_raw:
-        raise FileNotFoundError(f"pack_path missing for identity: {identity_id}")
-    pack = Path(pack_raw).expanduser().resolve()
-    if not pack.exists():
-        raise FileNotFoundError(f"pack_path not found: {pack}")
-    task = pack / "CURRENT_TASK.json"
-    if not task.exists():
-        raise FileNotFoundError(f"CURRENT_TASK.json not found: {task}")
-    return pack, task
-
-
-def _message_to_text(value: Any) -> str:
-    if isinstance(value, str):
-        return value
-    if isinstance(value, list):
-        parts: list[str] = []
-        for item in value:
-            if isinstance(item, str):
-                parts.append(item)
-            elif isinstance(item, dict):
-                text = item.get("text")
-                if isinstance(text, str):
-                    parts.append(text)
-                elif isinstance(item.get("content"), str):
-                    parts.append(str(item.get("content")))
-        return "\n".join([x for x in parts if x]).strip()
-    if isinstance(value, dict):
-        if isinstance(value.get("text"), str):
-            return str(value.get("text"))
-        if isinstance(value.get("content"), str):
-            return str(value.get("content"))
-    return ""
-
-
-def _extract_reply_samples(reply_log_path: Path) -> list[str]:
-    text = reply_log_path.read_text(encoding="utf-8", errors="ignore")
-    suffix = reply_log_path.suffix.lower()
-
-    if suffix == ".jsonl":
-        out: list[str] = []
-        for raw in text.splitlines():
-            raw = raw.strip()
-            if not raw:
-                continue
-            try:
-                row = json.loads(raw)
-            except Exception:
-                continue
-            if not isinstance(row, dict):
-                continue
-            role = str(row.get("role", "")).strip().lower()
-            if role and role not in {"assistant", "ai", "model"}:
-                continue
-            msg = _message_to_text(row.get("content"))
-            if not msg:
-                msg = _message_to_text(row.get("message"))
-            if not msg:
-                msg = _message_to_text(row.get("output"))
-            if msg:
-                out.append(msg)
-        return out
-
-    if suffix == ".json":
-        try:
-            doc = json.loads(text)
-        except Exception:
-            doc = None
-        out: list[str] = []
-        if isinstance(doc, dict):
-            replies = doc.get("replies")
-            if isinstance(replies, list):
-                for item in replies:
-                    msg = _message_to_text(item)
-                    if msg:
-                        out.append(msg)
-            messages = doc.get("messages")
-            if isinstance(messages, list):
-                for row in messages:
-                    if not isinstance(row, dict):
-                        continue
-                    role = str(row.get("role", "")).strip().lower()
-                    if role and role not in {"assistant", "ai", "model"}:
-                        continue
-                    msg = _message_to_text(row.get("content"))
-                    if msg:
-                        out.append(msg)
-            if not out:
-                msg = _message_to_text(doc.get("content"))
-                if msg:
-                    out.append(msg)
-        elif isinstance(doc, list):
-            for item in doc:
-                msg = _message_to_text(item)
-                if msg:
-                    out.append(msg)
-        return out
-
-    chunks = [x.strip() for x in text.split("\n---\n") if x.strip()]
-    if chunks:
-        return chunks
-    return [x.strip() for x in text.splitlines() if x.strip()]
-
-
-def _first_nonempty_line(text: str) -> str:
-    for line in str(text or "").splitlines():
-        s = line.strip()
-        if s:
-            return s
-    return ""
-
-
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _emit_blocker(receipt_path: Path, payload: dict[str, Any]) -> None:
@@ -172,7 +56,7 @@ def _emit_blocker(receipt_path: Path, payload: dict[str, Any]) -> None:
     receipt_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate that user-visible assistant replies start with Identity-Context first line.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -193,8 +77,18 @@ def main() -> int:
         choices=["activate", "update", "mutation", "readiness", "e2e", "ci", "validate", "scan", "three-plane", "inspection"],
         default="validate",
     )
+    ap.add_argument(
+        "--reply-log-fail-fast",
+        action="store_true",
+        help="stop reading --reply-log at the first reply without the Identity-Context first line",
+    )
+    ap.add_argument(
+        "--reply-log-checkpoint",
+        action="store_true",
+        help="resume --reply-log (.jsonl/plain) from the offset of the last full scan; only appended replies are read",
+    )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     repo_catalog_path = Path(args.repo_catalog).expanduser().resolve()
@@ -206,8 +100,8 @@ def main() -> int:
         return 2
 
     try:
-        _, task_path = _resolve_pack_and_task(catalog_path, args.identity_id)
-        task = load_json(task_path)
+        _, task_path = resolve_pack_and_task(catalog_path, args.identity_id)
+        task = load_current_task(task_path)
     except Exception as exc:
         print(f"[FAIL] {exc}")
         return 1
@@ -244,6 +138,7 @@ def main() -> int:
         return 1
 
     reply_samples: list[str] = []
+    reply_scan: ReplyFirstLineScan | None = None
     evidence_ref = ""
     stamp_doc: dict[str, Any] = {}
     if args.reply_log.strip():
@@ -251,7 +146,9 @@ def main() -> int:
         if not p.exists():
             print(f"[FAIL] reply log file not found: {p}")
             return 1
-        reply_samples = _extract_reply_samples(p)
+        reply_scan = scan_reply_first_lines(
+            p, fail_fast=args.reply_log_fail_fast, checkpoint=args.reply_log_checkpoint
+        )
         evidence_ref = str(p)
     elif args.reply_file.strip():
         p = Path(args.reply_file).expanduser().resolve()
@@ -269,7 +166,7 @@ def main() -> int:
             print(f"[FAIL] stamp json not found: {p}")
             return 1
         try:
-            doc = json.loads(p.read_text(encoding="utf-8"))
+            doc = load_json_document(p)
         except Exception as exc:
             print(f"[FAIL] invalid stamp json: {p} ({exc})")
             return 1
@@ -281,18 +178,17 @@ def main() -> int:
         reply_samples = [stamp_line] if stamp_line else []
         evidence_ref = str(p)
 
-    first_lines = [_first_nonempty_line(x) for x in reply_samples]
-    first_lines = [x for x in first_lines if x]
-
-    missing_refs: list[str] = []
-    for idx, line in enumerate(first_lines, start=1):
-        if not line.startswith("Identity-Context:"):
-            missing_refs.append(f"sample:{idx}")
+    if reply_scan is None:
+        reply_scan = ReplyFirstLineScan()
+        for sample in reply_samples:
+            reply_scan.add(first_nonempty_line(sample))
+    has_first_line = reply_scan.sample_count > 0
+    missing_refs = [f"sample:{idx}" for idx in reply_scan.missing_refs]
 
     stale_reasons: list[str] = []
     error_code = ""
 
-    if args.enforce_first_line_gate and len(first_lines) == 0:
+    if args.enforce_first_line_gate and not has_first_line:
         stale_reasons.append("reply_evidence_missing")
         error_code = ERR_REPLY_FIRST_LINE
 
@@ -301,7 +197,7 @@ def main() -> int:
         if not error_code:
             error_code = ERR_REPLY_FIRST_LINE
 
-    parsed_first: dict[str, Any] = parse_identity_context_stamp(first_lines[0]) if first_lines else {}
+    parsed_first: dict[str, Any] = parse_identity_context_stamp(reply_scan.first_line) if has_first_line else {}
     strict_format_enforced = args.operation in STRICT_LOCK_OPERATIONS
     expected_source_layer_input = str(args.expected_source_layer or "").strip().lower()
     expected_source_layer_input_invalid = bool(
@@ -349,7 +245,7 @@ def main() -> int:
         source_layer_downgrade_applied = True
 
     # Optional identity mismatch signal if first line exists and parsable.
-    if not error_code and first_lines:
+    if not error_code and has_first_line:
         actual_identity = str(parsed_first.get("identity_id", "")).strip()
         if actual_identity and actual_identity != ctx.identity_id:
             stale_reasons.append("reply_first_line_identity_mismatch")
@@ -357,10 +253,10 @@ def main() -> int:
 
     protocol_triggered = bool(layer_intent.get("protocol_triggered", False))
     protocol_trigger_reasons = list(layer_intent.get("protocol_trigger_reasons") or [])
-    has_layer_context = bool(parsed_first.get("_has_layer_context", False)) if first_lines else False
+    has_layer_context = bool(parsed_first.get("_has_layer_context", False)) if has_first_line else False
     parsed_work_layer = str(parsed_first.get("work_layer", "")).strip() if parsed_first else ""
     parsed_source_layer = str(parsed_first.get("source_layer", "")).strip() if parsed_first else ""
-    if not error_code and first_lines:
+    if not error_code and has_first_line:
         if not has_layer_context:
             if strict_format_enforced:
                 stale_reasons.append("reply_first_line_layer_context_tail_missing")
@@ -409,7 +305,7 @@ def main() -> int:
     lock_boundary_enforced = bool(args.enforce_first_line_gate and args.operation in STRICT_LOCK_OPERATIONS)
     parsed_lock_state = ""
     parsed_actor_id = ""
-    if not error_code and first_lines:
+    if not error_code and has_first_line:
         parsed_lock_state = str(parsed_first.get("lock", "")).strip()
         parsed_actor_id = str(parsed_first.get("actor_id", "")).strip()
     if strict_format_enforced and parsed_actor_id and parsed_actor_id != actor_id_effective and not error_code:
@@ -466,16 +362,18 @@ def main() -> int:
         "reply_first_line_lock_state": parsed_lock_state,
         "reply_first_line_missing_count": len(missing_refs),
         "reply_first_line_missing_refs": missing_refs,
-        "reply_sample_count": len(first_lines),
+        "reply_sample_count": reply_scan.sample_count,
         "reply_evidence_ref": evidence_ref,
         "expected_identity_id": ctx.identity_id,
         "blocker_receipt_path": str(receipt_path) if not ok else "",
         "stale_reasons": stale_reasons,
     }
+    if args.reply_log_fail_fast or args.reply_log_checkpoint:
+        payload["reply_log_scan"] = reply_scan.summary()
 
     if not ok:
         first_line_identity = ""
-        if first_lines:
+        if has_first_line:
             first_line_identity = str(parsed_first.get("identity_id", "")).strip()
         next_action = "emit_identity_context_first_line_then_retry"
         if error_code == ERR_INVALID_EXPECTED_SOURCE_LAYER:
@@ -504,4 +402,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
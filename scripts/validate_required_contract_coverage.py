@@ -9,7 +9,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from identity_batch_common import identity_batch_main
 from response_stamp_common import resolve_layer_intent
+from result_channel_common import print_result
 from tool_vendor_governance_common import (
     contract_required,
     load_json,
@@ -214,7 +216,7 @@ def _coverage_rate(passed: int, total: int) -> float:
     return round(bounded, 2)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description=(
             "Validate required-contract coverage semantics for tool/vendor closures "
@@ -254,7 +256,7 @@ def main() -> int:
         default="validate",
         help="operation context passed to operation-aware validators",
     )
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -449,7 +451,7 @@ def main() -> int:
         payload["discovery_required_gate_failed"] = discovery_gate_failed
 
     if args.json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
         for row in rows:
             print(
@@ -469,7 +471,7 @@ def main() -> int:
             f"failed_required_contract_count={failed_required} "
             f"failed_optional_contract_count={failed_optional}"
         )
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
     if failed_required > 0:
         return 1
@@ -483,4 +485,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
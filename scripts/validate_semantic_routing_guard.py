@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import argparse
-import json
 import re
 from pathlib import Path
 from typing import Any
 
+from feedback_batch_common import feedback_batch_facts
+from identity_batch_common import identity_batch_main
 from protocol_feedback_lane_common import (
     build_correlation_keys,
     collect_protocol_feedback_activity,
@@ -14,6 +15,7 @@ from protocol_feedback_lane_common import (
     discover_default_correlation_keys,
 )
 from response_stamp_common import resolve_layer_intent
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, resolve_pack_and_task, resolve_report_path
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -47,9 +49,9 @@ DEFAULT_CONTRACT = {
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -68,16 +70,7 @@ def _extract_first(text: str, pattern: str) -> str:
     return m.group(1).strip() if m else ""
 
 
-def _extract_fields(feedback_path: Path) -> tuple[dict[str, Any], str]:
-    raw = feedback_path.read_text(encoding="utf-8", errors="ignore")
-    parsed: dict[str, Any] = {}
-    try:
-        doc = json.loads(raw)
-        if isinstance(doc, dict):
-            parsed = doc
-    except Exception:
-        parsed = {}
-
+def _extract_fields(raw: str, parsed: dict[str, Any]) -> dict[str, Any]:
     fields: dict[str, Any] = {
         "intent_domain": str(parsed.get("intent_domain", "")).strip(),
         "intent_confidence": parsed.get("intent_confidence"),
@@ -90,8 +83,7 @@ def _extract_fields(feedback_path: Path) -> tuple[dict[str, Any], str]:
         fields["intent_confidence"] = conf
     if not fields["classifier_reason"]:
         fields["classifier_reason"] = _extract_first(raw, r"\bclassifier_reason\b\s*[:=]\s*(.+)$")
-
-    return fields, raw
+    return fields
 
 
 def _split_evidence_present(text: str, parsed_fields: dict[str, Any]) -> bool:
@@ -124,6 +116,15 @@ def _legacy_namespace_refs(text: str) -> list[str]:
     return sorted(set(refs))
 
 
+def _batch_facts(raw: str, parsed: dict[str, Any]) -> dict[str, Any]:
+    fields = _extract_fields(raw, parsed)
+    return {
+        "fields": fields,
+        "split_evidence_present": _split_evidence_present(raw, fields),
+        "legacy_namespace_refs": _legacy_namespace_refs(raw),
+    }
+
+
 def _to_float(v: Any) -> float | None:
     if isinstance(v, (int, float)):
         return float(v)
@@ -136,7 +137,7 @@ def _to_float(v: Any) -> float | None:
         return None
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate semantic routing guard contract for protocol feedback batches.")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -153,7 +154,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -285,7 +286,8 @@ def main() -> int:
         return 1
 
     payload["feedback_batch_path"] = str(batch_path)
-    fields, raw = _extract_fields(batch_path)
+    facts = feedback_batch_facts(pack_path, [batch_path], _batch_facts)[0]
+    fields = facts["fields"]
     intent_domain = str(fields.get("intent_domain", "")).strip().lower()
     conf = _to_float(fields.get("intent_confidence"))
     classifier_reason = str(fields.get("classifier_reason", "")).strip()
@@ -320,7 +322,7 @@ def main() -> int:
         stale_reasons.append("intent_domain_not_in_whitelist")
         error_code = ERR_DOMAIN_WHITELIST
 
-    if intent_domain == "mixed" and not _split_evidence_present(raw, fields):
+    if intent_domain == "mixed" and not facts["split_evidence_present"]:
         stale_reasons.append("mixed_domain_without_split_evidence")
         error_code = ERR_MIXED_WITHOUT_SPLIT
 
@@ -330,7 +332,7 @@ def main() -> int:
             stale_reasons.append("unknown_domain_without_clarification_strategy")
             error_code = ERR_MIXED_WITHOUT_SPLIT
 
-    legacy_refs = _legacy_namespace_refs(raw)
+    legacy_refs = facts["legacy_namespace_refs"]
     payload["legacy_namespace_refs"] = legacy_refs
     if legacy_refs:
         stale_reasons.append("legacy_vendor_namespace_reference_detected")
@@ -352,4 +354,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
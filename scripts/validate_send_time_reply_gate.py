@@ -3,12 +3,15 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any
 
-import yaml
+
+from governed_reply_pipeline_common import run_reply_stage
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_yaml_document
+from result_channel_common import print_result
 
 ERR_SEND_TIME_GATE = "IP-ASB-STAMP-SESSION-001"
 ERR_SYNTHETIC_EVIDENCE = "IP-ASB-STAMP-SESSION-002"
@@ -24,7 +27,7 @@ STRICT_SEND_TIME_OPERATIONS = {"activate", "update", "mutation", "readiness", "e
 
 def _is_fixture_identity(catalog_path: Path, identity_id: str) -> bool:
     try:
-        data = yaml.safe_load(catalog_path.read_text(encoding="utf-8")) or {}
+        data = load_yaml_document(catalog_path) or {}
     except Exception:
         return False
     rows = [x for x in (data.get("identities") or []) if isinstance(x, dict)]
@@ -117,12 +120,12 @@ def _is_governed_outlet(channel_id: str) -> bool:
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(
         description=(
             "Unified send-time gate for governed user-visible reply channel. "
@@ -169,7 +172,7 @@ def main() -> int:
         default="validate",
     )
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if catalog_path.exists() and _is_fixture_identity(catalog_path, args.identity_id):
@@ -449,14 +452,13 @@ def main() -> int:
     elif reply_text:
         cmd.extend(["--reply-text", reply_text])
 
-    p = subprocess.run(cmd, capture_output=True, text=True)
-    validator_payload = _parse_json_payload(p.stdout)
+    validator_rc, validator_payload = run_reply_stage(cmd, Path.cwd())
 
     first_line_status = str(validator_payload.get("reply_first_line_status", "")).strip() or (
-        STATUS_PASS_REQUIRED if p.returncode == 0 else STATUS_FAIL_REQUIRED
+        STATUS_PASS_REQUIRED if validator_rc == 0 else STATUS_FAIL_REQUIRED
     )
     error_code = str(validator_payload.get("error_code", "")).strip()
-    if p.returncode != 0 and not error_code:
+    if validator_rc != 0 and not error_code:
         error_code = ERR_SEND_TIME_GATE
 
     send_time_status = first_line_status
@@ -466,7 +468,7 @@ def main() -> int:
         STATUS_SKIPPED_NOT_REQUIRED,
         STATUS_WARN_NON_BLOCKING,
     }:
-        send_time_status = STATUS_PASS_REQUIRED if p.returncode == 0 else STATUS_FAIL_REQUIRED
+        send_time_status = STATUS_PASS_REQUIRED if validator_rc == 0 else STATUS_FAIL_REQUIRED
 
     payload = {
         "identity_id": args.identity_id,
@@ -515,7 +517,7 @@ def main() -> int:
         "protocol_trigger_confidence": validator_payload.get("protocol_trigger_confidence", 0.0),
         "blocker_receipt_path": validator_payload.get("blocker_receipt_path", ""),
         "stale_reasons": validator_payload.get("stale_reasons", []),
-        "upstream_validator_rc": p.returncode,
+        "upstream_validator_rc": validator_rc,
     }
     if str(error_code).strip() == ERR_RUNTIME_BINDING_MISMATCH:
         payload["outlet_bypass_detected"] = True
@@ -523,8 +525,8 @@ def main() -> int:
         payload["blocker_receipt"] = validator_payload.get("blocker_receipt")
 
     _emit(payload, json_only=args.json_only)
-    return 1 if p.returncode != 0 else 0
+    return 1 if validator_rc != 0 else 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 import argparse
-import json
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from actor_session_common import load_actor_binding, resolve_actor_id
+from git_facts_common import changed_files, rev_parse
+from identity_batch_common import identity_batch_main
+from identity_catalog_common import load_json_document
 from protocol_feedback_contract_common import (
     canonical_dirs,
     ensure_index_linkage,
@@ -19,6 +21,7 @@ from protocol_feedback_contract_common import (
     write_json,
 )
 from response_stamp_common import DEFAULT_WORK_LAYER, resolve_layer_intent
+from result_channel_common import print_result
 from tool_vendor_governance_common import contract_required, load_json, resolve_pack_and_task
 
 STATUS_PASS_REQUIRED = "PASS_REQUIRED"
@@ -63,9 +66,9 @@ LOCK_EXIT_PREFIX = "SESSION_LANE_LOCK_EXIT_"
 
 def _emit(payload: dict[str, Any], *, json_only: bool) -> None:
     if json_only:
-        print(json.dumps(payload, ensure_ascii=False))
+        print_result(payload, ensure_ascii=False)
     else:
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_result(payload, ensure_ascii=False, indent=2)
 
 
 def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
@@ -80,6 +83,13 @@ def _select_contract(task: dict[str, Any]) -> dict[str, Any]:
 
 
 def _run_git(args: list[str]) -> str:
+    if len(args) == 2 and args[0] == "rev-parse":
+        resolved = rev_parse(args[1], PROTOCOL_ROOT)
+        if resolved:
+            return resolved
+    if len(args) == 3 and args[:2] == ["diff", "--name-only"] and ".." in args[2]:
+        base, head = args[2].split("..", 1)
+        return "\n".join(changed_files(base, head, PROTOCOL_ROOT))
     cp = subprocess.run(["git", *args], cwd=str(PROTOCOL_ROOT), capture_output=True, text=True)
     if cp.returncode != 0:
         raise RuntimeError(cp.stderr.strip() or f"git {' '.join(args)} failed")
@@ -118,7 +128,7 @@ def _normalize_applied_gate_set(token: str) -> str:
 
 def _safe_json(path: Path) -> dict[str, Any]:
     try:
-        doc = json.loads(path.read_text(encoding="utf-8"))
+        doc = load_json_document(path)
     except Exception:
         return {}
     return doc if isinstance(doc, dict) else {}
@@ -241,7 +251,7 @@ def _write_lane_lock_protocol_receipt(
     return str(receipt_path), [receipt_ref]
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate work-layer gate-set routing contract (FIX-033).")
     ap.add_argument("--catalog", required=True)
     ap.add_argument("--identity-id", required=True)
@@ -262,7 +272,7 @@ def main() -> int:
     ap.add_argument("--applied-gate-set", default="")
     ap.add_argument("--force-check", action="store_true")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_path = Path(args.catalog).expanduser().resolve()
     if not catalog_path.exists():
@@ -546,4 +556,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(identity_batch_main(main))
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import contextlib
+import functools
+import importlib
+import inspect
+import io
+import os
+import sys
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from identity_batch_common import identity_batch_main
+from result_channel_common import Record, ResultChannel
+from validator_result_cache_common import ValidatorResultCache
+from validator_timing_common import ValidatorTiming, measure_validator, record_validator_timing, run_measured
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+VALIDATOR_MODE_INPROCESS = "inprocess"
+VALIDATOR_MODE_SUBPROCESS = "subprocess"
+VALIDATOR_MODE_CACHE = "cache"
+VALIDATOR_MODES = (VALIDATOR_MODE_INPROCESS, VALIDATOR_MODE_SUBPROCESS)
+PYTHON_LAUNCHERS = {"python", "python3", Path(sys.executable).name}
+
+_ENTRYPOINTS: dict[str, Callable[..., Any] | None] = {}
+
+
+@dataclass
+class ValidatorInvocation:
+    rc: int
+    stdout: str
+    stderr: str
+    mode: str
+    duration_ms: int
+    # payload the validator published on the result channel (None: parse stdout instead)
+    result: dict[str, Any] | None = None
+    events: list[Record] = field(default_factory=list)
+
+
+def default_validator_mode() -> str:
+    mode = str(os.environ.get("IDENTITY_VALIDATOR_MODE", "")).strip().lower()
+    return mode if mode in VALIDATOR_MODES else VALIDATOR_MODE_INPROCESS
+
+
+def _script_module(cmd: list[str], cwd: Path) -> tuple[str, list[str]] | None:
+    if len(cmd) < 2 or Path(cmd[0]).name not in PYTHON_LAUNCHERS:
+        return None
+    script = Path(cmd[1])
+    if script.suffix != ".py":
+        return None
+    if not script.is_absolute():
+        script = cwd / script
+    try:
+        script = script.resolve()
+    except OSError:
+        return None
+    if script.parent != SCRIPTS_DIR or not script.exists():
+        return None
+    return script.stem, list(cmd[2:])
+
+
+def validator_entrypoint(module_name: str) -> Callable[..., Any] | None:
+    """Return the argv-compatible ``main`` of a script module, or None when unusable in-process."""
+    if module_name in _ENTRYPOINTS:
+        return _ENTRYPOINTS[module_name]
+    entry: Callable[..., Any] | None = None
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    try:
+        module = importlib.import_module(module_name)
+        candidate = getattr(module, "main", None)
+        if callable(candidate):
+            entry = candidate
+            if getattr(module, "identity_batch_main", None) is identity_batch_main:
+                # same --identity-ids / --all handling as the script's __main__
+                entry = functools.partial(identity_batch_main, candidate)
+    except Exception:
+        entry = None
+    _ENTRYPOINTS[module_name] = entry
+    return entry
+
+
+def _accepts_argv(entry: Callable[..., Any]) -> bool:
+    try:
+        return len(inspect.signature(entry).parameters) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+def _exit_code(code: Any, stderr: io.StringIO) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=stderr)
+    return 1
+
+
+@contextlib.contextmanager
+def _scoped_process_state(argv0: str, argv: list[str], cwd: Path, env: dict[str, str] | None):
+    saved_argv = sys.argv
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ) if env is not None else None
+    sys.argv = [argv0, *argv]
+    os.chdir(str(cwd))
+    if env is not None:
+        os.environ.clear()
+        os.environ.update(env)
+    try:
+        yield
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+        if saved_env is not None:
+            os.environ.clear()
+            os.environ.update(saved_env)
+
+
+def _run_inprocess(entry: Callable[..., Any], argv0: str, argv: list[str], cwd: Path, env: dict[str, str] | None) -> tuple[int, str, str]:
+    out = io.StringIO()
+    err = io.StringIO()
+    with _scoped_process_state(argv0, argv, cwd, env), contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = _exit_code(entry(argv) if _accepts_argv(entry) else entry(), err)
+        except SystemExit as exc:
+            rc = _exit_code(exc.code, err)
+        except Exception:
+            traceback.print_exc(file=err)
+            rc = 1
+    return rc, out.getvalue(), err.getvalue()
+
+
+def _run_subprocess(
+    cmd: list[str],
+    cwd: Path,
+    env: dict[str, str] | None,
+    channel: ResultChannel | None = None,
+    timing: ValidatorTiming | None = None,
+) -> tuple[int, str, str]:
+    if channel is None:
+        p = run_measured(cmd, timing, capture_output=True, text=True, cwd=str(cwd), env=env)
+        return p.returncode, p.stdout or "", p.stderr or ""
+    with channel.subprocess_env(env) as (child_env, pass_fds):
+        p = run_measured(
+            cmd, timing, capture_output=True, text=True, cwd=str(cwd), env=child_env, pass_fds=pass_fds
+        )
+    return p.returncode, p.stdout or "", p.stderr or ""
+
+
+def run_validator(
+    cmd: list[str],
+    cwd: Path,
+    env: dict[str, str] | None = None,
+    mode: str = VALIDATOR_MODE_INPROCESS,
+    cache: ValidatorResultCache | None = None,
+    on_event: Callable[[Record], None] | None = None,
+) -> ValidatorInvocation:
+    """
+    Execute a ``python3 scripts/<name>.py ...`` command line.
+
+    In-process mode imports the script once and calls its ``main(argv)`` with stdout/stderr,
+    cwd, argv and (optionally) environment scoped to the call. Commands that are not
+    registry scripts, or scripts without a usable entry point, fall back to a subprocess.
+    In-process execution mutates process-global state and is not thread-safe.
+    With a ``cache``, declared-pure validators are served from (and stored into) the
+    content-addressed result cache.
+    The validator's result-channel payload is returned as ``result``; progress records are
+    passed to ``on_event`` while it runs. Executed (non-cached) runs are appended to the
+    validator timing store.
+    """
+    started = time.monotonic()
+    channel = ResultChannel(on_event)
+    cache_key = cache.key_for(cmd, cwd, env) if cache is not None else None
+    if cache is not None and cache_key:
+        hit = cache.get(cache_key)
+        if hit is not None:
+            return ValidatorInvocation(
+                rc=int(hit.get("rc", 1)),
+                stdout=str(hit.get("stdout", "")),
+                stderr=str(hit.get("stderr", "")),
+                mode=VALIDATOR_MODE_CACHE,
+                duration_ms=int((time.monotonic() - started) * 1000),
+                result=hit.get("result") if isinstance(hit.get("result"), dict) else None,
+            )
+    target = _script_module(cmd, cwd) if mode == VALIDATOR_MODE_INPROCESS else None
+    entry = validator_entrypoint(target[0]) if target else None
+    used_mode = VALIDATOR_MODE_INPROCESS if target and entry is not None else VALIDATOR_MODE_SUBPROCESS
+    with measure_validator(used_mode) as timing:
+        if target and entry is not None:
+            with channel.capture():
+                rc, stdout, stderr = _run_inprocess(entry, cmd[1], target[1], cwd, env)
+        else:
+            rc, stdout, stderr = _run_subprocess(cmd, cwd, env, channel, timing)
+        timing.rc = rc
+    record_validator_timing(cmd, timing, env=env)
+    if cache is not None and cache_key:
+        cache.put(cache_key, cmd, rc, stdout, stderr, result=channel.result)
+    return ValidatorInvocation(
+        rc=rc,
+        stdout=stdout,
+        stderr=stderr,
+        mode=used_mode,
+        duration_ms=int((time.monotonic() - started) * 1000),
+        result=channel.result,
+        events=channel.events,
+    )
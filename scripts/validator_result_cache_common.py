@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from identity_catalog_common import load_yaml_document
+from private_dir_common import private_dir, user_tmp_dir
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+CACHE_SCHEMA = "validator_result_cache_v1"
+DEFAULT_CACHE_DIR = user_tmp_dir("identity-validator-cache")
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_KEY_ENV_PREFIXES = ("IDENTITY_", "CODEX_")
+CACHE_KEY_ENV_NAMES = ("HOME", "USER", "PYTHONPATH")
+CACHE_CONTROL_ENV = ("IDENTITY_VALIDATOR_CACHE", "IDENTITY_VALIDATOR_CACHE_DIR", "IDENTITY_VALIDATOR_CACHE_MAX_BYTES")
+REPO_CATALOG = "identity/catalog/identities.yaml"
+CATALOG_SCHEMA = "identity/catalog/schema/identities.schema.json"
+
+
+@dataclass(frozen=True)
+class ValidatorInputs:
+    # (argv flag, default path); an empty flag names a fixed cwd-relative catalog.
+    catalogs: tuple[tuple[str, str], ...] = ()
+    files: tuple[str, ...] = ()
+    trees: tuple[str, ...] = ()
+    path_args: tuple[str, ...] = ()
+    pack_files: tuple[str, ...] = ()
+    pack_trees: tuple[str, ...] = ()
+
+
+# Validators whose result is a pure function of argv, cwd, identity env and the declared inputs.
+# Tree inputs also fingerprint mtimes because these validators pick "latest" evidence by mtime.
+CACHEABLE_VALIDATORS: dict[str, ValidatorInputs] = {
+    "validate_identity_manifest": ValidatorInputs(
+        catalogs=(("", REPO_CATALOG),),
+        files=(CATALOG_SCHEMA,),
+    ),
+    "validate_identity_protocol": ValidatorInputs(
+        catalogs=(("", REPO_CATALOG),),
+        files=(CATALOG_SCHEMA,),
+        pack_files=("IDENTITY_PROMPT.md", "CURRENT_TASK.json", "TASK_HISTORY.md", "META.yaml"),
+    ),
+    "validate_identity_state_consistency": ValidatorInputs(
+        catalogs=(("--catalog", str(Path.home() / ".codex" / "identity" / "catalog.local.yaml")),),
+        pack_files=("META.yaml",),
+    ),
+    "validate_identity_runtime_contract": ValidatorInputs(
+        catalogs=(("--catalog", REPO_CATALOG),),
+        trees=("identity/runtime",),
+        path_args=("--current-task",),
+        pack_files=("CURRENT_TASK.json", "RULEBOOK.jsonl"),
+        pack_trees=("runtime",),
+    ),
+    "validate_identity_prompt_quality": ValidatorInputs(
+        catalogs=(("--catalog", ""), ("--repo-catalog", REPO_CATALOG)),
+        pack_files=("IDENTITY_PROMPT.md", "CURRENT_TASK.json"),
+    ),
+}
+
+_FILE_DIGESTS: dict[tuple[str, int, int], str] = {}
+_CODE_FINGERPRINTS: dict[str, str] = {}
+
+
+def validator_cache_enabled() -> bool:
+    return str(os.environ.get("IDENTITY_VALIDATOR_CACHE", "1")).strip().lower() not in {"0", "false", "off", "no"}
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        st = path.stat()
+    except OSError:
+        return "missing"
+    if not path.is_file():
+        return "not_a_file"
+    memo_key = (str(path), st.st_size, st.st_mtime_ns)
+    cached = _FILE_DIGESTS.get(memo_key)
+    if cached is not None:
+        return cached
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+    _FILE_DIGESTS[memo_key] = digest
+    return digest
+
+
+def _tree_digest(root: Path) -> list[list[Any]]:
+    if not root.is_dir():
+        return [[str(root), "missing"]]
+    rows: list[list[Any]] = []
+    for p in sorted(root.rglob("*")):
+        if p.is_file():
+            rows.append([str(p), p.stat().st_mtime_ns, _file_digest(p)])
+    return rows
+
+
+def _sibling_imports(path: Path) -> list[str]:
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError):
+        return []
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split(".")[0])
+    return sorted(n for n in names if (SCRIPTS_DIR / f"{n}.py").exists())
+
+
+def code_fingerprint(module_name: str) -> str:
+    """sha256 over a script and every sibling module it (transitively) imports."""
+    if module_name in _CODE_FINGERPRINTS:
+        return _CODE_FINGERPRINTS[module_name]
+    seen: set[str] = set()
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        pending.extend(_sibling_imports(SCRIPTS_DIR / f"{name}.py"))
+    h = hashlib.sha256()
+    for name in sorted(seen):
+        h.update(name.encode("utf-8"))
+        h.update(_file_digest(SCRIPTS_DIR / f"{name}.py").encode("utf-8"))
+    _CODE_FINGERPRINTS[module_name] = h.hexdigest()
+    return _CODE_FINGERPRINTS[module_name]
+
+
+def _flag_value(argv: list[str], flag: str) -> str | None:
+    for idx, token in enumerate(argv):
+        if token == flag and idx + 1 < len(argv):
+            return argv[idx + 1]
+        if token.startswith(flag + "="):
+            return token[len(flag) + 1 :]
+    return None
+
+
+def _abs(raw: str, cwd: Path) -> Path:
+    p = Path(raw).expanduser()
+    return (p if p.is_absolute() else cwd / p).resolve()
+
+
+def _catalog_pack_roots(catalog: Path, identity_id: str, cwd: Path) -> list[Path]:
+    try:
+        data = load_yaml_document(catalog) or {}
+    except Exception:
+        return []
+    rows = data.get("identities") if isinstance(data, dict) else None
+    out: list[Path] = []
+    for row in rows or []:
+        if not isinstance(row, dict):
+            continue
+        iid = str(row.get("id", "")).strip()
+        if identity_id and iid != identity_id:
+            continue
+        pack_path = str(row.get("pack_path", "")).strip()
+        if pack_path:
+            out.append(_abs(pack_path, cwd))
+        elif iid:
+            out.append(_abs(f"identity/{iid}", cwd))
+    return out
+
+
+def _split_cmd(cmd: list[str], cwd: Path) -> tuple[str, list[str]] | None:
+    if len(cmd) < 2 or not cmd[1].endswith(".py"):
+        return None
+    script = _abs(cmd[1], cwd)
+    if script.parent != SCRIPTS_DIR:
+        return None
+    return script.stem, list(cmd[2:])
+
+
+def _input_fingerprint(spec: ValidatorInputs, argv: list[str], cwd: Path) -> list[list[Any]]:
+    rows: list[list[Any]] = []
+    identity_id = str(_flag_value(argv, "--identity-id") or "").strip()
+    pack_roots: list[Path] = []
+    for flag, default in spec.catalogs:
+        raw = (_flag_value(argv, flag) if flag else None) or default
+        if not raw:
+            continue
+        catalog = _abs(raw, cwd)
+        rows.append(["catalog", str(catalog), _file_digest(catalog)])
+        pack_roots.extend(_catalog_pack_roots(catalog, identity_id, cwd))
+    for flag in spec.path_args:
+        raw = _flag_value(argv, flag)
+        if raw:
+            path = _abs(raw, cwd)
+            rows.append(["path_arg", str(path), _file_digest(path)])
+            pack_roots.append(path.parent)
+    for raw in spec.files:
+        path = _abs(raw, cwd)
+        rows.append(["file", str(path), _file_digest(path)])
+    for raw in spec.trees:
+        rows.append(["tree", raw, _tree_digest(_abs(raw, cwd))])
+    for root in sorted(set(pack_roots)):
+        for name in spec.pack_files:
+            rows.append(["pack_file", str(root / name), _file_digest(root / name)])
+        for name in spec.pack_trees:
+            rows.append(["pack_tree", str(root / name), _tree_digest(root / name)])
+    return rows
+
+
+class ValidatorResultCache:
+    """
+    On-disk, content-addressed cache of validator results.
+
+    Keys hash (validator code fingerprint, argv, cwd, identity env, declared input digests);
+    entries are JSON files whose mtime is refreshed on hit, and the least recently used
+    entries are evicted once the directory exceeds ``max_bytes``. A cached PASS stands in for a
+    validator run, so the cache is only used when ``root`` is private to this user.
+    """
+
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self.root = Path(root).expanduser().resolve()
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self._trusted: bool | None = None
+
+    def trusted(self) -> bool:
+        if self._trusted is None:
+            self._trusted = private_dir(self.root) is not None
+        return self._trusted
+
+    def key_for(self, cmd: list[str], cwd: Path, env: dict[str, str] | None = None) -> str | None:
+        target = _split_cmd(cmd, Path(cwd))
+        if target is None or target[0] not in CACHEABLE_VALIDATORS:
+            return None
+        module_name, argv = target
+        source_env = os.environ if env is None else env
+        env_rows = sorted(
+            (k, v)
+            for k, v in source_env.items()
+            if (k.startswith(CACHE_KEY_ENV_PREFIXES) or k in CACHE_KEY_ENV_NAMES) and k not in CACHE_CONTROL_ENV
+        )
+        material = {
+            "schema": CACHE_SCHEMA,
+            "validator": module_name,
+            "code_sha256": code_fingerprint(module_name),
+            "argv": argv,
+            "cwd": str(Path(cwd).resolve()),
+            "env": env_rows,
+            "inputs": _input_fingerprint(CACHEABLE_VALIDATORS[module_name], argv, Path(cwd).resolve()),
+        }
+        return hashlib.sha256(json.dumps(material, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._entry_path(key)
+        if not self.trusted():
+            self.misses += 1
+            return None
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            self.misses += 1
+            return None
+        if not isinstance(doc, dict) or doc.get("schema") != CACHE_SCHEMA:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return doc
+
+    def put(
+        self, key: str, cmd: list[str], rc: int, stdout: str, stderr: str, *, result: dict[str, Any] | None = None
+    ) -> None:
+        if not self.trusted():
+            return
+        path = self._entry_path(key)
+        doc = {
+            "schema": CACHE_SCHEMA,
+            "cmd": list(cmd),
+            "rc": int(rc),
+            "stdout": stdout,
+            "stderr": stderr,
+            "created_at": _utc_now(),
+        }
+        if result is not None:
+            doc["result"] = result
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(doc, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        if not self.trusted():
+            return 0
+        entries: list[tuple[float, int, Path]] = []
+        for p in self.root.glob("*/*.json"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, p in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+
+def default_validator_cache(enabled: bool = True) -> ValidatorResultCache | None:
+    if not enabled or not validator_cache_enabled():
+        return None
+    root = str(os.environ.get("IDENTITY_VALIDATOR_CACHE_DIR", "")).strip() or str(DEFAULT_CACHE_DIR)
+    try:
+        max_bytes = int(str(os.environ.get("IDENTITY_VALIDATOR_CACHE_MAX_BYTES", "")).strip() or DEFAULT_CACHE_MAX_BYTES)
+    except ValueError:
+        max_bytes = DEFAULT_CACHE_MAX_BYTES
+    return ValidatorResultCache(Path(root), max_bytes)
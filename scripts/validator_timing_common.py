@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+from private_dir_common import private_dir, user_tmp_dir
+
+VALIDATOR_TIMING_SCHEMA = "identity_validator_timing_v1"
+DEFAULT_VALIDATOR_TIMING_DIR = user_tmp_dir("identity-validator-timings")
+VALIDATOR_TIMING_FILE = "timings.ndjson"
+# the store rotates to timings.ndjson.1 (one previous generation) once it passes this size
+DEFAULT_VALIDATOR_TIMING_MAX_BYTES = 8 * 1024 * 1024
+# IDENTITY_VALIDATOR_TIMING=0 disables recording; the other variables label the rows
+TIMING_ENV_ENABLED = "IDENTITY_VALIDATOR_TIMING"
+TIMING_ENV_DIR = "IDENTITY_VALIDATOR_TIMING_DIR"
+TIMING_ENV_MAX_BYTES = "IDENTITY_VALIDATOR_TIMING_MAX_BYTES"
+TIMING_ENV_ORCHESTRATOR = "IDENTITY_TIMING_ORCHESTRATOR"
+TIMING_ENV_RUN_ID = "IDENTITY_TIMING_RUN_ID"
+
+
+def _environ(env: Mapping[str, str] | None) -> Mapping[str, str]:
+    return os.environ if env is None else env
+
+
+def validator_timing_enabled(env: Mapping[str, str] | None = None) -> bool:
+    return str(_environ(env).get(TIMING_ENV_ENABLED, "1")).strip().lower() not in {"0", "false", "off", "no"}
+
+
+def validator_timing_path(env: Mapping[str, str] | None = None) -> Path | None:
+    """
+    Timing store path; None when the default directory is not private to this user, since
+    benchmark baselines and regression flags are computed from its rows.
+    """
+    root = str(_environ(env).get(TIMING_ENV_DIR, "")).strip()
+    if root:
+        return Path(root).expanduser() / VALIDATOR_TIMING_FILE
+    default = private_dir(DEFAULT_VALIDATOR_TIMING_DIR)
+    return default / VALIDATOR_TIMING_FILE if default is not None else None
+
+
+def validator_name(cmd: list[str]) -> str:
+    """``scripts/validate_x.py`` -> ``validate_x``; other commands keep their first word."""
+    for part in cmd[:2]:
+        if part.endswith((".py", ".sh")):
+            return Path(part).stem
+    return Path(cmd[0]).name if cmd else ""
+
+
+def validator_timing_max_bytes(env: Mapping[str, str] | None = None) -> int:
+    try:
+        return int(str(_environ(env).get(TIMING_ENV_MAX_BYTES, "")).strip() or DEFAULT_VALIDATOR_TIMING_MAX_BYTES)
+    except ValueError:
+        return DEFAULT_VALIDATOR_TIMING_MAX_BYTES
+
+
+def _rss_kb(usage: resource.struct_rusage) -> int:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return int(usage.ru_maxrss // 1024) if sys.platform == "darwin" else int(usage.ru_maxrss)
+
+
+def _reset_self_peak_rss() -> bool:
+    # ru_maxrss only ever grows; Linux can reset this process's VmHWM so one run gets its own peak
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _self_peak_rss_kb() -> int | None:
+    try:
+        with open("/proc/self/status", encoding="ascii", errors="ignore") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+@dataclass
+class ValidatorTiming:
+    """
+    Wall/CPU/peak-RSS of one validator run. CPU is the delta of this process plus its reaped
+    children (exact when validators run one at a time per process). RSS is the peak of that run
+    alone: the child's own rusage (``run_measured``) or, in-process, this process's peak after a
+    reset; None where neither can be measured.
+    """
+
+    wall_ms: int = 0
+    cpu_ms: int = 0
+    max_rss_kb: int | None = None
+    rc: int | None = None
+    mode: str = ""
+
+
+@contextlib.contextmanager
+def measure_validator(mode: str = "subprocess") -> Iterator[ValidatorTiming]:
+    timing = ValidatorTiming(mode=mode)
+    peak_reset = mode == "inprocess" and _reset_self_peak_rss()
+    self_0 = resource.getrusage(resource.RUSAGE_SELF)
+    child_0 = resource.getrusage(resource.RUSAGE_CHILDREN)
+    t0 = time.monotonic()
+    try:
+        yield timing
+    finally:
+        timing.wall_ms = int((time.monotonic() - t0) * 1000)
+        self_1 = resource.getrusage(resource.RUSAGE_SELF)
+        child_1 = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu = (self_1.ru_utime + self_1.ru_stime - self_0.ru_utime - self_0.ru_stime) + (
+            child_1.ru_utime + child_1.ru_stime - child_0.ru_utime - child_0.ru_stime
+        )
+        timing.cpu_ms = int(cpu * 1000)
+        if peak_reset:
+            timing.max_rss_kb = _self_peak_rss_kb()
+
+
+def run_measured(
+    cmd: list[str], timing: ValidatorTiming | None = None, *, capture_output: bool = False, **popen_kwargs: Any
+) -> subprocess.CompletedProcess:
+    """
+    ``subprocess.run`` that reaps the child with ``os.wait4`` and stores that child's own peak RSS
+    in ``timing`` (RUSAGE_CHILDREN would report the largest child this process ever reaped).
+    """
+    if capture_output:
+        popen_kwargs["stdout"] = subprocess.PIPE
+        popen_kwargs["stderr"] = subprocess.PIPE
+    captured: dict[str, Any] = {}
+    with subprocess.Popen(cmd, **popen_kwargs) as proc:
+        readers = [
+            threading.Thread(target=lambda name=name, stream=stream: captured.__setitem__(name, stream.read()))
+            for name, stream in (("stdout", proc.stdout), ("stderr", proc.stderr))
+            if stream is not None
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            _, status, usage = os.wait4(proc.pid, 0)
+        except BaseException:
+            proc.kill()
+            raise
+        # reaped here, so Popen.wait() must not wait again
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        for reader in readers:
+            reader.join()
+    if timing is not None:
+        timing.max_rss_kb = _rss_kb(usage)
+    return subprocess.CompletedProcess(cmd, proc.returncode, captured.get("stdout"), captured.get("stderr"))
+
+
+def _append_row(path: Path, line: bytes, max_bytes: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if max_bytes > 0 and path.stat().st_size + len(line) > max_bytes:
+            os.replace(path, path.with_name(path.name + ".1"))
+    except FileNotFoundError:
+        pass
+    # one O_APPEND write per row keeps rows from concurrent orchestrators whole
+    fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def record_validator_timing(
+    cmd: list[str], timing: ValidatorTiming, *, orchestrator: str = "", env: Mapping[str, str] | None = None
+) -> None:
+    """
+    Append one row to the timing store (``$IDENTITY_VALIDATOR_TIMING_DIR/timings.ndjson``), which
+    rotates to ``timings.ndjson.1`` past ``IDENTITY_VALIDATOR_TIMING_MAX_BYTES`` (default 8 MiB).
+    """
+    if not validator_timing_enabled(env):
+        return
+    store = validator_timing_path(env)
+    if store is None:
+        return
+    environ = _environ(env)
+    row = {
+        "schema": VALIDATOR_TIMING_SCHEMA,
+        "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "run_id": str(environ.get(TIMING_ENV_RUN_ID, "")).strip(),
+        "orchestrator": str(environ.get(TIMING_ENV_ORCHESTRATOR, "")).strip()
+        or orchestrator
+        or Path(sys.argv[0]).stem,
+        "validator": validator_name(cmd),
+        "mode": timing.mode,
+        "rc": timing.rc,
+        "wall_ms": timing.wall_ms,
+        "cpu_ms": timing.cpu_ms,
+        "max_rss_kb": timing.max_rss_kb,
+        "pid": os.getpid(),
+    }
+    line = (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
+    try:
+        _append_row(store, line, validator_timing_max_bytes(env))
+    except OSError:
+        return  # timings are diagnostics only
+
+
+@contextlib.contextmanager
+def timed_validator(
+    cmd: list[str], *, mode: str = "subprocess", orchestrator: str = "", env: Mapping[str, str] | None = None
+) -> Iterator[ValidatorTiming]:
+    """``measure_validator`` + ``record_validator_timing``; set ``timing.rc`` inside the block."""
+    with measure_validator(mode) as timing:
+        yield timing
+    record_validator_timing(cmd, timing, orchestrator=orchestrator, env=env)
+
+
+def load_validator_timings(path: Path | None = None, *, run_ids: Iterable[str] | None = None) -> list[dict[str, Any]]:
+    wanted = set(run_ids) if run_ids is not None else None
+    rows: list[dict[str, Any]] = []
+    store = path or validator_timing_path()
+    if store is None:
+        return rows
+    # the rotated generation first, so rows stay in append order
+    for candidate in (store.with_name(store.name + ".1"), store):
+        try:
+            f = candidate.open("r", encoding="utf-8")
+        except OSError:
+            continue
+        with f:
+            for raw in f:
+                try:
+                    row = json.loads(raw)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(row, dict) or row.get("schema") != VALIDATOR_TIMING_SCHEMA:
+                    continue
+                if wanted is not None and str(row.get("run_id", "")) not in wanted:
+                    continue
+                rows.append(row)
+    return rows
+
+
+def percentile(values: list[int] | list[float], pct: float) -> float:
+    """Nearest-rank percentile (``pct`` in 0-100); 0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return float(ordered[min(rank, len(ordered)) - 1])
+
+
+def summarize_validator_timings(rows: Iterable[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Per-validator sample count and p50/p95 of wall, CPU and peak RSS."""
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for row in rows:
+        grouped.setdefault(str(row.get("validator", "")), []).append(row)
+    out: dict[str, dict[str, Any]] = {}
+    for name in sorted(grouped):
+        samples = grouped[name]
+        stats: dict[str, Any] = {"samples": len(samples), "failures": sum(1 for r in samples if r.get("rc") not in (0, None))}
+        for metric in ("wall_ms", "cpu_ms", "max_rss_kb"):
+            # runs whose peak RSS could not be measured carry None and are left out
+            values = [int(r[metric]) for r in samples if isinstance(r.get(metric), (int, float))]
+            stats[f"{metric}_p50"] = percentile(values, 50)
+            stats[f"{metric}_p95"] = percentile(values, 95)
+        out[name] = stats
+    return out
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import socket
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from private_dir_common import private_dir, user_tmp_dir
+
+# Client path stays import-light: the worker exists to avoid interpreter/import cold starts.
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_IDLE_SECONDS = 300.0
+SPAWN_WAIT_SECONDS = 10.0
+SOCKET_FILENAME = "worker.sock"
+# Only these reach the worker: the identity env the result cache keys on
+# (validator_result_cache_common.CACHE_KEY_ENV_PREFIXES) plus a few non-secret basics.
+FORWARDED_ENV_PREFIXES = ("IDENTITY_", "CODEX_")
+FORWARDED_ENV_KEYS = ("PATH", "HOME", "USER", "LANG", "LC_ALL", "TZ", "PYTHONPATH")
+
+
+def default_socket_path() -> Path:
+    env = str(os.environ.get("IDENTITY_VALIDATOR_WORKER_SOCKET", "")).strip()
+    if env:
+        return Path(env).expanduser()
+    return user_tmp_dir("identity-validator-worker") / SOCKET_FILENAME
+
+
+def _socket_dir_ok(sock_path: Path) -> bool:
+    """The socket must live in a directory only this user can enter, or another user could plant it."""
+    return private_dir(sock_path.parent) is not None
+
+
+def _peer_is_self(conn: socket.socket) -> bool:
+    peercred = getattr(socket, "SO_PEERCRED", None)
+    if peercred is None:
+        return True  # non-Linux: the private socket directory is the only guard
+    try:
+        _, uid, _ = struct.unpack("3i", conn.getsockopt(socket.SOL_SOCKET, peercred, struct.calcsize("3i")))
+    except OSError:
+        return False
+    return uid == os.getuid()
+
+
+def forwarded_env(environ: dict[str, str] | None = None) -> dict[str, str]:
+    source = os.environ if environ is None else environ
+    return {k: v for k, v in source.items() if k.startswith(FORWARDED_ENV_PREFIXES) or k in FORWARDED_ENV_KEYS}
+
+
+def _validator_env(client_env: dict[str, str]) -> dict[str, str]:
+    """Worker env with the forwarded keys replaced by the client's (keys it unset are dropped)."""
+    base = {k: v for k, v in os.environ.items() if k not in forwarded_env(os.environ)}
+    return {**base, **client_env}
+
+
+def default_idle_seconds() -> float:
+    try:
+        return float(str(os.environ.get("IDENTITY_VALIDATOR_WORKER_IDLE_SECONDS", "")).strip() or DEFAULT_IDLE_SECONDS)
+    except ValueError:
+        return DEFAULT_IDLE_SECONDS
+
+
+def worker_enabled() -> bool:
+    return str(os.environ.get("IDENTITY_VALIDATOR_WORKER", "1")).strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _recv_all(conn: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _request(sock_path: Path, payload: dict[str, Any], timeout: float | None = None) -> dict[str, Any] | None:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(str(sock_path))
+            if not _peer_is_self(conn):
+                return None
+            conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            conn.shutdown(socket.SHUT_WR)
+            raw = _recv_all(conn)
+    except OSError:
+        return None
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _script_snapshot() -> dict[str, int]:
+    rows: dict[str, int] = {}
+    for p in SCRIPTS_DIR.glob("*.py"):
+        try:
+            rows[p.name] = p.stat().st_mtime_ns
+        except OSError:
+            continue
+    return rows
+
+
+def _client_cache(env: dict[str, str] | None) -> Any:
+    """Resolve the result cache under the client's environment (IDENTITY_VALIDATOR_CACHE*)."""
+    from validator_result_cache_common import default_validator_cache
+
+    if env is None:
+        return default_validator_cache()
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        return default_validator_cache()
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def serve(sock_path: Path, idle_seconds: float) -> int:
+    """
+    Serve validator command lines over a Unix socket until idle for ``idle_seconds``.
+
+    Requests run one at a time through the in-process validator registry (modules stay
+    imported; catalog, pack and CURRENT_TASK parses stay memoized in ``identity_catalog_common``
+    by path and stat). When any ``scripts/*.py`` changes on
+    disk the worker answers ``restart`` and exits so callers never run stale code.
+    """
+    if not _socket_dir_ok(sock_path):
+        print(f"[FAIL] worker socket directory is not private to this user: {sock_path.parent}", file=sys.stderr)
+        return 1
+    if _request(sock_path, {"op": "ping"}, timeout=1.0) is not None:
+        return 0
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    from validator_registry_common import VALIDATOR_MODE_INPROCESS, VALIDATOR_MODES, run_validator
+
+    snapshot = _script_snapshot()
+    try:
+        sock_path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        print(f"[FAIL] cannot replace worker socket {sock_path}: {exc}", file=sys.stderr)
+        return 1
+    old_umask = os.umask(0o177)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(sock_path))
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    server.settimeout(idle_seconds)
+    served = 0
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            with conn:
+                if not _peer_is_self(conn):
+                    continue
+                conn.settimeout(None)
+                try:
+                    request = json.loads(_recv_all(conn).decode("utf-8") or "{}")
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    request = {}
+                op = str(request.get("op", "run"))
+                if op == "ping":
+                    response: dict[str, Any] = {"ok": True, "pid": os.getpid(), "served": served}
+                elif op == "stop":
+                    conn.sendall(json.dumps({"ok": True, "stopped": True}).encode("utf-8"))
+                    break
+                elif _script_snapshot() != snapshot:
+                    conn.sendall(json.dumps({"restart": True}).encode("utf-8"))
+                    break
+                else:
+                    raw_env = request.get("env")
+                    env = (
+                        _validator_env({str(k): str(v) for k, v in raw_env.items()}) if isinstance(raw_env, dict) else None
+                    )
+                    mode = str((env or {}).get("IDENTITY_VALIDATOR_MODE", "")).strip().lower()
+                    result = run_validator(
+                        [str(x) for x in request.get("argv", [])],
+                        Path(str(request.get("cwd") or os.getcwd())),
+                        env=env,
+                        mode=mode if mode in VALIDATOR_MODES else VALIDATOR_MODE_INPROCESS,
+                        cache=_client_cache(env),
+                    )
+                    served += 1
+                    response = {
+                        "rc": result.rc,
+                        "stdout": result.stdout,
+                        "stderr": result.stderr,
+                        "mode": result.mode,
+                        "result": result.result,
+                        "events": result.events,
+                    }
+                conn.sendall(json.dumps(response).encode("utf-8"))
+    finally:
+        server.close()
+        try:
+            sock_path.unlink()
+        except FileNotFoundError:
+            pass
+    return 0
+
+
+def _spawn_worker(sock_path: Path, idle_seconds: float) -> bool:
+    import subprocess
+
+    subprocess.Popen(
+        [
+            sys.executable,
+            str(Path(__file__).resolve()),
+            "serve",
+            "--socket",
+            str(sock_path),
+            "--idle-timeout",
+            str(idle_seconds),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+    deadline = time.monotonic() + SPAWN_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        if _request(sock_path, {"op": "ping"}, timeout=1.0) is not None:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _exec_direct(argv: list[str]) -> int:
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(sys.executable, [sys.executable, *argv])
+    return 127
+
+
+def run_client(argv: list[str], sock_path: Path, idle_seconds: float) -> int:
+    """Run ``argv`` (``scripts/<validator>.py ...``) on the worker, starting it on demand."""
+    if not argv:
+        print("[FAIL] validator command required", file=sys.stderr)
+        return 2
+    if not worker_enabled() or not _socket_dir_ok(sock_path):
+        return _exec_direct(argv)
+    payload = {"op": "run", "argv": ["python3", *argv], "cwd": os.getcwd(), "env": forwarded_env()}
+    response = _request(sock_path, payload)
+    if response is None and _spawn_worker(sock_path, idle_seconds):
+        response = _request(sock_path, payload)
+    if response is None or response.get("restart") or "rc" not in response:
+        return _exec_direct(argv)
+    sys.stdout.write(str(response.get("stdout", "")))
+    sys.stdout.flush()
+    sys.stderr.write(str(response.get("stderr", "")))
+    sys.stderr.flush()
+    if response.get("result") is not None or response.get("events"):
+        # forward the worker-side result channel records to this client's orchestrator
+        from result_channel_common import ResultChannel
+
+        ResultChannel().replay(response.get("result"), response.get("events"))
+    return int(response.get("rc", 1))
+
+
+def main(argv: list[str] | None = None) -> int:
+    raw = list(sys.argv[1:] if argv is None else argv)
+    if raw[:1] == ["run"] and len(raw) > 1 and not raw[1].startswith("-"):
+        # hot path for the e2e/CI shim: skip argparse import and parsing
+        return run_client(raw[1:], default_socket_path(), default_idle_seconds())
+    import argparse
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--socket", default="", help="socket path (default: IDENTITY_VALIDATOR_WORKER_SOCKET or a private per-user /tmp dir)")
+    common.add_argument("--idle-timeout", type=float, default=-1.0, help="seconds idle before the worker exits")
+    ap = argparse.ArgumentParser(
+        description="Persistent validator worker: keeps validator modules warm behind a local Unix socket."
+    )
+    sub = ap.add_subparsers(dest="command", required=True)
+    sub.add_parser("serve", parents=[common], help="run the worker in the foreground")
+    run_p = sub.add_parser("run", parents=[common], help="run a validator command line on the worker (started on demand)")
+    run_p.add_argument("validator_argv", nargs=argparse.REMAINDER)
+    sub.add_parser("status", parents=[common], help="print worker status")
+    sub.add_parser("stop", parents=[common], help="stop a running worker")
+    args = ap.parse_args(raw)
+
+    sock_path = Path(args.socket).expanduser() if args.socket.strip() else default_socket_path()
+    idle_seconds = args.idle_timeout if args.idle_timeout > 0 else default_idle_seconds()
+    if args.command == "serve":
+        return serve(sock_path, idle_seconds)
+    if args.command == "run":
+        return run_client(list(args.validator_argv), sock_path, idle_seconds)
+    if args.command == "stop":
+        response = _request(sock_path, {"op": "stop"}, timeout=5.0)
+        print(json.dumps(response or {"ok": False, "running": False}, ensure_ascii=False))
+        return 0
+    response = _request(sock_path, {"op": "ping"}, timeout=5.0)
+    print(json.dumps({"running": response is not None, "socket": str(sock_path), **(response or {})}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -79,7 +79,7 @@ def _resolve_active_lock(
     return lock_protocol
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Emit canonical SESSION_LANE_LOCK_EXIT receipt and index linkage.")
     ap.add_argument("--identity-id", required=True)
     ap.add_argument("--catalog", required=True)
@@ -95,7 +95,7 @@ def main() -> int:
     )
     ap.add_argument("--force-check", action="store_true")
     ap.add_argument("--json-only", action="store_true")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     strict = is_strict_operation(args.operation)
     catalog_path = Path(args.catalog).expanduser().resolve()